@@ -0,0 +1,44 @@
+"""Shared timing and reporting helpers for the repository micro-benchmarks."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+
+def positive_int(value: str) -> int:
+    parsed = int(value)
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value!r}")
+    return parsed
+
+
+def _timed_run(operation: Callable[[], Any], iterations: int) -> int:
+    started = time.perf_counter_ns()
+    for _ in range(iterations):
+        operation()
+    return time.perf_counter_ns() - started
+
+
+def measure(operation: Callable[[], Any], *, iterations: int, repeats: int) -> dict[str, float]:
+    """Time ``operation`` and keep the best of ``repeats`` runs to damp scheduler noise."""
+
+    operation()
+    best_ns = min(_timed_run(operation, iterations) for _ in range(repeats))
+    ns_per_op = max(best_ns, 1) / iterations
+    return {
+        "ns_per_op": round(ns_per_op, 1),
+        "ops_per_second": round(1e9 / ns_per_op, 1),
+    }
+
+
+def emit_report(report: dict[str, Any], output: Path | None) -> None:
+    rendered = json.dumps(report, ensure_ascii=True, indent=2) + "\n"
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(rendered, encoding="utf-8")
+    print(rendered, end="")
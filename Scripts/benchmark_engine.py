@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""Benchmark the Monte Carlo engine and compare it with the versioned baseline in ``reports/``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows has no getrusage
+    resource = None
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.mc_core import (  # noqa: E402
+    SIMULATION_BATCH_SIZE,
+    mc_finish_weeks,
+    mc_items_done_for_weeks,
+)
+from backend.mca_prng_v1_sample_index_draw_port import McaPrngV1SampleIndexDrawPort  # noqa: E402
+from backend.simulation_limits import SIMULATION_HORIZON_WEEKS_MAX  # noqa: E402
+from backend.simulation_value_objects import SimulationSeed  # noqa: E402
+from Scripts.benchmark_common import positive_int  # noqa: E402
+
+SCHEMA_VERSION = 1
+DEFAULT_BASELINE = ROOT / "reports" / "engine-benchmark-baseline.json"
+N_SIMS_VALUES = (1_000, 20_000, 200_000)
+SAMPLE_COUNTS = (6, 52, 521)
+BATCH_SIZES = (512, SIMULATION_BATCH_SIZE, 8_192)
+BACKLOG_SIZES = (10, 200, 2_000)
+DEFAULT_BACKLOG_SIZE = 200
+DEFAULT_TARGET_WEEKS = 26
+SWEEP_N_SIMS = 20_000
+SWEEP_SAMPLE_COUNT = 52
+BENCHMARK_SEED = 20_240_601
+DEFAULT_TIME_BUDGET = 0.25
+DEFAULT_MEMORY_BUDGET = 0.10
+
+
+@dataclass(frozen=True)
+class EngineCase:
+    mode: str
+    n_sims: int
+    sample_count: int
+    batch_size: int
+    backlog_size: int | None = None
+    target_weeks: int | None = None
+
+    @property
+    def case_id(self) -> str:
+        size = f"backlog{self.backlog_size}" if self.backlog_size else f"weeks{self.target_weeks}"
+        return f"{self.mode}/n{self.n_sims}/s{self.sample_count}/{size}/b{self.batch_size}"
+
+    @property
+    def draws(self) -> int:
+        slots = SIMULATION_HORIZON_WEEKS_MAX if self.backlog_size else self.target_weeks or 0
+        return self.n_sims * slots
+
+
+def _case(mode: str, n_sims: int, samples: int, batch: int, backlog: int) -> EngineCase:
+    if mode == "backlog_to_weeks":
+        return EngineCase(mode, n_sims, samples, batch, backlog_size=backlog)
+    return EngineCase(mode, n_sims, samples, batch, target_weeks=DEFAULT_TARGET_WEEKS)
+
+
+def build_cases(max_n_sims: int | None = None) -> list[EngineCase]:
+    """Full mode x n_sims x samples grid, plus batch and backlog sweeps at a mid-size point."""
+
+    cases: dict[str, EngineCase] = {}
+    for mode in ("backlog_to_weeks", "weeks_to_items"):
+        grid = [
+            (n_sims, samples, SIMULATION_BATCH_SIZE, DEFAULT_BACKLOG_SIZE)
+            for n_sims in N_SIMS_VALUES
+            for samples in SAMPLE_COUNTS
+        ]
+        sweep = (SWEEP_N_SIMS, SWEEP_SAMPLE_COUNT)
+        grid += [(*sweep, batch, DEFAULT_BACKLOG_SIZE) for batch in BATCH_SIZES]
+        if mode == "backlog_to_weeks":
+            grid += [(*sweep, SIMULATION_BATCH_SIZE, backlog) for backlog in BACKLOG_SIZES]
+        for point in grid:
+            case = _case(mode, *point)
+            cases.setdefault(case.case_id, case)
+    return [case for case in cases.values() if max_n_sims is None or case.n_sims <= max_n_sims]
+
+
+def _throughput_samples(sample_count: int) -> np.ndarray:
+    # Deterministic weekly throughputs in 0..12, zero weeks included.
+    return (np.arange(sample_count, dtype=int) * 7) % 13
+
+
+def run_case(case: EngineCase) -> object:
+    samples = _throughput_samples(case.sample_count)
+    draw_port = McaPrngV1SampleIndexDrawPort(SimulationSeed(BENCHMARK_SEED))
+    if case.backlog_size is not None:
+        return mc_finish_weeks(
+            case.backlog_size,
+            samples,
+            case.n_sims,
+            include_zero_weeks=True,
+            draw_port=draw_port,
+            batch_size=case.batch_size,
+        )
+    assert case.target_weeks is not None
+    return mc_items_done_for_weeks(
+        case.target_weeks,
+        samples,
+        case.n_sims,
+        include_zero_weeks=True,
+        draw_port=draw_port,
+        batch_size=case.batch_size,
+    )
+
+
+def _peak_rss_bytes() -> int | None:
+    # ru_maxrss is in KiB on Linux; it is per process, hence one worker per case.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 if resource else None
+
+
+def measure_case(case: EngineCase, repeats: int) -> dict[str, Any]:
+    run_case(case)
+    best_ns = None
+    for _ in range(repeats):
+        started = time.perf_counter_ns()
+        run_case(case)
+        elapsed = time.perf_counter_ns() - started
+        best_ns = elapsed if best_ns is None else min(best_ns, elapsed)
+    assert best_ns is not None
+    tracemalloc.start()
+    run_case(case)
+    _current, peak_traced = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    best_ns = max(best_ns, 1)
+    return {
+        **asdict(case),
+        "draws": case.draws,
+        "seconds": round(best_ns / 1e9, 6),
+        "ns_per_draw": round(best_ns / case.draws, 3),
+        "sims_per_second": round(case.n_sims * 1e9 / best_ns, 1),
+        "peak_traced_bytes": peak_traced,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+def measure_cases(cases: list[EngineCase], *, repeats: int, isolated: bool) -> dict[str, Any]:
+    """Measure every case, each in a fresh process when ``isolated`` so peak RSS is per case."""
+
+    if not isolated:
+        return {case.case_id: measure_case(case, repeats) for case in cases}
+    context = multiprocessing.get_context("spawn")
+    results: dict[str, Any] = {}
+    for case in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results[case.case_id] = executor.submit(measure_case, case, repeats).result()
+    return results
+
+
+def build_report(cases: list[EngineCase], *, repeats: int, isolated: bool) -> dict[str, Any]:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "benchmark": "monte_carlo_engine",
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "repeats": repeats,
+        "cases": measure_cases(cases, repeats=repeats, isolated=isolated),
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    time_budget: float,
+    memory_budget: float,
+) -> list[str]:
+    """Regressions of ``current`` against ``baseline`` for the cases both reports contain."""
+
+    regressions = []
+    for case_id, measured in current["cases"].items():
+        reference = baseline["cases"].get(case_id)
+        if reference is None:
+            continue
+        for metric, budget in (("ns_per_draw", time_budget), ("peak_traced_bytes", memory_budget)):
+            limit = reference[metric] * (1 + budget)
+            if measured[metric] > limit:
+                regressions.append(
+                    f"{case_id}: {metric} {measured[metric]} > {round(limit, 3)} "
+                    f"(baseline {reference[metric]}, budget {budget:.0%})"
+                )
+    return regressions
+
+
+def _load_baseline(path: Path) -> dict[str, Any]:
+    baseline = json.loads(path.read_text(encoding="utf-8"))
+    if baseline.get("schema_version") != SCHEMA_VERSION:
+        raise ValueError(f"unsupported engine baseline schema in {path}")
+    return baseline
+
+
+def _cases_from_baseline(baseline: dict[str, Any], max_n_sims: int | None) -> list[EngineCase]:
+    fields = EngineCase.__dataclass_fields__
+    cases = [
+        EngineCase(**{name: value for name, value in entry.items() if name in fields})
+        for entry in baseline["cases"].values()
+    ]
+    return [case for case in cases if max_n_sims is None or case.n_sims <= max_n_sims]
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("command", choices=("record", "compare"))
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--repeats", type=positive_int, default=3)
+    parser.add_argument("--max-n-sims", type=positive_int)
+    parser.add_argument("--time-budget", type=float, default=DEFAULT_TIME_BUDGET)
+    parser.add_argument("--memory-budget", type=float, default=DEFAULT_MEMORY_BUDGET)
+    parser.add_argument("--in-process", action="store_true", help="skip per-case worker processes")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    isolated = not args.in_process
+    try:
+        if args.command == "record":
+            report = build_report(
+                build_cases(args.max_n_sims), repeats=args.repeats, isolated=isolated
+            )
+            args.baseline.parent.mkdir(parents=True, exist_ok=True)
+            args.baseline.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+            print(f"Engine baseline written: {len(report['cases'])} cases -> {args.baseline}")
+            return 0
+        baseline = _load_baseline(args.baseline)
+        cases = _cases_from_baseline(baseline, args.max_n_sims)
+        current = build_report(cases, repeats=args.repeats, isolated=isolated)
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        print(f"ERROR: engine benchmark failed: {exc}", file=sys.stderr)
+        return 1
+    regressions = compare_reports(
+        baseline, current, time_budget=args.time_budget, memory_budget=args.memory_budget
+    )
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+    print(f"Engine benchmark compared {len(cases)} cases, {len(regressions)} regression(s).")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
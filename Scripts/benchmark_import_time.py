@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Profile ``import backend.api`` with ``-X importtime`` and fail when cold start regresses."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from Scripts.benchmark_common import emit_report, positive_int  # noqa: E402
+
+TARGET_MODULE = "backend.api"
+# Loaded on first use or by the startup warm-up, never while importing the API.
+DEFERRED_MODULES = ("numpy", "pymongo", "redis")
+DEFAULT_BUDGET_MS = 500.0
+TOP_MODULES = 10
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """Cumulative microseconds per module, from the ``-X importtime`` stderr table."""
+
+    cumulative: dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if cumulative_us.strip().isdigit():
+            cumulative[name.strip()] = int(cumulative_us)
+    return cumulative
+
+
+def profile_import(module: str = TARGET_MODULE) -> dict[str, int]:
+    # A shared limiter backend is configured to prove its client library stays deferred.
+    env = {**os.environ, "APP_MONGO_URL": "", "APP_REDIS_URL": "redis://localhost:6379/0"}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def summarise(runs: list[dict[str, int]], module: str, budget_ms: float) -> dict[str, Any]:
+    best = min(runs, key=lambda run: run[module])
+    heaviest = sorted(
+        (name for name in best if name not in (module, "site") and "." not in name),
+        key=best.__getitem__,
+        reverse=True,
+    )[:TOP_MODULES]
+    total_ms = round(best[module] / 1000, 1)
+    deferred_loaded = sorted(set(DEFERRED_MODULES).intersection(best))
+    return {
+        "benchmark": "api_import_time",
+        "module": module,
+        "runs": len(runs),
+        "total_ms": total_ms,
+        "budget_ms": budget_ms,
+        "top_level_modules_ms": {name: round(best[name] / 1000, 1) for name in heaviest},
+        "deferred_modules_loaded": deferred_loaded,
+        "regressions": [
+            *(f"{name} is imported eagerly" for name in deferred_loaded),
+            *([f"import takes {total_ms} ms > {budget_ms} ms"] if total_ms > budget_ms else []),
+        ],
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=positive_int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+    runs = [profile_import() for _ in range(args.runs)]
+    report = summarise(runs, TARGET_MODULE, args.budget_ms)
+    emit_report(report, args.output)
+    for regression in report["regressions"]:
+        print(f"Regression: {regression}", file=sys.stderr)
+    return 1 if report["regressions"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
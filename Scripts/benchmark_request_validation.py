@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the per-request /simulate validation cost at the maximum sample count."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.api_models import SimulateRequest  # noqa: E402
+from backend.simulation_limits import (  # noqa: E402
+    SIMULATION_N_SIMS_MAX,
+    SIMULATION_THROUGHPUT_SAMPLES_MAX,
+)
+from backend.simulation_mappers import request_to_command  # noqa: E402
+from backend.simulation_models import SimulationCommand  # noqa: E402
+from backend.simulation_value_objects import SimulationSeed, ThroughputSamples  # noqa: E402
+from Scripts.benchmark_common import emit_report, measure, positive_int  # noqa: E402
+
+BENCHMARK_SEED = SimulationSeed(20260226)
+
+
+def max_payload(mode: str) -> dict[str, Any]:
+    samples = [(index * 7) % 13 for index in range(SIMULATION_THROUGHPUT_SAMPLES_MAX)]
+    payload: dict[str, Any] = {
+        "throughput_samples": samples,
+        "mode": mode,
+        "n_sims": SIMULATION_N_SIMS_MAX,
+    }
+    if mode == "backlog_to_weeks":
+        payload["backlog_size"] = 500
+    else:
+        payload["target_weeks"] = 52
+    return payload
+
+
+def validate_single_pass(payload: dict[str, Any]) -> SimulationCommand:
+    return request_to_command(SimulateRequest.model_validate(payload), BENCHMARK_SEED)
+
+
+def validate_twice(payload: dict[str, Any]) -> SimulationCommand:
+    """Former path: the request contract and ``SimulationCommand.create`` both revalidate."""
+
+    request = SimulateRequest.model_validate(payload)
+    return SimulationCommand.create(
+        throughput_samples=request.throughput_samples,
+        include_zero_weeks=request.include_zero_weeks,
+        mode=request.mode,
+        backlog_size=request.backlog_size,
+        target_weeks=request.target_weeks,
+        n_sims=request.n_sims,
+        seed=BENCHMARK_SEED,
+    )
+
+
+def run_benchmark(*, iterations: int, repeats: int) -> dict[str, Any]:
+    modes: dict[str, Any] = {}
+    for mode in ("backlog_to_weeks", "weeks_to_items"):
+        payload = max_payload(mode)
+        samples = payload["throughput_samples"]
+        paths = {
+            "validate_twice": lambda: validate_twice(payload),
+            "single_pass": lambda: validate_single_pass(payload),
+            "throughput_samples_create": lambda: ThroughputSamples.create(samples, False),
+        }
+        timings = {
+            name: measure(operation, iterations=iterations, repeats=repeats)
+            for name, operation in paths.items()
+        }
+        twice_ns = timings["validate_twice"]["ns_per_op"]
+        timings["single_pass"]["speedup_vs_twice"] = round(
+            twice_ns / timings["single_pass"]["ns_per_op"], 2
+        )
+        modes[mode] = timings
+    return {
+        "benchmark": "simulate_request_validation",
+        "samples_count": SIMULATION_THROUGHPUT_SAMPLES_MAX,
+        "iterations": iterations,
+        "repeats": repeats,
+        "modes": modes,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=positive_int, default=2000)
+    parser.add_argument("--repeats", type=positive_int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+    emit_report(run_benchmark(iterations=args.iterations, repeats=args.repeats), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
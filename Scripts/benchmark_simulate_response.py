@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the /simulate response serialisation paths on a realistic histogram."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.simulation_mappers import result_to_response, result_to_response_payload  # noqa: E402
+from backend.simulation_models import SimulationCommand, SimulationResult  # noqa: E402
+from backend.simulation_service import run_simulation  # noqa: E402
+from backend.simulation_value_objects import SimulationSeed  # noqa: E402
+from Scripts.benchmark_common import emit_report, measure, positive_int  # noqa: E402
+
+BENCHMARK_SAMPLES = [0, 3, 7, 12, 18, 25, 31, 40, 2, 9, 15, 22]
+
+
+def build_benchmark_result(n_sims: int = 20_000) -> SimulationResult:
+    command = SimulationCommand.create(
+        throughput_samples=BENCHMARK_SAMPLES,
+        include_zero_weeks=False,
+        mode="weeks_to_items",
+        backlog_size=None,
+        target_weeks=26,
+        n_sims=n_sims,
+        seed=SimulationSeed(20260226),
+    )
+    return run_simulation(command)
+
+
+def serialise_legacy(result: SimulationResult) -> bytes:
+    """Former path: Pydantic model, re-validation, ``jsonable_encoder`` and stdlib JSON."""
+
+    model = result_to_response(result)
+    content = jsonable_encoder(model, exclude_none=True)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def serialise_fast(result: SimulationResult, histogram_format: str = "buckets") -> bytes:
+    return orjson.dumps(result_to_response_payload(result, histogram_format=histogram_format))
+
+
+def run_benchmark(result: SimulationResult, *, iterations: int, repeats: int) -> dict[str, Any]:
+    paths = {
+        "legacy_pydantic_stdlib": lambda: serialise_legacy(result),
+        "fast_orjson_buckets": lambda: serialise_fast(result),
+        "fast_orjson_arrays": lambda: serialise_fast(result, "arrays"),
+    }
+    timings = {
+        name: {
+            **measure(operation, iterations=iterations, repeats=repeats),
+            "bytes": len(operation()),
+        }
+        for name, operation in paths.items()
+    }
+    legacy_ns = timings["legacy_pydantic_stdlib"]["ns_per_op"]
+    for timing in timings.values():
+        timing["speedup_vs_legacy"] = round(legacy_ns / timing["ns_per_op"], 2)
+    return {
+        "benchmark": "simulate_response_serialisation",
+        "histogram_buckets": len(result.result_distribution.buckets),
+        "iterations": iterations,
+        "repeats": repeats,
+        "paths": timings,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=positive_int, default=2000)
+    parser.add_argument("--repeats", type=positive_int, default=5)
+    parser.add_argument("--n-sims", type=positive_int, default=20_000)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+    result = build_benchmark_result(args.n_sims)
+    report = run_benchmark(result, iterations=args.iterations, repeats=args.repeats)
+    emit_report(report, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Time the static source analysers without cache, from a cold cache, warm and after edits."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "Scripts"))
+
+from benchmark_common import emit_report, positive_int  # noqa: E402
+from check_maintainability import _source_texts  # noqa: E402
+from dependency_graph import collect_import_edges, repository_paths, source_texts  # noqa: E402
+from maintainability_config import read_json  # noqa: E402
+from maintainability_dependencies import collect_dependencies  # noqa: E402
+from maintainability_metrics import collect_metric_debt  # noqa: E402
+from source_analysis_cache import SourceAnalysisCache  # noqa: E402
+
+Analysis = Callable[[SourceAnalysisCache | None], Any]
+
+
+def repository_analysis(
+    graph_texts: dict[str, str], maintainability_texts: dict[str, str], limits: dict[str, int]
+) -> Analysis:
+    """The parsing work of ``report_dependency_graph.py`` and ``check_maintainability.py``."""
+
+    visible = set(graph_texts)
+
+    def analyse(cache: SourceAnalysisCache | None) -> Any:
+        return (
+            collect_import_edges(graph_texts, visible, cache),
+            collect_dependencies(maintainability_texts, cache),
+            collect_metric_debt(maintainability_texts, limits, cache),
+        )
+
+    return analyse
+
+
+def edit_sources(texts: dict[str, str], count: int, revision: int) -> None:
+    """Append a comment to the first ``count`` files so their cache keys change."""
+
+    for path in sorted(texts)[:count]:
+        marker = "#" if path.endswith(".py") else "//"
+        texts[path] += f"\n{marker} benchmark edit {revision}\n"
+
+
+def _seconds(operation: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    operation()
+    return time.perf_counter() - started
+
+
+def run_scenarios(
+    root: Path, *, changed: int, repeats: int, workers: int
+) -> dict[str, dict[str, Any]]:
+    graph_texts = source_texts(root, repository_paths(root))
+    config = read_json(root / "config" / "maintainability.json", "maintainability config")
+    maintainability_texts = _source_texts(root, config)
+    analyse = repository_analysis(graph_texts, maintainability_texts, config["limits"])
+    timings: dict[str, list[float]] = {"full": [], "cold": [], "warm": [], "incremental": []}
+    parsed = len(graph_texts) + 2 * len(maintainability_texts)
+    files: dict[str, dict[str, int]] = {"full": {"reused": 0, "extracted": parsed}}
+    for revision in range(repeats):
+        timings["full"].append(_seconds(lambda: analyse(None)))
+        with tempfile.TemporaryDirectory() as directory:
+            for scenario in ("cold", "warm", "incremental"):
+                if scenario == "incremental":
+                    edit_sources(graph_texts, changed, revision)
+                    edit_sources(maintainability_texts, changed, revision)
+                cache = SourceAnalysisCache(Path(directory), workers=workers)
+                timings[scenario].append(_seconds(lambda: analyse(cache)))
+                files[scenario] = {"reused": cache.reused, "extracted": cache.extracted}
+    return {
+        scenario: {"seconds": round(min(values), 4), **files[scenario]}
+        for scenario, values in timings.items()
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--root", type=Path, default=ROOT)
+    parser.add_argument("--changed", type=positive_int, default=5)
+    parser.add_argument("--repeats", type=positive_int, default=3)
+    parser.add_argument("--workers", type=positive_int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+    scenarios = run_scenarios(
+        args.root.resolve(), changed=args.changed, repeats=args.repeats, workers=args.workers
+    )
+    full = scenarios["full"]["seconds"]
+    report = {
+        "benchmark": "source_analysis_cache",
+        "changed_files": args.changed,
+        "workers": args.workers,
+        "scenarios": scenarios,
+        "incremental_speedup": round(full / max(scenarios["incremental"]["seconds"], 1e-9), 1),
+    }
+    emit_report(report, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
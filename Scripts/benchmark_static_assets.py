@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Benchmark in-process requests/second for frontend asset serving, legacy versus precompressed."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from fastapi.staticfiles import StaticFiles
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend import api_static  # noqa: E402
+from Scripts.benchmark_common import emit_report, positive_int  # noqa: E402
+
+ASSET_PATH = "/assets/index-bench.js"
+
+
+def build_sample_dist(target: Path, asset_kib: int = 256) -> Path:
+    """Write a synthetic Vite-like build with gzip variants, as ``npm run precompress`` would."""
+
+    (target / "assets").mkdir(parents=True, exist_ok=True)
+    chunk = b"export const value = Math.max(1, 2) + 'monte-carlo';\n"
+    asset = chunk * (asset_kib * 1024 // len(chunk))
+    index = b"<!doctype html><html><head><script src='/assets/index-bench.js'></script></head>"
+    for relative, body in (("index.html", index), ("assets/index-bench.js", asset)):
+        (target / relative).write_bytes(body)
+        (target / f"{relative}.gz").write_bytes(gzip.compress(body, compresslevel=9))
+    return target
+
+
+def legacy_app(front_dir: Path) -> FastAPI:
+    """Former mount: plain ``StaticFiles``, which also answered ``/`` from disk."""
+
+    app = FastAPI()
+    app.mount("/", StaticFiles(directory=str(front_dir), html=True), name="front")
+    return app
+
+
+def optimised_app(front_dir: Path) -> FastAPI:
+    app = FastAPI()
+    original = api_static._front_dist_dir
+    api_static._front_dist_dir = lambda: front_dir
+    try:
+        api_static.mount_frontend(app)
+    finally:
+        api_static._front_dist_dir = original
+    return app
+
+
+async def _requests_per_second(
+    app: FastAPI, path: str, headers: dict[str, str], requests: int
+) -> dict[str, Any]:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        first = await client.get(path, headers=headers)
+        started = time.perf_counter()
+        for _ in range(requests):
+            await client.get(path, headers=headers)
+        elapsed = time.perf_counter() - started
+    return {
+        "status": first.status_code,
+        "wire_bytes": int(first.headers.get("content-length", 0)),
+        "requests_per_second": round(requests / max(elapsed, 1e-9), 1),
+    }
+
+
+def run_benchmark(front_dir: Path, *, requests: int) -> dict[str, Any]:
+    legacy = legacy_app(front_dir)
+    optimised = optimised_app(front_dir)
+    gzip_headers = {"accept-encoding": "gzip"}
+    scenarios = {
+        "legacy_asset": (legacy, ASSET_PATH, gzip_headers),
+        "precompressed_asset": (optimised, ASSET_PATH, gzip_headers),
+        "legacy_index": (legacy, "/", gzip_headers),
+        "cached_index": (optimised, "/", gzip_headers),
+    }
+
+    async def _run() -> dict[str, Any]:
+        results = {
+            name: await _requests_per_second(app, path, headers, requests)
+            for name, (app, path, headers) in scenarios.items()
+        }
+        transport = httpx.ASGITransport(app=optimised)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            etag = (await client.get(ASSET_PATH, headers=gzip_headers)).headers["etag"]
+        results["revalidated_asset_304"] = await _requests_per_second(
+            optimised, ASSET_PATH, {**gzip_headers, "if-none-match": etag}, requests
+        )
+        return results
+
+    return {
+        "benchmark": "static_asset_serving",
+        "requests": requests,
+        "scenarios": asyncio.run(_run()),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=positive_int, default=500)
+    parser.add_argument("--asset-kib", type=positive_int, default=256)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        front_dir = build_sample_dist(Path(temp_dir) / "dist", args.asset_kib)
+        emit_report(run_benchmark(front_dir, requests=args.requests), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
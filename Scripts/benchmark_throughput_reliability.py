@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Micro-benchmark the throughput reliability metrics at the maximum sample count."""
+
+from __future__ import annotations
+
+import argparse
+import math
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.prepared_samples import prepare_samples  # noqa: E402
+from backend.simulation_limits import SIMULATION_THROUGHPUT_SAMPLES_MAX  # noqa: E402
+from backend.simulation_value_objects import (  # noqa: E402
+    ThroughputReliability,
+    ThroughputSamples,
+)
+from backend.throughput_reliability import (  # noqa: E402
+    calculate_throughput_reliability,
+    throughput_reliability_from_array,
+)
+from Scripts.benchmark_common import emit_report, measure, positive_int  # noqa: E402
+
+# A ten-year weekly history with a slow upward drift.
+BENCHMARK_SAMPLES = [
+    (index * 7) % 13 + index // 40 for index in range(SIMULATION_THROUGHPUT_SAMPLES_MAX)
+]
+
+
+def _quantile(sorted_values: list[int], level: float) -> float:
+    position = (len(sorted_values) - 1) * level
+    lower_index = math.floor(position)
+    upper_index = min(lower_index + 1, len(sorted_values) - 1)
+    weight = position - lower_index
+    lower_value = sorted_values[lower_index]
+    return lower_value + weight * (sorted_values[upper_index] - lower_value)
+
+
+def python_loops(samples: list[int]) -> ThroughputReliability:
+    """Former path: per-sample checks, generator sums and a sorted tuple."""
+
+    values = tuple(samples)
+    if any(type(value) is not int or value < 0 for value in values):
+        raise ValueError("invalid samples")
+    count = len(values)
+    mean = sum(values) / count
+    variance = sum((value - mean) ** 2 for value in values) / count
+    sorted_values = sorted(values)
+    q25, median, q75 = (_quantile(sorted_values, level) for level in (0.25, 0.5, 0.75))
+    mean_x = (count - 1) / 2
+    denominator = sum((index - mean_x) ** 2 for index in range(count))
+    numerator = sum((index - mean_x) * (value - mean) for index, value in enumerate(values))
+    slope = numerator / denominator if denominator > 0 else 0.0
+    return ThroughputReliability.create(
+        cv=math.sqrt(variance) / mean if mean > 0 else 0.0,
+        iqr_ratio=(q75 - q25) / median if median > 0 else 0.0,
+        slope_norm=slope / mean if mean > 0 else 0.0,
+        samples_count=count,
+        mean=mean,
+    )
+
+
+def run_benchmark(*, iterations: int, repeats: int) -> dict[str, Any]:
+    prepared = np.asarray(BENCHMARK_SAMPLES, dtype=np.int64)
+    history = ThroughputSamples.create(BENCHMARK_SAMPLES, include_zero_weeks=True)
+    paths = {
+        "python_loops": lambda: python_loops(BENCHMARK_SAMPLES),
+        "numpy_from_list": lambda: calculate_throughput_reliability(BENCHMARK_SAMPLES),
+        "numpy_prepared_array": lambda: throughput_reliability_from_array(prepared),
+        "cached_prepared_samples": lambda: prepare_samples(history).reliability,
+    }
+    timings = {
+        name: measure(operation, iterations=iterations, repeats=repeats)
+        for name, operation in paths.items()
+    }
+    loops_ns = timings["python_loops"]["ns_per_op"]
+    for name in list(paths)[1:]:
+        timings[name]["speedup_vs_python_loops"] = round(loops_ns / timings[name]["ns_per_op"], 2)
+    return {
+        "benchmark": "throughput_reliability",
+        "samples_count": len(BENCHMARK_SAMPLES),
+        "iterations": iterations,
+        "repeats": repeats,
+        "paths": timings,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=positive_int, default=2000)
+    parser.add_argument("--repeats", type=positive_int, default=5)
+    parser.add_argument("--output", type=Path)
+    args = parser.parse_args(argv)
+    emit_report(run_benchmark(iterations=args.iterations, repeats=args.repeats), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,10 +7,12 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from Scripts.benchmark_common import positive_int  # noqa: E402
 from Scripts.statistical_distribution_calibration import (  # noqa: E402
     build_calibration_report,
 )
@@ -26,6 +28,34 @@ from Scripts.statistical_distribution_protocol import (  # noqa: E402
 DEFAULT_OUTPUT = ROOT / "reports/statistical-distribution-calibration.json"
 
 
+def run_control(
+    *,
+    protocol_path: Path = PROTOCOL_PATH,
+    protocol_schema_path: Path = PROTOCOL_SCHEMA_PATH,
+    seeds_path: Path = SEEDS_PATH,
+    seeds_schema_path: Path = SEEDS_SCHEMA_PATH,
+    output: Path = DEFAULT_OUTPUT,
+    workers: int = 1,
+) -> dict[str, Any]:
+    """Write and return the calibration; raises ``ProtocolBundleError`` for an invalid bundle."""
+    protocol, _seeds, _corpus = validate_protocol_bundle(
+        protocol_path=protocol_path,
+        protocol_schema_path=protocol_schema_path,
+        seeds_path=seeds_path,
+        seeds_schema_path=seeds_schema_path,
+    )
+    report = build_calibration_report(protocol, workers=workers)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(
+        json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8",
+    )
+    return report
+
+
+def exit_status(report: dict[str, Any]) -> int:
+    return 0 if report["status"] == "calibrated" else 1
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--protocol", type=Path, default=PROTOCOL_PATH)
@@ -33,22 +63,22 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--seeds", type=Path, default=SEEDS_PATH)
     parser.add_argument("--seeds-schema", type=Path, default=SEEDS_SCHEMA_PATH)
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument(
+        "--workers", type=positive_int, default=1, help="processus pour les cellules de la grille",
+    )
     args = parser.parse_args(argv)
     try:
-        protocol, _seeds, _corpus = validate_protocol_bundle(
+        report = run_control(
             protocol_path=args.protocol,
             protocol_schema_path=args.protocol_schema,
             seeds_path=args.seeds,
             seeds_schema_path=args.seeds_schema,
+            output=args.output,
+            workers=args.workers,
         )
     except ProtocolBundleError as exc:
         print(f"Calibration impossible ({exc.classification}).")
         return 1
-    report = build_calibration_report(protocol)
-    args.output.parent.mkdir(parents=True, exist_ok=True)
-    args.output.write_text(
-        json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8",
-    )
     sensitivity_values = [
         value
         for key, value in report["production_sensitivity"].items()
@@ -59,7 +89,7 @@ def main(argv: list[str] | None = None) -> int:
         f"faux positifs={report['false_positive']['observed_rate']}, "
         f"puissance minimale={min(sensitivity_values)}."
     )
-    return 0 if report["status"] == "calibrated" else 1
+    return exit_status(report)
 
 
 if __name__ == "__main__":
@@ -38,11 +38,14 @@ TARGET_FILES = (
     "backend/api_models.py",
     "backend/api_routes_simulate.py",
     "backend/simulation_store.py",
+    "backend/async_simulation_store.py",
     "frontend/vite.config.js",
     "Dockerfile",
     "docker-compose.yml",
 )
 
+IDENTITY_006_STORE_FILES = ("backend/simulation_store.py", "backend/async_simulation_store.py")
+
 RULE_DETAILS = {
     "IDENTITY-001": (
         "Forbidden Azure DevOps proxy or relay route.",
@@ -148,7 +151,7 @@ def _extract_python_block(path: Path, block_kind: str, name: str) -> list[tuple[
     start_index: int | None = None
     base_indent = 0
     header_complete = False
-    pattern = re.compile(rf"^(?P<indent>\s*){block_kind}\s+{re.escape(name)}\b")
+    pattern = re.compile(rf"^(?P<indent>\s*)(?:async\s+)?{block_kind}\s+{re.escape(name)}\b")
     for index, (_, line) in enumerate(lines):
         match = pattern.match(line)
         if match:
@@ -397,35 +400,24 @@ def _collect_identity_005(root: Path) -> list[Violation]:
 
 
 def _collect_identity_006(root: Path) -> list[Violation]:
-    path = root / "backend/simulation_store.py"
-    if not path.exists():
-        return []
-
-    block = _extract_python_block(path, "def", "save_simulation")
-    return _collect_tokens_in_block(path, "IDENTITY-006", block, FORBIDDEN_BACKEND_FIELDS)
+    violations: list[Violation] = []
+    for path in filter(Path.exists, map(root.joinpath, IDENTITY_006_STORE_FILES)):
+        block = _extract_python_block(path, "def", "save_simulation")
+        violations.extend(
+            _collect_tokens_in_block(path, "IDENTITY-006", block, FORBIDDEN_BACKEND_FIELDS)
+        )
+    return violations
 
 
 def _collect_identity_007(root: Path) -> list[Violation]:
-    violations: list[Violation] = []
     model_path = root / "backend/api_models.py"
     route_path = root / "backend/api_routes_simulate.py"
-    violations.extend(
-        _collect_tokens_in_block(
-            model_path,
-            "IDENTITY-007",
-            _extract_python_block(model_path, "class", "SimulationHistoryItem"),
-            FORBIDDEN_BACKEND_FIELDS,
-        )
-    )
-    violations.extend(
-        _collect_tokens_in_block(
-            route_path,
-            "IDENTITY-007",
-            _extract_python_block(route_path, "def", "simulation_history"),
-            FORBIDDEN_BACKEND_FIELDS,
-        )
-    )
-    return violations
+    model = _extract_python_block(model_path, "class", "SimulationHistoryItem")
+    route = _extract_python_block(route_path, "def", "simulation_history")
+    return [
+        *_collect_tokens_in_block(model_path, "IDENTITY-007", model, FORBIDDEN_BACKEND_FIELDS),
+        *_collect_tokens_in_block(route_path, "IDENTITY-007", route, FORBIDDEN_BACKEND_FIELDS),
+    ]
 
 
 def _collect_identity_008(root: Path) -> list[Violation]:
@@ -16,6 +16,11 @@ from maintainability_config import load_inputs, read_json
 from maintainability_dependencies import collect_dependencies, cyclic_components
 from maintainability_metrics import collect_metric_debt
 from maintainability_ratchet import compare_snapshot
+from source_analysis_cache import (
+    SourceAnalysisCache,
+    add_cache_arguments,
+    cache_from_arguments,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_CONFIG = ROOT / "config" / "maintainability.json"
@@ -99,15 +104,18 @@ def _mojibake_debt(root: Path, paths: list[str]) -> list[dict[str, Any]]:
 
 
 def build_snapshot(
-    root: Path, config: dict[str, Any], tracked_paths: list[str] | None = None
+    root: Path,
+    config: dict[str, Any],
+    tracked_paths: list[str] | None = None,
+    cache: SourceAnalysisCache | None = None,
 ) -> dict[str, Any]:
     paths = sorted(normalize_path(path) for path in (tracked_paths or _tracked_paths(root)))
     texts = _source_texts(root, config)
-    dependencies = collect_dependencies(texts)
+    dependencies = collect_dependencies(texts, cache)
     return {
         "schemaVersion": SCHEMA_VERSION,
         "limits": config["limits"],
-        "metrics": collect_metric_debt(texts, config["limits"]),
+        "metrics": collect_metric_debt(texts, config["limits"], cache),
         "cycles": cyclic_components(set(texts), dependencies),
         "dependencyViolations": _direction_violations(dependencies, config),
         "mojibake": _mojibake_debt(root, paths),
@@ -125,10 +133,11 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
     parser.add_argument("--exceptions", type=Path, default=DEFAULT_EXCEPTIONS)
     parser.add_argument("--write-baseline", action="store_true")
+    add_cache_arguments(parser)
     args = parser.parse_args(argv)
     try:
         config = read_json(args.config, "maintainability config")
-        snapshot = build_snapshot(args.root.resolve(), config)
+        snapshot = build_snapshot(args.root.resolve(), config, cache=cache_from_arguments(args))
         if args.write_baseline:
             _write_baseline(args.baseline, snapshot)
             print(f"Maintainability baseline written: {args.baseline}")
@@ -5,6 +5,10 @@ check_no_secrets.py
 Fail fast if staged files contain obvious secrets or non-fake ADO test data.
 
 - Scans only staged files (git index), not the whole repo.
+- Reads every staged blob through a single `git cat-file --batch` process.
+- Looks up rule literals in the case-folded text of each file and tests only
+  the lines holding one against the rules; large commits are scanned in
+  parallel.
 - Ignores binaries and large files.
 - Exits 1 if it detects a potential secret.
 
@@ -13,15 +17,23 @@ Recommended integration: .git/hooks/pre-commit
 
 from __future__ import annotations
 
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Tuple
+
+from check_no_secrets_lookup import RuleSet, candidate_lines, read_staged_blobs
 
 # --- Tuning knobs ---
 MAX_FILE_BYTES = 1_000_000  # 1 MB max per file (avoid scanning big blobs)
+# Below this many staged bytes, starting worker processes costs more than the scan.
+PARALLEL_MIN_BYTES = 4_000_000
+DEFAULT_WORKERS = os.cpu_count() or 1
 SKIP_EXTENSIONS = {
     ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico",
     ".pdf", ".zip", ".7z", ".rar",
@@ -48,6 +60,15 @@ ADO_ALLOWED_PLACEHOLDER_PREFIXES = (
     "EXAMPLE_",
     "SAMPLE_",
 )
+ADO_NON_PROD_VALUE_PATTERNS = tuple(
+    re.compile(pattern)
+    for pattern in (
+        r'^\s*(?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))\s*[:=]\s*["\']?(?P<value>[^"\']+?)["\']?\s*$',
+        r'^\s*(?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))\s*:\s*(?P<value>[^#\n]+?)\s*$',
+        r'(?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))["\']?\s*,\s*["\'](?P<value>[^"\']+)["\']',
+        r'setenv\(\s*["\'](?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))["\']\s*,\s*["\'](?P<value>[^"\']+)["\']\s*\)',
+    )
+)
 ADO_ALLOWED_PLACEHOLDER_VALUES = {
     "",
     "<SET_ME>",
@@ -116,29 +137,19 @@ def is_probably_binary(data: bytes) -> bool:
     return b"\x00" in data
 
 
-def read_staged_file_bytes(path: str) -> Optional[bytes]:
-    """
-    Read the staged version (from git index), not the working tree.
-    Uses: git show :path
-    """
-    code, out, err = run_git(["show", f":{path}"])
-    if code != 0:
-        # Might happen for submodules or weird entries; ignore.
-        return None
-    # `out` is text; convert back to bytes conservatively.
-    # We re-run with -p? Not needed. We'll encode to bytes for binary detection.
-    return out.encode("utf-8", errors="replace")
-
-
-def compile_rules() -> List[Tuple[str, re.Pattern]]:
+@lru_cache(maxsize=None)
+def compile_rules() -> RuleSet:
     """
     Rules:
     - ADO_PAT assignment
     - Generic token patterns
     - Private key blocks
     - Common cloud keys/tokens (lightweight)
+
+    Each rule carries lower-case literals, one of which every case-folded match
+    contains: only the lines holding a literal are tested against the rules.
     """
-    rules: List[Tuple[str, str]] = [
+    rules: List[Tuple[str, str, Tuple[str, ...]]] = [
         # Azure DevOps PAT: only if ADO_PAT is set to a non-empty non-placeholder value
         (
             "ADO_PAT set",
@@ -147,6 +158,7 @@ def compile_rules() -> List[Tuple[str, re.Pattern]]:
                 r"(?!<SET_ME>|SET_ME|CHANGEME|CHANGE_ME|YOUR_TOKEN|PASTE|PASTE_YOUR_TOKEN_HERE)"
                 r"[^'\"\s]{8,}"
             ),
+            ("ado_pat",),
         ),
 
         # Generic token assignment: require a quoted literal or long-looking value
@@ -154,19 +166,28 @@ def compile_rules() -> List[Tuple[str, re.Pattern]]:
         (
             "Generic token assignment",
             r"(?i)\b(token|api[_-]?key|secret|password)\s*[:=]\s*['\"][^'\"]{8,}['\"]",
+            ("token", "apikey", "api_key", "api-key", "secret", "password"),
         ),
 
         # GitHub tokens (classic + fine-grained formats)
-        ("GitHub token", r"\bgh[pousr]_[A-Za-z0-9]{20,}\b"),
+        ("GitHub token", r"\bgh[pousr]_[A-Za-z0-9]{20,}\b",
+         ("ghp_", "gho_", "ghu_", "ghs_", "ghr_")),
 
         # AWS access key id (basic)
-        ("AWS Access Key ID", r"\bAKIA[0-9A-Z]{16}\b"),
+        ("AWS Access Key ID", r"\bAKIA[0-9A-Z]{16}\b", ("akia",)),
 
         # Private key blocks
-        ("Private key block", r"-----BEGIN (RSA|DSA|EC|OPENSSH|PGP) PRIVATE KEY-----"),
+        (
+            "Private key block",
+            r"-----BEGIN (RSA|DSA|EC|OPENSSH|PGP) PRIVATE KEY-----",
+            ("-----begin ",),
+        ),
     ]
 
-    return [(name, re.compile(pattern)) for name, pattern in rules]
+    return RuleSet(
+        rules=tuple((name, re.compile(pattern)) for name, pattern, _literals in rules),
+        literals=tuple(literal for _name, _pattern, group in rules for literal in group),
+    )
 
 
 def is_allowed_ado_placeholder(value: str) -> bool:
@@ -181,20 +202,17 @@ def scan_ado_non_prod_values(path: str, text: str) -> List[Finding]:
         return []
 
     findings: List[Finding] = []
-    patterns = [
-        r'^\s*(?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))\s*[:=]\s*["\']?(?P<value>[^"\']+?)["\']?\s*$',
-        r'^\s*(?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))\s*:\s*(?P<value>[^#\n]+?)\s*$',
-        r'(?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))["\']?\s*,\s*["\'](?P<value>[^"\']+)["\']',
-        r'setenv\(\s*["\'](?P<name>ADO_(?:ORG|PROJECT|TEAM|UUID))["\']\s*,\s*["\'](?P<value>[^"\']+)["\']\s*\)',
-    ]
+    # Every pattern names an ADO_ variable.
+    if "ADO_" not in text:
+        return findings
 
     for i, line in enumerate(text.splitlines(), start=1):
         stripped = line.lstrip()
         if stripped.startswith("#") or stripped.startswith("//"):
             continue
 
-        for pattern in patterns:
-            match = re.search(pattern, line)
+        for pattern in ADO_NON_PROD_VALUE_PATTERNS:
+            match = pattern.search(line)
             if not match:
                 continue
 
@@ -227,10 +245,12 @@ def mask_excerpt(line: str) -> str:
     return s[:12] + "â€¦" + s[-8:]
 
 
-def scan_text(path: str, text: str, rules: List[Tuple[str, re.Pattern]]) -> List[Finding]:
+def scan_text(path: str, text: str, rules: RuleSet) -> List[Finding]:
     findings: List[Finding] = []
-    lines = text.splitlines()
-    for i, line in enumerate(lines, start=1):
+    indexes = candidate_lines(text, rules)
+    lines = text.splitlines() if indexes else []
+    for index in indexes:
+        i, line = index + 1, lines[index]
         # Skip commented lines (common in .env / yaml / ini)
         stripped = line.lstrip()
         if stripped.startswith("#") or stripped.startswith("//"):
@@ -251,6 +271,22 @@ def scan_text(path: str, text: str, rules: List[Tuple[str, re.Pattern]]) -> List
     return findings
 
 
+def scan_file(path: str, text: str) -> List[Finding]:
+    return scan_text(path, text, compile_rules()) + scan_ado_non_prod_values(path, text)
+
+
+def scan_files(texts: Dict[str, str], workers: int = DEFAULT_WORKERS) -> List[Finding]:
+    """Findings of every file in order, scanned across processes for large commits."""
+    paths = list(texts)
+    if workers > 1 and len(paths) > 1 and sum(map(len, texts.values())) >= PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(paths) // (4 * workers))
+            results = list(pool.map(scan_file, paths, texts.values(), chunksize=chunksize))
+    else:
+        results = [scan_file(path, texts[path]) for path in paths]
+    return [finding for findings in results for finding in findings]
+
+
 def main() -> int:
     # Quick check: must be in a git repo
     code, _, _ = run_git(["rev-parse", "--is-inside-work-tree"])
@@ -262,23 +298,16 @@ def main() -> int:
     if not staged_files:
         return 0
 
-    rules = compile_rules()
-    all_findings: List[Finding] = []
-
-    for path in staged_files:
-        if should_skip_file(path):
-            continue
-
-        data = read_staged_file_bytes(path)
-        if data is None:
-            continue
-        if is_probably_binary(data):
-            continue
-
-        text = data.decode("utf-8", errors="replace")
-
-        all_findings.extend(scan_text(path, text, rules))
-        all_findings.extend(scan_ado_non_prod_values(path, text))
+    blobs = read_staged_blobs(
+        [path for path in staged_files if not should_skip_file(path)], MAX_FILE_BYTES
+    )
+    all_findings = scan_files(
+        {
+            path: data.decode("utf-8", errors="replace")
+            for path, data in blobs.items()
+            if data is not None and not is_probably_binary(data)
+        }
+    )
 
     if all_findings:
         print(
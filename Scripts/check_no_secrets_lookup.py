@@ -0,0 +1,87 @@
+"""
+check_no_secrets_lookup.py
+Batch read of staged blobs and literal line lookup for check_no_secrets.py.
+"""
+
+from __future__ import annotations
+
+import re
+import subprocess
+from bisect import bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass
+from itertools import accumulate
+
+BATCH_HEADER = re.compile(rb"[0-9a-f]+ (\w+) (\d+)")
+
+
+def read_staged_blobs(paths: list[str], max_bytes: int) -> dict[str, bytes | None]:
+    """
+    Read the staged version (from git index) of every path, not the working tree.
+    Uses one `git cat-file --batch` process fed with `:path` lines.
+    Missing entries, submodules and blobs over `max_bytes` map to None.
+    """
+    blobs: dict[str, bytes | None] = dict.fromkeys(paths)
+    # A path containing a newline cannot be named on the batch input.
+    requested = [path for path in paths if "\n" not in path]
+    if not requested:
+        return blobs
+    p = subprocess.run(
+        ["git", "cat-file", "--batch"],
+        input="".join(f":{path}\n" for path in requested).encode("utf-8"),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    if p.returncode != 0:
+        return blobs
+    out, offset = p.stdout, 0
+    for path in requested:
+        # git answers every input line with exactly one header line.
+        end = out.index(b"\n", offset)
+        header = BATCH_HEADER.fullmatch(out, offset, end)
+        offset = end + 1
+        if header is None:
+            # "<name> missing" or "<name> ambiguous": nothing follows the header.
+            continue
+        size = int(header.group(2))
+        if header.group(1) == b"blob" and size <= max_bytes:
+            blobs[path] = out[offset : offset + size]
+        offset += size + 1
+    return blobs
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """Rules in reporting order, and the literals one of which each of their matches holds."""
+
+    rules: tuple[tuple[str, re.Pattern], ...]
+    literals: tuple[str, ...]
+
+    def __iter__(self) -> Iterator[tuple[str, re.Pattern]]:
+        return iter(self.rules)
+
+
+def fold_case(text: str) -> str:
+    """
+    Lower-case text without changing its length, so that every `(?i)` match of
+    an ASCII literal is found at the same offset in the result. Besides the
+    lower-case mapping, `re` also folds these three letters onto ASCII ones.
+    """
+    if not text.isascii():
+        text = text.replace("\u0130", "I").replace("\u017f", "s").replace("\u0131", "i")
+    return text.lower()
+
+
+def candidate_lines(text: str, rules: RuleSet) -> list[int]:
+    """Zero-based indexes, in `text.splitlines()`, of the lines holding a rule literal."""
+    folded = fold_case(text)
+    offsets = []
+    for literal in rules.literals:
+        offset = folded.find(literal)
+        while offset >= 0:
+            offsets.append(offset)
+            offset = folded.find(literal, offset + len(literal))
+    if not offsets:
+        return []
+    ends = list(accumulate(map(len, text.splitlines(keepends=True))))
+    return sorted({bisect_right(ends, offset) for offset in offsets})
@@ -5,23 +5,34 @@ from __future__ import annotations
 
 import argparse
 import sys
+from functools import partial
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from Scripts.source_analysis_cache import (  # noqa: E402
+    add_cache_arguments,
+    cache_from_arguments,
+)
 from Scripts.test_classification_compliance import (  # noqa: E402
     compliance_summary,
     validate_repository,
 )
+from Scripts.test_classifier_discovery import discover_all  # noqa: E402
 
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--root", type=Path, default=ROOT)
     parser.add_argument("--node-command", default="node")
+    add_cache_arguments(parser)
     args = parser.parse_args(argv)
-    errors = validate_repository(args.root, node_command=args.node_command)
+    errors = validate_repository(
+        args.root,
+        node_command=args.node_command,
+        discoverer=partial(discover_all, cache=cache_from_arguments(args)),
+    )
     if errors:
         print("ERROR: test classification compliance failed.", file=sys.stderr)
         for error in errors:
@@ -13,6 +13,15 @@ from typing import Any
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from Scripts.report_json_io import (  # noqa: E402
+    reject_duplicate_keys as _reject_duplicate_keys,
+)
+from Scripts.report_json_io import write_json_report  # noqa: E402
+from Scripts.source_analysis_cache import (  # noqa: E402
+    SourceAnalysisCache,
+    add_cache_arguments,
+    cache_from_arguments,
+)
 from Scripts.test_classifier_discovery import discover_all  # noqa: E402
 from Scripts.test_classifier_engine import classify_inventory  # noqa: E402
 
@@ -21,15 +30,6 @@ DEFAULT_OVERRIDES = Path("config/test-classification-overrides.json")
 DEFAULT_OUTPUT = Path("reports/test-classification-inventory.json")
 
 
-def _reject_duplicate_keys(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-    for key, value in pairs:
-        if key in result:
-            raise ValueError(f"Duplicate JSON property: {key}")
-        result[key] = value
-    return result
-
-
 def load_json(path: Path) -> dict[str, Any]:
     value = json.loads(path.read_text(encoding="utf-8"), object_pairs_hook=_reject_duplicate_keys)
     if not isinstance(value, dict):
@@ -47,20 +47,15 @@ def generate_inventory(
     overrides_path: Path = DEFAULT_OVERRIDES,
     output_path: Path = DEFAULT_OUTPUT,
     node_command: str = "node",
+    cache: SourceAnalysisCache | None = None,
 ) -> list[dict[str, Any]]:
     catalog = load_json(root / "config" / "test-classification.json")
     schema = load_json(root / "config" / "test-classification.schema.json")
     rules = load_json(_resolved(root, rules_path))
     overrides = load_json(_resolved(root, overrides_path))
-    cases = discover_all(root, node_command)
+    cases = discover_all(root, node_command, cache)
     inventory = classify_inventory(cases, rules, overrides, catalog, schema)
-    destination = _resolved(root, output_path)
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(
-        json.dumps(inventory, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-        newline="\n",
-    )
+    write_json_report(inventory, _resolved(root, output_path))
     return inventory
 
 
@@ -83,6 +78,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--overrides", type=Path, default=DEFAULT_OVERRIDES)
     parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT)
     parser.add_argument("--node-command", default="node")
+    add_cache_arguments(parser)
     return parser
 
 
@@ -94,6 +90,7 @@ def main(argv: list[str] | None = None) -> int:
         overrides_path=args.overrides,
         output_path=args.output,
         node_command=args.node_command,
+        cache=cache_from_arguments(args),
     )
     overrides = load_json(_resolved(args.root.resolve(), args.overrides))
     print(
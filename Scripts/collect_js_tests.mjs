@@ -14,6 +14,7 @@ function parseOptions(argv) {
   return {
     root: path.resolve(argv[index + 1]),
     typeScript: typeScriptIndex >= 0 ? path.resolve(argv[typeScriptIndex + 1]) : null,
+    filesFromStdin: argv.includes("--files-from-stdin"),
   };
 }
 
@@ -225,7 +226,11 @@ const typeScriptPath =
 if (!fs.existsSync(typeScriptPath)) throw new Error(`TypeScript compiler not found: ${typeScriptPath}`);
 const imported = await import(pathToFileURL(typeScriptPath).href);
 const ts = imported.default ?? imported;
-const result = sourceFiles(root).flatMap((file) => collectFile(ts, root, file));
+// With --files-from-stdin, only the repository-relative files of a JSON array are collected.
+const files = options.filesFromStdin
+  ? JSON.parse(fs.readFileSync(0, "utf8")).map((file) => path.join(root, file))
+  : sourceFiles(root);
+const result = files.flatMap((file) => collectFile(ts, root, file));
 result.sort((left, right) =>
   `${left.framework}\0${left.sourcePath}\0${left.selector}`.localeCompare(
     `${right.framework}\0${right.sourcePath}\0${right.selector}`,
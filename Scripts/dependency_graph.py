@@ -16,6 +16,7 @@ from dependency_graph_common import (
     repository_paths,
     source_texts,
 )
+from source_analysis_cache import SourceAnalysisCache, source_facts
 
 __all__ = [
     "SOURCE_ROOTS",
@@ -60,42 +61,34 @@ def _resolve_python(name: str, fallback: str, modules: dict[str, str]) -> tuple[
     return f"external:python:{package}", "external"
 
 
-def _python_edges(path: str, text: str, modules: dict[str, str]) -> list[dict[str, Any]]:
-    edges: list[dict[str, Any]] = []
+def _python_statements(path: str, text: str) -> list[list[Any]]:
+    statements: list[list[Any]] = []
     for node in ast.walk(ast.parse(text, filename=path)):
         if isinstance(node, ast.Import):
-            for alias in node.names:
-                target, resolution = _resolve_python(alias.name, alias.name, modules)
-                edges.append(
-                    edge(
-                        path,
-                        target,
-                        node.lineno,
-                        "python-import",
-                        "runtime",
-                        alias.name,
-                        resolution,
-                    )
-                )
+            statements.append(["import", node.lineno, "", [alias.name for alias in node.names]])
         elif isinstance(node, ast.ImportFrom):
             base = _absolute_python_module(path, node)
-            resolved: dict[tuple[str, str], str] = {}
-            for alias in node.names:
-                imported = f"{base}.{alias.name}" if base else alias.name
-                target, resolution = _resolve_python(imported, base, modules)
-                resolved[(target, resolution)] = imported if target in modules.values() else base
-            for (target, resolution), specifier in resolved.items():
-                edges.append(
-                    edge(
-                        path,
-                        target,
-                        node.lineno,
-                        "python-from",
-                        "runtime",
-                        specifier,
-                        resolution,
-                    )
-                )
+            statements.append(["from", node.lineno, base, [alias.name for alias in node.names]])
+    return statements
+
+
+def _python_edges(
+    path: str, statements: list[list[Any]], modules: dict[str, str]
+) -> list[dict[str, Any]]:
+    edges: list[dict[str, Any]] = []
+    for statement, line, base, names in statements:
+        if statement == "import":
+            for name in names:
+                target, resolution = _resolve_python(name, name, modules)
+                edges.append(edge(path, target, line, "python-import", "runtime", name, resolution))
+            continue
+        resolved: dict[tuple[str, str], str] = {}
+        for name in names:
+            imported = f"{base}.{name}" if base else name
+            target, resolution = _resolve_python(imported, base, modules)
+            resolved[(target, resolution)] = imported if target in modules.values() else base
+        for (target, resolution), specifier in resolved.items():
+            edges.append(edge(path, target, line, "python-from", "runtime", specifier, resolution))
     return edges
 
 
@@ -120,52 +113,48 @@ def _resolve_js(source: str, specifier: str, paths: set[str]) -> tuple[str, str]
     return (target, "internal") if target else (f"unresolved:{base}", "unresolved")
 
 
-def _js_edges(path: str, text: str, paths: set[str]) -> list[dict[str, Any]]:
-    edges: list[dict[str, Any]] = []
+def _js_statements(text: str) -> list[list[Any]]:
+    statements: list[list[Any]] = []
     for match in JS_STATEMENT.finditer(text):
         body = match.group("body")
         from_match = re.search(r"\bfrom\s*['\"]([^'\"]+)['\"]", body)
         side_effect = re.match(r"\s*['\"]([^'\"]+)['\"]", body)
         specifier = (from_match or side_effect).group(1) if from_match or side_effect else None
         if specifier:
-            target, resolution = _resolve_js(path, specifier, paths)
             phase = "compile" if body.lstrip().startswith("type ") else "runtime"
-            edges.append(
-                edge(
-                    path,
-                    target,
-                    line_number(text, match.start()),
-                    f"js-{match.group('kind')}",
-                    phase,
-                    specifier,
-                    resolution,
-                )
-            )
+            line = line_number(text, match.start())
+            statements.append([line, f"js-{match.group('kind')}", phase, specifier])
     for pattern, kind in ((JS_DYNAMIC, "js-dynamic-import"), (JS_RUNTIME_LOAD, "js-runtime-load")):
         for match in pattern.finditer(text):
-            target, resolution = _resolve_js(path, match.group("name"), paths)
-            edges.append(
-                edge(
-                    path,
-                    target,
-                    line_number(text, match.start()),
-                    kind,
-                    "runtime",
-                    match.group("name"),
-                    resolution,
-                )
+            statements.append(
+                [line_number(text, match.start()), kind, "runtime", match.group("name")]
             )
+    return statements
+
+
+def import_statements(path: str, text: str) -> list[list[Any]]:
+    """Unresolved import statements of one file, as JSON facts for the analysis cache."""
+    return _python_statements(path, text) if path.endswith(".py") else _js_statements(text)
+
+
+def _js_edges(path: str, statements: list[list[Any]], paths: set[str]) -> list[dict[str, Any]]:
+    edges: list[dict[str, Any]] = []
+    for line, kind, phase, specifier in statements:
+        target, resolution = _resolve_js(path, specifier, paths)
+        edges.append(edge(path, target, line, kind, phase, specifier, resolution))
     return edges
 
 
-def collect_import_edges(texts: dict[str, str], all_paths: set[str]) -> list[dict[str, Any]]:
+def collect_import_edges(
+    texts: dict[str, str], all_paths: set[str], cache: SourceAnalysisCache | None = None
+) -> list[dict[str, Any]]:
     modules = _python_modules(set(texts))
     edges: list[dict[str, Any]] = []
-    for path, text in sorted(texts.items()):
+    for path, statements in sorted(source_facts(import_statements, texts, cache).items()):
         edges.extend(
-            _python_edges(path, text, modules)
+            _python_edges(path, statements, modules)
             if path.endswith(".py")
-            else _js_edges(path, text, all_paths)
+            else _js_edges(path, statements, all_paths)
         )
     unique = {tuple(item.values()): item for item in edges}
     return sorted(unique.values(), key=lambda item: tuple(item.values()))
@@ -6,11 +6,13 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from Scripts.schema_registry import schema_overhead  # noqa: E402
 from Scripts.statistical_consolidated_render import finalize_report, write_reports  # noqa: E402
 from Scripts.statistical_consolidated_report import build_consolidated_report  # noqa: E402
 from Scripts.statistical_consolidated_report_validation import validate_report  # noqa: E402
@@ -50,6 +52,13 @@ def run_control(
         return None, [f"Infrastructure failure while generating the report: {exc}"]
 
 
+def exit_status(report: dict[str, object] | None, issues: list[str]) -> int:
+    if issues or report is None:
+        return 1
+    failure_classes = set(report["enforcement"]["generator_failure_classifications"])
+    return 1 if report["verdict"]["status"] in failure_classes else 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--root", type=Path, default=ROOT)
@@ -58,17 +67,20 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--markdown-report", type=Path)
     parser.add_argument("--source-path", action="append", default=[])
     args = parser.parse_args(argv)
-    try:
-        source_paths = parse_source_paths(args.source_path)
-        report, issues = run_control(
-            root=args.root,
-            schema_path=args.schema,
-            json_path=args.json_report,
-            markdown_path=args.markdown_report,
-            source_paths=source_paths,
-        )
-    except ValueError as exc:
-        report, issues = None, [str(exc)]
+    started = time.perf_counter()
+    with schema_overhead() as timings:
+        try:
+            source_paths = parse_source_paths(args.source_path)
+            report, issues = run_control(
+                root=args.root,
+                schema_path=args.schema,
+                json_path=args.json_report,
+                markdown_path=args.markdown_report,
+                source_paths=source_paths,
+            )
+        except ValueError as exc:
+            report, issues = None, [str(exc)]
+    print(timings.render(time.perf_counter() - started), file=sys.stderr)
     if issues or report is None:
         print("Rapport statistique consolidé invalide ou inexécutable.", file=sys.stderr)
         for issue in issues:
@@ -76,8 +88,7 @@ def main(argv: list[str] | None = None) -> int:
         return 1
     verdict = report["verdict"]["status"]
     print(f"Rapport statistique consolidé : verdict={verdict}, enforcement=blocking_in_main.")
-    failure_classes = set(report["enforcement"]["generator_failure_classifications"])
-    return 1 if verdict in failure_classes else 0
+    return exit_status(report, issues)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""Drive ``backend.api:app`` under concurrency and report throughput, latency, timeouts and CPU."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import math
+import os
+import random
+import socket
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.api_config import DEFAULT_CLIENT_COOKIE_NAME  # noqa: E402
+from Scripts.benchmark_common import emit_report, positive_int  # noqa: E402
+from Scripts.load_test_standins import STANDIN_MONGO_URL, STANDIN_REDIS_URL  # noqa: E402
+
+# Assumed request mix, not measured from production traffic: the weights only encode the guess that
+# most forecasts are unsaved backlog runs. Pass ``--mix`` to size workers from an observed mix.
+REQUEST_MIX = (
+    ("simulate_backlog", 45),
+    ("simulate_items", 20),
+    ("simulate_persisted", 20),
+    ("history", 15),
+)
+N_SIMS_MIX = ((1_000, 15), (20_000, 65), (100_000, 15), (200_000, 5))
+VIRTUAL_CLIENTS = 32
+READY_TIMEOUT_SECONDS = 60.0
+FORECAST_TIMEOUT_DETAIL = "Simulation trop longue"
+
+
+@dataclass(frozen=True)
+class PlannedRequest:
+    kind: str
+    method: str
+    path: str
+    client: int
+    payload: dict[str, Any] | None = None
+
+
+@dataclass
+class Outcome:
+    kind: str
+    latency_seconds: float
+    status: int | None
+    forecast_timeout: bool = False
+
+
+@dataclass
+class LoadResult:
+    outcomes: list[Outcome] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+
+def _weighted(rng: random.Random, choices: tuple[tuple[Any, int], ...]) -> Any:
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def _simulate_payload(rng: random.Random, kind: str, max_n_sims: int) -> dict[str, Any]:
+    n_sims = min(_weighted(rng, N_SIMS_MIX), max_n_sims)
+    payload: dict[str, Any] = {
+        "throughput_samples": [rng.randint(0, 15) for _ in range(rng.randint(6, 52))],
+        "include_zero_weeks": rng.random() < 0.5,
+        "n_sims": n_sims,
+    }
+    if kind == "simulate_items":
+        return {**payload, "mode": "weeks_to_items", "target_weeks": rng.randint(4, 26)}
+    return {**payload, "mode": "backlog_to_weeks", "backlog_size": rng.randint(20, 400)}
+
+
+def request_mix(value: str) -> tuple[tuple[str, int], ...]:
+    """Parse ``kind=weight,...`` to replace ``REQUEST_MIX``; kinds left out are not sent."""
+
+    known = {kind for kind, _weight in REQUEST_MIX}
+    mix: dict[str, int] = {}
+    for item in value.split(","):
+        kind, separator, weight = item.strip().partition("=")
+        if not separator or kind not in known or kind in mix or not weight.isdigit():
+            raise argparse.ArgumentTypeError(
+                f"expected distinct kind=weight items among {sorted(known)} with integer "
+                f"weights >= 0, got {item!r}"
+            )
+        mix[kind] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("expected at least one positive weight")
+    return tuple((kind, weight) for kind, weight in mix.items() if weight > 0)
+
+
+def build_plan(
+    requests: int,
+    *,
+    seed: int,
+    max_n_sims: int,
+    mix: tuple[tuple[str, int], ...] = REQUEST_MIX,
+) -> list[PlannedRequest]:
+    """Deterministic request sequence replaying ``mix`` for ``VIRTUAL_CLIENTS`` users."""
+
+    rng = random.Random(seed)
+    plan = []
+    for _ in range(requests):
+        kind = _weighted(rng, mix)
+        client = rng.randrange(VIRTUAL_CLIENTS)
+        if kind == "history":
+            plan.append(PlannedRequest(kind, "GET", "/simulations/history", client))
+        else:
+            payload = _simulate_payload(rng, kind, max_n_sims)
+            plan.append(PlannedRequest(kind, "POST", "/simulate", client, payload))
+    return plan
+
+
+def _headers(request: PlannedRequest) -> dict[str, str]:
+    headers = {"x-forwarded-for": f"10.0.0.{request.client}"}
+    if request.kind in ("simulate_persisted", "history"):
+        headers["cookie"] = f"{DEFAULT_CLIENT_COOKIE_NAME}=load-test-client-{request.client:04d}"
+    return headers
+
+
+async def _send(client: httpx.AsyncClient, request: PlannedRequest) -> Outcome:
+    started = time.perf_counter()
+    try:
+        response = await client.request(
+            request.method, request.path, json=request.payload, headers=_headers(request)
+        )
+    except httpx.TimeoutException:
+        return Outcome(request.kind, time.perf_counter() - started, None)
+    latency = time.perf_counter() - started
+    timed_out = response.status_code == 503 and FORECAST_TIMEOUT_DETAIL in response.text
+    return Outcome(request.kind, latency, response.status_code, timed_out)
+
+
+async def run_load(
+    base_url: str, plan: list[PlannedRequest], *, concurrency: int, client_timeout: float
+) -> LoadResult:
+    pending = iter(plan)
+    result = LoadResult()
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=client_timeout, limits=limits
+    ) as client:
+
+        async def _worker() -> None:
+            for request in pending:
+                result.outcomes.append(await _send(client, request))
+
+        started = time.perf_counter()
+        await asyncio.gather(*(_worker() for _ in range(concurrency)))
+        result.elapsed_seconds = time.perf_counter() - started
+    return result
+
+
+def _percentile_ms(sorted_latencies: list[float], percentile: int) -> float | None:
+    if not sorted_latencies:
+        return None
+    rank = max(math.ceil(percentile / 100 * len(sorted_latencies)), 1)
+    return round(sorted_latencies[rank - 1] * 1000, 2)
+
+
+def summarise_outcomes(outcomes: list[Outcome], elapsed_seconds: float) -> dict[str, Any]:
+    latencies = sorted(outcome.latency_seconds for outcome in outcomes)
+    count = len(outcomes)
+    statuses: dict[str, int] = {}
+    for outcome in outcomes:
+        statuses[str(outcome.status)] = statuses.get(str(outcome.status), 0) + 1
+    failures = sum(outcome.status != 200 for outcome in outcomes)
+    timeouts = sum(outcome.forecast_timeout for outcome in outcomes)
+    return {
+        "requests": count,
+        "throughput_rps": round(count / elapsed_seconds, 2) if elapsed_seconds else 0.0,
+        "p50_ms": _percentile_ms(latencies, 50),
+        "p95_ms": _percentile_ms(latencies, 95),
+        "p99_ms": _percentile_ms(latencies, 99),
+        "timeout_rate": round(timeouts / count, 4) if count else 0.0,
+        "error_rate": round(failures / count, 4) if count else 0.0,
+        "statuses": statuses,
+    }
+
+
+def process_tree_cpu_seconds(pid: int) -> float | None:
+    """User + system CPU of ``pid`` and its live children, read from ``/proc`` (Linux only)."""
+
+    pending, total, clock_ticks = [pid], 0.0, os.sysconf("SC_CLK_TCK")
+    while pending:
+        current = pending.pop()
+        try:
+            fields = Path(f"/proc/{current}/stat").read_text().rsplit(")", 1)[1].split()
+            children = Path(f"/proc/{current}/task/{current}/children").read_text().split()
+        except OSError:
+            return None
+        total += (int(fields[11]) + int(fields[12])) / clock_ticks
+        pending.extend(int(child) for child in children)
+    return total
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_until_ready(base_url: str, process: subprocess.Popen[bytes]) -> None:
+    deadline = time.monotonic() + READY_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"server exited with code {process.returncode}")
+        try:
+            if httpx.get(f"{base_url}/health/ready", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("server did not become ready in time")
+
+
+def server_environment(args: argparse.Namespace) -> dict[str, str]:
+    return {
+        **os.environ,
+        "APP_MONGO_URL": args.mongo_url or STANDIN_MONGO_URL,
+        "APP_REDIS_URL": args.redis_url or STANDIN_REDIS_URL,
+        "APP_FORECAST_TIMEOUT_SECONDS": str(args.forecast_timeout_seconds),
+    }
+
+
+@contextmanager
+def running_server(args: argparse.Namespace) -> Iterator[tuple[str, subprocess.Popen[bytes]]]:
+    port = _free_port()
+    command = [
+        sys.executable, "-m", "uvicorn", "--factory", "Scripts.load_test_standins:create_app",
+        "--host", "127.0.0.1", "--port", str(port), "--workers", str(args.workers),
+        "--log-level", "warning",
+    ]  # fmt: skip
+    process = subprocess.Popen(command, cwd=ROOT, env=server_environment(args))
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        _wait_until_ready(base_url, process)
+        yield base_url, process
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=positive_int, default=400)
+    parser.add_argument("--concurrency", type=positive_int, default=16)
+    parser.add_argument("--workers", type=positive_int, default=1)
+    parser.add_argument("--forecast-timeout-seconds", type=float, default=30.0)
+    parser.add_argument("--client-timeout", type=float, default=60.0)
+    parser.add_argument("--max-n-sims", type=positive_int, default=200_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument(
+        "--mix",
+        type=request_mix,
+        default=REQUEST_MIX,
+        help="request weights as kind=weight,... (default: the assumed REQUEST_MIX)",
+    )
+    parser.add_argument("--mongo-url", help="real Mongo instead of the in-process stand-in")
+    parser.add_argument("--redis-url", help="real Redis instead of the memory:// stand-in")
+    parser.add_argument("--output", type=Path)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    plan = build_plan(args.requests, seed=args.seed, max_n_sims=args.max_n_sims, mix=args.mix)
+    with running_server(args) as (base_url, process):
+        cpu_before = process_tree_cpu_seconds(process.pid)
+        result = asyncio.run(
+            run_load(
+                base_url, plan, concurrency=args.concurrency, client_timeout=args.client_timeout
+            )
+        )
+        cpu_after = process_tree_cpu_seconds(process.pid)
+    by_kind = {
+        kind: summarise_outcomes(
+            [outcome for outcome in result.outcomes if outcome.kind == kind],
+            result.elapsed_seconds,
+        )
+        for kind, _weight in args.mix
+    }
+    cpu = None if cpu_before is None or cpu_after is None else cpu_after - cpu_before
+    report = {
+        "benchmark": "api_load_test",
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+        "request_mix": dict(args.mix),
+        "forecast_timeout_seconds": args.forecast_timeout_seconds,
+        "stand_ins": {"mongo": args.mongo_url is None, "redis": args.redis_url is None},
+        "overall": summarise_outcomes(result.outcomes, result.elapsed_seconds),
+        "by_kind": by_kind,
+        "server_cpu_seconds": None if cpu is None else round(cpu, 3),
+        "cpu_ms_per_request": None if cpu is None else round(cpu * 1000 / len(plan), 3),
+    }
+    emit_report(report, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
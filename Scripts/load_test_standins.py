@@ -0,0 +1,116 @@
+"""In-process Mongo stand-in and uvicorn app factory used by ``Scripts/load_test.py``.
+
+The stand-in implements only the ``pymongo`` surface ``SimulationStore`` relies on, so the real
+store code (documents, history projection, reconnect loop) still runs under load. Redis is replaced
+by the ``memory://`` backend of ``limits``, which implements the same counter storage in process.
+"""
+
+from __future__ import annotations
+
+import copy
+import os
+import threading
+from typing import Any
+
+from fastapi import FastAPI
+
+STANDIN_MONGO_URL = "mongodb://load-test-stand-in"
+STANDIN_REDIS_URL = "memory://"
+UNTHROTTLED_RATE_LIMIT = "1000000/minute"
+
+
+class InMemoryCursor:
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self._rows = rows
+
+    def sort(self, field: str, direction: int) -> InMemoryCursor:
+        self._rows.sort(key=lambda row: row[field], reverse=direction < 0)
+        return self
+
+    def limit(self, count: int) -> InMemoryCursor:
+        del self._rows[count:]
+        return self
+
+    def __iter__(self):
+        return iter(self._rows)
+
+
+class InMemoryCollection:
+    """Thread-safe list of documents; the store calls it from the threadpool."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._documents: list[dict[str, Any]] = []
+
+    def create_index(self, keys: list[tuple[str, int]], **_options: Any) -> str:
+        return "_".join(f"{field}_{direction}" for field, direction in keys)
+
+    def insert_one(self, document: dict[str, Any]) -> None:
+        with self._lock:
+            self._documents.append(copy.deepcopy(document))
+
+    def update_many(self, query: dict[str, Any], update: dict[str, Any]) -> None:
+        with self._lock:
+            for document in self._matching(query):
+                document.update(update["$set"])
+
+    def find(self, query: dict[str, Any], projection: dict[str, int]) -> InMemoryCursor:
+        with self._lock:
+            rows = [
+                {key: value for key, value in document.items() if projection.get(key, 1)}
+                for document in self._matching(query)
+            ]
+        return InMemoryCursor(copy.deepcopy(rows))
+
+    def _matching(self, query: dict[str, Any]) -> list[dict[str, Any]]:
+        return [
+            document
+            for document in self._documents
+            if all(document.get(key) == value for key, value in query.items())
+        ]
+
+
+class _InMemoryAdmin:
+    @staticmethod
+    def command(name: str) -> dict[str, int]:
+        return {"ok": 1}
+
+
+class _InMemoryDatabase:
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __getitem__(self, collection: str) -> InMemoryCollection:
+        with InMemoryMongoClient.lock:
+            key = (self._name, collection)
+            return InMemoryMongoClient.collections.setdefault(key, InMemoryCollection())
+
+
+class InMemoryMongoClient:
+    """Replacement for ``pymongo.MongoClient``; every client of a process shares one dataset."""
+
+    collections: dict[tuple[str, str], InMemoryCollection] = {}
+    lock = threading.Lock()
+
+    def __init__(self, _url: str, **_options: Any) -> None:
+        self.admin = _InMemoryAdmin()
+
+    def __getitem__(self, database: str) -> _InMemoryDatabase:
+        return _InMemoryDatabase(database)
+
+    def close(self) -> None:
+        return None
+
+
+def create_app() -> FastAPI:
+    """Uvicorn ``--factory`` entry point: one call per worker process."""
+
+    os.environ.setdefault("APP_RATE_LIMIT_SIMULATE", UNTHROTTLED_RATE_LIMIT)
+    if os.environ.get("APP_MONGO_URL") == STANDIN_MONGO_URL:
+        from backend import simulation_store
+
+        os.environ["APP_MONGO_DRIVER"] = "sync"
+        simulation_store.MongoClient = InMemoryMongoClient
+    from backend.api import app
+
+    return app
@@ -6,6 +6,7 @@ import re
 from typing import Any
 
 from maintainability_common import normalize_path
+from source_analysis_cache import SourceAnalysisCache, source_facts
 
 JS_SUFFIXES = (".ts", ".tsx", ".js", ".jsx")
 
@@ -19,47 +20,47 @@ def _resolve_python_name(name: str, modules: dict[str, str]) -> str:
     return name.replace(".", "/") + ".py"
 
 
-def _python_imports(path: str, text: str, modules: dict[str, str]) -> set[str]:
+def _python_import_names(path: str, text: str) -> set[str]:
     tree = ast.parse(text, filename=path)
     current = path.removesuffix(".py").replace("/", ".")
     if current.endswith(".__init__"):
         current = current.removesuffix(".__init__")
     package = current.rsplit(".", 1)[0] if "." in current else ""
-    imports: set[str] = set()
+    names: set[str] = set()
     for node in ast.walk(tree):
-        names: list[str] = []
         if isinstance(node, ast.Import):
-            names = [alias.name for alias in node.names]
+            names.update(alias.name for alias in node.names)
         elif isinstance(node, ast.ImportFrom):
             base = node.module or ""
             if node.level:
                 prefix = package.split(".")
                 prefix = prefix[: max(0, len(prefix) - node.level + 1)]
                 base = ".".join((*prefix, base) if base else prefix)
-            names = [base, *(f"{base}.{alias.name}" for alias in node.names if base)]
-        imports.update(_resolve_python_name(name, modules) for name in names if name)
-    return imports
+            names.update((base, *(f"{base}.{alias.name}" for alias in node.names if base)))
+    return {name for name in names if name}
 
 
-def _js_imports(path: str, text: str, source_paths: set[str]) -> set[str]:
-    imports: set[str] = set()
+def _js_specifiers(text: str) -> set[str]:
     patterns = (
         re.compile(r"\b(?:import|export)\b(?:.|\n)*?\bfrom\s*['\"]([^'\"]+)['\"]"),
         re.compile(r"\bimport\s*\(\s*['\"]([^'\"]+)['\"]\s*\)"),
     )
-    for pattern in patterns:
-        for match in pattern.finditer(text):
-            specifier = match.group(1)
-            if not specifier.startswith("."):
-                imports.add(normalize_path(specifier))
-                continue
-            base = normalize_path(
-                posixpath.normpath(posixpath.join(posixpath.dirname(path), specifier))
-            )
-            candidates = [base, *(base + suffix for suffix in JS_SUFFIXES)]
-            candidates.extend(f"{base}/index{suffix}" for suffix in JS_SUFFIXES)
-            imports.add(next((item for item in candidates if item in source_paths), base))
-    return imports
+    return {match.group(1) for pattern in patterns for match in pattern.finditer(text)}
+
+
+def import_specifiers(path: str, text: str) -> list[str]:
+    """Unresolved imports of one file: dotted Python names or JavaScript specifiers."""
+    names = _python_import_names(path, text) if path.endswith(".py") else _js_specifiers(text)
+    return sorted(names)
+
+
+def _resolve_js_specifier(path: str, specifier: str, source_paths: set[str]) -> str:
+    if not specifier.startswith("."):
+        return normalize_path(specifier)
+    base = normalize_path(posixpath.normpath(posixpath.join(posixpath.dirname(path), specifier)))
+    candidates = [base, *(base + suffix for suffix in JS_SUFFIXES)]
+    candidates.extend(f"{base}/index{suffix}" for suffix in JS_SUFFIXES)
+    return next((item for item in candidates if item in source_paths), base)
 
 
 def _module_paths(source_paths: set[str]) -> dict[str, str]:
@@ -73,15 +74,17 @@ def _module_paths(source_paths: set[str]) -> dict[str, str]:
     return modules
 
 
-def collect_dependencies(texts: dict[str, str]) -> set[tuple[str, str]]:
+def collect_dependencies(
+    texts: dict[str, str], cache: SourceAnalysisCache | None = None
+) -> set[tuple[str, str]]:
     source_paths = set(texts)
     modules = _module_paths(source_paths)
     dependencies: set[tuple[str, str]] = set()
-    for path, content in texts.items():
+    for path, specifiers in source_facts(import_specifiers, texts, cache).items():
         targets = (
-            _python_imports(path, content, modules)
+            {_resolve_python_name(name, modules) for name in specifiers}
             if path.endswith(".py")
-            else _js_imports(path, content, source_paths)
+            else {_resolve_js_specifier(path, specifier, source_paths) for specifier in specifiers}
         )
         dependencies.update((path, normalize_path(target)) for target in targets if target != path)
     return dependencies
@@ -5,6 +5,8 @@ import re
 from dataclasses import dataclass
 from typing import Any
 
+from source_analysis_cache import SourceAnalysisCache, source_facts
+
 
 @dataclass(frozen=True)
 class FunctionMetric:
@@ -150,17 +152,26 @@ def source_metrics(path: str, text: str) -> tuple[int, int, list[FunctionMetric]
     return _line_count(text), _js_complexity(stripped), _js_functions(text)
 
 
-def collect_metric_debt(texts: dict[str, str], limits: dict[str, int]) -> list[dict[str, Any]]:
+def file_metrics(path: str, text: str) -> list[Any]:
+    file_lines, file_complexity, functions = source_metrics(path, text)
+    rows = [[function.symbol, function.lines, function.complexity] for function in functions]
+    return [file_lines, file_complexity, rows]
+
+
+def collect_metric_debt(
+    texts: dict[str, str], limits: dict[str, int], cache: SourceAnalysisCache | None = None
+) -> list[dict[str, Any]]:
     metrics: list[dict[str, Any]] = []
-    for path, content in texts.items():
-        file_lines, file_complexity, functions = source_metrics(path, content)
+    facts = source_facts(file_metrics, texts, cache)
+    for path in texts:
+        file_lines, file_complexity, functions = facts[path]
         values = (("file.lines", file_lines, None), ("file.complexity", file_complexity, None))
         values += tuple(
             value
-            for function in functions
+            for symbol, lines, complexity in functions
             for value in (
-                ("function.lines", function.lines, function.symbol),
-                ("function.complexity", function.complexity, function.symbol),
+                ("function.lines", lines, symbol),
+                ("function.complexity", complexity, symbol),
             )
         )
         for metric, value, symbol in values:
@@ -16,7 +16,7 @@ import urllib.error
 import urllib.request
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager, nullcontext
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 from pathlib import Path
 
@@ -140,6 +140,7 @@ class GateExecutionPlan:
     docker_smoke: bool
     resolution: TestResolution | None = None
     execution_profile: str = "pr"
+    use_cache: bool = False
 
     @property
     def coverage_artifacts(self) -> tuple[str, ...]:
@@ -973,12 +974,6 @@ def resolve_change_context(
     )
 
 
-def _gate_input_sources(mode: str) -> tuple[InputSource, ...]:
-    return ({"fast": InputSource.GIT_INDEX, "push": InputSource.HEAD}.get(
-        mode, InputSource.WORKSPACE
-    ),)
-
-
 def build_execution_plan(context: ChangeContext) -> GateExecutionPlan:
     """Build the immutable ordered command plan for a resolved context."""
     from Scripts.quality_gate_plan import build_execution_plan as build_profile_plan
@@ -988,11 +983,9 @@ def build_execution_plan(context: ChangeContext) -> GateExecutionPlan:
 
 def execution_plan(mode: str, documentation_only: bool) -> list[GateCommand]:
     """Return the historical list interface used by callers and tests."""
-    context = build_change_context(
-        mode,
-        ["README.md"] if documentation_only else [],
-    )
-    return list(build_execution_plan(context).commands)
+    from Scripts.quality_gate_plan import execution_plan as profile_execution_plan
+
+    return profile_execution_plan(mode, documentation_only, sys.modules[__name__])
 
 
 def _frontend_dependencies_available() -> bool:
@@ -1494,10 +1487,11 @@ def run_gate(
     *,
     execution_profile: str | None = None,
     selected_node: str | None = None,
+    use_cache: bool = False,
 ) -> int:
     """Run a gate and propagate the first failing command exit code."""
     context = resolve_change_context(mode, paths, execution_profile=execution_profile)
-    plan = build_execution_plan(context)
+    plan = replace(build_execution_plan(context), use_cache=use_cache)
     print(f"Quality gate mode: {mode}")
     print(f"Execution profile: {plan.execution_profile}")
     if context.documentation_only:
@@ -1559,6 +1553,7 @@ def run_pre_push_gate(
     remote_name: str,
     remote_url: str = "",
     repository_root: Path = ROOT,
+    use_cache: bool = False,
 ) -> int:
     """Validate each distinct terminal commit while preserving introduced diffs."""
     try:
@@ -1576,7 +1571,7 @@ def run_pre_push_gate(
     for target in validation.targets:
         print(f"\nValidating pushed terminal commit: {target.terminal_sha}")
         context = build_push_change_context(target)
-        plan = build_execution_plan(context)
+        plan = replace(build_execution_plan(context), use_cache=use_cache)
         _print_plan_selection(plan)
         try:
             with detached_commit_worktree(
@@ -1614,6 +1609,7 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser.add_argument("--remote-url", default="")
     parser.add_argument("--profile", choices=("pr", "main", "nightly", "release"))
     parser.add_argument("--node")
+    parser.add_argument("--no-cache", action="store_true", help="re-run every DAG node")
     return parser.parse_args(argv)
 
 
@@ -1624,8 +1620,9 @@ def main(argv: list[str] | None = None) -> int:
             sys.stdin.read(),
             remote_name=args.remote_name,
             remote_url=args.remote_url,
+            use_cache=not args.no_cache,
         )
-    options = {}
+    options = {"use_cache": not args.no_cache}
     if args.profile is not None:
         options["execution_profile"] = args.profile
     if args.node is not None:
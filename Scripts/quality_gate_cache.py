@@ -0,0 +1,148 @@
+"""Content-addressed cache of successful quality-gate DAG node results."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "quality-gate"
+CACHE_FORMAT = 1
+
+
+@lru_cache(maxsize=None)
+def tool_versions() -> tuple[str, ...]:
+    """Interpreter, installed Python distributions and Node.js a node command may run with."""
+
+    distributions = sorted(
+        f"{distribution.metadata['Name']}=={distribution.version}"
+        for distribution in metadata.distributions()
+    )
+    node = shutil.which("node")
+    try:
+        node_version = (
+            subprocess.run(
+                [node, "--version"], capture_output=True, text=True, check=False
+            ).stdout.strip()
+            if node
+            else "absent"
+        )
+    except OSError:
+        node_version = "unavailable"
+    return (f"python {sys.version}", f"node {node_version}", *distributions)
+
+
+def input_paths(root: Path, patterns: tuple[str, ...]) -> list[Path]:
+    return sorted(
+        {
+            path
+            for pattern in patterns
+            for path in root.glob(pattern)
+            if path.is_file() and "__pycache__" not in path.parts
+        }
+    )
+
+
+class NodeResultCache:
+    """Artifacts of nodes that passed, keyed by the inputs their contract entry declares.
+
+    Only nodes with ``cacheInputs`` are cached. A hit copies the stored artifact directory
+    back into ``validation_root``; failures are never stored.
+    """
+
+    def __init__(self, directory: Path, contract: dict[str, Any]) -> None:
+        self.directory = directory
+        self._nodes = {node["id"]: node for node in contract.get("nodes", [])}
+        self._digests: dict[Path, bytes] = {}
+        self._lock = threading.Lock()
+        self.hits: list[str] = []
+        self.misses: list[str] = []
+
+    def _digest(self, path: Path) -> bytes:
+        with self._lock:
+            cached = self._digests.get(path)
+        if cached is None:
+            cached = hashlib.sha256(path.read_bytes()).digest()
+            with self._lock:
+                self._digests[path] = cached
+        return cached
+
+    def key(self, root: Path, profile: str, node: str, commands: tuple[Any, ...]) -> str | None:
+        patterns = tuple(self._nodes.get(node, {}).get("cacheInputs", ()))
+        if not patterns:
+            return None
+        material = {
+            "format": CACHE_FORMAT,
+            "profile": profile,
+            "node": self._nodes[node],
+            "commands": [repr(command) for command in commands],
+            "tools": tool_versions(),
+        }
+        digest = hashlib.sha256(json.dumps(material, sort_keys=True).encode())
+        for path in input_paths(root, patterns):
+            digest.update(path.relative_to(root).as_posix().encode() + b"\0")
+            digest.update(self._digest(path))
+        return digest.hexdigest()
+
+    def _entry(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def restore(self, key: str, node: str, destination: Path) -> bool:
+        artifacts = self._entry(key) / "artifacts"
+        hit = artifacts.is_dir()
+        with self._lock:
+            (self.hits if hit else self.misses).append(node)
+        if hit:
+            shutil.copytree(artifacts, destination, dirs_exist_ok=True)
+        return hit
+
+    def store(self, key: str, source: Path) -> None:
+        entry = self._entry(key)
+        temporary = entry.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            if not entry.exists():
+                shutil.copytree(source, temporary / "artifacts")
+                os.replace(temporary, entry)
+        except OSError as exc:
+            # Includes a concurrent gate storing the same key first; the run itself passed.
+            shutil.rmtree(temporary, ignore_errors=True)
+            print(f"WARNING: DAG cache entry not written: {exc}")
+
+    def summary(self) -> str:
+        lookups = len(self.hits) + len(self.misses)
+        rate = len(self.hits) / lookups if lookups else 0.0
+        restored = ", ".join(sorted(self.hits)) or "(none)"
+        return f"DAG cache: hits={len(self.hits)}/{lookups} ({rate:.0%}) restored={restored}"
+
+
+def run_cached(
+    cache: NodeResultCache | None,
+    lookup: tuple[Path, str, str, tuple[Any, ...]],
+    artifacts: Path,
+    execute: Callable[[], int],
+) -> int:
+    """Restore the node's ``artifacts`` on a hit; otherwise ``execute`` it and store a pass.
+
+    ``lookup`` holds the ``NodeResultCache.key`` arguments: root, profile, node and commands.
+    """
+
+    key = cache.key(*lookup) if cache is not None else None
+    if cache is None or key is None:
+        return execute()
+    if cache.restore(key, lookup[2], artifacts):
+        print(f"\n==> {lookup[2]}: restored from the DAG cache")
+        return 0
+    code = execute()
+    if not code:
+        cache.store(key, artifacts)
+    return code
@@ -57,6 +57,7 @@ MASSIVE_SCRIPT_NAMES = {
     "check_python_coverage.py",
     "check_naming_convention.py",
     "check_no_secrets.py",
+    "check_no_secrets_lookup.py",
     "check_vitals_compliance.py",
     "pre_commit_guard.py",
     "quality_gate.py",
@@ -66,6 +67,7 @@ MASSIVE_SCRIPT_NAMES = {
     "maintainability_dependencies.py",
     "maintainability_metrics.py",
     "maintainability_ratchet.py",
+    "source_analysis_cache.py",
     "report_vitals_coverage.py",
     "setup_git_hooks.py",
     "check_test_classification.py",
@@ -78,6 +80,9 @@ MASSIVE_SCRIPT_NAMES = {
     "test_classification_rules_validation.py",
     "test_classifier_discovery.py",
     "test_classifier_engine.py",
+    "test_classifier_index.py",
+    "test_classifier_pytest.py",
+    "report_json_io.py",
     "report_test_execution_counts.py",
     "test_execution_counts_reference.py",
     "test_execution_profiles.py",
@@ -85,6 +90,8 @@ MASSIVE_SCRIPT_NAMES = {
     "test_execution_profiles_validation.py",
     "quality_gate_plan.py",
     "quality_gate_dag.py",
+    "quality_gate_cache.py",
+    "quality_gate_scheduler.py",
     "collect_js_tests.mjs",
     "check_test_governance.py",
     "test_governance_contract.py",
@@ -105,6 +112,7 @@ MASSIVE_SCRIPT_NAMES = {
     "statistical_main_enforcement.py",
     "statistical_main_enforcement_common.py",
     "statistical_main_evidence.py",
+    "schema_registry.py",
 }
 MASSIVE_TEST_PATHS = {
     "tests/test_identity_boundary.py",
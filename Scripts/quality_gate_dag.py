@@ -4,12 +4,20 @@ from __future__ import annotations
 
 import json
 import shutil
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
 from contextlib import nullcontext
 from pathlib import Path
 from typing import Any
 
+from Scripts.quality_gate_cache import DEFAULT_CACHE_DIR, NodeResultCache, run_cached
+from Scripts.quality_gate_scheduler import (
+    CANCELLED_EXIT_CODE,
+    NodeScheduler,
+    critical_path_seconds,
+    load_history,
+    record_history,
+)
 from Scripts.test_execution_profiles import (
     active_nodes,
     build_plan_report,
@@ -90,7 +98,7 @@ def _restore_current_results(
         _write_result(validation_root, profile, node, code, duration)
 
 
-def _run_node(
+def _execute_node(
     q: Any,
     plan: Any,
     node: str,
@@ -100,8 +108,8 @@ def _run_node(
     runtime_temp_root: Path,
     isolated_validation: bool,
     command_env: dict[str, str],
-) -> tuple[int, float]:
-    started = time.perf_counter()
+    cancelled: threading.Event | None = None,
+) -> int:
     if node == "aggregate":
         _prepare_aggregate_inputs(validation_root, plan.execution_profile)
     environment = {
@@ -110,6 +118,9 @@ def _run_node(
     }
     code = 0
     for command in commands:
+        if cancelled is not None and cancelled.is_set():
+            print(f"\n==> {node}: cancelled after another node failed")
+            return CANCELLED_EXIT_CODE
         code = q._run_command(
             command,
             validation_root=validation_root,
@@ -121,22 +132,30 @@ def _run_node(
             break
     if not code and plan.docker_smoke and node == "release-or-container-checks":
         code = q._run_docker_smoke(validation_root)
-    duration = time.perf_counter() - started
-    _write_result(validation_root, plan.execution_profile, node, code, duration)
-    return code, duration
+    return code
 
 
-def _ready_nodes(
-    pending: set[str], completed: set[str], nodes: dict[str, dict[str, Any]]
-) -> list[str]:
-    return sorted(
-        (
-            identifier
-            for identifier in pending
-            if active_dependencies(nodes[identifier], nodes) <= completed
-        ),
-        key=lambda item: (nodes[item].get("order", 0), item),
+def _run_node(
+    q: Any,
+    plan: Any,
+    node: str,
+    commands: tuple[Any, ...],
+    *,
+    validation_root: Path,
+    cache: NodeResultCache | None = None,
+    **options: Any,
+) -> tuple[int, float]:
+    started = time.perf_counter()
+    profile = plan.execution_profile
+    code = run_cached(
+        cache,
+        (validation_root, profile, node, commands),
+        _artifact_root(validation_root, profile, node),
+        lambda: _execute_node(q, plan, node, commands, validation_root=validation_root, **options),
     )
+    duration = time.perf_counter() - started
+    _write_result(validation_root, profile, node, code, duration)
+    return code, duration
 
 
 def _execute_parallel(
@@ -146,36 +165,29 @@ def _execute_parallel(
     contract: dict[str, Any],
     **kwargs: Any,
 ) -> tuple[int, dict[str, float]]:
-    nodes = active_nodes(contract, plan.execution_profile)
-    pending = set(nodes) - {identifier for identifier, commands in grouped.items() if not commands}
-    completed = set(nodes) - pending
-    durations: dict[str, float] = {}
-    outcomes_by_node: dict[str, tuple[int, float]] = {}
-    while pending:
-        ready = _ready_nodes(pending, completed, nodes)
-        if not ready:
-            return 2, durations
-        if "aggregate" in ready:
-            _restore_current_results(
-                kwargs["validation_root"],
-                plan.execution_profile,
-                outcomes_by_node,
-            )
-        with ThreadPoolExecutor(max_workers=len(ready)) as executor:
-            futures = {
-                node: executor.submit(_run_node, q, plan, node, grouped[node], **kwargs)
-                for node in ready
-            }
-            outcomes = {node: futures[node].result() for node in ready}
-        for node in ready:
-            code, duration = outcomes[node]
-            durations[node] = duration
-            outcomes_by_node[node] = (code, duration)
-            if code:
-                return code, durations
-            pending.remove(node)
-            completed.add(node)
-    return 0, durations
+    profile = plan.execution_profile
+    nodes = active_nodes(contract, profile)
+    cache = kwargs.get("cache")
+    history = cache.directory if cache is not None else None
+    scheduler = NodeScheduler(
+        nodes,
+        {identifier for identifier, commands in grouped.items() if commands},
+        critical_path_seconds(nodes, load_history(history, profile)),
+    )
+
+    def start(node: str, cancelled: threading.Event) -> tuple[int, float]:
+        if node == "aggregate":
+            _restore_current_results(kwargs["validation_root"], profile, scheduler.outcomes)
+        return _run_node(q, plan, node, grouped[node], cancelled=cancelled, **kwargs)
+
+    code = scheduler.run(start)
+    executed = {
+        node: duration
+        for node, (node_code, duration) in scheduler.outcomes.items()
+        if not node_code and cache is not None and node not in cache.hits
+    }
+    record_history(history, profile, executed)
+    return code, {node: duration for node, (_code, duration) in scheduler.outcomes.items()}
 
 
 def _execute_sequential(
@@ -261,7 +273,7 @@ def _aggregate(validation_root: Path, plan: Any, durations: dict[str, float]) ->
     )
 
 
-def _execute_inside_manager(
+def _dispatch_nodes(
     q: Any,
     plan: Any,
     grouped: dict[str, tuple[Any, ...]],
@@ -289,6 +301,21 @@ def _execute_inside_manager(
     return _execute_sequential(q, plan, grouped, contract, **kwargs)
 
 
+def _execute_inside_manager(
+    q: Any,
+    plan: Any,
+    grouped: dict[str, tuple[Any, ...]],
+    contract: dict[str, Any],
+    selected_node: str | None,
+    parallel: bool,
+    kwargs: dict[str, Any],
+) -> tuple[int, dict[str, float]]:
+    outcome = _dispatch_nodes(q, plan, grouped, contract, selected_node, parallel, kwargs)
+    if kwargs["cache"] is not None:
+        print(kwargs["cache"].summary())
+    return outcome
+
+
 def execute_gate_plan(
     q: Any,
     plan: Any,
@@ -309,10 +336,8 @@ def execute_gate_plan(
         return 2
     selected_commands = grouped.get(selected_node, ()) if selected_node else plan.commands
     needs_frontend = q.change_policy.needs_frontend_dependencies(selected_commands, q.NPM_COMMAND)
-    if needs_frontend:
-        code = q._ensure_frontend_dependencies()
-        if code:
-            return code
+    if needs_frontend and (code := q._ensure_frontend_dependencies()):
+        return code
     dependency_manager = (
         q.exposed_frontend_dependencies(validation_root)
         if needs_frontend and isolated_validation
@@ -323,6 +348,7 @@ def execute_gate_plan(
         "runtime_temp_root": runtime_temp_root,
         "isolated_validation": isolated_validation,
         "command_env": dict(command_env or {}),
+        "cache": NodeResultCache(DEFAULT_CACHE_DIR, contract) if plan.use_cache else None,
     }
     try:
         with dependency_manager:
@@ -326,10 +326,15 @@ def _test_governance_command(
     )
 
 
+def _gate_input_sources(q: Any, mode: str) -> tuple[Any, ...]:
+    sources = {"fast": q.InputSource.GIT_INDEX, "push": q.InputSource.HEAD}
+    return (sources.get(mode, q.InputSource.WORKSPACE),)
+
+
 def build_execution_plan(context: Any, q: Any) -> Any:
     """Build the immutable deterministic command list and its DAG profile."""
     profile = execution_profile_for_mode(context.mode, context.execution_profile)
-    inputs = q._gate_input_sources(context.mode)
+    inputs = _gate_input_sources(q, context.mode)
     commands = _base_commands(q, inputs)
     resolution = q.resolve_tests(context)
     if (
@@ -0,0 +1,153 @@
+"""Continuous, critical-path-first scheduling of quality-gate DAG nodes."""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+from Scripts.test_execution_profiles_graph import active_dependencies
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+# Estimate for a node that never ran here: the critical path then counts nodes.
+DEFAULT_NODE_SECONDS = 1.0
+HISTORY_FILE = "durations.json"
+CANCELLED_EXIT_CODE = 130
+
+NodeStarter = Callable[[str, threading.Event], tuple[int, float]]
+
+
+def load_history(directory: Path | None, profile: str) -> dict[str, float]:
+    """Durations of the last executed run of each node, empty when unknown or unreadable."""
+
+    if directory is None:
+        return {}
+    try:
+        history = json.loads((directory / HISTORY_FILE).read_text(encoding="utf-8"))
+        return {str(node): float(seconds) for node, seconds in history[profile].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return {}
+
+
+def record_history(directory: Path | None, profile: str, durations: dict[str, float]) -> None:
+    if directory is None or not durations:
+        return
+    path = directory / HISTORY_FILE
+    try:
+        history = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        history = {}
+    if not isinstance(history, dict) or not isinstance(history.get(profile), dict):
+        history = {**(history if isinstance(history, dict) else {}), profile: {}}
+    history[profile].update({node: round(seconds, 3) for node, seconds in durations.items()})
+    temporary = path.with_name(f"{HISTORY_FILE}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary.write_text(json.dumps(history, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError as exc:
+        print(f"WARNING: DAG duration history not written: {exc}")
+
+
+def critical_path_seconds(
+    nodes: dict[str, dict[str, Any]], estimates: dict[str, float]
+) -> dict[str, float]:
+    """Estimated seconds from the start of each node to the end of the longest chain it opens.
+
+    Relaxing every edge once per node reaches the fixed point of an acyclic graph and stays
+    bounded on a cyclic one, which the scheduler then reports as unsatisfiable.
+    """
+
+    own = {identifier: estimates.get(identifier, DEFAULT_NODE_SECONDS) for identifier in nodes}
+    remaining = dict(own)
+    edges = [
+        (dependency, identifier)
+        for identifier, node in nodes.items()
+        for dependency in active_dependencies(node, nodes)
+    ]
+    for _round in nodes:
+        for dependency, dependant in edges:
+            chain = own[dependency] + remaining[dependant]
+            remaining[dependency] = max(remaining[dependency], chain)
+    return remaining
+
+
+class NodeScheduler:
+    """Start each node as soon as its dependencies passed, longest remaining chain first.
+
+    At most ``workers`` nodes run at once and two nodes sharing a declared resource class
+    never overlap. The first failure stops new starts and sets the event handed to running
+    siblings, which stop before their next command.
+    """
+
+    def __init__(
+        self,
+        nodes: dict[str, dict[str, Any]],
+        pending: set[str],
+        priorities: dict[str, float],
+        *,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        self._nodes = nodes
+        self._pending = set(pending)
+        self._completed = set(nodes) - self._pending
+        self._priorities = priorities
+        self._workers = max(workers, 1)
+        self._held: set[str] = set()
+        self._running: dict[Future[tuple[int, float]], str] = {}
+        self.cancelled = threading.Event()
+        self.outcomes: dict[str, tuple[int, float]] = {}
+
+    def _resources(self, node: str) -> set[str]:
+        return set(self._nodes[node].get("resources", ()))
+
+    def _ready(self) -> list[str]:
+        return sorted(
+            (
+                identifier
+                for identifier in self._pending
+                if active_dependencies(self._nodes[identifier], self._nodes) <= self._completed
+            ),
+            key=lambda item: (
+                -self._priorities.get(item, 0.0),
+                self._nodes[item].get("order", 0),
+                item,
+            ),
+        )
+
+    def _start_ready(self, executor: ThreadPoolExecutor, start: NodeStarter) -> None:
+        for node in self._ready():
+            if len(self._running) >= self._workers:
+                return
+            if self._resources(node) & self._held:
+                continue
+            self._held |= self._resources(node)
+            self._pending.remove(node)
+            self._running[executor.submit(start, node, self.cancelled)] = node
+
+    def run(self, start: NodeStarter) -> int:
+        """Return the first failing exit code, 2 for an unsatisfiable graph, otherwise 0."""
+
+        failure = 0
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            while True:
+                if not failure:
+                    self._start_ready(executor, start)
+                if not self._running:
+                    break
+                done, _ = wait(self._running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    node = self._running.pop(future)
+                    self._held -= self._resources(node)
+                    self.outcomes[node] = future.result()
+                    code = self.outcomes[node][0]
+                    if code and not failure:
+                        failure = code
+                        self.cancelled.set()
+                    if not code:
+                        self._completed.add(node)
+        return failure or (2 if self._pending else 0)
@@ -0,0 +1,164 @@
+"""Copy-free cloning and incremental refresh of quality-gate workspace snapshots.
+
+A file is cloned by reflink (``FICLONE``) where the filesystem shares extents copy-on-write,
+otherwise by ``copy_file_range`` inside the kernel, otherwise by a plain copy. Hard links are never
+used since a command writing into the snapshot would then modify the workspace.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import stat
+import sys
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has neither FICLONE nor flock
+    fcntl = None  # type: ignore[assignment]
+
+# Linux _IOW(0x94, 9, int): share the source extents with the destination.
+FICLONE = 0x40049409
+COPY_CHUNK_BYTES = 1 << 30
+# Refuse to open a destination that is a symlink; absent on Windows, where links are cleared first.
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+Signature = list[int]
+
+
+def _kernel_copy(source_fd: int, destination_fd: int) -> str | None:
+    if fcntl is not None and sys.platform.startswith("linux"):
+        try:
+            fcntl.ioctl(destination_fd, FICLONE, source_fd)
+            return "reflink"
+        except OSError:
+            pass
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        return None
+    offset = 0
+    try:
+        while copied := copy_range(source_fd, destination_fd, COPY_CHUNK_BYTES, offset, offset):
+            offset += copied
+    except OSError:
+        return None
+    return "copy_file_range"
+
+
+def clone_file(source: Path, destination: Path) -> str:
+    """Copy content and metadata like ``shutil.copy2``; return the copy method used.
+
+    The destination is opened without following a final symlink, so a link planted there fails
+    instead of redirecting the write.
+    """
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0) | _NOFOLLOW
+    with source.open("rb") as reader, os.fdopen(os.open(destination, flags, 0o666), "wb") as writer:
+        method = _kernel_copy(reader.fileno(), writer.fileno())
+        if method is None:
+            writer.truncate(0)
+            shutil.copyfileobj(reader, writer)
+            method = "copy"
+    shutil.copystat(source, destination)
+    return method
+
+
+def _signature(status: os.stat_result) -> Signature:
+    return [status.st_size, status.st_mtime_ns, status.st_ino]
+
+
+def _destination_signature(destination: Path) -> Signature | None:
+    try:
+        status = destination.lstat()
+    except OSError:
+        return None
+    return _signature(status) if destination.is_file() and not destination.is_symlink() else None
+
+
+def _clear_non_regular(destination: Path) -> None:
+    """Remove a link, directory or special file left at a kept path; links are never followed."""
+
+    try:
+        mode = destination.lstat().st_mode
+    except FileNotFoundError:
+        return
+    if stat.S_ISDIR(mode):
+        shutil.rmtree(destination)
+    elif not stat.S_ISREG(mode):
+        destination.unlink()
+
+
+def _remove_extras(snapshot_root: Path, keep: set[str]) -> int:
+    """Delete what a fresh snapshot would not hold; links are removed, never followed."""
+
+    is_junction = getattr(os.path, "isjunction", lambda _path: False)
+    removed = 0
+    for directory, directories, files in os.walk(snapshot_root):
+        base = Path(directory)
+        for name in list(directories):
+            if (base / name).is_symlink() or is_junction(base / name):
+                directories.remove(name)
+                files.append(name)
+        for name in files:
+            path = base / name
+            if path.relative_to(snapshot_root).as_posix() not in keep:
+                _unlink(path, is_junction)
+                removed += 1
+    for directory, _directories, _files in os.walk(snapshot_root, topdown=False):
+        if directory != str(snapshot_root) and not os.listdir(directory):
+            os.rmdir(directory)
+    return removed
+
+
+def _unlink(path: Path, is_junction: Callable[[Path], bool]) -> None:
+    if is_junction(path):  # pragma: no cover - junctions only exist on Windows
+        os.rmdir(path)
+    else:
+        path.unlink()
+
+
+def synchronise_snapshot(
+    repository_root: Path,
+    snapshot_root: Path,
+    statuses: dict[str, os.stat_result],
+    manifest: dict[str, Any],
+) -> tuple[dict[str, Any], Counter[str]]:
+    """Make ``snapshot_root`` equal a fresh snapshot of ``statuses``, cloning only changed entries.
+
+    ``statuses`` holds the validated source status of every file to snapshot. ``manifest`` maps
+    each path to the size, modification time and inode of its source and of its snapshot copy
+    when last cloned; an entry is reused only if neither side changed since.
+    """
+
+    snapshot_root.mkdir(parents=True, exist_ok=True)
+    counts: Counter[str] = Counter(removed=_remove_extras(snapshot_root, {*statuses, ".git"}))
+    entries: dict[str, Any] = {}
+    for relative, status in statuses.items():
+        destination = snapshot_root / relative
+        current = [_signature(status), _destination_signature(destination)]
+        if manifest.get(relative) == current:
+            counts["reused"] += 1
+        else:
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            _clear_non_regular(destination)
+            counts[clone_file(repository_root / relative, destination)] += 1
+            current[1] = _signature(destination.stat())
+        entries[relative] = current
+    return entries, counts
+
+
+def read_manifest(path: Path) -> dict[str, Any]:
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def write_manifest(path: Path, entries: dict[str, Any]) -> None:
+    path.write_text(json.dumps(entries), encoding="utf-8")
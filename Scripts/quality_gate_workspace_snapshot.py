@@ -1,16 +1,33 @@
-"""Isolated workspace snapshot primitives for the full local quality gate."""
+"""Isolated workspace snapshot primitives for the full local quality gate.
+
+Files are cloned through ``quality_gate_snapshot_sync.clone_file``. When
+``MONTECARLO_WORKSPACE_SNAPSHOT_DIR`` names a directory, the snapshot persists there and each run
+only re-clones the files whose source or snapshot copy changed since the previous one.
+"""
 
 from __future__ import annotations
 
 import os
-import shutil
 import subprocess
 import tempfile
+import time
+from collections import Counter
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager, nullcontext
 from pathlib import Path
 from typing import Any
 
+from Scripts.quality_gate_snapshot_sync import (
+    clone_file,
+    fcntl,
+    read_manifest,
+    synchronise_snapshot,
+    write_manifest,
+)
+
+PERSISTENT_SNAPSHOT_ENV = "MONTECARLO_WORKSPACE_SNAPSHOT_DIR"
+MANIFEST_FILE = "manifest.json"
+
 
 def workspace_snapshot_paths(
     repository_root: Path, git_environment: dict[str, str]
@@ -32,19 +49,32 @@ def workspace_snapshot_paths(
     return (*paths, ".env") if (repository_root / ".env").is_file() else paths
 
 
-def _copy_regular_file(repository_root: Path, snapshot_root: Path, relative: str) -> None:
+def _source_status(repository_root: Path, relative: str) -> os.stat_result | None:
     relative_path = Path(relative)
     if relative_path.is_absolute() or ".." in relative_path.parts:
         raise RuntimeError(f"Workspace snapshot source escapes the repository: {relative}")
     source = repository_root / relative_path
     if not source.exists():
-        return
+        return None
     is_junction = getattr(os.path, "isjunction", lambda _path: False)
     if not source.is_file() or source.is_symlink() or is_junction(source):
         raise RuntimeError(f"Workspace snapshot source must be a regular file: {relative}")
-    destination = snapshot_root / relative_path
+    return source.stat()
+
+
+def _copy_regular_file(repository_root: Path, snapshot_root: Path, relative: str) -> str | None:
+    if _source_status(repository_root, relative) is None:
+        return None
+    destination = snapshot_root / relative
     destination.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(source, destination)
+    return clone_file(repository_root / relative, destination)
+
+
+def _report_timing(counts: Counter[str], started: float) -> None:
+    details = ", ".join(f"{name}={count}" for name, count in sorted(counts.items()) if count)
+    files = sum(count for name, count in counts.items() if name != "removed")
+    elapsed = time.perf_counter() - started
+    print(f"Workspace snapshot: {files} files in {elapsed:.3f}s ({details or 'empty'})")
 
 
 def _write_git_pointer(snapshot_root: Path, git_directory: Path) -> None:
@@ -58,17 +88,85 @@ def _write_git_pointer(snapshot_root: Path, git_directory: Path) -> None:
 
 
 @contextmanager
-def workspace_snapshot(
-    repository_root: Path,
-    paths: tuple[str, ...],
-    git_directory: Path,
+def _temporary_snapshot(
+    repository_root: Path, paths: tuple[str, ...], git_directory: Path
 ) -> Iterator[Path]:
+    started = time.perf_counter()
     with tempfile.TemporaryDirectory(prefix="montecarlo-main-") as temp_dir:
         snapshot_root = Path(temp_dir) / "repository"
         snapshot_root.mkdir()
+        counts: Counter[str] = Counter()
         for relative in paths:
-            _copy_regular_file(repository_root, snapshot_root, relative)
+            method = _copy_regular_file(repository_root, snapshot_root, relative)
+            if method is not None:
+                counts[method] += 1
+        _write_git_pointer(snapshot_root, git_directory)
+        _report_timing(counts, started)
+        yield snapshot_root
+
+
+def _inside_workspace(directory: Path, repository_root: Path, paths: tuple[str, ...]) -> bool:
+    try:
+        relative = directory.resolve().relative_to(repository_root.resolve()).as_posix()
+    except ValueError:
+        return False
+    return relative == "." or any(
+        path == relative or path.startswith(f"{relative}/") for path in paths
+    )
+
+
+@contextmanager
+def _persistent_snapshot(
+    directory: Path, repository_root: Path, paths: tuple[str, ...], git_directory: Path
+) -> Iterator[Path | None]:
+    """Yield the synchronised persistent snapshot, or ``None`` when another gate holds it."""
+
+    if _inside_workspace(directory, repository_root, paths):
+        raise RuntimeError(f"Persistent workspace snapshot is part of the workspace: {directory}")
+    started = time.perf_counter()
+    directory.mkdir(parents=True, exist_ok=True)
+    with (directory / ".lock").open("w") as lock:
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)  # type: ignore[union-attr]
+        except OSError:
+            print(f"Persistent workspace snapshot busy, using a temporary copy: {directory}")
+            yield None
+            return
+        manifest_path = directory / MANIFEST_FILE
+        manifest = read_manifest(manifest_path)
+        # A run interrupted before the manifest is rewritten re-clones on its next start.
+        manifest_path.unlink(missing_ok=True)
+        statuses = {
+            relative: status
+            for relative in paths
+            if (status := _source_status(repository_root, relative)) is not None
+        }
+        snapshot_root = directory / "repository"
+        entries, counts = synchronise_snapshot(repository_root, snapshot_root, statuses, manifest)
         _write_git_pointer(snapshot_root, git_directory)
+        write_manifest(manifest_path, entries)
+        _report_timing(counts, started)
+        yield snapshot_root
+
+
+@contextmanager
+def workspace_snapshot(
+    repository_root: Path,
+    paths: tuple[str, ...],
+    git_directory: Path,
+) -> Iterator[Path]:
+    persistent = os.environ.get(PERSISTENT_SNAPSHOT_ENV)
+    if not persistent or fcntl is None:
+        with _temporary_snapshot(repository_root, paths, git_directory) as snapshot_root:
+            yield snapshot_root
+        return
+    with _persistent_snapshot(
+        Path(persistent), repository_root, paths, git_directory
+    ) as snapshot_root:
+        if snapshot_root is not None:
+            yield snapshot_root
+            return
+    with _temporary_snapshot(repository_root, paths, git_directory) as snapshot_root:
         yield snapshot_root
 
 
@@ -14,6 +14,11 @@ from typing import Any
 
 from change_cost_baseline_render import render_markdown
 from report_dependency_graph import build_report as build_dependency_report
+from source_analysis_cache import (
+    SourceAnalysisCache,
+    add_cache_arguments,
+    cache_from_arguments,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_REPORT = ROOT / "reports" / "change-cost-baseline.json"
@@ -245,8 +250,8 @@ def calculate_baseline(
     }
 
 
-def build_report(root: Path = ROOT) -> dict[str, Any]:
-    return calculate_baseline(root, build_dependency_report(root))
+def build_report(root: Path = ROOT, cache: SourceAnalysisCache | None = None) -> dict[str, Any]:
+    return calculate_baseline(root, build_dependency_report(root, cache=cache))
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -255,9 +260,10 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--report", type=Path, default=DEFAULT_REPORT)
     parser.add_argument("--document", type=Path, default=DEFAULT_DOCUMENT)
     parser.add_argument("--check", action="store_true")
+    add_cache_arguments(parser)
     args = parser.parse_args(argv)
     try:
-        report = build_report(args.root.resolve())
+        report = build_report(args.root.resolve(), cache_from_arguments(args))
         rendered = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
         document = render_markdown(report)
         if args.check:
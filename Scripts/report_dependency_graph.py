@@ -24,6 +24,11 @@ from dependency_graph import (
     source_texts,
 )
 from dependency_graph_render import render_markdown
+from source_analysis_cache import (
+    SourceAnalysisCache,
+    add_cache_arguments,
+    cache_from_arguments,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 DEFAULT_REPORT = ROOT / "reports" / "dependency-graph.json"
@@ -194,10 +199,14 @@ def _directions(edges: list[dict[str, Any]], texts: dict[str, str]) -> list[dict
     ]
 
 
-def build_report(root: Path = ROOT, paths: list[str] | None = None) -> dict[str, Any]:
+def build_report(
+    root: Path = ROOT,
+    paths: list[str] | None = None,
+    cache: SourceAnalysisCache | None = None,
+) -> dict[str, Any]:
     visible_paths = paths or repository_paths(root)
     texts = source_texts(root, visible_paths)
-    edges = collect_import_edges(texts, set(visible_paths))
+    edges = collect_import_edges(texts, set(visible_paths), cache)
     cycles = elementary_cycles(set(texts), edges)
     deep = deep_imports(edges)
     bypasses = api_bypasses(edges, set(visible_paths))
@@ -245,9 +254,10 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--report", type=Path, default=DEFAULT_REPORT)
     parser.add_argument("--document", type=Path, default=DEFAULT_DOCUMENT)
     parser.add_argument("--check", action="store_true")
+    add_cache_arguments(parser)
     args = parser.parse_args(argv)
     try:
-        report = build_report(args.root.resolve())
+        report = build_report(args.root.resolve(), cache=cache_from_arguments(args))
         rendered = json.dumps(report, ensure_ascii=False, indent=2) + "\n"
         document = render_markdown(report)
         if args.check:
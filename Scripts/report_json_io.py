@@ -0,0 +1,141 @@
+"""Streaming JSON I/O shared by the test-governance reports.
+
+The versioned reports are the bytes of ``json.dumps(value, ensure_ascii=False, indent=2)``
+followed by a newline. They are written here chunk by chunk into a temporary sibling that
+replaces the destination, hashed on the way, and read back member by member when a
+consumer needs only part of the document.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator
+
+from Scripts.schema_registry import REGISTRY
+
+# Encoder chunks are flushed to disk and to the digest in batches of this many.
+WRITE_BATCH_CHUNKS = 1 << 14
+ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+WHITESPACE = " \t\n\r"
+
+PairsHook = Callable[[list[tuple[str, Any]]], dict[str, Any]]
+
+
+def reject_duplicate_keys(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
+    value = dict(pairs)
+    if len(value) != len(pairs):
+        seen: set[str] = set()
+        duplicate = next(key for key, _item in pairs if key in seen or seen.add(key))
+        raise ValueError(f"Duplicate JSON property: {duplicate}")
+    return value
+
+
+def report_blocks(value: Any) -> Iterator[bytes]:
+    """UTF-8 blocks of the canonical report serialisation, newline included."""
+    chunks = ENCODER.iterencode(value)
+    while batch := list(islice(chunks, WRITE_BATCH_CHUNKS)):
+        yield "".join(batch).encode("utf-8")
+    yield b"\n"
+
+
+def report_digest(value: Any) -> str:
+    """SHA-256 of the canonical serialisation, without holding it in memory."""
+    digest = hashlib.sha256()
+    for block in report_blocks(value):
+        digest.update(block)
+    return digest.hexdigest()
+
+
+def write_json_report(value: Any, destination: Path) -> str:
+    """Stream the canonical serialisation to ``destination`` and return its SHA-256."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    temporary = destination.with_name(f".{destination.name}.{os.getpid()}.tmp")
+    digest = hashlib.sha256()
+    try:
+        with temporary.open("wb") as handle:
+            for block in report_blocks(value):
+                digest.update(block)
+                handle.write(block)
+        os.replace(temporary, destination)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return digest.hexdigest()
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    while index < len(text) and text[index] in WHITESPACE:
+        index += 1
+    return index
+
+
+def _expect(text: str, index: int, tokens: str) -> tuple[str, int]:
+    index = _skip_whitespace(text, index)
+    if index >= len(text) or text[index] not in tokens:
+        raise json.JSONDecodeError(f"Expected one of {tokens!r}", text, index)
+    return text[index], index + 1
+
+
+def iter_json_members(
+    text: str, hook: PairsHook = reject_duplicate_keys
+) -> Iterator[tuple[str, Any]]:
+    """``(key, value)`` members of a top-level JSON object, decoded one at a time.
+
+    Top-level keys are checked for duplicates as they are met; ``hook`` checks the
+    nested objects.
+    """
+    decoder = json.JSONDecoder(object_pairs_hook=hook)
+    seen: set[str] = set()
+    _token, index = _expect(text, 0, "{")
+    token = "}" if text.startswith("}", _skip_whitespace(text, index)) else ","
+    if token == "}":
+        index = _skip_whitespace(text, index) + 1
+    while token == ",":
+        index = _skip_whitespace(text, index)
+        key, index = decoder.raw_decode(text, index)
+        if not isinstance(key, str):
+            raise json.JSONDecodeError("Expected a property name", text, index)
+        if key in seen:
+            raise ValueError(f"Duplicate JSON property: {key}")
+        seen.add(key)
+        _token, index = _expect(text, index, ":")
+        value, index = decoder.raw_decode(text, _skip_whitespace(text, index))
+        yield key, value
+        token, index = _expect(text, index, ",}")
+    index = _skip_whitespace(text, index)
+    if index != len(text):
+        raise json.JSONDecodeError("Extra data", text, index)
+
+
+def json_member(path: Path, key: str, hook: PairsHook = reject_duplicate_keys) -> Any:
+    """One top-level member of a JSON object file, decoding no member after it."""
+    for name, value in iter_json_members(path.read_text(encoding="utf-8"), hook):
+        if name == key:
+            return value
+    raise KeyError(key)
+
+
+def record_validator(schema_path: Path, definition: str) -> Draft202012Validator:
+    """Compiled validator of one ``$defs`` entry, checked and built once per process.
+
+    Both the schema and the entry go through the shared schema registry.
+    """
+    schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    REGISTRY.validator(schema)
+    return REGISTRY.validator({"$ref": f"#/$defs/{definition}", "$defs": schema["$defs"]})
+
+
+def record_schema_errors(
+    validator: Draft202012Validator, records: Iterable[Any], label: str
+) -> list[str]:
+    return [
+        f"{label} {index}: {error.message}"
+        for index, record in enumerate(records)
+        for error in validator.iter_errors(record)
+    ]
@@ -352,7 +352,6 @@ main = execution_counts_main(
     default_output=DEFAULT_OUTPUT,
     default_native=DEFAULT_NATIVE,
     validate_report=validate_report_reference,
-    load_json=load_json,
     consolidate=consolidate,
     report_writer=write_report,
 )
@@ -6,13 +6,18 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from Scripts.statistical_compatibility_common import load_json  # noqa: E402
+from Scripts.statistical_compatibility_common import (  # noqa: E402
+    CompatibilityDiagnostic,
+    load_json,
+)
 from Scripts.statistical_compatibility_control import validate_authority_and_evaluate  # noqa: E402
 from Scripts.statistical_compatibility_evidence import (  # noqa: E402
     build_evidence,
@@ -58,54 +63,93 @@ def parse_proof_paths(values: list[str]) -> dict[str, str]:
     return overrides
 
 
+@dataclass(frozen=True)
+class CompatibilityRun:
+    evidence: dict[str, Any]
+    states: list[dict[str, Any]]
+    proof_fingerprints: dict[str, str]
+    diagnostics: list[CompatibilityDiagnostic]
+    evidence_issues: list[str]
+    output: Path
+
+    @property
+    def passed(self) -> bool:
+        return not self.diagnostics and not self.evidence_issues
+
+
+def run_control(
+    *,
+    root: Path = ROOT,
+    authority_path: Path = DEFAULT_AUTHORITY,
+    authority_schema_path: Path = DEFAULT_AUTHORITY_SCHEMA,
+    evidence_schema_path: Path = DEFAULT_EVIDENCE_SCHEMA,
+    output: Path = DEFAULT_OUTPUT,
+    proof_paths: dict[str, str] | None = None,
+) -> CompatibilityRun:
+    """Evaluate the authority and write its evidence; loading failures propagate."""
+    authority = load_json(_at(root, authority_path))
+    authority_schema = load_json(_at(root, authority_schema_path))
+    evidence_schema = load_json(_at(root, evidence_schema_path))
+    states, proof_fingerprints, diagnostics = validate_authority_and_evaluate(
+        root,
+        authority,
+        authority_schema,
+        load_committed_authority(root, authority_path.as_posix()),
+        proof_paths or {},
+    )
+    evidence = build_evidence(authority, states, proof_fingerprints, diagnostics)
+    evidence_issues = validate_evidence(evidence, evidence_schema)
+    destination = _at(root, output)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.write_text(
+        json.dumps(evidence, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8",
+        newline="\n",
+    )
+    return CompatibilityRun(
+        evidence, states, proof_fingerprints, diagnostics, evidence_issues, destination
+    )
+
+
 def main(argv: list[str] | None = None) -> int:
     args = _parser().parse_args(argv)
     try:
-        proof_paths = parse_proof_paths(args.proof_path)
-        authority = load_json(_at(args.root, args.authority))
-        authority_schema = load_json(_at(args.root, args.authority_schema))
-        evidence_schema = load_json(_at(args.root, args.evidence_schema))
+        run = run_control(
+            root=args.root,
+            authority_path=args.authority,
+            authority_schema_path=args.authority_schema,
+            evidence_schema_path=args.evidence_schema,
+            output=args.output,
+            proof_paths=parse_proof_paths(args.proof_path),
+        )
     except (OSError, UnicodeError, ValueError, json.JSONDecodeError) as exc:
         print(
             f"ERROR compatibility_control_error: cannot load compatibility authority: {exc}",
             file=sys.stderr,
         )
         return 2
-    states, proof_fingerprints, diagnostics = validate_authority_and_evaluate(
-        args.root,
-        authority,
-        authority_schema,
-        load_committed_authority(args.root, args.authority.as_posix()),
-        proof_paths,
-    )
     if args.print_fingerprints:
-        for state in states:
+        for state in run.states:
             print(f"component {state['id']}: {state['actual_semantic_fingerprint']}")
-        for proof_id, fingerprint in proof_fingerprints.items():
+        for proof_id, fingerprint in run.proof_fingerprints.items():
             print(f"proof {proof_id}: {fingerprint}")
-    evidence = build_evidence(authority, states, proof_fingerprints, diagnostics)
-    evidence_issues = validate_evidence(evidence, evidence_schema)
-    output = _at(args.root, args.output)
-    output.parent.mkdir(parents=True, exist_ok=True)
-    output.write_text(
-        json.dumps(evidence, ensure_ascii=False, indent=2, sort_keys=True) + "\n",
-        encoding="utf-8",
-        newline="\n",
-    )
-    for diagnostic in diagnostics:
+    for diagnostic in run.diagnostics:
         print(
             f"ERROR {diagnostic.classification} [{diagnostic.component}] "
             f"{diagnostic.code}: {diagnostic.corrective_action}",
             file=sys.stderr,
         )
-    for issue in evidence_issues:
+    for issue in run.evidence_issues:
         print(f"ERROR compatibility_control_error evidence {issue}", file=sys.stderr)
-    if diagnostics or evidence_issues:
-        print(f"Statistical compatibility blocked; evidence written to {output}.", file=sys.stderr)
+    if not run.passed:
+        print(
+            f"Statistical compatibility blocked; evidence written to {run.output}.",
+            file=sys.stderr,
+        )
         return 1
     print(
         "Statistical compatibility is coherent and blocking control passed; "
-        f"evidence written to {output}."
+        f"evidence written to {run.output}."
     )
     return 0
 
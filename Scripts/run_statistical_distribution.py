@@ -22,18 +22,20 @@ from Scripts.statistical_distribution_protocol import (  # noqa: E402
     validate_protocol_bundle,
 )
 from Scripts.statistical_distribution_runner import (  # noqa: E402
+    CohortObservations,
     EngineExecutionError,
     InfrastructureError,
     build_distribution_evidence,
     build_execution_plan,
     invalid_evidence,
-    run_python_plan,
+    observe_python_plan,
+    reduce_engine_report,
     run_typescript_plan,
-    validate_engine_report,
     write_evidence,
 )
 
 DEFAULT_EVIDENCE_PATH = ROOT / "reports/statistical-distribution-evidence.json"
+PythonRunner = Callable[[dict[str, Any]], CohortObservations]
 EngineRunner = Callable[[dict[str, Any]], dict[str, Any]]
 
 
@@ -45,7 +47,7 @@ def run_control(
     seeds_schema_path: Path = SEEDS_SCHEMA_PATH,
     corpus_path: Path = CORPUS_PATH,
     evidence_path: Path = DEFAULT_EVIDENCE_PATH,
-    python_runner: EngineRunner = run_python_plan,
+    python_runner: PythonRunner = observe_python_plan,
     typescript_runner: EngineRunner = run_typescript_plan,
 ) -> dict[str, Any]:
     try:
@@ -58,12 +60,12 @@ def run_control(
         )
         python_plan = build_execution_plan(protocol, seeds, corpus, "python")
         typescript_plan = build_execution_plan(protocol, seeds, corpus, "typescript")
-        python_report = python_runner(python_plan)
-        typescript_report = typescript_runner(typescript_plan)
-        validate_engine_report(python_report, python_plan, "python")
-        validate_engine_report(typescript_report, typescript_plan, "typescript")
+        python_observations = python_runner(python_plan)
+        typescript_observations = reduce_engine_report(
+            typescript_runner(typescript_plan), typescript_plan, "typescript",
+        )
         report = build_distribution_evidence(
-            protocol, seeds, corpus, python_report, typescript_report,
+            protocol, seeds, corpus, python_observations, typescript_observations,
         )
     except ProtocolBundleError as exc:
         report = invalid_evidence(exc.classification, exc.diagnostics)
@@ -75,6 +77,10 @@ def run_control(
     return report
 
 
+def exit_status(report: dict[str, Any]) -> int:
+    return 1 if report["status"] == "invalid" else 0
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--protocol", type=Path, default=PROTOCOL_PATH)
@@ -98,7 +104,7 @@ def main(argv: list[str] | None = None) -> int:
         f"métriques={summary['metric_count']}, divergences={summary['divergences']}, "
         f"non concluantes={summary['inconclusive']}."
     )
-    return 1 if report["status"] == "invalid" else 0
+    return exit_status(report)
 
 
 if __name__ == "__main__":
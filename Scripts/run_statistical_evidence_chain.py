@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""Régénérer la chaîne des preuves statistiques dans un seul processus.
+
+Parité déterministe, rejeu exact, parité distributionnelle, calibration, compatibilité
+et rapport consolidé forment un graphe dérivé des artefacts que chaque étape lit et
+écrit. Les étapes indépendantes s'exécutent en parallèle, partagent les schémas compilés
+et les rapports moteurs communs, et seules celles dont les entrées ont changé depuis le
+dernier succès sont régénérées.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import threading
+import time
+from copy import deepcopy
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.mc_core import SIMULATION_BATCH_SIZE  # noqa: E402
+from Scripts import calibrate_statistical_distribution as calibration  # noqa: E402
+from Scripts import generate_statistical_consolidated_report as consolidated  # noqa: E402
+from Scripts import run_statistical_compatibility as compatibility  # noqa: E402
+from Scripts import run_statistical_distribution as distribution  # noqa: E402
+from Scripts import run_statistical_exact_replay as exact_replay  # noqa: E402
+from Scripts import run_statistical_reference_corpus as parity  # noqa: E402
+from Scripts.schema_registry import schema_key, schema_overhead  # noqa: E402
+from Scripts.statistical_case_cache import add_runner_arguments, runner_options  # noqa: E402
+from Scripts.statistical_compatibility_common import load_json  # noqa: E402
+from Scripts.statistical_compatibility_evolution import load_committed_authority  # noqa: E402
+from Scripts.statistical_consolidated_source_catalog import SOURCE_DEFINITIONS  # noqa: E402
+from Scripts.statistical_corpus_runner import (  # noqa: E402
+    run_python_corpus,
+    run_typescript_corpus,
+)
+from Scripts.statistical_distribution_protocol import (  # noqa: E402
+    CORPUS_PATH,
+    PROTOCOL_PATH,
+    PROTOCOL_SCHEMA_PATH,
+    SEEDS_PATH,
+    SEEDS_SCHEMA_PATH,
+)
+from Scripts.statistical_evidence_graph import (  # noqa: E402
+    DEFAULT_MANIFEST,
+    EvidenceManifest,
+    EvidenceStage,
+    StageResult,
+    run_graph,
+)
+from Scripts.validate_statistical_reference_corpus import SCHEMA_PATH  # noqa: E402
+
+PROTOCOL_INPUTS = (PROTOCOL_PATH, PROTOCOL_SCHEMA_PATH, SEEDS_PATH, SEEDS_SCHEMA_PATH)
+STATUS_LABELS = {
+    "regenerated": "régénérée",
+    "up_to_date": "à jour",
+    "failed": "en échec",
+    "error": "erreur",
+    "blocked": "bloquée",
+}
+
+
+class SharedEngineRuns:
+    """Engine reports computed once per process; each caller receives its own copy.
+
+    The parity report and the exact replay both run the TypeScript corpus and the Python
+    corpus at the production batch size; the first caller runs the engine while the
+    other waits for its report. A failure is raised to every caller.
+    """
+
+    def __init__(self, **python_options: Any) -> None:
+        self._python_options = python_options
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[Any, ...], threading.Lock] = {}
+        self._outcomes: dict[tuple[Any, ...], tuple[Any, BaseException | None]] = {}
+
+    def _shared(self, key: tuple[Any, ...], compute: Any) -> dict[str, Any]:
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._outcomes:
+                try:
+                    self._outcomes[key] = (compute(), None)
+                except Exception as exc:  # noqa: BLE001 - replayed to every caller
+                    self._outcomes[key] = (None, exc)
+            report, error = self._outcomes[key]
+        if error is not None:
+            raise error
+        return deepcopy(report)
+
+    def python_corpus(self, corpus: dict[str, Any], batch_size: int) -> dict[str, Any]:
+        return self._shared(
+            ("python", schema_key(corpus), batch_size),
+            lambda: run_python_corpus(corpus, batch_size=batch_size, **self._python_options),
+        )
+
+    def typescript_corpus(self, corpus_path: Path) -> dict[str, Any]:
+        return self._shared(
+            ("typescript", corpus_path.resolve()), lambda: run_typescript_corpus(corpus_path)
+        )
+
+
+def _at_root(path: str | Path) -> Path:
+    path = Path(path)
+    return path if path.is_absolute() else ROOT / path
+
+
+def _compatibility_inputs() -> tuple[tuple[Path, ...], str]:
+    """Authority files, every artifact it fingerprints and the committed authority.
+
+    An unreadable authority leaves only its own files as inputs: the stage then fails
+    as the standalone control does and is never recorded as up to date.
+    """
+    paths = [
+        compatibility.DEFAULT_AUTHORITY,
+        compatibility.DEFAULT_AUTHORITY_SCHEMA,
+        compatibility.DEFAULT_EVIDENCE_SCHEMA,
+    ]
+    try:
+        authority = load_json(_at_root(compatibility.DEFAULT_AUTHORITY))
+        for proof in authority["proof_artifacts"]:
+            paths += [proof["path"], proof["schema_path"]]
+        for component in authority["components"]:
+            paths += [entry["path"] for entry in component["authorities"]]
+    except (OSError, UnicodeError, ValueError, KeyError, TypeError):
+        pass
+    committed = load_committed_authority(ROOT, compatibility.DEFAULT_AUTHORITY.as_posix())
+    salt = "none" if committed is None else schema_key(committed)
+    return tuple(dict.fromkeys(_at_root(path) for path in paths)), salt
+
+
+def _consolidated_inputs() -> tuple[Path, ...]:
+    paths = [consolidated.SCHEMA_PATH]
+    for definition in SOURCE_DEFINITIONS:
+        paths.append(_at_root(definition.path))
+        if definition.schema_path is not None:
+            paths.append(_at_root(definition.schema_path))
+    return tuple(dict.fromkeys(paths))
+
+
+def _parity(engines: SharedEngineRuns) -> bool:
+    report = parity.run_control(
+        python_runner=lambda corpus: engines.python_corpus(corpus, SIMULATION_BATCH_SIZE),
+        typescript_runner=engines.typescript_corpus,
+    )
+    return parity.exit_status(report) == 0
+
+
+def _exact_replay(engines: SharedEngineRuns) -> bool:
+    report = exact_replay.run_control(
+        python_runner=engines.python_corpus, typescript_runner=engines.typescript_corpus
+    )
+    return exact_replay.exit_status(report) == 0
+
+
+def _consolidated() -> bool:
+    report, issues = consolidated.run_control()
+    return consolidated.exit_status(report, issues) == 0
+
+
+def build_stages(engines: SharedEngineRuns, *, workers: int) -> tuple[EvidenceStage, ...]:
+    compatibility_inputs, committed_authority = _compatibility_inputs()
+    return (
+        EvidenceStage(
+            "deterministic_parity",
+            (SCHEMA_PATH, CORPUS_PATH, parity.DEFAULT_VALIDATION_PROBES),
+            (parity.DEFAULT_JSON_REPORT, parity.DEFAULT_MARKDOWN_REPORT),
+            lambda: _parity(engines),
+        ),
+        EvidenceStage(
+            "exact_replay",
+            (SCHEMA_PATH, CORPUS_PATH),
+            (exact_replay.DEFAULT_EVIDENCE_PATH,),
+            lambda: _exact_replay(engines),
+        ),
+        EvidenceStage(
+            "distribution_evidence",
+            (*PROTOCOL_INPUTS, CORPUS_PATH),
+            (distribution.DEFAULT_EVIDENCE_PATH,),
+            lambda: distribution.exit_status(distribution.run_control()) == 0,
+        ),
+        EvidenceStage(
+            "distribution_calibration",
+            PROTOCOL_INPUTS,
+            (calibration.DEFAULT_OUTPUT,),
+            lambda: calibration.exit_status(calibration.run_control(workers=workers)) == 0,
+        ),
+        EvidenceStage(
+            "compatibility_evidence",
+            compatibility_inputs,
+            (_at_root(compatibility.DEFAULT_OUTPUT),),
+            lambda: compatibility.run_control().passed,
+            salt=committed_authority,
+        ),
+        EvidenceStage(
+            "consolidated_report",
+            _consolidated_inputs(),
+            (consolidated.DEFAULT_JSON_PATH, consolidated.DEFAULT_MARKDOWN_PATH),
+            _consolidated,
+        ),
+    )
+
+
+def _render(result: StageResult) -> str:
+    line = f"- {result.name} : {STATUS_LABELS[result.status]}"
+    if result.status in {"regenerated", "failed", "error"}:
+        line += f" ({result.seconds:.1f} s)"
+    return f"{line} — {result.detail}" if result.detail else line
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--force", action="store_true", help="régénérer toutes les preuves")
+    parser.add_argument("--jobs", type=int, default=4, help="étapes exécutées en parallèle")
+    add_runner_arguments(parser)
+    args = parser.parse_args(argv)
+    options = runner_options(args)
+    manifest = EvidenceManifest(args.manifest)
+    if args.force:
+        manifest.entries.clear()
+    started = time.perf_counter()
+    with schema_overhead() as timings:
+        results = run_graph(
+            build_stages(SharedEngineRuns(**options), workers=options["workers"]),
+            manifest=manifest,
+            max_workers=max(args.jobs, 1),
+        )
+    print("Chaîne des preuves statistiques :")
+    for result in results:
+        print(_render(result))
+    print(timings.render(time.perf_counter() - started), file=sys.stderr)
+    return 0 if all(result.status in {"regenerated", "up_to_date"} for result in results) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,6 +7,8 @@ import argparse
 import json
 import sys
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -14,6 +16,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
 from Scripts.run_statistical_reference_corpus import validate_for_execution  # noqa: E402
+from Scripts.statistical_case_cache import add_runner_arguments, runner_options  # noqa: E402
 from Scripts.statistical_corpus_runner import (  # noqa: E402
     fatal_engine_report,
     run_python_corpus,
@@ -194,8 +197,9 @@ def _safe_engine_run(
 def _default_python_runner(
     corpus: dict[str, Any],
     batch_size: int,
+    **options: Any,
 ) -> dict[str, Any]:
-    return run_python_corpus(corpus, batch_size=batch_size)
+    return run_python_corpus(corpus, batch_size=batch_size, **options)
 
 
 def write_evidence(report: dict[str, Any], path: Path) -> None:
@@ -227,21 +231,25 @@ def _run_validated_control(
             "batch_plan_invalid",
             batch_issues,
         )
-    typescript_report = _safe_engine_run(
-        engine="typescript",
-        corpus=corpus,
-        batch_size=None,
-        runner=lambda: typescript_runner(corpus_path),
-    )
-    python_reports = [
-        _safe_engine_run(
-            engine="python",
+    # The Node subprocess runs while the Python batches execute.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        typescript_future = executor.submit(
+            _safe_engine_run,
+            engine="typescript",
             corpus=corpus,
-            batch_size=batch_size,
-            runner=lambda size=batch_size: python_runner(corpus, size),
+            batch_size=None,
+            runner=lambda: typescript_runner(corpus_path),
         )
-        for batch_size in batch_sizes
-    ]
+        python_reports = [
+            _safe_engine_run(
+                engine="python",
+                corpus=corpus,
+                batch_size=batch_size,
+                runner=lambda size=batch_size: python_runner(corpus, size),
+            )
+            for batch_size in batch_sizes
+        ]
+        typescript_report = typescript_future.result()
     return build_exact_replay_report(
         corpus,
         batch_sizes,
@@ -278,6 +286,19 @@ def run_control(
     return report
 
 
+def exit_status(report: dict[str, Any]) -> int:
+    return (
+        1
+        if report["status"]
+        in {
+            "invalid_corpus",
+            "invalid_configuration",
+            "engine_error",
+        }
+        else 0
+    )
+
+
 def _print_summary(report: dict[str, Any]) -> None:
     print(f"Rejeu statistique exact : statut={report['status']}, contrôle=informatif.")
     if report["status"] in {"invalid_corpus", "invalid_configuration"}:
@@ -304,6 +325,7 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--corpus", type=Path, default=CORPUS_PATH)
     parser.add_argument("--evidence", type=Path, default=DEFAULT_EVIDENCE_PATH)
     parser.add_argument("--batch-size", type=int, action="append", dest="batch_sizes")
+    add_runner_arguments(parser)
     args = parser.parse_args(argv)
     batch_sizes = tuple(args.batch_sizes) if args.batch_sizes is not None else DEFAULT_BATCH_SIZES
     report = run_control(
@@ -311,18 +333,10 @@ def main(argv: list[str] | None = None) -> int:
         corpus_path=args.corpus,
         evidence_path=args.evidence,
         batch_sizes=batch_sizes,
+        python_runner=partial(_default_python_runner, **runner_options(args)),
     )
     _print_summary(report)
-    return (
-        1
-        if report["status"]
-        in {
-            "invalid_corpus",
-            "invalid_configuration",
-            "engine_error",
-        }
-        else 0
-    )
+    return exit_status(report)
 
 
 if __name__ == "__main__":
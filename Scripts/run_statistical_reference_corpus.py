@@ -6,15 +6,18 @@ from __future__ import annotations
 import argparse
 import sys
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from Scripts.schema_registry import check_schema  # noqa: E402
+from Scripts.statistical_case_cache import add_runner_arguments, runner_options  # noqa: E402
 from Scripts.statistical_corpus_runner import (  # noqa: E402
     error_payload,
     fatal_engine_report,
@@ -60,7 +63,7 @@ def validate_for_execution(
     if not isinstance(schema, dict):
         return None, "schema_invalid", [f"{schema_path.as_posix()}:/: schema must be a JSON object"]
     try:
-        Draft202012Validator.check_schema(schema)
+        check_schema(schema)
     except SchemaError as exc:
         return None, "schema_invalid", [f"{schema_path.as_posix()}:/: {exc.message}"]
 
@@ -104,6 +107,31 @@ def _safe_validation_run(
         }
 
 
+def _run_engines(
+    corpus: dict[str, Any],
+    *,
+    python: Callable[[], dict[str, Any]],
+    typescript: Callable[[], dict[str, Any]],
+    python_validation: Callable[[], dict[str, Any]],
+    typescript_validation: Callable[[], dict[str, Any]],
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Run both Node bridges while the Python engine executes the corpus."""
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        typescript_future = executor.submit(_safe_engine_run, "typescript", corpus, typescript)
+        typescript_validation_future = executor.submit(
+            _safe_validation_run, "typescript", typescript_validation
+        )
+        python_report = _safe_engine_run("python", corpus, python)
+        python_validation_report = _safe_validation_run("python", python_validation)
+        return (
+            python_report,
+            typescript_future.result(),
+            python_validation_report,
+            typescript_validation_future.result(),
+        )
+
+
 def run_control(
     *,
     schema_path: Path = SCHEMA_PATH,
@@ -135,23 +163,16 @@ def run_control(
             )
             write_reports(report, json_report_path, markdown_report_path)
             return report
-        python_report = _safe_engine_run(
-            "python",
-            corpus,
-            lambda: python_runner(corpus),
-        )
-        typescript_report = _safe_engine_run(
-            "typescript",
-            corpus,
-            lambda: typescript_runner(corpus_path),
-        )
-        python_validation_report = _safe_validation_run(
-            "python",
-            lambda: python_validation_runner(probes),
-        )
-        typescript_validation_report = _safe_validation_run(
-            "typescript",
-            lambda: typescript_validation_runner(validation_probes_path),
+        python_report, typescript_report, python_validation_report, typescript_validation_report = (
+            _run_engines(
+                corpus,
+                python=lambda: python_runner(corpus),
+                typescript=lambda: typescript_runner(corpus_path),
+                python_validation=lambda: python_validation_runner(probes),
+                typescript_validation=lambda: typescript_validation_runner(
+                    validation_probes_path
+                ),
+            )
         )
         report = build_parity_report(
             corpus,
@@ -165,6 +186,10 @@ def run_control(
     return report
 
 
+def exit_status(report: dict[str, Any]) -> int:
+    return 1 if report["status"] in {"invalid_corpus", "engine_error"} else 0
+
+
 def _print_summary(report: dict[str, Any]) -> None:
     print(
         f"Statistical parity report: status={report['status']}, "
@@ -206,6 +231,7 @@ def main(argv: list[str] | None = None) -> int:
         type=Path,
         default=DEFAULT_VALIDATION_PROBES,
     )
+    add_runner_arguments(parser)
     args = parser.parse_args(argv)
     report = run_control(
         schema_path=args.schema,
@@ -213,9 +239,10 @@ def main(argv: list[str] | None = None) -> int:
         json_report_path=args.json_report,
         markdown_report_path=args.markdown_report,
         validation_probes_path=args.validation_probes,
+        python_runner=partial(run_python_corpus, **runner_options(args)),
     )
     _print_summary(report)
-    return 1 if report["status"] in {"invalid_corpus", "engine_error"} else 0
+    return exit_status(report)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+"""Process-wide registry of checked, compiled JSON Schemas shared by the repository's controls.
+
+Both the statistical controls and the test-governance reports (``report_json_io.py``) use it.
+Checking a contract schema against the Draft 2020-12 metaschema costs 5 to 90 ms, far more than
+building its validator, and one run checks the same ``contracts/`` schemas from several controls.
+The registry keys each schema by the SHA-256 of its canonical JSON, so a schema is checked and
+compiled once per process. When ``MONTECARLO_SCHEMA_CACHE_DIR`` names a directory, schemas found
+valid are also recorded there and later processes skip their metaschema check; invalid schemas are
+never recorded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError, ValidationError
+
+PERSISTENT_CACHE_ENV = "MONTECARLO_SCHEMA_CACHE_DIR"
+# A recorded verdict holds for one metaschema implementation.
+CACHE_FORMAT = f"1-{version('jsonschema')}"
+
+
+@dataclass
+class SchemaTimings:
+    """Time spent on schemas since the registry was created or last reset."""
+
+    check_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    checked: int = 0
+    reused: int = 0
+    validations: int = 0
+
+    def render(self, total_seconds: float) -> str:
+        spent = self.check_seconds + self.validate_seconds
+        share = spent / total_seconds if total_seconds > 0 else 0.0
+        return (
+            f"Schémas JSON : {spent * 1000:.0f} ms sur {total_seconds * 1000:.0f} ms "
+            f"({share:.0%}) ; vérification {self.check_seconds * 1000:.0f} ms "
+            f"({self.checked} schémas, {self.reused} réutilisés), "
+            f"validation {self.validate_seconds * 1000:.0f} ms ({self.validations} documents)."
+        )
+
+
+def schema_key(schema: Any) -> str:
+    encoded = json.dumps(schema, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class SchemaRegistry:
+    """Checked schemas and their validators, keyed by content."""
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.timings = SchemaTimings()
+        self._validators: dict[str, Draft202012Validator] = {}
+        self._invalid: dict[str, SchemaError] = {}
+
+    def _marker(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{CACHE_FORMAT}-{key}"
+
+    def _check(self, key: str, schema: Any) -> None:
+        if key in self._invalid:
+            raise self._invalid[key]
+        marker = self._marker(key)
+        if marker is not None and marker.is_file():
+            self.timings.reused += 1
+            return
+        started = time.perf_counter()
+        try:
+            Draft202012Validator.check_schema(schema)
+        except SchemaError as exc:
+            self._invalid[key] = exc
+            raise
+        finally:
+            self.timings.check_seconds += time.perf_counter() - started
+            self.timings.checked += 1
+        if marker is not None:
+            self._record(marker)
+
+    @staticmethod
+    def _record(marker: Path) -> None:
+        # The marker only spares later processes a check: failing to write it is not an error.
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError as exc:
+            print(f"WARNING: schema cache not written: {exc}", file=sys.stderr)
+
+    def validator(self, schema: Any) -> Draft202012Validator:
+        """The validator of a schema checked against the metaschema; raises ``SchemaError``."""
+        key = schema_key(schema)
+        validator = self._validators.get(key)
+        if validator is None:
+            self._check(key, schema)
+            # A private copy: the caller may mutate its schema after validating.
+            validator = self._validators[key] = Draft202012Validator(deepcopy(schema))
+        return validator
+
+    def errors(self, schema: Any, instance: Any) -> list[ValidationError]:
+        validator = self.validator(schema)
+        started = time.perf_counter()
+        try:
+            return list(validator.iter_errors(instance))
+        finally:
+            self.timings.validate_seconds += time.perf_counter() - started
+            self.timings.validations += 1
+
+
+def _default_registry() -> SchemaRegistry:
+    directory = os.environ.get(PERSISTENT_CACHE_ENV)
+    return SchemaRegistry(Path(directory) if directory else None)
+
+
+REGISTRY = _default_registry()
+
+
+def check_schema(schema: Any) -> None:
+    """Raise ``SchemaError`` unless the schema is valid Draft 2020-12."""
+    REGISTRY.validator(schema)
+
+
+def schema_errors(schema: Any, instance: Any) -> list[ValidationError]:
+    """Validation errors of ``instance``; raises ``SchemaError`` for an invalid schema."""
+    return REGISTRY.errors(schema, instance)
+
+
+@contextmanager
+def schema_overhead() -> Iterator[SchemaTimings]:
+    """Fresh timings for the enclosed block; the caller renders them against its duration."""
+    previous = REGISTRY.timings
+    REGISTRY.timings = SchemaTimings()
+    try:
+        yield REGISTRY.timings
+    finally:
+        REGISTRY.timings = previous
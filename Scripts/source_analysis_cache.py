@@ -0,0 +1,188 @@
+"""Content-addressed on-disk cache of per-file facts shared by the static source analysers.
+
+``check_maintainability.py`` and ``report_dependency_graph.py`` both parse every Python file and
+scan every JavaScript file. Each of their extractors turns one ``(path, text)`` into JSON facts
+that depend on no other file, so the cross-file resolution stays in the analysers while the
+parsing is keyed by the path, the text, the interpreter whose ``ast`` produced the facts and the
+source of the extractor's module together with every ``Scripts`` module it imports, directly or not.
+A run re-extracts only the files whose key changed, across processes when enough of them did.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+SCRIPTS_DIRECTORY = Path(__file__).resolve().parent
+CACHE_DIRECTORY = Path(".cache") / "source-analysis"
+CACHE_FORMAT = 1
+# Below this many files a process pool costs more than it saves.
+PARALLEL_THRESHOLD = 32
+
+Extractor = Callable[[str, str], Any]
+# Facts of a whole batch of ``path -> text`` at once, for extractors run out of process.
+BatchExtractor = Callable[[dict[str, str]], dict[str, Any]]
+
+
+@lru_cache(maxsize=None)
+def file_digest(file: str) -> str:
+    return hashlib.sha256(Path(file).read_bytes()).hexdigest()
+
+
+def _extractor_name(extractor: Extractor) -> str:
+    return f"{extractor.__module__}.{extractor.__qualname__}"
+
+
+def _first_party_file(module: str) -> Path | None:
+    # ``Scripts`` is flat and its modules are imported both as ``Scripts.x`` and as bare ``x``.
+    parts = module.split(".")
+    if parts[0] == "Scripts":
+        parts = parts[1:]
+    candidate = SCRIPTS_DIRECTORY / f"{parts[0]}.py" if parts else None
+    return candidate if candidate is not None and candidate.is_file() else None
+
+
+def _imported_modules(source: str) -> set[str]:
+    modules: set[str] = set()
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            modules.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            modules.add(node.module)
+            modules.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return modules
+
+
+def module_closure(module_file: Path) -> list[Path]:
+    """``module_file`` and the ``Scripts`` modules it imports, transitively, sorted."""
+
+    closure = {module_file.resolve()}
+    pending = [module_file.resolve()]
+    while pending:
+        source = pending.pop().read_text(encoding="utf-8")
+        for module in _imported_modules(source):
+            dependency = _first_party_file(module)
+            if dependency is not None and dependency not in closure:
+                closure.add(dependency)
+                pending.append(dependency)
+    return sorted(closure)
+
+
+def interpreter_tag() -> str:
+    """Implementation and ``major.minor`` version, which decide what ``ast.parse`` returns."""
+
+    version = sys.version_info
+    return f"{sys.implementation.name}-{version.major}.{version.minor}"
+
+
+def extractor_fingerprint(extractor: Extractor) -> str:
+    """Changes with the interpreter, the extractor's module and every first-party helper it uses."""
+
+    module_file = Path(sys.modules[extractor.__module__].__file__ or "")
+    digests = "\0".join(file_digest(str(path)) for path in module_closure(module_file))
+    source_digest = hashlib.sha256(digests.encode()).hexdigest()
+    return f"{CACHE_FORMAT}:{interpreter_tag()}:{_extractor_name(extractor)}:{source_digest}"
+
+
+def _entry_key(fingerprint: str, path: str, text: str) -> str:
+    return hashlib.sha256(f"{fingerprint}\0{path}\0{text}".encode()).hexdigest()
+
+
+def _json_facts(values: list[Any]) -> list[Any]:
+    # Fresh and stored facts must compare equal, so both go through the JSON encoding.
+    return json.loads(json.dumps(values, ensure_ascii=False))
+
+
+def extract_all(extractor: Extractor, texts: dict[str, str], *, workers: int = 1) -> dict[str, Any]:
+    paths = list(texts)
+    if workers > 1 and len(paths) >= PARALLEL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            values = list(pool.map(extractor, paths, texts.values(), chunksize=8))
+    else:
+        values = [extractor(path, texts[path]) for path in paths]
+    return dict(zip(paths, _json_facts(values)))
+
+
+class SourceAnalysisCache:
+    """One JSON file per extractor, rewritten with the entries of the latest run only."""
+
+    def __init__(self, directory: Path, *, workers: int = 1) -> None:
+        self.directory = directory
+        self.workers = max(workers, 1)
+        self.extracted = 0
+        self.reused = 0
+
+    def _load(self, path: Path) -> dict[str, Any]:
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return stored if isinstance(stored, dict) else {}
+
+    def _store(self, path: Path, entries: dict[str, Any]) -> None:
+        temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(entries, ensure_ascii=False), encoding="utf-8")
+            os.replace(temporary, path)
+        except OSError as exc:
+            print(f"WARNING: source analysis cache not written: {exc}", file=sys.stderr)
+
+    def facts(self, extractor: Extractor, texts: dict[str, str]) -> dict[str, Any]:
+        return self.batch_facts(
+            _extractor_name(extractor),
+            extractor_fingerprint(extractor),
+            lambda missing: extract_all(extractor, missing, workers=self.workers),
+            texts,
+        )
+
+    def batch_facts(
+        self, name: str, fingerprint: str, extract: BatchExtractor, texts: dict[str, str]
+    ) -> dict[str, Any]:
+        """Facts stored under ``name``; ``extract`` receives only the changed texts, if any."""
+        keys = {path: _entry_key(fingerprint, path, text) for path, text in texts.items()}
+        path = self.directory / f"{name}.json"
+        stored = self._load(path)
+        missing = {item: texts[item] for item, key in keys.items() if key not in stored}
+        fresh = extract(missing) if missing else {}
+        self.extracted += len(fresh)
+        self.reused += len(keys) - len(fresh)
+        facts = {item: fresh[item] if item in fresh else stored[key] for item, key in keys.items()}
+        if fresh or len(stored) != len(keys):
+            self._store(path, {keys[item]: value for item, value in facts.items()})
+        return facts
+
+
+def source_facts(
+    extractor: Extractor, texts: dict[str, str], cache: SourceAnalysisCache | None = None
+) -> dict[str, Any]:
+    """``extractor`` facts for every text, from ``cache`` when one is given."""
+
+    return extract_all(extractor, texts) if cache is None else cache.facts(extractor, texts)
+
+
+def add_cache_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processus d'analyse des fichiers modifiés",
+    )
+    parser.add_argument("--cache-dir", type=Path, help="défaut : <root>/.cache/source-analysis")
+    parser.add_argument("--no-cache", action="store_true", help="réanalyser tous les fichiers")
+
+
+def cache_from_arguments(args: argparse.Namespace) -> SourceAnalysisCache | None:
+    if args.no_cache:
+        return None
+    directory = args.cache_dir or args.root.resolve() / CACHE_DIRECTORY
+    return SourceAnalysisCache(directory, workers=args.workers)
@@ -0,0 +1,82 @@
+"""Content-addressed cache of canonical corpus case results for the Python engine."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = ROOT / ".cache" / "statistical-corpus"
+# Everything that can change a canonical result: the engine package and its canonicaliser.
+ENGINE_SOURCE_PATTERNS = ("backend/**/*.py", "Scripts/statistical_corpus_runner.py")
+CACHE_FORMAT = 1
+
+
+@lru_cache(maxsize=None)
+def engine_source_fingerprint(root: Path = ROOT) -> str:
+    digest = hashlib.sha256(f"format:{CACHE_FORMAT}".encode())
+    paths = sorted({path for pattern in ENGINE_SOURCE_PATTERNS for path in root.glob(pattern)})
+    for path in paths:
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def case_cache_key(reference_case: dict[str, Any], *, batch_size: int, fingerprint: str) -> str:
+    """Key on what the engine sees; the case id and expected result are not inputs."""
+
+    material = {
+        "input": reference_case["input"],
+        "seed": reference_case["seed"],
+        "batch_size": batch_size,
+        "engine": fingerprint,
+    }
+    encoded = json.dumps(material, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class CaseResultCache:
+    """One JSON file per key; unreadable entries are misses and get rewritten."""
+
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR) -> None:
+        self.directory = directory
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        try:
+            result = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return result if isinstance(result, dict) else None
+
+    def store(self, key: str, result: dict[str, Any]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        temporary.write_text(json.dumps(result, ensure_ascii=False), encoding="utf-8")
+        os.replace(temporary, path)
+
+
+def add_runner_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="processus Python pour les cas du corpus",
+    )
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--no-cache", action="store_true", help="réexécuter tous les cas")
+
+
+def runner_options(args: argparse.Namespace) -> dict[str, Any]:
+    """``run_python_corpus`` keyword arguments selected on the command line."""
+
+    cache = None if args.no_cache else CaseResultCache(args.cache_dir)
+    return {"workers": max(args.workers, 1), "cache": cache}
@@ -5,9 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from Scripts.schema_registry import schema_errors
 from Scripts.statistical_compatibility_common import (
     CLASSIFICATIONS,
     HISTORICAL_DATA_CATEGORIES,
@@ -53,9 +53,8 @@ def _diagnostic(
 
 def structural_diagnostics(authority: Any, schema: Any) -> list[CompatibilityDiagnostic]:
     try:
-        Draft202012Validator.check_schema(schema)
         errors = sorted(
-            Draft202012Validator(schema).iter_errors(authority),
+            schema_errors(schema, authority),
             key=lambda error: (list(error.absolute_path), error.message),
         )
     except SchemaError as exc:
@@ -5,8 +5,7 @@ from __future__ import annotations
 from copy import deepcopy
 from typing import Any
 
-from jsonschema import Draft202012Validator
-
+from Scripts.schema_registry import schema_errors
 from Scripts.statistical_compatibility_common import CompatibilityDiagnostic, sha256
 
 
@@ -112,7 +111,7 @@ def build_evidence(
 
 def validate_evidence(evidence: Any, schema: dict[str, Any]) -> list[str]:
     errors = sorted(
-        Draft202012Validator(schema).iter_errors(evidence),
+        schema_errors(schema, evidence),
         key=lambda error: (list(error.absolute_path), error.message),
     )
     issues = [
@@ -253,11 +253,35 @@ _MANIFEST_FIELDS = (
 )
 
 
+def _released_versions(
+    current: dict[str, dict[str, Any]], previous: dict[str, dict[str, Any]]
+) -> dict[str, str]:
+    return {
+        component_id: component["current_version"]
+        for component_id, component in current.items()
+        if component_id in previous
+        and len(component["releases"]) > len(previous[component_id]["releases"])
+    }
+
+
+def _manifest_changed(new: dict[str, Any], old: dict[str, Any], released: dict[str, str]) -> bool:
+    # Following a dependency onto its newly appended release is lineage, not a manifest edit.
+    followed = [
+        {**dependency, "version": released.get(dependency["component"], dependency["version"])}
+        for dependency in old["dependencies"]
+    ]
+    return any(
+        new[field] != (followed if field == "dependencies" else old[field])
+        for field in _MANIFEST_FIELDS
+    )
+
+
 def _component_evolution_diagnostics(
     component_id: str,
     new: dict[str, Any],
     old: dict[str, Any],
     changed_proofs: set[str],
+    released: dict[str, str],
 ) -> tuple[bool, list[CompatibilityDiagnostic]]:
     diagnostics: list[CompatibilityDiagnostic] = []
     old_releases = old["releases"]
@@ -270,7 +294,7 @@ def _component_evolution_diagnostics(
             )
         ]
     appended = new["releases"][len(old_releases) :]
-    manifest_changed = any(new[field] != old[field] for field in _MANIFEST_FIELDS)
+    manifest_changed = _manifest_changed(new, old, released)
     if manifest_changed and not appended:
         diagnostics.append(
             _diagnostic(
@@ -315,6 +339,7 @@ def evolution_diagnostics(
         for component_id in removed
     )
     any_release = False
+    released = _released_versions(current_components, previous_components)
     shared = sorted(set(previous_components) & set(current_components))
     for component_id in shared:
         appended, component_diagnostics = _component_evolution_diagnostics(
@@ -322,6 +347,7 @@ def evolution_diagnostics(
             current_components[component_id],
             previous_components[component_id],
             changed_proofs,
+            released,
         )
         any_release = any_release or appended
         diagnostics.extend(component_diagnostics)
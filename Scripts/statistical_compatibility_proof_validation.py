@@ -5,9 +5,9 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Callable
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from Scripts.schema_registry import check_schema, schema_errors
 from Scripts.statistical_compatibility_common import (
     CompatibilityDiagnostic,
     json_pointer,
@@ -25,7 +25,7 @@ def _schema_diagnostics(
     diagnostic: DiagnosticFactory,
 ) -> list[CompatibilityDiagnostic]:
     errors = sorted(
-        Draft202012Validator(schema).iter_errors(document),
+        schema_errors(schema, document),
         key=lambda error: (list(error.absolute_path), error.message),
     )
     return [
@@ -96,7 +96,7 @@ def validate_proof_catalog(
         try:
             document = load_json(root / proof_path)
             schema = load_json(root / proof["schema_path"])
-            Draft202012Validator.check_schema(schema)
+            check_schema(schema)
             actual = json_document_fingerprint(root, proof_path)
         except (OSError, UnicodeError, ValueError, ExtractionError, SchemaError) as exc:
             diagnostics.append(
@@ -9,9 +9,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from Scripts.schema_registry import check_schema, schema_errors
 from Scripts.statistical_compatibility_evidence import (
     evidence_fingerprint as compatibility_fingerprint,
 )
@@ -159,7 +159,7 @@ def _load_schema(root: Path, record: SourceRecord) -> list[dict[str, Any]]:
     try:
         raw = (root / schema_path).read_bytes()
         schema = _json(raw)
-        Draft202012Validator.check_schema(schema)
+        check_schema(schema)
     except (OSError, UnicodeError, ValueError, json.JSONDecodeError, SchemaError):
         record.entry["validation_status"] = "invalid"
         return [
@@ -179,7 +179,7 @@ def _schema_diagnostics(record: SourceRecord) -> list[dict[str, Any]]:
     if record.schema is None:
         return []
     errors = sorted(
-        Draft202012Validator(record.schema).iter_errors(record.data),
+        schema_errors(record.schema, record.data),
         key=lambda error: (list(error.absolute_path), error.message),
     )
     if errors and record.entry["validation_status"] == "valid":
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from jsonschema import Draft202012Validator
-
+from Scripts.schema_registry import schema_errors
 from Scripts.statistical_consolidated_diagnostics import (
     VERDICT_PRIORITY,
     consolidated_verdict,
@@ -22,7 +21,7 @@ def _pointer(parts: Any) -> str:
 
 def structural_issues(report: Any, schema: dict[str, Any]) -> list[str]:
     errors = sorted(
-        Draft202012Validator(schema).iter_errors(report),
+        schema_errors(schema, report),
         key=lambda error: (list(error.absolute_path), error.message),
     )
     return [f"{_pointer(error.absolute_path)}: {error.message}" for error in errors]
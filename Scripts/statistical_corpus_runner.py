@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
 import shutil
 import subprocess
 import sys
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +18,11 @@ from backend.mc_core import SIMULATION_BATCH_SIZE
 from backend.simulation_models import SimulationCommand, SimulationResult
 from backend.simulation_service import run_simulation_with_batch_size
 from backend.simulation_value_objects import StatisticalValueError
+from Scripts.statistical_case_cache import (
+    CaseResultCache,
+    case_cache_key,
+    engine_source_fingerprint,
+)
 
 ROOT = Path(__file__).resolve().parents[1]
 TYPESCRIPT_BRIDGE = ROOT / "frontend/scripts/run-statistical-reference-corpus.mjs"
@@ -98,37 +106,90 @@ def _engine_header(
     return header
 
 
+def _case_report(
+    reference_case: dict[str, Any],
+    execute_case: CaseExecutor,
+) -> dict[str, Any]:
+    try:
+        result = execute_case(reference_case)
+    except Exception as exc:  # noqa: BLE001 - engine failures are report data
+        return {
+            "id": reference_case["id"],
+            "status": "engine_error",
+            "error": error_payload(exc),
+        }
+    return {"id": reference_case["id"], "status": "ok", "result": result}
+
+
+def _python_case_report(reference_case: dict[str, Any], batch_size: int) -> dict[str, Any]:
+    return _case_report(
+        reference_case,
+        lambda case: execute_python_case(case, batch_size=batch_size),
+    )
+
+
+def _run_python_cases(
+    cases: list[dict[str, Any]],
+    *,
+    batch_size: int,
+    workers: int,
+) -> list[dict[str, Any]]:
+    if workers <= 1 or len(cases) <= 1:
+        return [_python_case_report(case, batch_size) for case in cases]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(cases)), mp_context=context) as executor:
+        return list(executor.map(_python_case_report, cases, repeat(batch_size)))
+
+
+def _cached_python_cases(
+    cases: list[dict[str, Any]],
+    *,
+    batch_size: int,
+    workers: int,
+    cache: CaseResultCache | None,
+) -> list[dict[str, Any]]:
+    if cache is None:
+        return _run_python_cases(cases, batch_size=batch_size, workers=workers)
+    fingerprint = engine_source_fingerprint()
+    keys = [case_cache_key(case, batch_size=batch_size, fingerprint=fingerprint) for case in cases]
+    reports: list[dict[str, Any] | None] = []
+    for reference_case, key in zip(cases, keys):
+        result = cache.load(key)
+        if result is None:
+            reports.append(None)
+        else:
+            reports.append({"id": reference_case["id"], "status": "ok", "result": result})
+    missing = [index for index, report in enumerate(reports) if report is None]
+    computed = _run_python_cases(
+        [cases[index] for index in missing], batch_size=batch_size, workers=workers
+    )
+    for index, report in zip(missing, computed):
+        reports[index] = report
+        if report["status"] == "ok":
+            cache.store(keys[index], report["result"])
+    return [report for report in reports if report is not None]
+
+
 def run_python_corpus(
     corpus: dict[str, Any],
     execute_case: CaseExecutor = execute_python_case,
     *,
     batch_size: int = SIMULATION_BATCH_SIZE,
+    workers: int = 1,
+    cache: CaseResultCache | None = None,
 ) -> dict[str, Any]:
-    case_reports: list[dict[str, Any]] = []
-    for reference_case in corpus["cases"]:
-        try:
-            if execute_case is execute_python_case:
-                result = execute_python_case(
-                    reference_case,
-                    batch_size=batch_size,
-                )
-            else:
-                result = execute_case(reference_case)
-            case_reports.append(
-                {
-                    "id": reference_case["id"],
-                    "status": "ok",
-                    "result": result,
-                }
-            )
-        except Exception as exc:  # noqa: BLE001 - engine failures are report data
-            case_reports.append(
-                {
-                    "id": reference_case["id"],
-                    "status": "engine_error",
-                    "error": error_payload(exc),
-                }
-            )
+    """Run every case; the default engine can fan out over ``workers`` and reuse ``cache``.
+
+    Custom executors run serially and uncached: they are neither picklable nor
+    covered by the engine source fingerprint.
+    """
+
+    if execute_case is execute_python_case:
+        case_reports = _cached_python_cases(
+            corpus["cases"], batch_size=batch_size, workers=workers, cache=cache
+        )
+    else:
+        case_reports = [_case_report(case, execute_case) for case in corpus["cases"]]
     status = (
         "engine_error"
         if any(case_report["status"] == "engine_error" for case_report in case_reports)
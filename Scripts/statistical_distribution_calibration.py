@@ -5,39 +5,66 @@ from __future__ import annotations
 import hashlib
 import json
 import math
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
+from functools import partial
 from statistics import NormalDist
 from typing import Any
 
 import numpy as np
 
-from Scripts.statistical_distribution_statistics import dkw_radius, rate_difference_interval
+from Scripts.statistical_distribution_statistics import dkw_radius
 
+_ERF = np.frompyfunc(math.erf, 1, 1)
+_SQRT2 = math.sqrt(2.0)
+
+
+def _score_p_values(left: np.ndarray, right: np.ndarray, size: int) -> np.ndarray:
+    """Two-proportion score test per pair, with the float steps of ``NormalDist().cdf``."""
 
-def _score_p_value(left: int, right: int, size: int) -> float:
     pooled = (left + right) / (2 * size)
     variance = pooled * (1 - pooled) * (2 / size)
-    if variance == 0:
-        return 1.0 if left == right else 0.0
-    z = abs(left / size - right / size) / math.sqrt(variance)
-    return 2 * (1 - NormalDist().cdf(z))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.abs(left / size - right / size) / np.sqrt(variance)
+    # math.erf per element keeps p-values bit-identical to the scalar NormalDist path.
+    cdf = 0.5 * (1.0 + _ERF(np.where(variance == 0, 0.0, z) / _SQRT2).astype(float))
+    p_values = 2 * (1 - cdf)
+    return np.where(variance == 0, np.where(left == right, 1.0, 0.0), p_values)
+
+
+def _effects(left: np.ndarray, right: np.ndarray, size: int) -> np.ndarray:
+    return np.abs(left / size - right / size)
 
 
-def _rate_equivalent(left: int, right: int, size: int, alpha: float, margin: float) -> bool:
-    low, high = rate_difference_interval((left, size), (right, size), alpha)
-    return max(abs(low), abs(high)) <= margin
+def _rate_equivalent(
+    left: np.ndarray, right: np.ndarray, size: int, alpha: float, margin: float,
+) -> np.ndarray:
+    """Vector form of ``rate_difference_interval`` on equal-size Wilson intervals."""
 
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    denominator = 1 + (z * z / size)
+    bounds = []
+    for successes in (left, right):
+        rate = successes / size
+        center = (rate + z * z / (2 * size)) / denominator
+        radius = z * np.sqrt(rate * (1 - rate) / size + z * z / (4 * size * size))
+        radius /= denominator
+        bounds.append((np.maximum(0.0, center - radius), np.minimum(1.0, center + radius)))
+    (left_low, left_high), (right_low, right_high) = bounds
+    return np.maximum(np.abs(left_low - right_high), np.abs(left_high - right_low)) <= margin
 
-def _cdf_equivalent(left: int, right: int, size: int, alpha: float, margin: float) -> bool:
-    effect = abs(left / size - right / size)
-    return effect + dkw_radius(size, size, alpha) <= margin
+
+def _cdf_equivalent(
+    left: np.ndarray, right: np.ndarray, size: int, alpha: float, margin: float,
+) -> np.ndarray:
+    return _effects(left, right, size) + dkw_radius(size, size, alpha) <= margin
 
 
 def _divergent(
-    left: int, right: int, size: int, alpha: float, margin: float,
-) -> bool:
-    effect = abs(left / size - right / size)
-    return effect > margin and _score_p_value(left, right, size) <= alpha
+    left: np.ndarray, right: np.ndarray, size: int, alpha: float, margin: float,
+) -> np.ndarray:
+    return (_effects(left, right, size) > margin) & (_score_p_values(left, right, size) <= alpha)
 
 
 def _binomial_envelope(repetitions: int, probability: float, confidence: float) -> int:
@@ -81,10 +108,9 @@ def _count_pairwise(
     samples: tuple[np.ndarray, np.ndarray],
     predicate: Any,
 ) -> int:
-    return sum(
-        predicate(int(left), int(right))
-        for left, right in zip(*samples)
-    )
+    """Count the repetitions for which the vectorised ``predicate`` holds."""
+
+    return int(np.count_nonzero(predicate(*samples)))
 
 
 def _grid_counts(
@@ -147,32 +173,18 @@ def _grid_power_counts(
 
 
 def _grid_entry(
-    rng: np.random.Generator,
+    cell: tuple[int, int, dict[str, tuple[np.ndarray, np.ndarray]]],
     *,
-    cohort_size: int,
-    n_sims: int,
     repetitions: int,
     alpha: float,
     family_size: int,
     margins: dict[str, float],
 ) -> dict[str, Any]:
-    samples = _grid_samples(rng, cohort_size, n_sims, repetitions)
-    counts = _grid_counts(
-        samples,
-        cohort_size,
-        cohort_size * n_sims,
-        alpha,
-        family_size,
-        margins,
-    )
-    (
-        rate_matches,
-        cdf_matches,
-        conditional_matches,
-        rate_power,
-        cdf_power,
-        conditional_power,
-    ) = counts
+    cohort_size, n_sims, samples = cell
+    size = cohort_size * n_sims
+    counts = _grid_counts(samples, cohort_size, size, alpha, family_size, margins)
+    rate_matches, cdf_matches, conditional_matches, *power = counts
+    rate_power, cdf_power, conditional_power = power
     return {
         "cohort_size": cohort_size,
         "n_sims": n_sims,
@@ -193,22 +205,43 @@ def _build_grid(
     protocol: dict[str, Any],
     rng: np.random.Generator,
     family_size: int,
+    workers: int = 1,
 ) -> list[dict[str, Any]]:
+    """Draw every cell in protocol order, then evaluate cells serially or on ``workers``."""
+
     configuration = protocol["calibration"]
     inference = protocol["inference"]
-    return [
-        _grid_entry(
-            rng,
-            cohort_size=cohort_size,
-            n_sims=n_sims,
-            repetitions=configuration["repetitions"],
-            alpha=inference["familywise_alpha"],
-            family_size=family_size,
-            margins=inference["equivalence_margins"],
-        )
+    repetitions = configuration["repetitions"]
+    cells = [
+        (cohort_size, n_sims, _grid_samples(rng, cohort_size, n_sims, repetitions))
         for cohort_size in configuration["cohort_sizes"]
         for n_sims in configuration["simulation_sizes"]
     ]
+    evaluate = partial(
+        _grid_entry,
+        repetitions=repetitions,
+        alpha=inference["familywise_alpha"],
+        family_size=family_size,
+        margins=inference["equivalence_margins"],
+    )
+    if workers <= 1 or len(cells) <= 1:
+        return [evaluate(cell) for cell in cells]
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=min(workers, len(cells)), mp_context=context) as executor:
+        return list(executor.map(evaluate, cells))
+
+
+def _holm_rejects_any(
+    p_values: np.ndarray, effects: np.ndarray, alpha: float, margin: float,
+) -> np.ndarray:
+    """Holm step-down per row: any rank with p <= alpha / (m - rank) and a material effect."""
+
+    family_size = p_values.shape[1]
+    order = np.lexsort((effects, p_values), axis=-1)
+    ranked_p = np.take_along_axis(p_values, order, axis=1)
+    ranked_effect = np.take_along_axis(effects, order, axis=1)
+    thresholds = alpha / (family_size - np.arange(family_size))
+    return ((ranked_p <= thresholds) & (ranked_effect > margin)).any(axis=1)
 
 
 def _false_positive_families(
@@ -220,23 +253,17 @@ def _false_positive_families(
     alpha: float,
     margin: float,
 ) -> int:
-    observed = 0
-    for _ in range(repetitions):
-        left = rng.binomial(size, 0.5, family_size)
-        right = rng.binomial(size, 0.5, family_size)
-        raw = sorted(
-            (
-                _score_p_value(int(a), int(b), size),
-                abs(int(a) / size - int(b) / size),
-            )
-            for a, b in zip(left, right)
-        )
-        if any(
-            p_value <= alpha / (family_size - rank) and effect > margin
-            for rank, (p_value, effect) in enumerate(raw)
-        ):
-            observed += 1
-    return observed
+    # Draw per repetition as before so the PCG64 stream, and the artifact, are unchanged.
+    draws = [
+        (rng.binomial(size, 0.5, family_size), rng.binomial(size, 0.5, family_size))
+        for _ in range(repetitions)
+    ]
+    left = np.array([pair[0] for pair in draws]).reshape(repetitions, family_size)
+    right = np.array([pair[1] for pair in draws]).reshape(repetitions, family_size)
+    rejected = _holm_rejects_any(
+        _score_p_values(left, right, size), _effects(left, right, size), alpha, margin,
+    )
+    return int(np.count_nonzero(rejected))
 
 
 def _presence_power(
@@ -250,11 +277,9 @@ def _presence_power(
 ) -> float:
     left = rng.binomial(cohort_size, 0.30, repetitions)
     right = np.full(repetitions, cohort_size)
-    detected = sum(
-        _divergent(
-            int(a), int(b), cohort_size, alpha / family_size, margin,
-        )
-        for a, b in zip(left, right)
+    detected = _count_pairwise(
+        (left, right),
+        lambda a, b: _divergent(a, b, cohort_size, alpha / family_size, margin),
     )
     return round(detected / repetitions, 4)
 
@@ -332,7 +357,7 @@ def _calibration_diagnostics(
     return diagnostics
 
 
-def build_calibration_report(protocol: dict[str, Any]) -> dict[str, Any]:
+def build_calibration_report(protocol: dict[str, Any], *, workers: int = 1) -> dict[str, Any]:
     configuration = protocol["calibration"]
     family_size = sum(
         len(scenario["metrics"])
@@ -340,7 +365,7 @@ def build_calibration_report(protocol: dict[str, Any]) -> dict[str, Any]:
         if scenario["distribution_view"] != "structural-censor-state"
     )
     rng = np.random.Generator(np.random.PCG64(218002))
-    grid = _build_grid(protocol, rng, family_size)
+    grid = _build_grid(protocol, rng, family_size, workers)
     false_positive = _false_positive_report(protocol, rng, family_size)
     sensitivity = _production_sensitivity(protocol, rng, family_size, grid)
     diagnostics = _calibration_diagnostics(false_positive, sensitivity)
@@ -11,11 +11,6 @@ from Scripts.statistical_distribution_statistics import (
 )
 
 
-def scenario_results(report: dict[str, Any], scenario_id: str) -> list[dict[str, Any]]:
-    prefix = f"{scenario_id}:"
-    return [case["result"] for case in report["cases"] if case["id"].startswith(prefix)]
-
-
 def outcome_block(result: dict[str, Any]) -> dict[float, int]:
     block = {float(bucket["x"]): bucket["count"] for bucket in result["result_distribution"]}
     completion = result.get("completion_summary")
@@ -25,6 +20,25 @@ def outcome_block(result: dict[str, Any]) -> dict[float, int]:
     return block
 
 
+# Canonical result fields the metrics read besides the outcome histogram.
+OBSERVED_FIELDS = ("completion_summary", "result_percentiles", "risk_score")
+
+
+def reduce_result(result: dict[str, Any]) -> dict[str, Any]:
+    """Observation of one cohort member: its outcome block plus the fields the metrics read.
+
+    The per-week histogram is folded into a single count block here so a cohort never keeps
+    the canonical results themselves.
+    """
+
+    observation = {
+        "outcome": outcome_block(result),
+        "throughput_reliability": result["throughput_reliability"],
+    }
+    observation.update({field: result[field] for field in OBSERVED_FIELDS if field in result})
+    return observation
+
+
 def presence_blocks(
     results: list[dict[str, Any]], field: str, nested: str | None = None,
 ) -> list[tuple[int, int]]:
@@ -92,8 +106,8 @@ def structural_metrics(
     metrics: list[dict[str, Any]] = []
     for metric_id in scenario["metrics"]:
         if metric_id == "outcome_cdf":
-            left_values = [outcome_block(result) for result in left]
-            right_values = [outcome_block(result) for result in right]
+            left_values = [observation["outcome"] for observation in left]
+            right_values = [observation["outcome"] for observation in right]
         elif metric_id == "censored_rate":
             left_values = [result["completion_summary"]["censored_rate"] for result in left]
             right_values = [result["completion_summary"]["censored_rate"] for result in right]
@@ -181,8 +195,8 @@ def inferential_metric(
     if metric_id == "outcome_cdf":
         return compare_count_blocks(
             metric_id,
-            [outcome_block(result) for result in left],
-            [outcome_block(result) for result in right],
+            [observation["outcome"] for observation in left],
+            [observation["outcome"] for observation in right],
             margin=inference["equivalence_margins"]["pooled_cdf"],
             **common,
         )
@@ -8,9 +8,10 @@ import math
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from Scripts.schema_registry import schema_errors
+
 ROOT = Path(__file__).resolve().parents[1]
 PROTOCOL_PATH = ROOT / "contracts/statistical-distribution-protocol-v1.0.json"
 PROTOCOL_SCHEMA_PATH = ROOT / "contracts/statistical-distribution-protocol-v1.0.schema.json"
@@ -48,11 +49,11 @@ def _pointer(parts: list[object]) -> str:
 
 def schema_issues(instance: Any, schema: Any, label: str) -> list[str]:
     try:
-        Draft202012Validator.check_schema(schema)
+        errors = sorted(
+            schema_errors(schema, instance), key=lambda error: list(error.absolute_path)
+        )
     except SchemaError as exc:
         return [f"Schéma {label} invalide : {exc.message}."]
-    validator = Draft202012Validator(schema)
-    errors = sorted(validator.iter_errors(instance), key=lambda error: list(error.absolute_path))
     return [
         f"{label}{_pointer(list(error.absolute_path))}: {error.message} "
         f"(mot-clé {error.validator})."
@@ -7,14 +7,15 @@ import json
 import os
 import shutil
 import subprocess
+from collections.abc import Iterable
 from copy import deepcopy
 from pathlib import Path
 from typing import Any
 
-from Scripts.statistical_corpus_runner import run_python_corpus
+from Scripts.statistical_corpus_runner import error_payload, execute_python_case
 from Scripts.statistical_distribution_metrics import (
     inferential_metric,
-    scenario_results,
+    reduce_result,
     structural_metrics,
 )
 from Scripts.statistical_distribution_protocol import partitioned_seeds
@@ -25,6 +26,9 @@ from Scripts.statistical_distribution_statistics import (
 
 ROOT = Path(__file__).resolve().parents[1]
 TYPESCRIPT_BRIDGE = ROOT / "frontend/scripts/run-statistical-distribution.mjs"
+PYTHON_BATCH_SIZE = 1000
+# Reduced observations of each scenario's cohort, in plan order, keyed by scenario id.
+CohortObservations = dict[str, list[dict[str, Any]]]
 
 
 class InfrastructureError(RuntimeError):
@@ -68,18 +72,34 @@ def build_execution_plan(
     }
 
 
-def _augment_python_report(report: dict[str, Any], plan: dict[str, Any]) -> dict[str, Any]:
-    return {
-        **report,
-        "proof_kind": plan["proof_kind"],
-        "protocol_version": plan["protocol_version"],
-        "cohort_id": plan["cohort_id"],
-    }
+def _scenario_id(case_id: str) -> str:
+    return case_id.rpartition(":")[0]
+
 
+def _group_observations(
+    cases: Iterable[tuple[str, dict[str, Any]]],
+) -> CohortObservations:
+    observations: CohortObservations = {}
+    for case_id, result in cases:
+        observations.setdefault(_scenario_id(case_id), []).append(reduce_result(result))
+    return observations
 
-def run_python_plan(plan: dict[str, Any]) -> dict[str, Any]:
-    report = run_python_corpus(plan, batch_size=1000)
-    return _augment_python_report(report, plan)
+
+def _python_results(plan: dict[str, Any]) -> Iterable[tuple[str, dict[str, Any]]]:
+    for case in plan["cases"]:
+        try:
+            result = execute_python_case(case, batch_size=PYTHON_BATCH_SIZE)
+        except Exception as exc:  # noqa: BLE001 - reported like a failed engine report
+            raise EngineExecutionError(
+                f"Le moteur python a échoué : {error_payload(exc)}."
+            ) from exc
+        yield case["id"], result
+
+
+def observe_python_plan(plan: dict[str, Any]) -> CohortObservations:
+    """Run the Python cohort case by case, reducing each result before the next one runs."""
+
+    return _group_observations(_python_results(plan))
 
 
 def run_typescript_plan(
@@ -143,6 +163,13 @@ def validate_engine_report(report: dict[str, Any], plan: dict[str, Any], engine:
         raise EngineExecutionError(f"Le moteur {engine} a échoué : {detail}.")
 
 
+def reduce_engine_report(
+    report: dict[str, Any], plan: dict[str, Any], engine: str,
+) -> CohortObservations:
+    validate_engine_report(report, plan, engine)
+    return _group_observations((case["id"], case["result"]) for case in report["cases"])
+
+
 def _artifact_fingerprint(report: dict[str, Any]) -> str:
     canonical = json.dumps(report, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
     return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
@@ -150,8 +177,8 @@ def _artifact_fingerprint(report: dict[str, Any]) -> str:
 
 def _build_scenario_reports(
     protocol: dict[str, Any],
-    python_report: dict[str, Any],
-    typescript_report: dict[str, Any],
+    python_observations: CohortObservations,
+    typescript_observations: CohortObservations,
 ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
     inference = protocol["inference"]
     inferential_count = sum(
@@ -164,8 +191,8 @@ def _build_scenario_reports(
     all_metrics: list[dict[str, Any]] = []
     metric_index = 0
     for scenario in protocol["scenarios"]:
-        left = scenario_results(python_report, scenario["id"])
-        right = scenario_results(typescript_report, scenario["id"])
+        left = python_observations.get(scenario["id"], [])
+        right = typescript_observations.get(scenario["id"], [])
         if scenario["distribution_view"] == "structural-censor-state":
             metrics = structural_metrics(scenario, left, right)
         else:
@@ -249,11 +276,11 @@ def build_distribution_evidence(
     protocol: dict[str, Any],
     seed_document: dict[str, Any],
     corpus: dict[str, Any],
-    python_report: dict[str, Any],
-    typescript_report: dict[str, Any],
+    python_observations: CohortObservations,
+    typescript_observations: CohortObservations,
 ) -> dict[str, Any]:
     scenario_reports, all_metrics = _build_scenario_reports(
-        protocol, python_report, typescript_report,
+        protocol, python_observations, typescript_observations,
     )
     global_verdict = _finalize_scenarios(
         scenario_reports, all_metrics, protocol["inference"]["familywise_alpha"],
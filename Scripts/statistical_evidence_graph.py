@@ -0,0 +1,244 @@
+"""Dependency graph and freshness of the statistical evidence artifacts.
+
+Each stage declares the files it reads and the files it writes; a stage depends on the
+stages producing its inputs. Its fingerprint combines the statistical toolchain sources,
+an optional salt and the content of its inputs, hashed once its dependencies have run:
+a dependency that rewrote identical bytes leaves its dependents up to date. A stage whose
+fingerprint and outputs match the manifest is skipped; ready stages run concurrently.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+from Scripts.report_json_io import write_json_report
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_MANIFEST = ROOT / ".cache" / "statistical-evidence" / "manifest.json"
+# Everything that can change an artifact besides its declared inputs: both engines,
+# their bridges and the statistical control scripts.
+TOOLCHAIN_PATTERNS = (
+    "backend/**/*.py",
+    "Scripts/*statistical*.py",
+    "Scripts/report_json_io.py",
+    "Scripts/schema_registry.py",
+    "frontend/src/**/*.ts",
+    "frontend/scripts/run-statistical-*.mjs",
+)
+MANIFEST_FORMAT = 1
+BLOCKING_STATUSES = frozenset({"error", "blocked"})
+
+
+@dataclass(frozen=True)
+class EvidenceStage:
+    name: str
+    inputs: tuple[Path, ...]
+    outputs: tuple[Path, ...]
+    run: Callable[[], bool]
+    salt: str = ""
+
+
+@dataclass(frozen=True)
+class StageResult:
+    """``regenerated``, ``up_to_date``, ``failed`` (evidence written, control failed),
+    ``error`` (the stage raised) or ``blocked`` (a dependency raised or was blocked)."""
+
+    name: str
+    status: str
+    seconds: float = 0.0
+    detail: str = ""
+
+
+def artifact_label(path: Path) -> str:
+    """Repository-relative name, so a moved checkout keeps its manifest."""
+    return path.relative_to(ROOT).as_posix() if path.is_relative_to(ROOT) else str(path)
+
+
+def file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def toolchain_fingerprint(root: Path = ROOT) -> str:
+    digest = hashlib.sha256(f"format:{MANIFEST_FORMAT}".encode())
+    paths = sorted({path for pattern in TOOLCHAIN_PATTERNS for path in root.glob(pattern)})
+    for path in paths:
+        if path.name.endswith(".test.ts"):
+            continue
+        digest.update(path.relative_to(root).as_posix().encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def stage_fingerprint(stage: EvidenceStage, toolchain: str) -> str:
+    digest = hashlib.sha256(f"{stage.name}\0{toolchain}\0{stage.salt}".encode())
+    for path in stage.inputs:
+        digest.update(f"\0{artifact_label(path)}\0{file_digest(path) or 'missing'}".encode())
+    return digest.hexdigest()
+
+
+def stage_dependencies(stages: Iterable[EvidenceStage]) -> dict[str, tuple[str, ...]]:
+    """Producers of each stage's inputs; raises ``ValueError`` for an invalid graph."""
+    stages = tuple(stages)
+    producers: dict[Path, str] = {}
+    for stage in stages:
+        for path in stage.outputs:
+            if path in producers:
+                raise ValueError(f"{path} is written by {producers[path]} and {stage.name}.")
+            producers[path] = stage.name
+    dependencies = {
+        stage.name: tuple(dict.fromkeys(producers[p] for p in stage.inputs if p in producers))
+        for stage in stages
+    }
+    if len(dependencies) != len(stages):
+        raise ValueError("Evidence stage names must be unique.")
+    _check_acyclic(dependencies)
+    return dependencies
+
+
+def _check_acyclic(dependencies: dict[str, tuple[str, ...]]) -> None:
+    resolved: set[str] = set()
+    while len(resolved) < len(dependencies):
+        ready = {
+            name
+            for name, needed in dependencies.items()
+            if name not in resolved and resolved.issuperset(needed)
+        }
+        if not ready:
+            cycle = sorted(set(dependencies) - resolved)
+            raise ValueError(f"Evidence stages form a cycle: {', '.join(cycle)}.")
+        resolved |= ready
+
+
+class EvidenceManifest:
+    """Fingerprint and output digests of every stage regenerated successfully."""
+
+    def __init__(self, path: Path = DEFAULT_MANIFEST) -> None:
+        self.path = path
+        self.entries = self._load()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("format") != MANIFEST_FORMAT:
+            return {}
+        stages = manifest.get("stages")
+        return stages if isinstance(stages, dict) else {}
+
+    @staticmethod
+    def _outputs(stage: EvidenceStage) -> dict[str, str | None]:
+        return {artifact_label(path): file_digest(path) for path in stage.outputs}
+
+    def is_fresh(self, stage: EvidenceStage, fingerprint: str) -> bool:
+        entry = self.entries.get(stage.name)
+        outputs = self._outputs(stage)
+        return (
+            isinstance(entry, dict)
+            and entry.get("fingerprint") == fingerprint
+            and entry.get("outputs") == outputs
+            and None not in outputs.values()
+        )
+
+    def record(self, stage: EvidenceStage, fingerprint: str) -> None:
+        self.entries[stage.name] = {"fingerprint": fingerprint, "outputs": self._outputs(stage)}
+
+    def forget(self, name: str) -> None:
+        self.entries.pop(name, None)
+
+    def save(self) -> None:
+        write_json_report({"format": MANIFEST_FORMAT, "stages": self.entries}, self.path)
+
+
+def _run_stage(stage: EvidenceStage) -> StageResult:
+    started = time.perf_counter()
+    try:
+        passed = stage.run()
+    except Exception as exc:  # noqa: BLE001 - one broken stage must not hide the others
+        return StageResult(
+            stage.name, "error", time.perf_counter() - started, f"{type(exc).__name__}: {exc}"
+        )
+    status = "regenerated" if passed else "failed"
+    return StageResult(stage.name, status, time.perf_counter() - started)
+
+
+class _Scheduler:
+    def __init__(
+        self,
+        stages: tuple[EvidenceStage, ...],
+        manifest: EvidenceManifest | None,
+        executor: ThreadPoolExecutor,
+    ) -> None:
+        self.dependencies = stage_dependencies(stages)
+        self.pending = {stage.name: stage for stage in stages}
+        self.manifest = manifest
+        self.executor = executor
+        self.toolchain = toolchain_fingerprint()
+        self.results: dict[str, StageResult] = {}
+        self.running: dict[Future[StageResult], tuple[EvidenceStage, str]] = {}
+
+    def _ready(self) -> list[EvidenceStage]:
+        return [
+            stage
+            for name, stage in self.pending.items()
+            if all(dependency in self.results for dependency in self.dependencies[name])
+        ]
+
+    def _start(self, stage: EvidenceStage) -> None:
+        del self.pending[stage.name]
+        if any(self.results[d].status in BLOCKING_STATUSES for d in self.dependencies[stage.name]):
+            self.results[stage.name] = StageResult(stage.name, "blocked")
+            return
+        fingerprint = stage_fingerprint(stage, self.toolchain)
+        if self.manifest is not None and self.manifest.is_fresh(stage, fingerprint):
+            self.results[stage.name] = StageResult(stage.name, "up_to_date")
+            return
+        self.running[self.executor.submit(_run_stage, stage)] = (stage, fingerprint)
+
+    def _collect(self) -> None:
+        done, _pending = wait(self.running, return_when=FIRST_COMPLETED)
+        for future in done:
+            stage, fingerprint = self.running.pop(future)
+            result = self.results[stage.name] = future.result()
+            if self.manifest is None:
+                continue
+            if result.status == "regenerated":
+                self.manifest.record(stage, fingerprint)
+            else:
+                self.manifest.forget(stage.name)
+
+    def run(self) -> dict[str, StageResult]:
+        while self.pending or self.running:
+            ready = self._ready()
+            for stage in ready:
+                self._start(stage)
+            if self.running and not ready:
+                self._collect()
+        return self.results
+
+
+def run_graph(
+    stages: Iterable[EvidenceStage],
+    *,
+    manifest: EvidenceManifest | None = None,
+    max_workers: int = 4,
+) -> list[StageResult]:
+    """Run stale stages in dependency order; without a manifest every stage runs."""
+    stages = tuple(stages)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = _Scheduler(stages, manifest, executor).run()
+    if manifest is not None:
+        manifest.save()
+    return [results[stage.name] for stage in stages]
@@ -5,9 +5,9 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from Scripts.schema_registry import check_schema
 from Scripts.statistical_compatibility_authority import (
     semantic_diagnostics,
     structural_diagnostics,
@@ -49,7 +49,7 @@ def _validate_schema_file(root: Path, relative: str) -> list[str]:
     if not isinstance(schema, dict):
         return [f"{relative}: schema must be a JSON object"]
     try:
-        Draft202012Validator.check_schema(schema)
+        check_schema(schema)
     except SchemaError as exc:
         return [f"{relative}: schema is invalid: {exc.message}"]
     return []
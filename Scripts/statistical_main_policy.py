@@ -7,9 +7,10 @@ import json
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
+from Scripts.schema_registry import schema_errors
+
 POLICY_PATH = Path("config/statistical-main-enforcement-v1.0.json")
 POLICY_SCHEMA_PATH = Path("config/statistical-main-enforcement-v1.0.schema.json")
 ATTESTATION_SCHEMA_PATH = Path("config/statistical-main-attestation-v1.0.schema.json")
@@ -74,13 +75,12 @@ def schema_issues(value: Any, schema: Any) -> list[str]:
     if not isinstance(schema, dict):
         return ["schema must be a JSON object"]
     try:
-        Draft202012Validator.check_schema(schema)
+        errors = sorted(
+            schema_errors(schema, value),
+            key=lambda error: (list(error.absolute_path), error.message),
+        )
     except SchemaError as exc:
         return [f"schema is invalid: {exc.message}"]
-    errors = sorted(
-        Draft202012Validator(schema).iter_errors(value),
-        key=lambda error: (list(error.absolute_path), error.message),
-    )
     return [
         f"/{'/'.join(str(item) for item in error.absolute_path)}: {error.message}"
         for error in errors
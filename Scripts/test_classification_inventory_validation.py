@@ -10,6 +10,7 @@ from datetime import date
 from pathlib import Path
 from typing import Any
 
+from Scripts.report_json_io import report_blocks, report_digest
 from Scripts.test_classification_contract import validate_record_compliance
 from Scripts.test_classifier_discovery import LogicalCase
 from Scripts.test_classifier_engine import classify_inventory
@@ -34,7 +35,7 @@ def load_json(path: Path) -> Any:
 
 
 def inventory_bytes(inventory: list[dict[str, Any]]) -> bytes:
-    return (json.dumps(inventory, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    return b"".join(report_blocks(inventory))
 
 
 def validate_versioned_records(
@@ -132,7 +133,7 @@ def generated_inventory_errors(
 def _determinism_errors(
     expected: list[dict[str, Any]], repeated: list[dict[str, Any]]
 ) -> list[str]:
-    if inventory_bytes(expected) == inventory_bytes(repeated):
+    if report_digest(expected) == report_digest(repeated):
         return []
     return ["in-memory classification inventory is not deterministic"]
 
@@ -144,7 +145,7 @@ def _versioned_comparison_errors(
         versioned_bytes = inventory_path.read_bytes()
     except OSError as exc:
         return [f"versioned classification inventory cannot be read: {exc}"]
-    if inventory_bytes(expected) != versioned_bytes:
+    if report_digest(expected) != hashlib.sha256(versioned_bytes).hexdigest():
         return ["generated inventory differs from the versioned inventory"]
     return []
 
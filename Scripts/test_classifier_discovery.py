@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
-import ast
 import json
+import re
 import subprocess
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 
+from Scripts.source_analysis_cache import (
+    CACHE_FORMAT,
+    SourceAnalysisCache,
+    file_digest,
+    source_facts,
+)
+from Scripts.test_classifier_pytest import pytest_file_cases
+
+JAVASCRIPT_TEST_ROOTS = ("frontend/src", "frontend/tests/e2e")
+JAVASCRIPT_TEST_FILE = re.compile(r"\.(?:test|spec)\.(?:js|jsx|ts|tsx)$")
+
 
 @dataclass(frozen=True)
 class LogicalCase:
@@ -22,117 +34,21 @@ class LogicalCase:
         return f"{self.framework}:{self.source_path}::{self.selector}"
 
 
-def _name(node: ast.AST) -> str:
-    if isinstance(node, ast.Name):
-        return node.id
-    if isinstance(node, ast.Attribute):
-        prefix = _name(node.value)
-        return f"{prefix}.{node.attr}" if prefix else node.attr
-    if isinstance(node, ast.Call):
-        return _name(node.func)
-    return ""
-
-
 def _pytest_file(path: Path) -> bool:
     return path.name.startswith("test_") or path.name.endswith("_test.py")
 
 
-def _is_fixture(function: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
-    return any(_name(decorator).endswith("fixture") for decorator in function.decorator_list)
-
-
-def _module_imports(tree: ast.Module) -> list[str]:
-    imports: set[str] = set()
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            imports.update(alias.name for alias in node.names)
-        elif isinstance(node, ast.ImportFrom) and node.module:
-            imports.add(node.module)
-    return sorted(imports)
-
-
-def _python_evidence(
-    function: ast.FunctionDef | ast.AsyncFunctionDef, imports: list[str], conditional: bool
-) -> dict[str, Any]:
-    calls = sorted({_name(node.func) for node in ast.walk(function) if isinstance(node, ast.Call)})
-    resources = sorted(
-        {
-            node.value[:160]
-            for node in ast.walk(function)
-            if isinstance(node, ast.Constant)
-            and isinstance(node.value, str)
-            and any(token in node.value for token in ("/", "\\", ".json", ".yaml", ".yml"))
-        }
-    )
-    fixtures = [argument.arg for argument in function.args.args]
-    fixtures.extend(argument.arg for argument in function.args.kwonlyargs)
-    decorators = sorted(filter(None, (_name(decorator) for decorator in function.decorator_list)))
-    return {
-        "imports": imports,
-        "calls": calls,
-        "fixtures": sorted(fixtures),
-        "resources": resources,
-        "modifiers": decorators,
-        "conditional": conditional,
-        "dynamicTitle": False,
-    }
-
-
-def _collect_python_body(
-    body: list[ast.stmt],
-    source_path: str,
-    imports: list[str],
-    class_names: tuple[str, ...] = (),
-    conditional: bool = False,
-) -> list[LogicalCase]:
-    cases: list[LogicalCase] = []
-    for statement in body:
-        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
-            if statement.name.startswith("test") and not _is_fixture(statement):
-                selector = "::".join((*class_names, statement.name))
-                cases.append(
-                    LogicalCase(
-                        framework="pytest",
-                        source_path=source_path,
-                        selector=selector,
-                        evidence=_python_evidence(statement, imports, conditional),
-                    )
-                )
-        elif isinstance(statement, ast.ClassDef) and statement.name.startswith("Test"):
-            cases.extend(
-                _collect_python_body(
-                    statement.body,
-                    source_path,
-                    imports,
-                    (*class_names, statement.name),
-                    conditional,
-                )
-            )
-        elif isinstance(statement, ast.If):
-            cases.extend(
-                _collect_python_body(
-                    statement.body + statement.orelse,
-                    source_path,
-                    imports,
-                    class_names,
-                    True,
-                )
-            )
-    return cases
-
-
-def discover_pytest(root: Path) -> list[LogicalCase]:
+def discover_pytest(root: Path, cache: SourceAnalysisCache | None = None) -> list[LogicalCase]:
     tests_root = root / "tests"
-    cases: list[LogicalCase] = []
     if not tests_root.exists():
-        return cases
-    for path in sorted(tests_root.rglob("*.py")):
-        if not _pytest_file(path):
-            continue
-        tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
-        source_path = path.relative_to(root).as_posix()
-        cases.extend(_collect_python_body(tree.body, source_path, _module_imports(tree)))
-    return cases
+        return []
+    texts = {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(tests_root.rglob("*.py"))
+        if _pytest_file(path)
+    }
+    facts = source_facts(pytest_file_cases, texts, cache)
+    return [_case_from_json(value) for source_path in texts for value in facts[source_path]]
 
 
 def _case_from_json(value: dict[str, Any]) -> LogicalCase:
@@ -144,13 +60,53 @@ def _case_from_json(value: dict[str, Any]) -> LogicalCase:
     )
 
 
-def discover_javascript(root: Path, node_command: str = "node") -> list[LogicalCase]:
+def _case_order(case: LogicalCase) -> tuple[str, str, str]:
+    return case.framework, case.source_path, case.selector
+
+
+def _javascript_texts(root: Path) -> dict[str, str]:
+    # Same files as the collector walk: regular files only, symbolic links skipped.
+    paths = [
+        path
+        for directory in JAVASCRIPT_TEST_ROOTS
+        for path in sorted((root / directory).rglob("*"))
+        if JAVASCRIPT_TEST_FILE.search(path.name) and path.is_file() and not path.is_symlink()
+    ]
+    return {
+        path.relative_to(root).as_posix(): path.read_text(encoding="utf-8", errors="replace")
+        for path in paths
+    }
+
+
+def _collector_paths() -> tuple[Path, Path]:
     tool_root = Path(__file__).resolve().parents[1]
-    collector = tool_root / "Scripts" / "collect_js_tests.mjs"
-    typescript = tool_root / "frontend" / "node_modules" / "typescript" / "lib" / "typescript.js"
+    typescript = tool_root / "frontend" / "node_modules" / "typescript"
+    return tool_root / "Scripts" / "collect_js_tests.mjs", typescript
+
+
+def _collector_fingerprint() -> str:
+    collector, typescript = _collector_paths()
+    manifest = typescript / "package.json"
+    compiler = file_digest(str(manifest)) if manifest.is_file() else "missing"
+    return f"{CACHE_FORMAT}:{file_digest(str(collector))}:{compiler}:{file_digest(__file__)}"
+
+
+def _collect_javascript(
+    root: Path, node_command: str, texts: dict[str, str]
+) -> dict[str, list[dict[str, Any]]]:
+    collector, typescript = _collector_paths()
     result = subprocess.run(
-        [node_command, str(collector), "--root", str(root), "--typescript", str(typescript)],
+        [
+            node_command,
+            str(collector),
+            "--root",
+            str(root),
+            "--typescript",
+            str(typescript / "lib" / "typescript.js"),
+            "--files-from-stdin",
+        ],
         cwd=root,
+        input=json.dumps(list(texts)),
         capture_output=True,
         text=True,
         encoding="utf-8",
@@ -162,12 +118,35 @@ def discover_javascript(root: Path, node_command: str = "node") -> list[LogicalC
     payload = json.loads(result.stdout)
     if not isinstance(payload, list):
         raise RuntimeError("JavaScript test discovery returned a non-array payload")
-    return [_case_from_json(value) for value in payload]
+    facts: dict[str, list[dict[str, Any]]] = {source_path: [] for source_path in texts}
+    for value in payload:
+        if value["sourcePath"] not in facts:
+            raise RuntimeError(f"JavaScript test discovery reported {value['sourcePath']}")
+        facts[value["sourcePath"]].append(value)
+    return facts
 
 
-def discover_all(root: Path, node_command: str = "node") -> list[LogicalCase]:
-    cases = discover_pytest(root) + discover_javascript(root, node_command)
-    cases.sort(key=lambda case: (case.framework, case.source_path, case.selector))
+def discover_javascript(
+    root: Path, node_command: str = "node", cache: SourceAnalysisCache | None = None
+) -> list[LogicalCase]:
+    """Vitest and Playwright cases; the collector only parses files missing from the cache."""
+    texts = _javascript_texts(root)
+    collect = partial(_collect_javascript, root, node_command)
+    if cache is None:
+        facts = collect(texts) if texts else {}
+    else:
+        facts = cache.batch_facts(
+            f"{__name__}.javascript_cases", _collector_fingerprint(), collect, texts
+        )
+    cases = [_case_from_json(value) for values in facts.values() for value in values]
+    return sorted(cases, key=_case_order)
+
+
+def discover_all(
+    root: Path, node_command: str = "node", cache: SourceAnalysisCache | None = None
+) -> list[LogicalCase]:
+    cases = discover_pytest(root, cache) + discover_javascript(root, node_command, cache)
+    cases.sort(key=_case_order)
     identifiers = [case.logical_case_id for case in cases]
     if len(identifiers) != len(set(identifiers)):
         duplicates = sorted(
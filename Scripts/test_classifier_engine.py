@@ -8,66 +8,21 @@ from typing import Any
 
 from Scripts.test_classification_contract import validate_record_engine
 from Scripts.test_classifier_discovery import LogicalCase
-
-EVIDENCE_FIELDS = ("imports", "calls", "fixtures", "resources", "modifiers")
-
-
-def _values(case: LogicalCase, field: str) -> list[str]:
-    if field == "framework":
-        return [case.framework]
-    if field == "sourcePath":
-        return [case.source_path]
-    if field == "selector":
-        return [case.selector]
-    value = case.evidence.get(field, [])
-    if isinstance(value, bool):
-        return [str(value).lower()]
-    return [str(item) for item in value]
-
-
-def _pattern_matches(values: list[str], pattern: str) -> bool:
-    return any(re.search(pattern, value, re.IGNORECASE) is not None for value in values)
-
-
-def _group_matches(case: LogicalCase, group: dict[str, list[str]], require_all: bool) -> bool:
-    outcomes = [
-        _pattern_matches(_values(case, field), pattern)
-        for field, patterns in group.items()
-        for pattern in patterns
-    ]
-    if not outcomes:
-        return True
-    return all(outcomes) if require_all else any(outcomes)
+from Scripts.test_classifier_index import RuleIndex, case_values, compile_rule
 
 
 def rule_matches(case: LogicalCase, rule: dict[str, Any]) -> bool:
-    match = rule.get("match", {})
-    frameworks = match.get("frameworks", [])
-    if frameworks and case.framework not in frameworks:
-        return False
-    if not _group_matches(case, match.get("all", {}), True):
-        return False
-    if match.get("any") and not _group_matches(case, match["any"], False):
-        return False
-    if match.get("none") and _group_matches(case, match["none"], False):
-        return False
-    if rule.get("requiresBehaviorEvidence"):
-        behavior_group = {field: match.get("any", {}).get(field, []) for field in EVIDENCE_FIELDS}
-        behavior_group = {field: patterns for field, patterns in behavior_group.items() if patterns}
-        if not behavior_group or not _group_matches(case, behavior_group, False):
-            return False
-    return True
-
-
-def _matching_rules(case: LogicalCase, rules: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    return sorted(
-        (rule for rule in rules if rule_matches(case, rule)),
-        key=lambda rule: (rule["priority"], rule["id"]),
+    compiled = compile_rule(rule)
+    return compiled.applies_to(case.framework) and compiled.matches(
+        lambda field, pattern: any(
+            re.search(pattern, value, re.IGNORECASE) is not None
+            for value in case_values(case, field)
+        )
     )
 
 
-def _nature(case: LogicalCase, rules: dict[str, Any]) -> tuple[str | None, str | None]:
-    matches = _matching_rules(case, rules["natureRules"])
+def _nature(case: LogicalCase, index: RuleIndex) -> tuple[str | None, str | None]:
+    matches = index.matching(case, "natureRules")
     if not matches:
         return None, "No nature rule has sufficient behavioral evidence."
     best_priority = matches[0]["priority"]
@@ -82,26 +37,30 @@ def _ordered(values: set[str], vocabulary: list[str]) -> list[str]:
 
 
 def _add_dimensions(
-    record: dict[str, Any], case: LogicalCase, rules: dict[str, Any], catalog: dict[str, Any]
+    record: dict[str, Any],
+    case: LogicalCase,
+    rules: dict[str, Any],
+    index: RuleIndex,
+    catalog: dict[str, Any],
 ) -> None:
     purpose_values = {rules["defaults"]["purpose"]}
-    for rule in _matching_rules(case, rules["purposeRules"]):
+    for rule in index.matching(case, "purposeRules"):
         purpose_values.update(rule["values"])
     record["purposes"] = _ordered(purpose_values, catalog["dimensions"]["purpose"]["values"])
 
     domain_values: set[str] = set()
-    for rule in _matching_rules(case, rules["domainRules"]):
+    for rule in index.matching(case, "domainRules"):
         domain_values.update(rule["values"])
     ordered_domains = _ordered(domain_values, catalog["dimensions"]["domain"]["values"])
     if ordered_domains:
         record["domains"] = ordered_domains
 
 
-def _add_traceability(record: dict[str, Any], case: LogicalCase, rules: dict[str, Any]) -> None:
+def _add_traceability(record: dict[str, Any], case: LogicalCase, index: RuleIndex) -> None:
     risks: set[str] = set()
     critical_paths: set[str] = set()
     criticalities: list[str] = []
-    for rule in _matching_rules(case, rules["traceabilityRules"]):
+    for rule in index.matching(case, "traceabilityRules"):
         risks.update(rule.get("risks", []))
         critical_paths.update(rule.get("criticalPaths", []))
         criticalities.append(rule["criticality"])
@@ -114,8 +73,8 @@ def _add_traceability(record: dict[str, Any], case: LogicalCase, rules: dict[str
         record["criticality"] = max(criticalities, key=rank.get)
 
 
-def _execution_profile(case: LogicalCase, rules: dict[str, Any]) -> str:
-    matches = _matching_rules(case, rules["executionProfileRules"])
+def _execution_profile(case: LogicalCase, rules: dict[str, Any], index: RuleIndex) -> str:
+    matches = index.matching(case, "executionProfileRules")
     if not matches:
         return rules["defaults"]["executionProfile"]
     best_priority = matches[0]["priority"]
@@ -160,22 +119,24 @@ def classify_case(
     rules: dict[str, Any],
     overrides: dict[str, Any],
     catalog: dict[str, Any],
+    index: RuleIndex | None = None,
 ) -> dict[str, Any]:
-    nature, unresolved_reason = _nature(case, rules)
+    index = index or RuleIndex(rules)
+    nature, unresolved_reason = _nature(case, index)
     record: dict[str, Any] = {
         "logicalCaseId": case.logical_case_id,
         "framework": case.framework,
         "sourcePath": case.source_path,
         "selector": case.selector,
         "status": "classified" if nature else "unresolved",
-        "executionProfile": _execution_profile(case, rules),
+        "executionProfile": _execution_profile(case, rules, index),
     }
     if nature:
         record["nature"] = nature
     else:
         record["unresolvedReason"] = unresolved_reason
-    _add_dimensions(record, case, rules, catalog)
-    _add_traceability(record, case, rules)
+    _add_dimensions(record, case, rules, index, catalog)
+    _add_traceability(record, case, index)
     override = _override_for(case, overrides)
     return _apply_override(record, override) if override else record
 
@@ -193,7 +154,8 @@ def classify_inventory(
     catalog: dict[str, Any],
     schema: dict[str, Any],
 ) -> list[dict[str, Any]]:
-    records = [classify_case(case, rules, overrides, catalog) for case in cases]
+    index = RuleIndex(rules)
+    records = [classify_case(case, rules, overrides, catalog, index) for case in cases]
     records.sort(key=lambda record: record["logicalCaseId"])
     identifiers = [record["logicalCaseId"] for record in records]
     if len(identifiers) != len(set(identifiers)):
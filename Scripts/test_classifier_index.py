@@ -0,0 +1,175 @@
+"""Compiled, framework-bucketed view of the test classification rules."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from Scripts.test_classifier_discovery import LogicalCase
+
+RULE_FAMILIES = (
+    "natureRules",
+    "executionProfileRules",
+    "purposeRules",
+    "domainRules",
+    "traceabilityRules",
+)
+EVIDENCE_FIELDS = ("imports", "calls", "fixtures", "resources", "modifiers")
+
+Term = tuple[str, str]
+TermMatcher = Callable[[str, str], bool]
+BACK_REFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def case_values(case: LogicalCase, field: str) -> tuple[str, ...]:
+    if field == "framework":
+        return (case.framework,)
+    if field == "sourcePath":
+        return (case.source_path,)
+    if field == "selector":
+        return (case.selector,)
+    value = case.evidence.get(field, [])
+    if isinstance(value, bool):
+        return (str(value).lower(),)
+    return tuple(str(item) for item in value)
+
+
+def _terms(group: dict[str, list[str]]) -> tuple[Term, ...]:
+    return tuple((field, pattern) for field, patterns in group.items() for pattern in patterns)
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """A rule's match block flattened into (field, pattern) terms."""
+
+    rule: dict[str, Any]
+    frameworks: frozenset[str]
+    all_terms: tuple[Term, ...]
+    any_terms: tuple[Term, ...]
+    none_terms: tuple[Term, ...]
+    behavior_terms: tuple[Term, ...] | None
+    # A "none" block without any pattern excludes every case.
+    excludes_all: bool
+
+    def applies_to(self, framework: str) -> bool:
+        return not self.frameworks or framework in self.frameworks
+
+    def matches(self, matched: TermMatcher) -> bool:
+        if self.excludes_all or not all(matched(*term) for term in self.all_terms):
+            return False
+        if self.any_terms and not any(matched(*term) for term in self.any_terms):
+            return False
+        if any(matched(*term) for term in self.none_terms):
+            return False
+        return self.behavior_terms is None or any(matched(*term) for term in self.behavior_terms)
+
+
+def compile_rule(rule: dict[str, Any]) -> CompiledRule:
+    match = rule.get("match", {})
+    any_group = match.get("any", {})
+    none_terms = _terms(match.get("none", {}))
+    behavior_terms = None
+    if rule.get("requiresBehaviorEvidence"):
+        behavior_terms = _terms({field: any_group.get(field, []) for field in EVIDENCE_FIELDS})
+    return CompiledRule(
+        rule=rule,
+        frameworks=frozenset(match.get("frameworks", [])),
+        all_terms=_terms(match.get("all", {})),
+        any_terms=_terms(any_group),
+        none_terms=none_terms,
+        behavior_terms=behavior_terms,
+        excludes_all=bool(match.get("none")) and not none_terms,
+    )
+
+
+def _screen(patterns: list[str]) -> re.Pattern[str] | None:
+    """One alternation of the patterns, unless a back-reference would shift with them."""
+    if any(BACK_REFERENCE.search(pattern) for pattern in patterns):
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+class RuleIndex:
+    """Rules of one configuration, compiled once and reused for every case.
+
+    Each family is sorted by priority and bucketed by framework, so a case only
+    meets the rules that may apply to it, already in decision order. The
+    patterns of a field are compiled once and combined in one alternation whose
+    single search rules out the values no pattern matches. The patterns a field
+    value matches are memoised, so the imports, calls and paths shared by the
+    cases of a file are searched once.
+    """
+
+    def __init__(self, rules: dict[str, Any]) -> None:
+        self._ordered = {
+            family: [
+                compile_rule(rule)
+                for rule in sorted(
+                    rules.get(family, []), key=lambda rule: (rule["priority"], rule["id"])
+                )
+            ]
+            for family in RULE_FAMILIES
+        }
+        patterns: dict[str, dict[str, None]] = {}
+        for compiled in (rule for family in self._ordered.values() for rule in family):
+            for field, pattern in (
+                compiled.all_terms + compiled.any_terms + compiled.none_terms
+            ):
+                patterns.setdefault(field, {})[pattern] = None
+        self._patterns = {
+            field: [(pattern, re.compile(pattern, re.IGNORECASE)) for pattern in known]
+            for field, known in patterns.items()
+        }
+        self._screens = {field: _screen(list(known)) for field, known in patterns.items()}
+        self._buckets: dict[tuple[str, str], list[CompiledRule]] = {}
+        self._hits: dict[tuple[str, tuple[str, ...]], frozenset[str]] = {}
+
+    def candidates(self, family: str, framework: str) -> list[CompiledRule]:
+        """Rules of a family that may apply to a framework, by priority then id."""
+        key = (family, framework)
+        if key not in self._buckets:
+            self._buckets[key] = [
+                rule for rule in self._ordered[family] if rule.applies_to(framework)
+            ]
+        return self._buckets[key]
+
+    def _value_hits(self, field: str, value: str) -> set[str]:
+        screen = self._screens[field]
+        if screen is not None and screen.search(value) is None:
+            return set()
+        return {
+            pattern
+            for pattern, compiled in self._patterns[field]
+            if compiled.search(value) is not None
+        }
+
+    def hits(self, field: str, values: tuple[str, ...]) -> frozenset[str]:
+        """Patterns of a field that match at least one of its values."""
+        key = (field, values)
+        found = self._hits.get(key)
+        if found is None:
+            matched: set[str] = set()
+            for value in values:
+                matched |= self._value_hits(field, value)
+            found = self._hits[key] = frozenset(matched)
+        return found
+
+    def matching(self, case: LogicalCase, family: str) -> list[dict[str, Any]]:
+        """Rules of a family matched by a case, by priority then id."""
+        values: dict[str, frozenset[str]] = {}
+
+        def matched(field: str, pattern: str) -> bool:
+            if field not in values:
+                values[field] = self.hits(field, case_values(case, field))
+            return pattern in values[field]
+
+        return [
+            rule.rule
+            for rule in self.candidates(family, case.framework)
+            if rule.matches(matched)
+        ]
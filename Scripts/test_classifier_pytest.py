@@ -0,0 +1,107 @@
+"""AST extraction of the logical Pytest cases of one test file."""
+
+from __future__ import annotations
+
+import ast
+from typing import Any
+
+
+def _name(node: ast.AST) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        prefix = _name(node.value)
+        return f"{prefix}.{node.attr}" if prefix else node.attr
+    if isinstance(node, ast.Call):
+        return _name(node.func)
+    return ""
+
+
+def _is_fixture(function: ast.FunctionDef | ast.AsyncFunctionDef) -> bool:
+    return any(_name(decorator).endswith("fixture") for decorator in function.decorator_list)
+
+
+def _module_imports(tree: ast.Module) -> list[str]:
+    imports: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            imports.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            imports.add(node.module)
+    return sorted(imports)
+
+
+def _python_evidence(
+    function: ast.FunctionDef | ast.AsyncFunctionDef, imports: list[str], conditional: bool
+) -> dict[str, Any]:
+    calls = sorted({_name(node.func) for node in ast.walk(function) if isinstance(node, ast.Call)})
+    resources = sorted(
+        {
+            node.value[:160]
+            for node in ast.walk(function)
+            if isinstance(node, ast.Constant)
+            and isinstance(node.value, str)
+            and any(token in node.value for token in ("/", "\\", ".json", ".yaml", ".yml"))
+        }
+    )
+    fixtures = [argument.arg for argument in function.args.args]
+    fixtures.extend(argument.arg for argument in function.args.kwonlyargs)
+    decorators = sorted(filter(None, (_name(decorator) for decorator in function.decorator_list)))
+    return {
+        "imports": imports,
+        "calls": calls,
+        "fixtures": sorted(fixtures),
+        "resources": resources,
+        "modifiers": decorators,
+        "conditional": conditional,
+        "dynamicTitle": False,
+    }
+
+
+def _collect_python_body(
+    body: list[ast.stmt],
+    source_path: str,
+    imports: list[str],
+    class_names: tuple[str, ...] = (),
+    conditional: bool = False,
+) -> list[dict[str, Any]]:
+    cases: list[dict[str, Any]] = []
+    for statement in body:
+        if isinstance(statement, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            if statement.name.startswith("test") and not _is_fixture(statement):
+                selector = "::".join((*class_names, statement.name))
+                cases.append(
+                    {
+                        "framework": "pytest",
+                        "sourcePath": source_path,
+                        "selector": selector,
+                        "evidence": _python_evidence(statement, imports, conditional),
+                    }
+                )
+        elif isinstance(statement, ast.ClassDef) and statement.name.startswith("Test"):
+            cases.extend(
+                _collect_python_body(
+                    statement.body,
+                    source_path,
+                    imports,
+                    (*class_names, statement.name),
+                    conditional,
+                )
+            )
+        elif isinstance(statement, ast.If):
+            cases.extend(
+                _collect_python_body(
+                    statement.body + statement.orelse,
+                    source_path,
+                    imports,
+                    class_names,
+                    True,
+                )
+            )
+    return cases
+
+
+def pytest_file_cases(source_path: str, text: str) -> list[dict[str, Any]]:
+    """Cases of one pytest file, as JSON facts for the source analysis cache."""
+    tree = ast.parse(text, filename=source_path)
+    return _collect_python_body(tree.body, source_path, _module_imports(tree))
@@ -8,21 +8,28 @@ import json
 from pathlib import Path
 from typing import Any, Callable
 
+from Scripts.report_json_io import (
+    json_member,
+    record_schema_errors,
+    record_validator,
+    write_json_report,
+)
+from Scripts.report_json_io import reject_duplicate_keys as reject_duplicate_keys
 
-def reject_duplicate_keys(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
-    value: dict[str, Any] = {}
-    for key, item in pairs:
-        if key in value:
-            raise ValueError(f"Duplicate JSON property: {key}")
-        value[key] = item
-    return value
+SCHEMA = Path(__file__).resolve().parents[1] / "config/test-execution-counts.schema.json"
 
 
-def write_report(report: dict[str, Any], destination: Path) -> bytes:
-    payload = (json.dumps(report, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_bytes(payload)
-    return payload
+def write_report(report: dict[str, Any], destination: Path) -> str:
+    """Check each logical-case detail against the schema, then stream the report.
+
+    Returns the SHA-256 of the written bytes.
+    """
+    errors = record_schema_errors(
+        record_validator(SCHEMA, "logicalCase"), report["logicalCases"], "logical case"
+    )
+    if errors:
+        raise ValueError(f"Invalid execution-count report: {'; '.join(errors)}")
+    return write_json_report(report, destination)
 
 
 def build_parser(
@@ -144,9 +151,8 @@ def execution_counts_main(
     default_output: Path,
     default_native: tuple[Path, ...],
     validate_report: Callable[[Path, Path, Path], list[str]],
-    load_json: Callable[[Path], Any],
     consolidate: Callable[..., dict[str, Any]],
-    report_writer: Callable[[dict[str, Any], Path], bytes],
+    report_writer: Callable[[dict[str, Any], Path], str],
 ) -> Callable[[list[str] | None], int]:
     """Bind the execution-count CLI while keeping consolidation independently testable."""
 
@@ -165,7 +171,7 @@ def execution_counts_main(
                     print(f"ERROR: {error}")
                 return 1
             path = args.output if args.output.is_absolute() else root / args.output
-            print(json.dumps(load_json(path)["totals"], sort_keys=True))
+            print(json.dumps(json_member(path, "totals"), sort_keys=True))
             return 0
         report = consolidate(root, args.inventory, args.native or default_native)
         destination = args.output if args.output.is_absolute() else root / args.output
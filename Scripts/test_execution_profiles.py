@@ -13,6 +13,10 @@ from typing import Any, Iterable
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
+from Scripts.report_json_io import (  # noqa: E402
+    reject_duplicate_keys as _reject_duplicate_keys,
+)
+from Scripts.report_json_io import write_json_report  # noqa: E402
 from Scripts.test_execution_profiles_graph import (  # noqa: E402
     PROFILES,
     active_nodes,
@@ -35,15 +39,6 @@ FRAMEWORK_NODE = {
 }
 
 
-def _reject_duplicate_keys(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-    for key, value in pairs:
-        if key in result:
-            raise ValueError(f"Duplicate JSON property: {key}")
-        result[key] = value
-    return result
-
-
 def load_json(path: Path) -> Any:
     try:
         return json.loads(
@@ -172,11 +167,8 @@ def write_framework_selection(
     return payload
 
 
-def write_report(report: dict[str, Any], destination: Path) -> bytes:
-    payload = (json.dumps(report, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_bytes(payload)
-    return payload
+def write_report(report: dict[str, Any], destination: Path) -> str:
+    return write_json_report(report, destination)
 
 
 def node_for_command(contract: dict[str, Any], profile: str, step: str) -> str:
@@ -63,6 +63,26 @@ def _array_errors(node: dict[str, Any], label: str, field: str) -> list[str]:
     return []
 
 
+def _cache_input_errors(node: dict[str, Any], label: str) -> list[str]:
+    if "cacheInputs" not in node:
+        return []
+    errors = _array_errors(node, label, "cacheInputs")
+    patterns = node["cacheInputs"] if not errors else []
+    # Absolute patterns start with an empty segment.
+    if any({"", ".."} & set(pattern.split("/")) for pattern in patterns):
+        errors.append(f"{label}.cacheInputs must stay inside the repository")
+    return errors
+
+
+def _cached_aggregator_errors(contract: dict[str, Any]) -> list[str]:
+    # The aggregator consumes current-run proofs, which a restored result would not be.
+    return [
+        f"aggregator {node['id']} must not declare cacheInputs"
+        for node in contract["nodes"]
+        if node["aggregator"] and "cacheInputs" in node
+    ]
+
+
 def _one_node_errors(node: Any, label: str) -> list[str]:
     if not isinstance(node, dict):
         return [f"{label} must be an object"]
@@ -81,6 +101,7 @@ def _one_node_errors(node: Any, label: str) -> list[str]:
         "resources",
     ):
         errors.extend(_array_errors(node, label, field))
+    errors.extend(_cache_input_errors(node, label))
     if not isinstance(node.get("aggregator"), bool):
         errors.append(f"{label}.aggregator must be boolean")
     return errors
@@ -107,6 +128,7 @@ def validate_contract(contract: Any) -> list[str]:
         errors.extend(dependency_errors(contract))
         errors.extend(reachability_errors(contract))
         errors.extend(parallel_conflict_errors(contract))
+        errors.extend(_cached_aggregator_errors(contract))
     return errors
 
 
@@ -6,6 +6,8 @@ import json
 from pathlib import Path
 from typing import Any
 
+from Scripts.report_json_io import reject_duplicate_keys as _reject_duplicate_keys
+
 SCHEMA_VERSION = "1.0.0"
 PROFILES = ("pr", "main", "nightly", "release")
 STATES = ("skipped", "disabled", "expected_failure", "quarantine", "retry")
@@ -37,15 +39,6 @@ REQUIRED_ENTRY_FIELDS = {
 OPTIONAL_ENTRY_FIELDS = {"compensatingMeasure", "retryPolicy"}
 
 
-def _reject_duplicate_keys(pairs: list[tuple[str, Any]]) -> dict[str, Any]:
-    result: dict[str, Any] = {}
-    for key, value in pairs:
-        if key in result:
-            raise ValueError(f"Duplicate JSON property: {key}")
-        result[key] = value
-    return result
-
-
 def load_json(path: Path) -> Any:
     try:
         return json.loads(
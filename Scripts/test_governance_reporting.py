@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from collections import Counter, defaultdict
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
 
+from Scripts.report_json_io import write_json_report
 from Scripts.test_execution_profiles_graph import included_profiles
 from Scripts.test_governance_contract import (
     FRAMEWORK_NODES,
@@ -288,9 +288,4 @@ def build_report(
 
 
 def write_report(report: dict[str, Any], destination: Path) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    destination.write_text(
-        json.dumps(report, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
-        newline="\n",
-    )
+    write_json_report(report, destination)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Measure the engine across working-set budgets on this host and write the batch profile.
+
+Each budget is turned into a batch size per horizon, as the API does, and timed on a
+short, a medium and the maximum horizon. The budget with the lowest cost relative to
+the best budget of every horizon is written to the profile the API loads at startup.
+All budgets must produce identical results: batching never changes a simulation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import platform
+import sys
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from backend.api_config import DEFAULT_ENGINE_BATCH_PROFILE  # noqa: E402
+from backend.engine_batch_size import (  # noqa: E402
+    ENGINE_BATCH_PROFILE_FORMAT,
+    batch_size_for_working_set,
+)
+from backend.simulation_limits import SIMULATION_HORIZON_WEEKS_MAX  # noqa: E402
+from Scripts.benchmark_common import emit_report, measure, positive_int  # noqa: E402
+from Scripts.benchmark_engine import DEFAULT_BACKLOG_SIZE, EngineCase, run_case  # noqa: E402
+
+KIB = 1024
+DEFAULT_WORKING_SETS = tuple(size * KIB for size in (256, 512, 1_024, 1_536, 2_048, 4_096, 8_192))
+HORIZONS = (
+    ("weeks_to_items", 26),
+    ("weeks_to_items", 104),
+    ("backlog_to_weeks", SIMULATION_HORIZON_WEEKS_MAX),
+)
+SAMPLE_COUNT = 52
+
+
+def _case(mode: str, horizon: int, n_sims: int, batch_size: int) -> EngineCase:
+    if mode == "backlog_to_weeks":
+        return EngineCase(mode, n_sims, SAMPLE_COUNT, batch_size, backlog_size=DEFAULT_BACKLOG_SIZE)
+    return EngineCase(mode, n_sims, SAMPLE_COUNT, batch_size, target_weeks=horizon)
+
+
+def _result_values(result: Any) -> np.ndarray:
+    return getattr(result, "completed_weeks", result)
+
+
+def measure_working_sets(
+    working_sets: tuple[int, ...], *, n_sims: int, repeats: int
+) -> list[dict[str, Any]]:
+    """ns per drawn slot for every budget and horizon; raises if batching changes a result."""
+
+    measurements = []
+    for mode, horizon in HORIZONS:
+        reference = None
+        for working_set in working_sets:
+            case = _case(mode, horizon, n_sims, batch_size_for_working_set(horizon, working_set))
+            outputs: list[Any] = []
+            timing = measure(lambda: outputs.append(run_case(case)), iterations=1, repeats=repeats)
+            values = _result_values(outputs[-1])
+            if reference is None:
+                reference = values
+            elif not np.array_equal(values, reference):
+                raise RuntimeError(f"{case.case_id}: result depends on the batch size")
+            measurements.append(
+                {
+                    "working_set_bytes": working_set,
+                    "mode": mode,
+                    "horizon_weeks": horizon,
+                    "batch_size": case.batch_size,
+                    "ns_per_slot": round(timing["ns_per_op"] / (n_sims * horizon), 2),
+                }
+            )
+    return measurements
+
+
+def best_working_set(measurements: list[dict[str, Any]]) -> int:
+    """Budget with the lowest mean cost relative to the fastest budget of each horizon."""
+
+    fastest: dict[int, float] = {}
+    for row in measurements:
+        horizon = row["horizon_weeks"]
+        fastest[horizon] = min(fastest.get(horizon, row["ns_per_slot"]), row["ns_per_slot"])
+    relative: dict[int, list[float]] = {}
+    for row in measurements:
+        ratio = row["ns_per_slot"] / max(fastest[row["horizon_weeks"]], 1e-9)
+        relative.setdefault(row["working_set_bytes"], []).append(ratio)
+    return min(relative, key=lambda working_set: sum(relative[working_set]))
+
+
+def build_profile(working_sets: tuple[int, ...], *, n_sims: int, repeats: int) -> dict[str, Any]:
+    measurements = measure_working_sets(working_sets, n_sims=n_sims, repeats=repeats)
+    return {
+        "format": ENGINE_BATCH_PROFILE_FORMAT,
+        "working_set_bytes": best_working_set(measurements),
+        "host": {
+            "machine": platform.machine(),
+            "processor": platform.processor(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+        },
+        "n_sims": n_sims,
+        "repeats": repeats,
+        "measurements": measurements,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--output", type=Path, default=Path(DEFAULT_ENGINE_BATCH_PROFILE))
+    parser.add_argument("--n-sims", type=positive_int, default=20_000)
+    parser.add_argument("--repeats", type=positive_int, default=3)
+    parser.add_argument(
+        "--working-set", type=positive_int, action="append", dest="working_sets",
+        help="budget candidate in bytes (repeatable)",
+    )
+    args = parser.parse_args(argv)
+    working_sets = tuple(dict.fromkeys(args.working_sets or DEFAULT_WORKING_SETS))
+    emit_report(build_profile(working_sets, n_sims=args.n_sims, repeats=args.repeats), args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -7,10 +7,10 @@ import argparse
 import json
 import sys
 from copy import deepcopy
+from operator import attrgetter
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -29,6 +29,7 @@ from Scripts.statistical_reference_corpus_pbi_214 import (  # noqa: E402
     PBI_214_CASE_IDS as _PBI_214_CASE_IDS,
 )
 from Scripts.statistical_reference_corpus_validation import validate_reference_corpus  # noqa: E402
+from Scripts.schema_registry import check_schema, schema_errors  # noqa: E402
 
 PBI_210_CASE_IDS = _PBI_210_CASE_IDS
 PBI_211_CASE_IDS = _PBI_211_CASE_IDS
@@ -259,6 +260,9 @@ INPUT_REJECTION_PROBES = (
 )
 
 
+_ISSUE_ORDER = attrgetter("instance_path", "keyword", "message", "schema_path")
+
+
 def _json_pointer(parts: Any) -> str:
     escaped = [str(part).replace("~", "~0").replace("/", "~1") for part in parts]
     return "/" + "/".join(escaped) if escaped else "/"
@@ -286,7 +290,11 @@ def load_json(path: Path) -> Any:
 
 
 def validate_instance(instance: Any, schema: dict[str, Any]) -> list[ValidationIssue]:
-    validator = Draft202012Validator(schema)
+    try:
+        errors = schema_errors(schema, instance)
+    except SchemaError as exc:
+        path = _json_pointer(exc.absolute_path)
+        return [ValidationIssue("/", "invalidSchema", exc.message, path)]
     issues = [
         ValidationIssue(
             instance_path=_json_pointer(error.absolute_path),
@@ -294,17 +302,9 @@ def validate_instance(instance: Any, schema: dict[str, Any]) -> list[ValidationI
             message=error.message,
             schema_path=_json_pointer(error.absolute_schema_path),
         )
-        for error in validator.iter_errors(instance)
+        for error in errors
     ]
-    return sorted(
-        issues,
-        key=lambda issue: (
-            issue.instance_path,
-            issue.keyword,
-            issue.message,
-            issue.schema_path,
-        ),
-    )
+    return sorted(issues, key=_ISSUE_ORDER)
 
 
 def validate_contract(instance: Any, schema: dict[str, Any]) -> list[ValidationIssue]:
@@ -349,15 +349,7 @@ def validate_contract(instance: Any, schema: dict[str, Any]) -> list[ValidationI
             else:
                 first_index_by_scenario[scenario] = index
         issues.extend(_validate_case_semantics(case, index))
-    return sorted(
-        issues,
-        key=lambda issue: (
-            issue.instance_path,
-            issue.keyword,
-            issue.message,
-            issue.schema_path,
-        ),
-    )
+    return sorted(issues, key=_ISSUE_ORDER)
 
 
 def validate_input_rejection_probes(corpus: dict[str, Any], schema: dict[str, Any]) -> list[str]:
@@ -386,7 +378,7 @@ def run_control(instance_paths: list[Path] | None = None) -> list[str]:
     schema = load_json(SCHEMA_PATH)
     if not isinstance(schema, dict):
         return [f"{SCHEMA_PATH.as_posix()}:/: schema must be a JSON object"]
-    Draft202012Validator.check_schema(schema)
+    check_schema(schema)
 
     corpus = load_json(CORPUS_PATH)
     if not isinstance(corpus, dict):
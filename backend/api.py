@@ -1,6 +1,6 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi.errors import RateLimitExceeded
 from slowapi.extension import _rate_limit_exceeded_handler
@@ -8,17 +8,23 @@ from slowapi.middleware import SlowAPIMiddleware
 
 from .api_config import get_api_config
 from .api_routes_simulate import limiter, router, simulation_store
+from .api_startup import StartupReadiness, warm_up_simulation
 from .api_static import mount_frontend
+from .simulation_store_factory import call_store
+
+readiness = StartupReadiness()
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
-    simulation_store.connect()
+    # Mongo and the engine warm-up must not delay the first accepted connection.
+    readiness.start(simulation_store, warm_up_simulation)
     limiter.check_storage()
     try:
         yield
     finally:
-        simulation_store.close()
+        await readiness.stop()
+        await call_store(simulation_store.close)
 
 
 app = FastAPI(title="Monte Carlo Simulate API", version="2.0", lifespan=lifespan)
@@ -42,16 +48,30 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/ready")
+def health_ready(response: Response) -> dict[str, str]:
+    if not readiness.ready:
+        response.status_code = 503
+    return readiness.snapshot()
+
+
 @app.get("/health/mongo")
-def health_mongo() -> dict[str, str]:
+async def health_mongo() -> dict[str, str]:
     if not simulation_store.enabled:
         return {"status": "disabled"}
     try:
-        simulation_store.ping()
+        await call_store(simulation_store.ping)
         return {"status": "ok"}
     except Exception as exc:
         raise HTTPException(503, "mongo_unreachable") from exc
 
 
+@app.get("/health/mongo/pool")
+def health_mongo_pool() -> dict[str, object]:
+    if not simulation_store.enabled:
+        return {"status": "disabled"}
+    return {"status": "ok", **simulation_store.pool_status()}
+
+
 app.include_router(router)
 mount_frontend(app)
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import os
+import sys
 from dataclasses import dataclass
+from pathlib import Path
 
 DEFAULT_CORS_ORIGINS = ["http://localhost:5173", "http://127.0.0.1:5173"]
 DEFAULT_RATE_LIMIT_SIMULATE = "20/minute"
@@ -9,6 +11,22 @@ DEFAULT_RATE_LIMIT_STORAGE_URL = "memory://"
 DEFAULT_CLIENT_COOKIE_NAME = "IDMontecarlo"
 DEFAULT_SIMULATION_HISTORY_LIMIT = 10
 DEFAULT_MONGO_COLLECTION_SIMULATIONS = "simulations"
+DEFAULT_MONGO_DRIVER = "sync"
+MONGO_DRIVERS = ("sync", "async")
+ENGINE_BATCH_PROFILE_NAME = Path(".cache") / "engine-batch-profile.json"
+
+
+def _default_engine_batch_profile() -> str:
+    # A PyInstaller build runs from a temporary _MEIPASS extracted at every launch, so its
+    # profile lives next to the executable, which persists.
+    if getattr(sys, "frozen", False):
+        base = Path(sys.executable).resolve().parent
+    else:
+        base = Path(__file__).resolve().parents[1]
+    return str(base / ENGINE_BATCH_PROFILE_NAME)
+
+
+DEFAULT_ENGINE_BATCH_PROFILE = _default_engine_batch_profile()
 
 
 def _parse_csv_env(name: str, default: list[str]) -> list[str]:
@@ -32,6 +50,11 @@ def _parse_str_env(name: str, default: str) -> str:
     return raw or default
 
 
+def _parse_choice_env(name: str, choices: tuple[str, ...], default: str) -> str:
+    raw = (os.getenv(name) or "").strip().lower()
+    return raw if raw in choices else default
+
+
 @dataclass(frozen=True)
 class ApiConfig:
     cors_origins: list[str]
@@ -50,6 +73,11 @@ class ApiConfig:
     mongo_connect_timeout_ms: int
     mongo_socket_timeout_ms: int
     mongo_max_idle_time_ms: int
+    mongo_driver: str = DEFAULT_MONGO_DRIVER
+    # Engine batch: a fixed size wins over a working-set budget, which wins over the profile.
+    engine_batch_size: int | None = None
+    engine_working_set_bytes: int | None = None
+    engine_batch_profile: str = DEFAULT_ENGINE_BATCH_PROFILE
 
 
 def _parse_float_env(name: str, default: float) -> float:
@@ -101,4 +129,11 @@ def get_api_config() -> ApiConfig:
         mongo_connect_timeout_ms=_parse_int_env("APP_MONGO_CONNECT_TIMEOUT_MS", 2000),
         mongo_socket_timeout_ms=_parse_int_env("APP_MONGO_SOCKET_TIMEOUT_MS", 5000),
         mongo_max_idle_time_ms=_parse_int_env("APP_MONGO_MAX_IDLE_TIME_MS", 60000),
+        mongo_driver=_parse_choice_env("APP_MONGO_DRIVER", MONGO_DRIVERS, DEFAULT_MONGO_DRIVER),
+        engine_batch_size=_parse_int_env("APP_ENGINE_BATCH_SIZE", 0) or None,
+        engine_working_set_bytes=_parse_int_env("APP_ENGINE_WORKING_SET_BYTES", 0) or None,
+        engine_batch_profile=_parse_str_env(
+            "APP_ENGINE_BATCH_PROFILE",
+            DEFAULT_ENGINE_BATCH_PROFILE,
+        ),
     )
@@ -6,22 +6,18 @@ from pydantic import (
     ConfigDict,
     Field,
     FiniteFloat,
+    PrivateAttr,
     StrictBool,
     StrictInt,
     model_validator,
 )
 
 from .simulation_limits import SIMULATION_SEED_MAX, SIMULATION_SEED_MIN
-from .simulation_value_objects import (
-    BacklogSize,
-    SimulationCount,
-    SimulationHorizon,
-    StatisticalValueError,
-    ThroughputSamples,
-)
+from .simulation_models import SimulationParameters
 from .simulation_value_objects import (
     SimulationPercentiles as DomainSimulationPercentiles,
 )
+from .simulation_value_objects import StatisticalValueError
 
 __all__ = [
     "SIMULATION_SEED_MAX",
@@ -46,40 +42,37 @@ class SimulateRequest(BaseModel):
     n_sims: StrictInt = 20000
     seed: Optional[StrictInt] = None
 
+    _parameters: Optional[SimulationParameters] = PrivateAttr(default=None)
+
     @model_validator(mode="after")
     def validate_domain_contract(self) -> "SimulateRequest":
         try:
-            ThroughputSamples.create(
-                self.throughput_samples,
-                self.include_zero_weeks,
+            parameters = SimulationParameters.create(
+                throughput_samples=self.throughput_samples,
+                include_zero_weeks=self.include_zero_weeks,
+                mode=self.mode,
+                backlog_size=self.backlog_size,
+                target_weeks=self.target_weeks,
+                n_sims=self.n_sims,
             )
-            SimulationCount(self.n_sims)
-            if self.mode == "backlog_to_weeks":
-                if self.backlog_size is None:
-                    raise StatisticalValueError(
-                        "backlog_size requis pour le mode backlog_to_weeks."
-                    )
-                if "target_weeks" in self.model_fields_set:
-                    raise StatisticalValueError(
-                        "target_weeks doit etre absent pour le mode backlog_to_weeks."
-                    )
-                BacklogSize(self.backlog_size)
-            else:
-                if self.target_weeks is None:
-                    raise StatisticalValueError(
-                        "target_weeks requis pour le mode weeks_to_items."
-                    )
-                if "backlog_size" in self.model_fields_set:
-                    raise StatisticalValueError(
-                        "backlog_size doit etre absent pour le mode weeks_to_items."
-                    )
-                SimulationHorizon(self.target_weeks)
         except StatisticalValueError as exc:
             if str(exc).startswith("Historique insuffisant"):
                 return self
             raise
+        inactive_field = "target_weeks" if self.mode == "backlog_to_weeks" else "backlog_size"
+        if inactive_field in self.model_fields_set:
+            raise StatisticalValueError(
+                f"{inactive_field} doit etre absent pour le mode {self.mode}."
+            )
+        self._parameters = parameters
         return self
 
+    @property
+    def command_parameters(self) -> Optional[SimulationParameters]:
+        """Domain inputs validated once by ``validate_domain_contract``, if complete."""
+
+        return self._parameters
+
 
 class DistributionBucket(BaseModel):
     model_config = ConfigDict(extra="forbid")
@@ -169,6 +162,25 @@ class SimulateResponse(BaseModel):
         return self
 
 
+class CompactDistribution(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    x: List[StrictInt]
+    count: List[StrictInt]
+
+    @model_validator(mode="after")
+    def validate_parallel_arrays(self) -> "CompactDistribution":
+        if len(self.x) != len(self.count):
+            raise ValueError("x et count doivent avoir la meme longueur.")
+        return self
+
+
+class SimulateCompactResponse(SimulateResponse):
+    """Variante ``histogram_format=arrays`` : histogramme en tableaux paralleles."""
+
+    result_distribution: CompactDistribution
+
+
 class SimulationHistoryItem(BaseModel):
     created_at: str
     last_seen: str
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from starlette.responses import Response
+
+
+class FastJSONResponse(Response):
+    """Serialise a pre-validated payload straight to JSON bytes with orjson.
+
+    Used for domain results whose invariants are already enforced upstream, so
+    neither Pydantic re-validation nor ``jsonable_encoder`` is needed.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
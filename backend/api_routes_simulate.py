@@ -1,44 +1,80 @@
 import asyncio
+import inspect
 import json
 import logging
 import time
+from pathlib import Path
 
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Request
+from limits.storage import storage_from_string
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from starlette.concurrency import run_in_threadpool
 
 from .api_config import get_api_config
 from .api_models import (
+    SimulateCompactResponse,
     SimulateRequest,
     SimulateResponse,
     SimulationHistoryItem,
 )
+from .api_responses import FastJSONResponse
+from .engine_batch_size import EngineBatchSizing
 from .simulation_mappers import (
+    HistogramFormat,
     persistence_row_to_history_item,
     request_to_command,
-    result_to_response,
+    result_to_response_payload,
 )
 from .simulation_models import SimulationCommand, SimulationResult
 from .simulation_seed import resolve_simulation_seed
-from .simulation_service import run_simulation
-from .simulation_store import SimulationStore
+from .simulation_store_factory import build_simulation_store, call_store
 from .simulation_value_objects import StatisticalValueError
 
 router = APIRouter()
 cfg = get_api_config()
-simulation_store = SimulationStore(cfg)
+simulation_store = build_simulation_store(cfg)
+batch_sizing = EngineBatchSizing.configured(
+    fixed_batch_size=cfg.engine_batch_size,
+    working_set_bytes=cfg.engine_working_set_bytes,
+    profile_path=Path(cfg.engine_batch_profile),
+)
 logger = logging.getLogger(__name__)
 RATE_LIMIT_STORAGE_WARNING_INTERVAL_SECONDS = 5.0
+MEMORY_STORAGE_URI = "memory://"
+
+
+def run_simulation(command: SimulationCommand) -> SimulationResult:
+    # NumPy and the engine are loaded on first use (normally by the startup
+    # warm-up) so that importing the API stays cheap.
+    from .simulation_service import engine_batch_size, run_simulation_with_batch_size
+
+    return run_simulation_with_batch_size(
+        command,
+        batch_size=engine_batch_size(command, batch_sizing),
+    )
 
 
 class ObservableLimiter(Limiter):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+    def __init__(self, *args, storage_uri: str = MEMORY_STORAGE_URI, **kwargs):
+        # slowapi builds the storage eagerly; a shared backend would import its
+        # client library (redis: ~100 ms) at module import, so it is attached
+        # on first use instead. _attach_storage rebinds slowapi's private
+        # _storage/_limiter, hence the exact slowapi pin in requirements.txt.
+        super().__init__(*args, storage_uri=MEMORY_STORAGE_URI, **kwargs)
+        self._storage_uri = storage_uri
+        self._storage_attached = storage_uri == MEMORY_STORAGE_URI
         self.logger = logger
         self._storage_warning_active = False
         self._storage_warning_last_logged_at = 0.0
 
+    def _attach_storage(self) -> None:
+        if self._storage_attached:
+            return
+        self._storage = storage_from_string(self._storage_uri, **self._storage_options)
+        self._limiter = type(self._limiter)(self._storage)
+        self._storage_attached = True
+
     def _warning_interval_elapsed(self) -> bool:
         return (
             time.monotonic() - self._storage_warning_last_logged_at
@@ -62,7 +98,8 @@ class ObservableLimiter(Limiter):
         logger.warning("Rate limit storage recovered; shared throttling restored.")
 
     def check_storage(self) -> bool:
-        if self._storage_uri == "memory://":
+        self._attach_storage()
+        if self._storage_uri == MEMORY_STORAGE_URI:
             return True
         try:
             available = bool(self._storage.check())
@@ -81,6 +118,7 @@ class ObservableLimiter(Limiter):
         endpoint_func=None,
         in_middleware=True,
     ) -> None:
+        self._attach_storage()
         if self._storage_warning_active and not self.check_storage():
             request.state.view_rate_limit = None
             return
@@ -110,6 +148,23 @@ limiter = ObservableLimiter(
 )
 
 
+def _log_persistence_failure(
+    mc_client_id: str,
+    command: SimulationCommand,
+    exc: Exception,
+) -> None:
+    logger.warning(
+        "Simulation persistence failed; returning computed result without history entry.",
+        extra={
+            "event": "simulation_persistence_failed",
+            "mode": command.mode,
+            "n_sims": command.n_sims.value,
+            "client_id_prefix": mc_client_id[:8],
+        },
+        exc_info=exc,
+    )
+
+
 def _persist_simulation(
     mc_client_id: str,
     command: SimulationCommand,
@@ -121,25 +176,52 @@ def _persist_simulation(
     try:
         simulation_store.save_simulation(mc_client_id, command, result)
     except Exception as exc:
-        logger.warning(
-            "Simulation persistence failed; returning computed result without history entry.",
-            extra={
-                "event": "simulation_persistence_failed",
-                "mode": command.mode,
-                "n_sims": command.n_sims.value,
-                "client_id_prefix": mc_client_id[:8],
-            },
-            exc_info=exc,
-        )
+        _log_persistence_failure(mc_client_id, command, exc)
+
+
+async def _persist_simulation_async(
+    mc_client_id: str,
+    command: SimulationCommand,
+    result: SimulationResult,
+) -> None:
+    if not simulation_store.enabled or not mc_client_id:
+        return
+
+    try:
+        await simulation_store.save_simulation(mc_client_id, command, result)
+    except Exception as exc:
+        _log_persistence_failure(mc_client_id, command, exc)
+
+
+def _schedule_persistence(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    command: SimulationCommand,
+    result: SimulationResult,
+) -> None:
+    mc_client_id = (request.cookies.get(cfg.client_cookie_name) or "").strip()
+    if not mc_client_id or not simulation_store.enabled:
+        return
+    persist = (
+        _persist_simulation_async
+        if inspect.iscoroutinefunction(simulation_store.save_simulation)
+        else _persist_simulation
+    )
+    background_tasks.add_task(persist, mc_client_id, command, result)
 
 
-@router.post("/simulate", response_model=SimulateResponse, response_model_exclude_none=True)
+@router.post(
+    "/simulate",
+    response_model=None,
+    responses={200: {"model": SimulateResponse | SimulateCompactResponse}},
+)
 @limiter.limit(cfg.rate_limit_simulate)
 async def simulate(
     request: Request,
     req: SimulateRequest,
     background_tasks: BackgroundTasks,
-) -> SimulateResponse:
+    histogram_format: HistogramFormat = "buckets",
+) -> FastJSONResponse:
     started_at = time.perf_counter()
 
     try:
@@ -170,11 +252,9 @@ async def simulate(
             "Simulation trop longue. Reessayez avec moins de simulations ou plus tard.",
         ) from exc
 
-    response_model = result_to_response(result)
+    payload = result_to_response_payload(result, histogram_format=histogram_format)
 
-    mc_client_id = (request.cookies.get(cfg.client_cookie_name) or "").strip()
-    if mc_client_id and simulation_store.enabled:
-        background_tasks.add_task(_persist_simulation, mc_client_id, command, result)
+    _schedule_persistence(request, background_tasks, command, result)
 
     logger.info(
         json.dumps(
@@ -189,11 +269,11 @@ async def simulate(
         )
     )
 
-    return response_model
+    return FastJSONResponse(payload)
 
 
 @router.get("/simulations/history", response_model=list[SimulationHistoryItem])
-def simulation_history(request: Request) -> list[SimulationHistoryItem]:
+async def simulation_history(request: Request) -> list[SimulationHistoryItem]:
     mc_client_id = (request.cookies.get(cfg.client_cookie_name) or "").strip()
     if not mc_client_id:
         return []
@@ -201,7 +281,7 @@ def simulation_history(request: Request) -> list[SimulationHistoryItem]:
         return []
 
     try:
-        rows = simulation_store.list_recent(mc_client_id)
+        rows = await call_store(simulation_store.list_recent, mc_client_id)
         return [persistence_row_to_history_item(row) for row in rows]
     except Exception as exc:
         raise HTTPException(503, "Historique indisponible temporairement.") from exc
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from .api_responses import FastJSONResponse
+from .simulation_limits import SIMULATION_N_SIMS_MIN
+from .simulation_mappers import result_to_response_payload
+from .simulation_models import SimulationCommand
+from .simulation_store_factory import call_store
+from .simulation_value_objects import SimulationSeed
+
+logger = logging.getLogger(__name__)
+
+WARM_UP_THROUGHPUT_SAMPLES = (3, 5, 4, 6, 2, 5)
+WARM_UP_BACKLOG_SIZE = 20
+
+
+def warm_up_simulation() -> None:
+    """Run the smallest valid forecast end to end, response serialisation included."""
+
+    from .simulation_service import run_simulation
+
+    command = SimulationCommand.create(
+        throughput_samples=list(WARM_UP_THROUGHPUT_SAMPLES),
+        include_zero_weeks=False,
+        mode="backlog_to_weeks",
+        backlog_size=WARM_UP_BACKLOG_SIZE,
+        target_weeks=None,
+        n_sims=SIMULATION_N_SIMS_MIN,
+        seed=SimulationSeed(0),
+    )
+    FastJSONResponse(result_to_response_payload(run_simulation(command)))
+
+
+class StartupReadiness:
+    """Demarrage differe de l'API, expose par ``GET /health/ready``.
+
+    La connexion Mongo et le pre-calcul d'une petite simulation tournent en
+    arriere-plan : le serveur accepte des connexions des l'import termine et
+    l'etat de chaque etape reste consultable jusqu'a ce qu'elles aboutissent.
+    """
+
+    def __init__(self) -> None:
+        self.mongo = "pending"
+        self.warm_up = "pending"
+        self._tasks: list[asyncio.Task[None]] = []
+
+    @property
+    def ready(self) -> bool:
+        return self.mongo not in ("pending", "connecting") and self.warm_up != "pending"
+
+    def start(self, store: Any, warm_up: Callable[[], None]) -> None:
+        loop = asyncio.get_running_loop()
+        self.warm_up = "pending"
+        self.mongo = "connecting" if store.enabled else "disabled"
+        self._tasks = [loop.create_task(self._run_warm_up(warm_up))]
+        if store.enabled:
+            self._tasks.append(loop.create_task(self._connect(store)))
+
+    async def _connect(self, store: Any) -> None:
+        try:
+            await call_store(store.connect)
+        except Exception as exc:
+            self.mongo = "unavailable"
+            logger.warning(
+                "Mongo unreachable at startup; persistence will reconnect on first use.",
+                exc_info=exc,
+            )
+            return
+        self.mongo = "connected"
+
+    async def _run_warm_up(self, warm_up: Callable[[], None]) -> None:
+        try:
+            await run_in_threadpool(warm_up)
+        except Exception as exc:
+            self.warm_up = "failed"
+            logger.warning("Simulation warm-up failed.", exc_info=exc)
+            return
+        self.warm_up = "done"
+
+    async def wait(self) -> None:
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await self.wait()
+        self._tasks = []
+
+    def snapshot(self) -> dict[str, str]:
+        return {
+            "status": "ready" if self.ready else "starting",
+            "mongo": self.mongo,
+            "warm_up": self.warm_up,
+        }
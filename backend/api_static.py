@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import hashlib
+import os
 import sys
 from pathlib import Path
 
-from fastapi import FastAPI
-from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, Request
+from fastapi.responses import FileResponse, Response
+from starlette.datastructures import Headers
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Ordre de preference quand le client accepte plusieurs encodages.
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+HASHED_ASSETS_PREFIX = "assets/"
 
 
 def _front_dist_dir() -> Path:
@@ -13,11 +23,141 @@ def _front_dist_dir() -> Path:
     return base / "frontend" / "dist"
 
 
+def _is_refused(params: str) -> bool:
+    quality = params.replace(" ", "").lower()
+    if not quality.startswith("q="):
+        return False
+    try:
+        return float(quality[2:]) == 0
+    except ValueError:
+        return False
+
+
+def accepted_encodings(accept_encoding: str | None) -> set[str]:
+    """Content codings the client accepts, ignoring those explicitly refused with ``q=0``."""
+
+    accepted: set[str] = set()
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip() and not _is_refused(params):
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def cache_control_for(relative_path: str) -> str:
+    """Vite fingerprints everything under ``assets/``; other files must be revalidated."""
+
+    if relative_path.replace(os.sep, "/").startswith(HASHED_ASSETS_PREFIX):
+        return IMMUTABLE_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """``StaticFiles`` serving build-time ``.br``/``.gz`` variants with explicit cache headers.
+
+    Variants are indexed once at mount time because ``frontend/dist`` is immutable once built.
+    ETag and ``304`` handling reuse Starlette's, with one ETag per served encoding.
+    """
+
+    def __init__(self, *, directory: str | os.PathLike[str], html: bool = False) -> None:
+        super().__init__(directory=directory, html=html)
+        self._root = os.path.realpath(directory)
+        self._variants: dict[str, list[tuple[str, str, os.stat_result]]] = {}
+        for folder, _dirs, files in os.walk(self._root):
+            for name in files:
+                self._index_variants(os.path.join(folder, name), set(files))
+
+    def _index_variants(self, path: str, siblings: set[str]) -> None:
+        variants = [
+            (encoding, path + suffix, os.stat(path + suffix))
+            for encoding, suffix in PRECOMPRESSED_ENCODINGS
+            if os.path.basename(path) + suffix in siblings
+        ]
+        if variants:
+            self._variants[path] = variants
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        real_path = os.path.realpath(full_path)
+        response = FileResponse(full_path, status_code=status_code, stat_result=stat_result)
+        variants = self._variants.get(real_path, [])
+        accepted = accepted_encodings(request_headers.get("accept-encoding"))
+        for encoding, variant_path, variant_stat in variants:
+            if encoding in accepted:
+                response = FileResponse(
+                    variant_path,
+                    status_code=status_code,
+                    stat_result=variant_stat,
+                    media_type=response.media_type,
+                    headers={"content-encoding": encoding},
+                )
+                break
+        if variants:
+            response.headers["vary"] = "Accept-Encoding"
+        response.headers["cache-control"] = cache_control_for(
+            os.path.relpath(real_path, self._root)
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+class CachedIndexDocument:
+    """``index.html`` and its precompressed variants held in memory for the ``/`` route."""
+
+    def __init__(self, index_path: Path) -> None:
+        self._bodies: dict[str, bytes] = {"identity": index_path.read_bytes()}
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            variant = index_path.with_name(index_path.name + suffix)
+            if variant.is_file():
+                self._bodies[encoding] = variant.read_bytes()
+        self._etags = {
+            encoding: f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+            for encoding, body in self._bodies.items()
+        }
+
+    def _encoding_for(self, request: Request) -> str:
+        accepted = accepted_encodings(request.headers.get("accept-encoding"))
+        for encoding, _suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding in accepted and encoding in self._bodies:
+                return encoding
+        return "identity"
+
+    def response(self, request: Request) -> Response:
+        encoding = self._encoding_for(request)
+        etag = self._etags[encoding]
+        headers = {
+            "etag": etag,
+            "cache-control": REVALIDATE_CACHE_CONTROL,
+            "vary": "Accept-Encoding",
+        }
+        if encoding != "identity":
+            headers["content-encoding"] = encoding
+        if_none_match = request.headers.get("if-none-match", "")
+        if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+            return NotModifiedResponse(Headers(headers))
+        return Response(self._bodies[encoding], media_type="text/html", headers=headers)
+
+
 def mount_frontend(app: FastAPI) -> None:
     front_dir = _front_dist_dir()
     if front_dir.exists():
-        app.mount("/", StaticFiles(directory=str(front_dir), html=True), name="front")
+        if (front_dir / "index.html").is_file():
+            index_document = CachedIndexDocument(front_dir / "index.html")
+
+            # Declared before the mount so that "/" is answered from memory.
+            @app.api_route("/", methods=["GET", "HEAD"])
+            async def index(request: Request) -> Response:
+                return index_document.response(request)
 
-        @app.get("/")
-        def index():
-            return FileResponse(str(front_dir / "index.html"))
+        app.mount(
+            "/",
+            PrecompressedStaticFiles(directory=str(front_dir), html=True),
+            name="front",
+        )
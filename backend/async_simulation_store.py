@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, TypeVar
+
+from pymongo import DESCENDING, AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import OperationFailure, PyMongoError
+
+from .api_config import ApiConfig
+from .simulation_models import SimulationCommand, SimulationResult
+from .simulation_store import (
+    HISTORY_PROJECTION,
+    INDEX_OPTIONS_CONFLICT_CODE,
+    MongoStoreSettings,
+    _simulation_document,
+    history_row,
+)
+
+logger = logging.getLogger(__name__)
+T = TypeVar("T")
+
+
+class AsyncSimulationStore(MongoStoreSettings):
+    """Frontiere Mongo non bloquante pour la boucle d'evenements FastAPI.
+
+    Meme contrat que ``SimulationStore`` : documents, projection d'historique et
+    reconnexion unique sur ``PyMongoError``. La creation des index est differee
+    dans une tache de fond pour que le demarrage ne bloque que sur le ``ping``.
+    """
+
+    driver = "async"
+
+    def __init__(self, cfg: ApiConfig) -> None:
+        super().__init__(cfg)
+        self._client: AsyncMongoClient[Any] | None = None
+        self._collection: AsyncCollection[Any] | None = None
+        self._lock = asyncio.Lock()
+        self._index_task: asyncio.Task[None] | None = None
+
+    def _build_client(self) -> AsyncMongoClient[Any]:
+        return AsyncMongoClient(self._mongo_url, **self._client_options())
+
+    async def _reset_client(self) -> None:
+        client = self._client
+        self._client = None
+        self._collection = None
+        if client is not None:
+            await client.close()
+
+    async def connect(self) -> None:
+        if not self.enabled or self._collection is not None:
+            return
+
+        async with self._lock:
+            if self._collection is not None:
+                return
+            client = self._build_client()
+            try:
+                collection = client[self._mongo_db][self._collection_name]
+                await client.admin.command("ping")
+            except Exception:
+                await client.close()
+                raise
+            self._client = client
+            self._collection = collection
+            self._schedule_index_creation(collection)
+
+    def _schedule_index_creation(self, collection: AsyncCollection[Any]) -> None:
+        if self._indexes_ready or (self._index_task is not None and not self._index_task.done()):
+            return
+        self._index_task = asyncio.get_running_loop().create_task(
+            self._create_indexes_in_background(collection)
+        )
+
+    async def _create_indexes_in_background(self, collection: AsyncCollection[Any]) -> None:
+        try:
+            await self._ensure_indexes(collection)
+        except PyMongoError as exc:
+            logger.warning(
+                "Mongo index creation failed; it will be retried on the next connection.",
+                exc_info=exc,
+            )
+            return
+        self._indexes_ready = True
+
+    async def _ensure_indexes(self, collection: AsyncCollection[Any]) -> None:
+        await collection.create_index([("mc_client_id", 1), ("created_at", DESCENDING)])
+        try:
+            await collection.create_index(
+                [("last_seen", 1)],
+                expireAfterSeconds=self._LAST_SEEN_TTL_SECONDS,
+            )
+        except OperationFailure as exc:
+            if exc.code != INDEX_OPTIONS_CONFLICT_CODE:
+                raise
+            await collection.drop_index(self._LAST_SEEN_INDEX_NAME)
+            await collection.create_index(
+                [("last_seen", 1)],
+                expireAfterSeconds=self._LAST_SEEN_TTL_SECONDS,
+            )
+
+    async def close(self) -> None:
+        index_task = self._index_task
+        self._index_task = None
+        if index_task is not None and not index_task.done():
+            index_task.cancel()
+            await asyncio.gather(index_task, return_exceptions=True)
+        await self._reset_client()
+
+    async def _ensure_collection(self) -> AsyncCollection[Any]:
+        if not self.enabled:
+            raise RuntimeError("Mongo persistence is disabled.")
+        await self.connect()
+        assert self._collection is not None
+        return self._collection
+
+    async def ping(self) -> bool:
+        if not self.enabled:
+            return False
+
+        async def _op() -> bool:
+            await self._ensure_collection()
+            assert self._client is not None
+            await self._client.admin.command("ping")
+            return True
+
+        return await self._run_with_reconnect(_op)
+
+    async def _run_with_reconnect(self, op: Callable[[], Awaitable[T]]) -> T:
+        last_exc: Exception | None = None
+        for attempt in range(2):
+            try:
+                return await op()
+            except PyMongoError as exc:
+                last_exc = exc
+                await self._reset_client()
+                if attempt == 1:
+                    break
+        if last_exc is not None:
+            raise last_exc
+        raise RuntimeError("Mongo operation failed unexpectedly.")
+
+    async def save_simulation(
+        self,
+        mc_client_id: str,
+        command: SimulationCommand,
+        result: SimulationResult,
+    ) -> None:
+        if not self.enabled or not mc_client_id:
+            return
+
+        async def _op() -> None:
+            coll = await self._ensure_collection()
+            now = datetime.now(timezone.utc)
+            doc = _simulation_document(mc_client_id, command, result, now)
+            await coll.insert_one(doc)
+            await coll.update_many({"mc_client_id": mc_client_id}, {"$set": {"last_seen": now}})
+
+        await self._run_with_reconnect(_op)
+
+    async def list_recent(self, mc_client_id: str) -> list[dict[str, Any]]:
+        if not self.enabled or not mc_client_id:
+            return []
+
+        async def _op() -> list[dict[str, Any]]:
+            coll = await self._ensure_collection()
+            cursor = coll.find(
+                {"mc_client_id": mc_client_id},
+                HISTORY_PROJECTION,
+            ).sort("created_at", DESCENDING).limit(self._history_limit)
+            return [history_row(item) async for item in cursor]
+
+        return await self._run_with_reconnect(_op)
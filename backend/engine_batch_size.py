@@ -0,0 +1,88 @@
+"""Taille de lot du moteur derivee d'un budget de memoire de travail.
+
+Le cout par slot tire depend du cache : un lot dont les matrices tiennent dans le cache
+proche du coeur evite de relire la memoire principale a chaque passe NumPy. Le nombre
+de simulations par lot suit donc l'horizon au lieu d'une constante unique. Les resultats
+ne dependent pas de la taille de lot.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Peak bytes per drawn slot besides the drawn sample itself: PRNG states, mixed uint32
+# values, uint64 index products and the int64 index matrix (measured with tracemalloc).
+DRAW_BYTES_PER_SLOT = 36
+SAMPLE_ITEMSIZE = 8
+DEFAULT_ENGINE_WORKING_SET_BYTES = 1_536 * 1024
+ENGINE_BATCH_PROFILE_FORMAT = 1
+
+
+def batch_size_for_working_set(
+    draw_slots_per_simulation: int,
+    working_set_bytes: int,
+    sample_itemsize: int = SAMPLE_ITEMSIZE,
+) -> int:
+    """Simulations per batch whose drawing working set fits ``working_set_bytes``."""
+    if draw_slots_per_simulation <= 0 or working_set_bytes <= 0 or sample_itemsize <= 0:
+        raise ValueError("horizon, budget et taille d'element doivent etre > 0")
+    slot_bytes = DRAW_BYTES_PER_SLOT + sample_itemsize
+    return max(1, working_set_bytes // (draw_slots_per_simulation * slot_bytes))
+
+
+def read_engine_batch_profile(path: Path) -> int | None:
+    """Working set recorded by ``Scripts/tune_engine_batch_size.py``, if usable.
+
+    A missing profile is the normal untuned case; an unreadable one is reported and
+    ignored so that the API still starts with the default budget.
+    """
+    try:
+        profile = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Engine batch profile %s is unreadable; using defaults.", path, exc_info=exc)
+        return None
+    working_set = profile.get("working_set_bytes") if isinstance(profile, dict) else None
+    if (
+        not isinstance(profile, dict)
+        or profile.get("format") != ENGINE_BATCH_PROFILE_FORMAT
+        or type(working_set) is not int
+        or working_set <= 0
+    ):
+        logger.warning("Engine batch profile %s is invalid; using defaults.", path)
+        return None
+    return working_set
+
+
+@dataclass(frozen=True)
+class EngineBatchSizing:
+    """Fixed batch size, or a working-set budget turned into a batch per horizon."""
+
+    working_set_bytes: int = DEFAULT_ENGINE_WORKING_SET_BYTES
+    fixed_batch_size: int | None = None
+
+    @classmethod
+    def configured(
+        cls,
+        *,
+        fixed_batch_size: int | None,
+        working_set_bytes: int | None,
+        profile_path: Path | None,
+    ) -> EngineBatchSizing:
+        """Precedence: fixed batch size, explicit budget, tuned profile, default budget."""
+        if fixed_batch_size is not None:
+            return cls(fixed_batch_size=fixed_batch_size)
+        if working_set_bytes is None and profile_path is not None:
+            working_set_bytes = read_engine_batch_profile(profile_path)
+        return cls(working_set_bytes=working_set_bytes or DEFAULT_ENGINE_WORKING_SET_BYTES)
+
+    def batch_size(self, draw_slots_per_simulation: int) -> int:
+        if self.fixed_batch_size is not None:
+            return self.fixed_batch_size
+        return batch_size_for_working_set(draw_slots_per_simulation, self.working_set_bytes)
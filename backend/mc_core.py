@@ -5,7 +5,8 @@ from typing import Dict, Literal, Optional, Tuple
 
 import numpy as np
 
-from .sample_index_draw_port import SampleIndexDrawPort
+from .prepared_samples import PreparedSamples
+from .sample_index_draw_port import LeadingSlotsSampleIndexDrawPort, SampleIndexDrawPort
 from .simulation_limits import SIMULATION_HORIZON_WEEKS_MAX
 
 SIMULATION_BATCH_SIZE = 2048
@@ -44,7 +45,7 @@ class FinishWeeksSimulation:
 
 def mc_finish_weeks(
     backlog_size: int,
-    throughput_samples: np.ndarray,
+    throughput_samples: np.ndarray | PreparedSamples,
     n_sims: int = 20000,
     include_zero_weeks: bool = False,
     *,
@@ -55,7 +56,8 @@ def mc_finish_weeks(
     Monte Carlo "Quand finira-t-on un backlog de N items ?"
 
     - backlog_size: nombre d'items à livrer
-    - throughput_samples: array des throughputs (items/semaine) observés historiquement
+    - throughput_samples: array des throughputs (items/semaine) observés historiquement,
+      ou historique deja prepare par `prepare_samples`
     - n_sims: nombre de simulations
     - draw_port: source injectee d'indices d'echantillons deterministes
 
@@ -63,23 +65,20 @@ def mc_finish_weeks(
     """
     if backlog_size <= 0:
         raise ValueError("backlog_size doit être > 0")
-    if throughput_samples is None or len(throughput_samples) == 0:
-        raise ValueError("throughput_samples est vide")
-
-    samples = np.asarray(throughput_samples, dtype=int)
-    if include_zero_weeks:
-        samples = samples[samples >= 0]
-        if len(samples) == 0:
-            raise ValueError("throughput_samples ne contient aucune valeur >= 0")
-    else:
-        samples = samples[samples > 0]
-        if len(samples) == 0:
-            raise ValueError("throughput_samples ne contient aucune valeur > 0")
+    samples = _engine_samples(throughput_samples, include_zero_weeks)
 
     resolved_batch_size = _resolve_batch_size(batch_size)
 
     # Garde-fou historique: la version boucle stoppait au plus tard a 521 semaines.
     max_weeks = SIMULATION_HORIZON_WEEKS_MAX
+    earliest_week, latest_week = _completion_window(backlog_size, samples, max_weeks)
+    if earliest_week > max_weeks:
+        # Meme la meilleure semaine repetee n'atteint pas le backlog: censure totale exacte.
+        return FinishWeeksSimulation(
+            completed_weeks=np.empty(0, dtype=int),
+            simulation_count=n_sims,
+            horizon_weeks=max_weeks,
+        )
     completed_batches: list[np.ndarray] = []
 
     for start in range(0, n_sims, resolved_batch_size):
@@ -90,14 +89,9 @@ def mc_finish_weeks(
             samples,
             current_batch_size,
             max_weeks,
+            used_slots=latest_week,
         )
-        cumulative = np.cumsum(draws, axis=1)
-        reached = cumulative >= backlog_size
-
-        first_hit_idx = reached.argmax(axis=1)  # 0-based
-        has_hit = reached.any(axis=1)
-
-        completed_batches.append(first_hit_idx[has_hit].astype(int) + 1)
+        completed_batches.append(_first_completion_weeks(draws, backlog_size, earliest_week))
 
     return FinishWeeksSimulation(
         completed_weeks=np.concatenate(completed_batches),
@@ -108,7 +102,7 @@ def mc_finish_weeks(
 
 def mc_items_done_for_weeks(
     weeks: int,
-    throughput_samples: np.ndarray,
+    throughput_samples: np.ndarray | PreparedSamples,
     n_sims: int = 20000,
     include_zero_weeks: bool = False,
     *,
@@ -119,7 +113,8 @@ def mc_items_done_for_weeks(
     Monte Carlo "Combien d'items seront livrés en N semaines ?"
 
     - weeks: horizon de simulation en semaines
-    - throughput_samples: array des throughputs (items/semaine) observés historiquement
+    - throughput_samples: array des throughputs (items/semaine) observés historiquement,
+      ou historique deja prepare par `prepare_samples`
     - n_sims: nombre de simulations
     - draw_port: source injectee d'indices d'echantillons deterministes
 
@@ -127,18 +122,7 @@ def mc_items_done_for_weeks(
     """
     if weeks <= 0:
         raise ValueError("weeks doit être > 0")
-    if throughput_samples is None or len(throughput_samples) == 0:
-        raise ValueError("throughput_samples est vide")
-
-    samples = np.asarray(throughput_samples, dtype=int)
-    if include_zero_weeks:
-        samples = samples[samples >= 0]
-        if len(samples) == 0:
-            raise ValueError("throughput_samples ne contient aucune valeur >= 0")
-    else:
-        samples = samples[samples > 0]
-        if len(samples) == 0:
-            raise ValueError("throughput_samples ne contient aucune valeur > 0")
+    samples = _engine_samples(throughput_samples, include_zero_weeks)
 
     resolved_batch_size = _resolve_batch_size(batch_size)
     items_done = np.empty(n_sims, dtype=int)
@@ -157,6 +141,73 @@ def mc_items_done_for_weeks(
     return items_done
 
 
+def _engine_samples(
+    throughput_samples: np.ndarray | PreparedSamples,
+    include_zero_weeks: bool,
+) -> np.ndarray:
+    if isinstance(throughput_samples, PreparedSamples):
+        # Already validated: filter only the zeros the caller excludes.
+        samples = throughput_samples.values
+        if include_zero_weeks or throughput_samples.minimum > 0:
+            return samples
+        samples = samples[samples > 0]
+    else:
+        if throughput_samples is None or len(throughput_samples) == 0:
+            raise ValueError("throughput_samples est vide")
+        samples = np.asarray(throughput_samples, dtype=int)
+        samples = samples[samples >= 0] if include_zero_weeks else samples[samples > 0]
+    if len(samples) == 0:
+        comparison = ">= 0" if include_zero_weeks else "> 0"
+        raise ValueError(f"throughput_samples ne contient aucune valeur {comparison}")
+    return samples
+
+
+def finish_weeks_draw_slots(backlog_size: int, samples: PreparedSamples) -> int:
+    """Semaines tirees par simulation par `mc_finish_weeks` pour ce backlog et cet historique.
+
+    Seules les semaines jusqu'a ``ceil(backlog / min)`` sont tirees quand ``min > 0`` ; la
+    taille de lot se calcule sur cette largeur plutot que sur l'horizon complet.
+    """
+    if backlog_size <= 0:
+        raise ValueError("backlog_size doit être > 0")
+    return _completion_window(backlog_size, samples.values, SIMULATION_HORIZON_WEEKS_MAX)[1]
+
+
+def _completion_window(
+    backlog_size: int,
+    samples: np.ndarray,
+    max_weeks: int,
+) -> tuple[int, int]:
+    """Bornes des semaines de fin possibles, tirees du plus fort et du plus faible throughput.
+
+    Aucune simulation ne finit avant ``ceil(backlog / max)`` et toutes ont fini a
+    ``ceil(backlog / min)`` quand ``min > 0`` ; la premiere borne depasse l'horizon quand
+    ``max == 0``.
+    """
+    maximum = int(samples.max())
+    minimum = int(samples.min())
+    earliest = -(-backlog_size // maximum) if maximum > 0 else max_weeks + 1
+    latest = min(-(-backlog_size // minimum), max_weeks) if minimum > 0 else max_weeks
+    return earliest, latest
+
+
+def _first_completion_weeks(
+    draws: np.ndarray,
+    backlog_size: int,
+    earliest_week: int,
+) -> np.ndarray:
+    # Les semaines precedant la borne basse ne sont que sommees, sans recherche de fin.
+    skipped = earliest_week - 1
+    cumulative = np.cumsum(draws[:, skipped:], axis=1)
+    if skipped:
+        cumulative += draws[:, :skipped].sum(axis=1, keepdims=True)
+    reached = cumulative >= backlog_size
+
+    first_hit_idx = reached.argmax(axis=1)  # 0-based depuis la borne basse
+    has_hit = reached.any(axis=1)
+    return first_hit_idx[has_hit].astype(int) + earliest_week
+
+
 def _resolve_batch_size(batch_size: int) -> int:
     if batch_size <= 0:
         raise ValueError("batch_size doit etre > 0")
@@ -168,13 +219,22 @@ def _draw_samples_batch(
     samples: np.ndarray,
     simulation_count: int,
     draw_slots_per_simulation: int,
+    *,
+    used_slots: int | None = None,
 ) -> np.ndarray:
-    """Draw a simulation-major matrix whose rows are contiguous logical slots."""
+    """Draw a simulation-major matrix whose rows are contiguous logical slots.
 
-    sample_indexes = draw_port.draw_sample_indices(
-        len(samples),
-        (simulation_count, draw_slots_per_simulation),
-    )
+    With ``used_slots``, only the leading slots of each row are returned; the skipped
+    slots stay consumed, so the next batch starts at the same logical offset.
+    """
+
+    shape = (simulation_count, draw_slots_per_simulation)
+    if used_slots is None or used_slots >= draw_slots_per_simulation:
+        sample_indexes = draw_port.draw_sample_indices(len(samples), shape)
+    elif isinstance(draw_port, LeadingSlotsSampleIndexDrawPort):
+        sample_indexes = draw_port.draw_leading_sample_indices(len(samples), shape, used_slots)
+    else:
+        sample_indexes = draw_port.draw_sample_indices(len(samples), shape)[:, :used_slots]
     return samples[sample_indexes]
 
 
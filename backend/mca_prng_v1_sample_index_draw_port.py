@@ -26,8 +26,15 @@ class McaPrngV1SampleIndexDrawPort:
     def __init__(self, seed: SimulationSeed) -> None:
         self._state = np.uint32(seed.value)
 
-    def _draw_uint32_values(self, draw_count: int) -> np.ndarray:
-        offsets = np.arange(1, draw_count + 1, dtype=np.uint64)
+    def _draw_uint32_values(
+        self,
+        draw_count: int,
+        offsets: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Consomme ``draw_count`` transitions; ``offsets`` (base 1) choisit celles calculees."""
+
+        if offsets is None:
+            offsets = np.arange(1, draw_count + 1, dtype=np.uint64)
         states = np.bitwise_and(
             np.uint64(self._state) + offsets * _STATE_INCREMENT,
             _UINT32_MASK,
@@ -53,7 +60,9 @@ class McaPrngV1SampleIndexDrawPort:
             copy=False,
         )
 
-        self._state = states[-1]
+        self._state = np.uint32(
+            (int(self._state) + draw_count * int(_STATE_INCREMENT)) & int(_UINT32_MASK)
+        )
         return values
 
     def draw_uint32(self, draw_count: int) -> np.ndarray:
@@ -68,26 +77,51 @@ class McaPrngV1SampleIndexDrawPort:
         sample_count: int,
         shape: SampleIndexDrawShape,
     ) -> np.ndarray:
-        if (
-            type(sample_count) is not int
-            or sample_count <= 0
-            or sample_count > _MAX_SAMPLE_COUNT
-        ):
-            raise ValueError("sample_count doit etre un entier > 0")
-        if (
-            type(shape) is not tuple
-            or len(shape) != 2
-            or any(type(dimension) is not int or dimension <= 0 for dimension in shape)
-        ):
-            raise ValueError("shape doit contenir deux dimensions entieres > 0")
-
-        draw_count = shape[0] * shape[1]
-        values = self._draw_uint32_values(draw_count)
-        values_uint64 = values.astype(np.uint64)
-        high, low = divmod(sample_count, _UINT32_RANGE)
-        high_products = values_uint64 * np.uint64(high)
-        low_products = values_uint64 * np.uint64(low)
-        indices = (
-            high_products + np.right_shift(low_products, 32)
-        ).astype(np.int64)
-        return indices.reshape(shape, order="C")
+        _validate_request(sample_count, shape)
+        values = self._draw_uint32_values(shape[0] * shape[1])
+        return _sample_indices(values, sample_count).reshape(shape, order="C")
+
+    def draw_leading_sample_indices(
+        self,
+        sample_count: int,
+        shape: SampleIndexDrawShape,
+        leading_slots: int,
+    ) -> np.ndarray:
+        """Colonnes ``[0, leading_slots)`` de la matrice ``shape``, sans calculer les suivantes.
+
+        L'etat avance sur la matrice entiere : le tirage suivant reprend au meme offset.
+        """
+
+        _validate_request(sample_count, shape)
+        if type(leading_slots) is not int or not 0 < leading_slots <= shape[1]:
+            raise ValueError("leading_slots doit etre un entier entre 1 et shape[1]")
+        rows, slots = shape
+        offsets = (
+            np.arange(rows, dtype=np.uint64)[:, np.newaxis] * np.uint64(slots)
+            + np.arange(1, leading_slots + 1, dtype=np.uint64)
+        ).ravel()
+        values = self._draw_uint32_values(rows * slots, offsets)
+        return _sample_indices(values, sample_count).reshape((rows, leading_slots))
+
+
+def _validate_request(sample_count: int, shape: SampleIndexDrawShape) -> None:
+    if (
+        type(sample_count) is not int
+        or sample_count <= 0
+        or sample_count > _MAX_SAMPLE_COUNT
+    ):
+        raise ValueError("sample_count doit etre un entier > 0")
+    if (
+        type(shape) is not tuple
+        or len(shape) != 2
+        or any(type(dimension) is not int or dimension <= 0 for dimension in shape)
+    ):
+        raise ValueError("shape doit contenir deux dimensions entieres > 0")
+
+
+def _sample_indices(values: np.ndarray, sample_count: int) -> np.ndarray:
+    values_uint64 = values.astype(np.uint64)
+    high, low = divmod(sample_count, _UINT32_RANGE)
+    high_products = values_uint64 * np.uint64(high)
+    low_products = values_uint64 * np.uint64(low)
+    return (high_products + np.right_shift(low_products, 32)).astype(np.int64)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from .simulation_value_objects import ThroughputReliability, ThroughputSamples
+from .throughput_reliability import throughput_reliability_from_array
+
+PREPARED_SAMPLES_CACHE_SIZE = 256
+
+
+@dataclass(frozen=True, eq=False)
+class PreparedSamples:
+    """Engine-ready form of a usable throughput history, shared between requests.
+
+    ``values`` is read-only because one instance serves concurrent simulations. It stays
+    ``int64``: a narrower lookup table shrinks the drawn matrix, but widening it again in
+    the cumulative sum costs more than the gather saves.
+    """
+
+    values: np.ndarray
+    minimum: int
+    maximum: int
+    include_zero_weeks: bool
+    reliability: ThroughputReliability
+
+    @classmethod
+    def create(cls, usable_values: Sequence[int], include_zero_weeks: bool) -> PreparedSamples:
+        values = np.asarray(usable_values, dtype=np.int64)
+        values.flags.writeable = False
+        minimum = int(values.min())
+        maximum = int(values.max())
+        return cls(
+            values=values,
+            minimum=minimum,
+            maximum=maximum,
+            include_zero_weeks=include_zero_weeks,
+            reliability=throughput_reliability_from_array(values),
+        )
+
+    @property
+    def samples_count(self) -> int:
+        return int(self.values.size)
+
+
+@lru_cache(maxsize=PREPARED_SAMPLES_CACHE_SIZE)
+def _prepared(usable_values: tuple[int, ...], include_zero_weeks: bool) -> PreparedSamples:
+    return PreparedSamples.create(usable_values, include_zero_weeks)
+
+
+def prepare_samples(samples: ThroughputSamples) -> PreparedSamples:
+    """Prepared form of the history, memoised by content and zero-week policy.
+
+    The same team history is simulated with other modes, backlogs and seeds: those
+    requests reuse its arrays and reliability instead of rebuilding them.
+    """
+    return _prepared(samples.usable_values, samples.include_zero_weeks)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Protocol, TypeAlias
+from typing import Protocol, TypeAlias, runtime_checkable
 
 import numpy as np
 
@@ -22,3 +22,22 @@ class SampleIndexDrawPort(Protocol):
         """Retourne des entiers de ``shape`` appartenant a [0, sample_count)."""
 
         ...
+
+
+@runtime_checkable
+class LeadingSlotsSampleIndexDrawPort(SampleIndexDrawPort, Protocol):
+    """Capacite optionnelle : ne calculer que les premiers slots de chaque ligne.
+
+    Les slots ecartes restent consommes, comme si la matrice entiere avait ete tiree ;
+    un port sans cette capacite est servi par une matrice complete tronquee.
+    """
+
+    def draw_leading_sample_indices(
+        self,
+        sample_count: int,
+        shape: SampleIndexDrawShape,
+        leading_slots: int,
+    ) -> np.ndarray:
+        """Retourne les colonnes ``[0, leading_slots)`` de ``shape``."""
+
+        ...
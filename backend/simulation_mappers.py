@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from typing import Any, Mapping
+from typing import Any, Literal, Mapping, TypeAlias
 
 from .api_models import SimulateRequest, SimulateResponse, SimulationHistoryItem
 from .simulation_models import SimulationCommand, SimulationResult
 from .simulation_value_objects import SimulationSeed
 
+HistogramFormat: TypeAlias = Literal["buckets", "arrays"]
+
 
 def request_to_command(
     request: SimulateRequest,
     resolved_seed: SimulationSeed,
 ) -> SimulationCommand:
+    parameters = request.command_parameters
+    if parameters is not None:
+        return parameters.with_seed(resolved_seed)
     return SimulationCommand.create(
         throughput_samples=request.throughput_samples,
         include_zero_weeks=request.include_zero_weeks,
@@ -22,26 +27,37 @@ def request_to_command(
     )
 
 
-def result_to_response(result: SimulationResult) -> SimulateResponse:
+def _distribution_payload(
+    result: SimulationResult,
+    histogram_format: HistogramFormat,
+) -> list[dict[str, int]] | dict[str, list[int]]:
+    buckets = result.result_distribution.buckets
+    if histogram_format == "arrays":
+        return {
+            "x": [bucket.x for bucket in buckets],
+            "count": [bucket.count for bucket in buckets],
+        }
+    return [{"x": bucket.x, "count": bucket.count} for bucket in buckets]
+
+
+def result_to_response_payload(
+    result: SimulationResult,
+    *,
+    histogram_format: HistogramFormat = "buckets",
+) -> dict[str, Any]:
+    """Map an already validated domain result to the JSON shape of ``SimulateResponse``.
+
+    ``SimulationResult`` enforces every invariant that ``SimulateResponse`` checks, so the
+    HTTP path serialises this payload directly; keys follow the response model field order.
+    """
+
     values: dict[str, Any] = {
         "result_kind": result.result_kind,
         "result_percentiles": result.result_percentiles.to_dict(),
-        "result_distribution": [
-            {"x": bucket.x, "count": bucket.count}
-            for bucket in result.result_distribution.buckets
-        ],
-        "samples_count": result.samples_count,
-        "throughput_reliability": {
-            "cv": result.throughput_reliability.cv,
-            "iqr_ratio": result.throughput_reliability.iqr_ratio,
-            "slope_norm": result.throughput_reliability.slope_norm,
-            "label": result.throughput_reliability.label,
-            "samples_count": result.throughput_reliability.samples_count,
-        },
-        "seed": result.seed.value,
     }
     if result.risk_score is not None:
         values["risk_score"] = result.risk_score
+    values["result_distribution"] = _distribution_payload(result, histogram_format)
     if result.completion_summary is not None:
         values["completion_summary"] = {
             "completed_count": result.completion_summary.completed_count,
@@ -49,7 +65,20 @@ def result_to_response(result: SimulationResult) -> SimulateResponse:
             "censored_rate": result.completion_summary.censored_rate,
             "horizon_weeks": result.completion_summary.horizon_weeks,
         }
-    return SimulateResponse(**values)
+    values["samples_count"] = result.samples_count
+    values["throughput_reliability"] = {
+        "cv": result.throughput_reliability.cv,
+        "iqr_ratio": result.throughput_reliability.iqr_ratio,
+        "slope_norm": result.throughput_reliability.slope_norm,
+        "label": result.throughput_reliability.label,
+        "samples_count": result.throughput_reliability.samples_count,
+    }
+    values["seed"] = result.seed.value
+    return values
+
+
+def result_to_response(result: SimulationResult) -> SimulateResponse:
+    return SimulateResponse(**result_to_response_payload(result))
 
 
 def persistence_row_to_history_item(
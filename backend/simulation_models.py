@@ -33,36 +33,18 @@ _NORMALIZED_INPUT_ALLOWED_KEYS = _NORMALIZED_INPUT_COMMON_KEYS | {
 
 
 @dataclass(frozen=True, slots=True)
-class SimulationCommand:
+class SimulationParameters:
+    """Validated command inputs awaiting the resolved seed.
+
+    Built once at the HTTP boundary so that ``request_to_command`` only attaches
+    the seed instead of revalidating every throughput sample.
+    """
+
     throughput_samples: ThroughputSamples
     mode: SimulationMode
     backlog_size: BacklogSize | None
     target_weeks: SimulationHorizon | None
     n_sims: SimulationCount
-    seed: SimulationSeed
-
-    def __post_init__(self) -> None:
-        if not isinstance(self.throughput_samples, ThroughputSamples):
-            raise StatisticalValueError("throughput_samples doit etre un Value Object.")
-        if not isinstance(self.n_sims, SimulationCount):
-            raise StatisticalValueError("n_sims doit etre un Value Object.")
-        if not isinstance(self.seed, SimulationSeed):
-            raise StatisticalValueError("seed doit etre un Value Object.")
-        if self.mode == "backlog_to_weeks":
-            if not isinstance(self.backlog_size, BacklogSize) or self.target_weeks is not None:
-                raise StatisticalValueError(
-                    "backlog_to_weeks doit contenir uniquement un backlog actif."
-                )
-        elif self.mode == "weeks_to_items":
-            if (
-                not isinstance(self.target_weeks, SimulationHorizon)
-                or self.backlog_size is not None
-            ):
-                raise StatisticalValueError(
-                    "weeks_to_items doit contenir uniquement un horizon actif."
-                )
-        else:
-            raise StatisticalValueError("mode de simulation invalide.")
 
     @classmethod
     def create(
@@ -74,10 +56,7 @@ class SimulationCommand:
         backlog_size: object | None,
         target_weeks: object | None,
         n_sims: object,
-        seed: SimulationSeed,
-    ) -> SimulationCommand:
-        if not isinstance(seed, SimulationSeed):
-            raise StatisticalValueError("seed doit etre un Value Object resolu.")
+    ) -> SimulationParameters:
         if mode not in ("backlog_to_weeks", "weeks_to_items"):
             raise StatisticalValueError("mode de simulation invalide.")
         if not isinstance(throughput_samples, (list, tuple)):
@@ -98,14 +77,7 @@ class SimulationCommand:
                 raise StatisticalValueError(
                     "target_weeks doit etre absent pour le mode backlog_to_weeks."
                 )
-            return cls(
-                samples,
-                mode,
-                BacklogSize(backlog_size),
-                None,
-                simulation_count,
-                seed,
-            )
+            return cls(samples, mode, BacklogSize(backlog_size), None, simulation_count)
         if target_weeks is None:
             raise StatisticalValueError(
                 "target_weeks requis pour le mode weeks_to_items."
@@ -114,15 +86,74 @@ class SimulationCommand:
             raise StatisticalValueError(
                 "backlog_size doit etre absent pour le mode weeks_to_items."
             )
-        return cls(
-            samples,
-            mode,
-            None,
-            SimulationHorizon(target_weeks),
-            simulation_count,
+        return cls(samples, mode, None, SimulationHorizon(target_weeks), simulation_count)
+
+    def with_seed(self, seed: SimulationSeed) -> SimulationCommand:
+        return SimulationCommand(
+            self.throughput_samples,
+            self.mode,
+            self.backlog_size,
+            self.target_weeks,
+            self.n_sims,
             seed,
         )
 
+
+@dataclass(frozen=True, slots=True)
+class SimulationCommand:
+    throughput_samples: ThroughputSamples
+    mode: SimulationMode
+    backlog_size: BacklogSize | None
+    target_weeks: SimulationHorizon | None
+    n_sims: SimulationCount
+    seed: SimulationSeed
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.throughput_samples, ThroughputSamples):
+            raise StatisticalValueError("throughput_samples doit etre un Value Object.")
+        if not isinstance(self.n_sims, SimulationCount):
+            raise StatisticalValueError("n_sims doit etre un Value Object.")
+        if not isinstance(self.seed, SimulationSeed):
+            raise StatisticalValueError("seed doit etre un Value Object.")
+        if self.mode == "backlog_to_weeks":
+            if not isinstance(self.backlog_size, BacklogSize) or self.target_weeks is not None:
+                raise StatisticalValueError(
+                    "backlog_to_weeks doit contenir uniquement un backlog actif."
+                )
+        elif self.mode == "weeks_to_items":
+            if (
+                not isinstance(self.target_weeks, SimulationHorizon)
+                or self.backlog_size is not None
+            ):
+                raise StatisticalValueError(
+                    "weeks_to_items doit contenir uniquement un horizon actif."
+                )
+        else:
+            raise StatisticalValueError("mode de simulation invalide.")
+
+    @classmethod
+    def create(
+        cls,
+        *,
+        throughput_samples: object,
+        include_zero_weeks: object,
+        mode: object,
+        backlog_size: object | None,
+        target_weeks: object | None,
+        n_sims: object,
+        seed: SimulationSeed,
+    ) -> SimulationCommand:
+        if not isinstance(seed, SimulationSeed):
+            raise StatisticalValueError("seed doit etre un Value Object resolu.")
+        return SimulationParameters.create(
+            throughput_samples=throughput_samples,
+            include_zero_weeks=include_zero_weeks,
+            mode=mode,
+            backlog_size=backlog_size,
+            target_weeks=target_weeks,
+            n_sims=n_sims,
+        ).with_seed(seed)
+
     @classmethod
     def from_normalized_input(
         cls,
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import numpy as np
 
+from .engine_batch_size import EngineBatchSizing
 from .histogram import build_histogram
 from .mc_core import (
-    SIMULATION_BATCH_SIZE,
     FinishWeeksSimulation,
+    finish_weeks_draw_slots,
     mc_finish_weeks,
     mc_items_done_for_weeks,
     percentiles,
 )
 from .mca_prng_v1_sample_index_draw_port import McaPrngV1SampleIndexDrawPort
+from .prepared_samples import PreparedSamples, prepare_samples
 from .sample_index_draw_port import SampleIndexDrawPort
 from .simulation_models import (
     SimulationCommand,
@@ -21,16 +23,15 @@ from .simulation_value_objects import (
     Histogram,
     SimulationPercentiles,
 )
-from .throughput_reliability import calculate_throughput_reliability
 
 
-def _prepare_samples(command: SimulationCommand) -> np.ndarray:
-    return np.asarray(command.throughput_samples.usable_values, dtype=int)
+def _prepare_samples(command: SimulationCommand) -> PreparedSamples:
+    return prepare_samples(command.throughput_samples)
 
 
 def _run_engine(
     command: SimulationCommand,
-    samples: np.ndarray,
+    samples: PreparedSamples,
     draw_port: SampleIndexDrawPort,
     *,
     batch_size: int,
@@ -63,10 +64,24 @@ def _run_engine(
     )
 
 
+DEFAULT_BATCH_SIZING = EngineBatchSizing()
+
+
+def engine_batch_size(command: SimulationCommand, sizing: EngineBatchSizing) -> int:
+    """Batch size for the weeks actually drawn per simulation by the command's mode."""
+    if command.mode == "backlog_to_weeks":
+        assert command.backlog_size is not None
+        return sizing.batch_size(
+            finish_weeks_draw_slots(command.backlog_size.value, _prepare_samples(command))
+        )
+    assert command.target_weeks is not None
+    return sizing.batch_size(command.target_weeks.value)
+
+
 def run_simulation(command: SimulationCommand) -> SimulationResult:
     return run_simulation_with_batch_size(
         command,
-        batch_size=SIMULATION_BATCH_SIZE,
+        batch_size=engine_batch_size(command, DEFAULT_BATCH_SIZING),
     )
 
 
@@ -114,9 +129,6 @@ def run_simulation_with_batch_size(
             total_count=percentile_total_count,
         ),
     )
-    throughput_reliability = calculate_throughput_reliability(
-        command.throughput_samples.usable_values
-    )
     expected_mass = (
         completion_summary.completed_count
         if completion_summary is not None
@@ -131,7 +143,7 @@ def run_simulation_with_batch_size(
             expected_mass=expected_mass,
         ),
         completion_summary=completion_summary,
-        samples_count=int(len(samples)),
-        throughput_reliability=throughput_reliability,
+        samples_count=samples.samples_count,
+        throughput_reliability=samples.reliability,
         seed=command.seed,
     )
@@ -10,6 +10,7 @@ from pymongo.errors import OperationFailure, PyMongoError
 
 from .api_config import ApiConfig
 from .simulation_models import SimulationCommand, SimulationResult
+from .simulation_store_pool_metrics import MongoPoolMetrics
 
 SENSITIVE_HISTORY_FIELDS = {
     "selected_org": 0,
@@ -24,6 +25,14 @@ SENSITIVE_HISTORY_FIELDS = {
     "server_url": 0,
     "azure_devops_url": 0,
 }
+HISTORY_PROJECTION = {
+    "_id": 0,
+    "mc_client_id": 0,
+    **SENSITIVE_HISTORY_FIELDS,
+}
+LAST_SEEN_INDEX_NAME = "last_seen_1"
+LAST_SEEN_TTL_SECONDS = 30 * 24 * 3600
+INDEX_OPTIONS_CONFLICT_CODE = 85
 
 
 def _to_iso_z(value: datetime) -> str:
@@ -74,9 +83,22 @@ def _simulation_document(
     return doc
 
 
-class SimulationStore:
-    _LAST_SEEN_INDEX_NAME = "last_seen_1"
-    _LAST_SEEN_TTL_SECONDS = 30 * 24 * 3600
+def history_row(item: dict[str, Any]) -> dict[str, Any]:
+    created_at = item.get("created_at")
+    last_seen = item.get("last_seen")
+    if isinstance(created_at, datetime):
+        item["created_at"] = _to_iso_z(created_at)
+    if isinstance(last_seen, datetime):
+        item["last_seen"] = _to_iso_z(last_seen)
+    return item
+
+
+class MongoStoreSettings:
+    """Configuration Mongo partagee par les stores synchrone et asynchrone."""
+
+    driver = "sync"
+    _LAST_SEEN_INDEX_NAME = LAST_SEEN_INDEX_NAME
+    _LAST_SEEN_TTL_SECONDS = LAST_SEEN_TTL_SECONDS
 
     def __init__(self, cfg: ApiConfig) -> None:
         self._mongo_url = cfg.mongo_url
@@ -89,26 +111,51 @@ class SimulationStore:
         self._mongo_connect_timeout_ms = cfg.mongo_connect_timeout_ms
         self._mongo_socket_timeout_ms = cfg.mongo_socket_timeout_ms
         self._mongo_max_idle_time_ms = cfg.mongo_max_idle_time_ms
+        self.pool_metrics = MongoPoolMetrics()
+        self._indexes_ready = False
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self._mongo_url)
+
+    @property
+    def indexes_ready(self) -> bool:
+        return self._indexes_ready
+
+    def _client_options(self) -> dict[str, Any]:
+        return {
+            "minPoolSize": self._mongo_min_pool_size,
+            "maxPoolSize": self._mongo_max_pool_size,
+            "serverSelectionTimeoutMS": self._mongo_server_selection_timeout_ms,
+            "connectTimeoutMS": self._mongo_connect_timeout_ms,
+            "socketTimeoutMS": self._mongo_socket_timeout_ms,
+            "maxIdleTimeMS": self._mongo_max_idle_time_ms,
+            "retryWrites": True,
+            "retryReads": True,
+            "event_listeners": [self.pool_metrics],
+        }
+
+    def pool_status(self) -> dict[str, Any]:
+        return {
+            "driver": self.driver,
+            "indexes_ready": self.indexes_ready,
+            "pool": self.pool_metrics.snapshot(),
+        }
+
+
+class SimulationStore(MongoStoreSettings):
+    def __init__(self, cfg: ApiConfig) -> None:
+        super().__init__(cfg)
         self._client: MongoClient[Any] | None = None
         self._collection: Collection[Any] | None = None
         self._lock = threading.Lock()
 
     @property
-    def enabled(self) -> bool:
-        return bool(self._mongo_url)
+    def indexes_ready(self) -> bool:
+        return self._collection is not None
 
     def _build_client(self) -> MongoClient[Any]:
-        return MongoClient(
-            self._mongo_url,
-            minPoolSize=self._mongo_min_pool_size,
-            maxPoolSize=self._mongo_max_pool_size,
-            serverSelectionTimeoutMS=self._mongo_server_selection_timeout_ms,
-            connectTimeoutMS=self._mongo_connect_timeout_ms,
-            socketTimeoutMS=self._mongo_socket_timeout_ms,
-            maxIdleTimeMS=self._mongo_max_idle_time_ms,
-            retryWrites=True,
-            retryReads=True,
-        )
+        return MongoClient(self._mongo_url, **self._client_options())
 
     def _reset_client(self) -> None:
         with self._lock:
@@ -146,7 +193,7 @@ class SimulationStore:
                 expireAfterSeconds=self._LAST_SEEN_TTL_SECONDS,
             )
         except OperationFailure as exc:
-            if exc.code != 85:
+            if exc.code != INDEX_OPTIONS_CONFLICT_CODE:
                 raise
             collection.drop_index(self._LAST_SEEN_INDEX_NAME)
             collection.create_index(
@@ -216,22 +263,8 @@ class SimulationStore:
             coll = self._ensure_collection()
             cursor = coll.find(
                 {"mc_client_id": mc_client_id},
-                {
-                    "_id": 0,
-                    "mc_client_id": 0,
-                    **SENSITIVE_HISTORY_FIELDS,
-                },
+                HISTORY_PROJECTION,
             ).sort("created_at", DESCENDING).limit(self._history_limit)
-
-            out: list[dict[str, Any]] = []
-            for item in cursor:
-                created_at = item.get("created_at")
-                last_seen = item.get("last_seen")
-                if isinstance(created_at, datetime):
-                    item["created_at"] = _to_iso_z(created_at)
-                if isinstance(last_seen, datetime):
-                    item["last_seen"] = _to_iso_z(last_seen)
-                out.append(item)
-            return out
+            return [history_row(item) for item in cursor]
 
         return self._run_with_reconnect(_op)
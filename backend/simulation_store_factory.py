@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from .api_config import ApiConfig
+from .simulation_models import SimulationCommand, SimulationResult
+
+if TYPE_CHECKING:
+    from .async_simulation_store import AsyncSimulationStore
+    from .simulation_store import SimulationStore
+
+
+class DisabledSimulationStore:
+    """Store sans persistance utilise quand ``APP_MONGO_URL`` est vide.
+
+    Il respecte le contrat des stores Mongo sans importer ``pymongo`` : le
+    driver n'est charge que si la persistance est effectivement configuree.
+    """
+
+    enabled = False
+
+    def __init__(self, cfg: ApiConfig) -> None:
+        self.driver = cfg.mongo_driver
+
+    async def connect(self) -> None:
+        return None
+
+    async def close(self) -> None:
+        return None
+
+    async def ping(self) -> bool:
+        return False
+
+    async def save_simulation(
+        self,
+        mc_client_id: str,
+        command: SimulationCommand,
+        result: SimulationResult,
+    ) -> None:
+        return None
+
+    async def list_recent(self, mc_client_id: str) -> list[dict[str, Any]]:
+        return []
+
+    def pool_status(self) -> dict[str, Any]:
+        return {"driver": self.driver, "indexes_ready": False, "pool": {}}
+
+
+def build_simulation_store(
+    cfg: ApiConfig,
+) -> SimulationStore | AsyncSimulationStore | DisabledSimulationStore:
+    if not cfg.mongo_url:
+        return DisabledSimulationStore(cfg)
+    if cfg.mongo_driver == "async":
+        from .async_simulation_store import AsyncSimulationStore
+
+        return AsyncSimulationStore(cfg)
+    from .simulation_store import SimulationStore
+
+    return SimulationStore(cfg)
+
+
+async def call_store(operation: Callable[..., Any], *args: Any) -> Any:
+    """Await an async store operation or push a blocking one to the threadpool."""
+
+    if inspect.iscoroutinefunction(operation):
+        return await operation(*args)
+    return await run_in_threadpool(operation, *args)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+from pymongo.monitoring import ConnectionPoolListener
+
+_COUNTERS = (
+    "connections_created",
+    "connections_closed",
+    "checkouts_started",
+    "checkouts_succeeded",
+    "checkouts_failed",
+    "checkins",
+    "pool_cleared",
+)
+
+
+class MongoPoolMetrics(ConnectionPoolListener):
+    """Compteurs du pool Mongo alimentes par les evenements CMAP du driver.
+
+    Le listener est partage par les clients synchrone et asynchrone : les
+    evenements peuvent arriver depuis plusieurs threads, d'ou le verrou.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters = dict.fromkeys(_COUNTERS, 0)
+        self._checkout_wait_ms_total = 0.0
+        self._checkout_wait_ms_max = 0.0
+
+    def _increment(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    def _record_checkout(self, name: str, duration_seconds: float) -> None:
+        wait_ms = duration_seconds * 1000
+        with self._lock:
+            self._counters[name] += 1
+            self._checkout_wait_ms_total += wait_ms
+            self._checkout_wait_ms_max = max(self._checkout_wait_ms_max, wait_ms)
+
+    def pool_created(self, event: Any) -> None:
+        return None
+
+    def pool_ready(self, event: Any) -> None:
+        return None
+
+    def pool_cleared(self, event: Any) -> None:
+        self._increment("pool_cleared")
+
+    def pool_closed(self, event: Any) -> None:
+        return None
+
+    def connection_created(self, event: Any) -> None:
+        self._increment("connections_created")
+
+    def connection_ready(self, event: Any) -> None:
+        return None
+
+    def connection_closed(self, event: Any) -> None:
+        self._increment("connections_closed")
+
+    def connection_check_out_started(self, event: Any) -> None:
+        self._increment("checkouts_started")
+
+    def connection_check_out_failed(self, event: Any) -> None:
+        self._record_checkout("checkouts_failed", event.duration)
+
+    def connection_checked_out(self, event: Any) -> None:
+        self._record_checkout("checkouts_succeeded", event.duration)
+
+    def connection_checked_in(self, event: Any) -> None:
+        self._increment("checkins")
+
+    def snapshot(self) -> dict[str, int | float]:
+        with self._lock:
+            counters = dict(self._counters)
+            wait_total = self._checkout_wait_ms_total
+            wait_max = self._checkout_wait_ms_max
+        completed = counters["checkouts_succeeded"] + counters["checkouts_failed"]
+        return {
+            "open_connections": counters["connections_created"] - counters["connections_closed"],
+            "in_use": counters["checkouts_succeeded"] - counters["checkins"],
+            "waiting": counters["checkouts_started"] - completed,
+            "checkouts": counters["checkouts_succeeded"],
+            "checkout_failures": counters["checkouts_failed"],
+            "pool_cleared": counters["pool_cleared"],
+            "checkout_wait_ms_avg": round(wait_total / completed, 3) if completed else 0.0,
+            "checkout_wait_ms_max": round(wait_max, 3),
+        }
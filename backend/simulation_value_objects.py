@@ -161,14 +161,14 @@ class ThroughputSamples:
                 f"{SIMULATION_THROUGHPUT_SAMPLES_MAX} valeurs."
             )
 
-        validated = tuple(_strict_integer(value, "throughput_samples") for value in raw_values)
-        if any(value < 0 for value in validated):
+        # Single C-level passes (type set, min, filter) instead of per-sample Python checks.
+        if set(map(type, raw_values)) != {int}:
+            raise StatisticalValueError("throughput_samples doit etre un entier strict.")
+        if min(raw_values) < 0:
             raise StatisticalValueError(
                 "throughput_samples doit contenir uniquement des entiers >= 0."
             )
-        usable = (
-            validated if include_zero_weeks else tuple(value for value in validated if value > 0)
-        )
+        usable = raw_values if include_zero_weeks else tuple(filter(None, raw_values))
         if len(usable) < SIMULATION_THROUGHPUT_SAMPLES_MIN:
             detail = (
                 "Historique insuffisant (moins de 6 semaines)."
@@ -177,7 +177,7 @@ class ThroughputSamples:
             )
             raise StatisticalValueError(detail)
         instance = object.__new__(cls)
-        object.__setattr__(instance, "raw_values", validated)
+        object.__setattr__(instance, "raw_values", raw_values)
         object.__setattr__(instance, "usable_values", usable)
         object.__setattr__(instance, "include_zero_weeks", include_zero_weeks)
         return instance
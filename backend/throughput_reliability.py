@@ -1,49 +1,66 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Iterable, Sequence
+from collections.abc import Iterable
+
+import numpy as np
 
 from .simulation_value_objects import StatisticalValueError, ThroughputReliability
 
+# Largest integer both engines represent exactly; keeps the int64 sums below overflow.
+MAX_SAFE_SAMPLE = 2**53 - 1
+
 
-def _linear_quantile(sorted_values: Sequence[float], level: float) -> float:
+def _linear_quantile(sorted_values: np.ndarray, level: float) -> float:
     position = (len(sorted_values) - 1) * level
     lower_index = math.floor(position)
     upper_index = min(lower_index + 1, len(sorted_values) - 1)
     weight = position - lower_index
-    lower_value = sorted_values[lower_index]
-    return lower_value + weight * (sorted_values[upper_index] - lower_value)
+    lower_value = int(sorted_values[lower_index])
+    return lower_value + weight * (int(sorted_values[upper_index]) - lower_value)
+
 
+def _sequential_sum(values: np.ndarray) -> float:
+    # Left-to-right accumulation, like the TypeScript reduce: a pairwise or compensated
+    # sum can move a metric sitting on a rounding boundary.
+    return float(np.add.accumulate(values)[-1])
 
-def _strict_samples(samples: Iterable[object]) -> tuple[int, ...]:
+
+def _strict_samples(samples: Iterable[object]) -> np.ndarray:
     try:
         raw_values = tuple(samples)
     except TypeError as exc:
         raise StatisticalValueError("throughput_samples doit etre une collection.") from exc
     if not raw_values:
         raise StatisticalValueError("throughput_samples est vide.")
-    if any(type(value) is not int or value < 0 for value in raw_values):
+    # Single C-level passes (type set, min, max) instead of per-sample Python checks.
+    if (
+        set(map(type, raw_values)) != {int}
+        or min(raw_values) < 0
+        or max(raw_values) > MAX_SAFE_SAMPLE
+    ):
         raise StatisticalValueError(
             "throughput_samples doit contenir uniquement des entiers finis >= 0."
         )
-    return raw_values
+    return np.asarray(raw_values, dtype=np.int64)
 
 
-def calculate_throughput_reliability(
-    samples: Iterable[object],
-) -> ThroughputReliability:
-    values = _strict_samples(samples)
+def throughput_reliability_from_array(values: np.ndarray) -> ThroughputReliability:
+    """Reliability of validated int64 samples, without memoisation."""
     samples_count = len(values)
-    mean = sum(values) / samples_count
-    variance = sum((value - mean) ** 2 for value in values) / samples_count
-    sorted_values = sorted(values)
+    mean = int(values.sum()) / samples_count
+    # float_power calls the C pow like ``x ** 2`` does; squaring with x * x may differ by 1 ulp.
+    deviations = values - mean
+    variance = _sequential_sum(np.float_power(deviations, 2)) / samples_count
+    sorted_values = np.sort(values)
     q25 = _linear_quantile(sorted_values, 0.25)
     median = _linear_quantile(sorted_values, 0.5)
     q75 = _linear_quantile(sorted_values, 0.75)
 
-    mean_x = (samples_count - 1) / 2
-    slope_denominator = sum((index - mean_x) ** 2 for index in range(samples_count))
-    slope_numerator = sum((index - mean_x) * (value - mean) for index, value in enumerate(values))
+    centered_index = np.arange(samples_count) - (samples_count - 1) / 2
+    # Sum of the squared centred indexes: a multiple of 1/4, exact in closed form.
+    slope_denominator = samples_count * (samples_count**2 - 1) / 12
+    slope_numerator = _sequential_sum(centered_index * deviations)
     slope = slope_numerator / slope_denominator if slope_denominator > 0 else 0.0
     return ThroughputReliability.create(
         cv=math.sqrt(variance) / mean if mean > 0 else 0.0,
@@ -52,3 +69,9 @@ def calculate_throughput_reliability(
         samples_count=samples_count,
         mean=mean,
     )
+
+
+def calculate_throughput_reliability(
+    samples: Iterable[object],
+) -> ThroughputReliability:
+    return throughput_reliability_from_array(_strict_samples(samples))
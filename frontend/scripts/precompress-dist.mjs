@@ -0,0 +1,41 @@
+import process from "node:process";
+import path from "node:path";
+import { readdir, readFile, writeFile } from "node:fs/promises";
+import { fileURLToPath } from "node:url";
+import { brotliCompressSync, constants, gzipSync } from "node:zlib";
+
+const frontendRoot = path.resolve(path.dirname(fileURLToPath(import.meta.url)), "..");
+const distDir = path.resolve(process.argv[2] ?? path.join(frontendRoot, "dist"));
+const compressible = new Set([
+  ".html", ".js", ".mjs", ".css", ".json", ".svg", ".txt", ".map", ".webmanifest",
+]);
+const minimumBytes = 1024;
+
+async function* walk(directory) {
+  for (const entry of await readdir(directory, { withFileTypes: true })) {
+    const entryPath = path.join(directory, entry.name);
+    if (entry.isDirectory()) {
+      yield* walk(entryPath);
+    } else if (entry.isFile()) {
+      yield entryPath;
+    }
+  }
+}
+
+let written = 0;
+for await (const filePath of walk(distDir)) {
+  if (!compressible.has(path.extname(filePath))) continue;
+  const source = await readFile(filePath);
+  if (source.length < minimumBytes) continue;
+  const variants = [
+    [".br", brotliCompressSync(source, { params: { [constants.BROTLI_PARAM_QUALITY]: 11 } })],
+    [".gz", gzipSync(source, { level: 9 })],
+  ];
+  for (const [suffix, compressed] of variants) {
+    if (compressed.length < source.length) {
+      await writeFile(`${filePath}${suffix}`, compressed);
+      written += 1;
+    }
+  }
+}
+process.stdout.write(`Precompressed variants written: ${written} in ${distDir}\n`);
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import sys
+from pathlib import Path
+
 from backend.api_config import (
     DEFAULT_CLIENT_COOKIE_NAME,
     DEFAULT_CORS_ORIGINS,
+    DEFAULT_ENGINE_BATCH_PROFILE,
     DEFAULT_MONGO_COLLECTION_SIMULATIONS,
+    DEFAULT_MONGO_DRIVER,
     DEFAULT_RATE_LIMIT_SIMULATE,
     DEFAULT_RATE_LIMIT_STORAGE_URL,
     DEFAULT_SIMULATION_HISTORY_LIMIT,
+    MONGO_DRIVERS,
+    _default_engine_batch_profile,
     _parse_bool_env,
+    _parse_choice_env,
     _parse_csv_env,
     _parse_float_env,
     _parse_int_env,
@@ -33,6 +41,10 @@ def test_get_api_config_defaults(monkeypatch):
     monkeypatch.delenv("APP_MONGO_CONNECT_TIMEOUT_MS", raising=False)
     monkeypatch.delenv("APP_MONGO_SOCKET_TIMEOUT_MS", raising=False)
     monkeypatch.delenv("APP_MONGO_MAX_IDLE_TIME_MS", raising=False)
+    monkeypatch.delenv("APP_MONGO_DRIVER", raising=False)
+    monkeypatch.delenv("APP_ENGINE_BATCH_SIZE", raising=False)
+    monkeypatch.delenv("APP_ENGINE_WORKING_SET_BYTES", raising=False)
+    monkeypatch.delenv("APP_ENGINE_BATCH_PROFILE", raising=False)
 
     cfg = get_api_config()
     assert cfg.cors_origins == DEFAULT_CORS_ORIGINS
@@ -51,6 +63,11 @@ def test_get_api_config_defaults(monkeypatch):
     assert cfg.mongo_connect_timeout_ms == 2000
     assert cfg.mongo_socket_timeout_ms == 5000
     assert cfg.mongo_max_idle_time_ms == 60000
+    assert cfg.mongo_driver == DEFAULT_MONGO_DRIVER
+    assert cfg.engine_batch_size is None
+    assert cfg.engine_working_set_bytes is None
+    assert cfg.engine_batch_profile == DEFAULT_ENGINE_BATCH_PROFILE
+    assert DEFAULT_ENGINE_BATCH_PROFILE.endswith(".cache/engine-batch-profile.json")
 
 
 def test_parse_csv_env_values_and_empty_fallback(monkeypatch):
@@ -118,3 +135,42 @@ def test_parse_int_env(monkeypatch):
 
     monkeypatch.setenv("APP_SIMULATION_HISTORY_LIMIT", "0")
     assert _parse_int_env("APP_SIMULATION_HISTORY_LIMIT", 10) == 10
+
+
+def test_parse_choice_env(monkeypatch):
+    monkeypatch.delenv("APP_MONGO_DRIVER", raising=False)
+    assert _parse_choice_env("APP_MONGO_DRIVER", MONGO_DRIVERS, "sync") == "sync"
+
+    monkeypatch.setenv("APP_MONGO_DRIVER", " Async ")
+    assert _parse_choice_env("APP_MONGO_DRIVER", MONGO_DRIVERS, "sync") == "async"
+    assert get_api_config().mongo_driver == "async"
+
+    monkeypatch.setenv("APP_MONGO_DRIVER", "motor")
+    assert _parse_choice_env("APP_MONGO_DRIVER", MONGO_DRIVERS, "sync") == "sync"
+
+
+def test_engine_batch_settings_are_optional_positive_overrides(monkeypatch):
+    monkeypatch.setenv("APP_ENGINE_BATCH_SIZE", "256")
+    monkeypatch.setenv("APP_ENGINE_WORKING_SET_BYTES", "0")
+    monkeypatch.setenv("APP_ENGINE_BATCH_PROFILE", " /srv/engine-profile.json ")
+
+    cfg = get_api_config()
+
+    assert cfg.engine_batch_size == 256
+    assert cfg.engine_working_set_bytes is None
+    assert cfg.engine_batch_profile == "/srv/engine-profile.json"
+
+
+def test_frozen_builds_read_the_engine_batch_profile_next_to_the_executable(monkeypatch, tmp_path):
+    executable = tmp_path / "MonteCarloADO" / "MonteCarloADO.exe"
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "_MEIPASS", str(tmp_path / "_MEI12345"), raising=False)
+    monkeypatch.setattr(sys, "executable", str(executable))
+
+    assert (
+        Path(_default_engine_batch_profile())
+        == (executable.parent / ".cache" / "engine-batch-profile.json").resolve()
+    )
+
+    monkeypatch.delattr(sys, "frozen")
+    assert _default_engine_batch_profile() == DEFAULT_ENGINE_BATCH_PROFILE
@@ -1,78 +1,149 @@
 import asyncio
 
+import pytest
 from fastapi import FastAPI
 
 from backend import api
 from backend.api import app
+from backend.api_startup import StartupReadiness, warm_up_simulation
+from backend.simulation_limits import SIMULATION_N_SIMS_MIN
 from tests.http_client import ApiTestClient
 
 
-def test_lifespan_connects_checks_storage_and_closes_store(monkeypatch):
-    calls: list[str] = []
+class _Store:
+    def __init__(self, calls: list[str], *, enabled: bool = True, fail: bool = False) -> None:
+        self.enabled = enabled
+        self._calls = calls
+        self._fail = fail
 
-    class _Store:
-        enabled = True
+    def connect(self):
+        self._calls.append("connect")
+        if self._fail:
+            raise RuntimeError("mongo down")
 
-        @staticmethod
-        def connect():
-            calls.append("connect")
+    def close(self):
+        self._calls.append("close")
 
-        @staticmethod
-        def close():
-            calls.append("close")
 
-    class _Limiter:
-        @staticmethod
-        def check_storage():
-            calls.append("check_storage")
+class _Limiter:
+    def __init__(self, calls: list[str]) -> None:
+        self._calls = calls
+
+    def check_storage(self):
+        self._calls.append("check_storage")
+
+
+def _install_startup(monkeypatch, store: _Store, calls: list[str]) -> StartupReadiness:
+    readiness = StartupReadiness()
+    monkeypatch.setattr(api, "simulation_store", store)
+    monkeypatch.setattr(api, "limiter", _Limiter(calls))
+    monkeypatch.setattr(api, "readiness", readiness)
+    monkeypatch.setattr(api, "warm_up_simulation", lambda: calls.append("warm_up"))
+    return readiness
+
+
+def test_lifespan_defers_connection_and_warm_up_then_closes_store(monkeypatch):
+    calls: list[str] = []
+    readiness = _install_startup(monkeypatch, _Store(calls), calls)
+    snapshots: list[dict[str, str]] = []
 
     async def _run() -> None:
         async with api.lifespan(FastAPI()):
             calls.append("yield")
-
-    monkeypatch.setattr(api, "simulation_store", _Store())
-    monkeypatch.setattr(api, "limiter", _Limiter())
+            snapshots.append(readiness.snapshot())
+            await readiness.wait()
+            snapshots.append(readiness.snapshot())
 
     asyncio.run(_run())
 
-    assert calls == ["connect", "check_storage", "yield", "close"]
+    assert calls[:2] == ["check_storage", "yield"]
+    assert sorted(calls[2:4]) == ["connect", "warm_up"]
+    assert calls[4:] == ["close"]
+    assert snapshots == [
+        {"status": "starting", "mongo": "connecting", "warm_up": "pending"},
+        {"status": "ready", "mongo": "connected", "warm_up": "done"},
+    ]
 
 
 def test_lifespan_closes_store_when_context_raises(monkeypatch):
     calls: list[str] = []
-
-    class _Store:
-        enabled = True
-
-        @staticmethod
-        def connect():
-            calls.append("connect")
-
-        @staticmethod
-        def close():
-            calls.append("close")
-
-    class _Limiter:
-        @staticmethod
-        def check_storage():
-            calls.append("check_storage")
+    _install_startup(monkeypatch, _Store(calls), calls)
 
     async def _run() -> None:
         async with api.lifespan(FastAPI()):
             calls.append("yield")
             raise RuntimeError("boom")
 
-    monkeypatch.setattr(api, "simulation_store", _Store())
-    monkeypatch.setattr(api, "limiter", _Limiter())
+    with pytest.raises(RuntimeError, match="boom"):
+        asyncio.run(_run())
+
+    assert calls[:2] == ["check_storage", "yield"]
+    assert calls[-1] == "close"
+
+
+def test_startup_failures_are_reported_without_blocking_readiness(caplog):
+    calls: list[str] = []
+    readiness = StartupReadiness()
+
+    def _failing_warm_up():
+        raise RuntimeError("engine")
+
+    async def _run() -> None:
+        readiness.start(_Store(calls, fail=True), _failing_warm_up)
+        await readiness.wait()
 
-    try:
+    with caplog.at_level("WARNING"):
         asyncio.run(_run())
-    except RuntimeError as exc:
-        assert str(exc) == "boom"
-    else:
-        raise AssertionError("Expected RuntimeError from lifespan body")
 
-    assert calls == ["connect", "check_storage", "yield", "close"]
+    assert readiness.snapshot() == {"status": "ready", "mongo": "unavailable", "warm_up": "failed"}
+    assert "Mongo unreachable at startup" in caplog.text
+    assert "Simulation warm-up failed" in caplog.text
+
+
+def test_startup_skips_connection_when_mongo_is_disabled():
+    calls: list[str] = []
+    readiness = StartupReadiness()
+
+    async def _run() -> None:
+        readiness.start(_Store(calls, enabled=False), lambda: calls.append("warm_up"))
+        await readiness.stop()
+
+    asyncio.run(_run())
+
+    assert "connect" not in calls
+    assert readiness.mongo == "disabled"
+
+
+def test_warm_up_simulation_runs_the_engine(monkeypatch):
+    commands = []
+    from backend import simulation_service
+
+    real_run = simulation_service.run_simulation
+
+    def _spy(command):
+        commands.append(command)
+        return real_run(command)
+
+    monkeypatch.setattr(simulation_service, "run_simulation", _spy)
+    warm_up_simulation()
+
+    assert commands[0].n_sims.value == SIMULATION_N_SIMS_MIN
+    assert commands[0].mode == "backlog_to_weeks"
+
+
+def test_health_ready_reports_503_until_startup_completes(monkeypatch):
+    readiness = StartupReadiness()
+    monkeypatch.setattr(api, "readiness", readiness)
+    client = ApiTestClient(app)
+
+    starting = client.get("/health/ready")
+    assert starting.status_code == 503
+    assert starting.json() == {"status": "starting", "mongo": "pending", "warm_up": "pending"}
+
+    readiness.mongo, readiness.warm_up = "disabled", "done"
+    ready = client.get("/health/ready")
+    assert ready.status_code == 200
+    assert ready.json() == {"status": "ready", "mongo": "disabled", "warm_up": "done"}
 
 
 def test_health():
@@ -135,3 +206,44 @@ def test_health_mongo_enabled_but_unreachable_returns_503(monkeypatch):
     r = client.get("/health/mongo")
     assert r.status_code == 503
     assert r.json()["detail"] == "mongo_unreachable"
+
+
+def test_health_mongo_awaits_async_store(monkeypatch):
+    calls: list[str] = []
+
+    class _AsyncStore:
+        enabled = True
+
+        async def ping(self):
+            calls.append("ping")
+            return True
+
+    monkeypatch.setattr(api, "simulation_store", _AsyncStore())
+    client = ApiTestClient(app)
+    r = client.get("/health/mongo")
+    assert r.status_code == 200
+    assert calls == ["ping"]
+
+
+def test_health_mongo_pool_reports_disabled_or_metrics(monkeypatch):
+    class _DisabledStore:
+        enabled = False
+
+    class _EnabledStore:
+        enabled = True
+
+        @staticmethod
+        def pool_status():
+            return {"driver": "async", "indexes_ready": False, "pool": {"in_use": 1}}
+
+    monkeypatch.setattr(api, "simulation_store", _DisabledStore())
+    client = ApiTestClient(app)
+    assert client.get("/health/mongo/pool").json() == {"status": "disabled"}
+
+    monkeypatch.setattr(api, "simulation_store", _EnabledStore())
+    assert client.get("/health/mongo/pool").json() == {
+        "status": "ok",
+        "driver": "async",
+        "indexes_ready": False,
+        "pool": {"in_use": 1},
+    }
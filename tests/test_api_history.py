@@ -212,3 +212,69 @@ def test_simulate_returns_result_when_store_unavailable(monkeypatch):
     )
     assert r.status_code == 200
     assert r.json()["result_kind"] == "weeks"
+
+
+class _FakeAsyncStore(_FakeStore):
+    async def save_simulation(self, mc_client_id, command, result):
+        _FakeStore.save_simulation(self, mc_client_id, command, result)
+
+    async def list_recent(self, mc_client_id):
+        return _FakeStore.list_recent(self, mc_client_id)
+
+
+def test_simulate_persists_through_async_store(monkeypatch):
+    fake = _FakeAsyncStore(enabled=True)
+    monkeypatch.setattr(api_routes_simulate, "simulation_store", fake)
+
+    client = ApiTestClient(app)
+    client.cookies.set(api_routes_simulate.cfg.client_cookie_name, "async-client")
+    r = client.post(
+        "/simulate",
+        headers={"x-forwarded-for": "async-store-history-test"},
+        json={
+            "throughput_samples": [1, 2, 3, 4, 5, 6],
+            "mode": "backlog_to_weeks",
+            "backlog_size": 20,
+            "n_sims": 2000,
+        },
+    )
+
+    assert r.status_code == 200
+    assert [saved[0] for saved in fake.saved] == ["async-client"]
+
+
+def test_async_store_persistence_failure_is_logged_without_failing(monkeypatch, caplog):
+    fake = _FakeAsyncStore(enabled=True, fail=True)
+    monkeypatch.setattr(api_routes_simulate, "simulation_store", fake)
+
+    client = ApiTestClient(app)
+    client.cookies.set(api_routes_simulate.cfg.client_cookie_name, "async-client")
+    with caplog.at_level("WARNING"):
+        r = client.post(
+            "/simulate",
+            headers={"x-forwarded-for": "async-store-history-test"},
+            json={
+                "throughput_samples": [1, 2, 3, 4, 5, 6],
+                "mode": "backlog_to_weeks",
+                "backlog_size": 20,
+                "n_sims": 2000,
+            },
+        )
+
+    assert r.status_code == 200
+    assert "Simulation persistence failed" in caplog.text
+
+
+def test_simulation_history_awaits_async_store(monkeypatch):
+    fake = _FakeAsyncStore(enabled=True, fail=True)
+    monkeypatch.setattr(api_routes_simulate, "simulation_store", fake)
+
+    client = ApiTestClient(app)
+    client.cookies.set(api_routes_simulate.cfg.client_cookie_name, "async-client")
+    r = client.get("/simulations/history")
+
+    assert r.status_code == 503
+    fake.fail = False
+    r = client.get("/simulations/history")
+    assert r.status_code == 200
+    assert r.json() == []
@@ -1,7 +1,7 @@
 import pytest
 from pydantic import ValidationError
 
-from backend.api_models import SimulateResponse, SimulationHistoryItem
+from backend.api_models import CompactDistribution, SimulateResponse, SimulationHistoryItem
 
 
 def test_simulate_response_rejects_a_non_authoritative_risk_score() -> None:
@@ -36,3 +36,8 @@ def test_history_item_rejects_an_explicit_null_risk_score() -> None:
             risk_score=None,
             distribution=[{"x": 30, "count": 1000}],
         )
+
+
+def test_compact_distribution_requires_parallel_arrays() -> None:
+    with pytest.raises(ValidationError, match="meme longueur"):
+        CompactDistribution(x=[1, 2], count=[3])
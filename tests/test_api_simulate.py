@@ -7,13 +7,18 @@ from starlette.requests import Request
 
 from backend.api import app
 from backend.api_config import ApiConfig
-from backend.api_models import SIMULATION_SEED_MAX
+from backend.api_models import (
+    SIMULATION_SEED_MAX,
+    SimulateCompactResponse,
+    SimulateResponse,
+)
 from backend.api_routes_simulate import (
     _client_key_from_request,
     _persist_simulation,
+    batch_sizing,
     limiter,
 )
-from backend.mc_core import SIMULATION_BATCH_SIZE, FinishWeeksSimulation
+from backend.mc_core import FinishWeeksSimulation
 from backend.simulation_limits import (
     SIMULATION_BACKLOG_SIZE_MAX,
     SIMULATION_HORIZON_WEEKS_MAX,
@@ -27,6 +32,7 @@ from backend.simulation_models import (
     SimulationResult,
 )
 from backend.simulation_seed import resolve_simulation_seed
+from backend.simulation_service import engine_batch_size
 from backend.simulation_value_objects import (
     CompletionSummary,
     Histogram,
@@ -90,6 +96,38 @@ def test_simulate_backlog_to_weeks_success():
     assert set(first_bucket.keys()) == {"x", "count"}
     assert isinstance(first_bucket["x"], int)
     assert isinstance(first_bucket["count"], int)
+    SimulateResponse.model_validate(body)
+
+
+def test_simulate_compact_histogram_returns_parallel_arrays_for_same_result():
+    client = ApiTestClient(app)
+    payload = {
+        "throughput_samples": [0, 1, 2, 3, 4, 5, 6, 0],
+        "mode": "weeks_to_items",
+        "target_weeks": 12,
+        "n_sims": 2000,
+        "seed": 424242,
+    }
+    headers = {"x-forwarded-for": "compact-histogram-test"}
+
+    buckets = client.post("/simulate", json=payload, headers=headers)
+    arrays = client.post("/simulate?histogram_format=arrays", json=payload, headers=headers)
+    invalid = client.post("/simulate?histogram_format=binary", json=payload, headers=headers)
+
+    assert buckets.headers["content-type"] == "application/json"
+    compact = SimulateCompactResponse.model_validate(arrays.json())
+    expected = SimulateResponse.model_validate(buckets.json()).result_distribution
+    assert compact.result_distribution.x == [bucket.x for bucket in expected]
+    assert compact.result_distribution.count == [bucket.count for bucket in expected]
+    assert arrays.json()["result_percentiles"] == buckets.json()["result_percentiles"]
+    assert invalid.status_code == 422
+
+    schema = client.get("/openapi.json").json()
+    success = schema["paths"]["/simulate"]["post"]["responses"]["200"]
+    assert success["content"]["application/json"]["schema"]["anyOf"] == [
+        {"$ref": "#/components/schemas/SimulateResponse"},
+        {"$ref": "#/components/schemas/SimulateCompactResponse"},
+    ]
 
 
 def test_simulate_weeks_to_items_success():
@@ -389,7 +427,7 @@ def test_simulate_returns_business_percentiles_for_known_discrete_results(monkey
     known_items = np.tile(np.array([18, 22, 24, 25, 27], dtype=int), 200)
 
     def fake_compute(command, _samples, _draw_port, *, batch_size):
-        assert batch_size == SIMULATION_BATCH_SIZE
+        assert batch_size == engine_batch_size(command, batch_sizing)
         if command.mode == "backlog_to_weeks":
             return (
                 FinishWeeksSimulation(
@@ -419,8 +457,8 @@ def test_simulate_returns_business_percentiles_for_known_discrete_results(monkey
 def test_simulate_backlog_to_weeks_omits_unidentifiable_percentiles_and_risk_score(monkeypatch):
     client = ApiTestClient(app)
 
-    def fake_compute(_command, _samples, _draw_port, *, batch_size):
-        assert batch_size == SIMULATION_BATCH_SIZE
+    def fake_compute(command, _samples, _draw_port, *, batch_size):
+        assert batch_size == engine_batch_size(command, batch_sizing)
         return (
             FinishWeeksSimulation(
                 completed_weeks=np.array([], dtype=int),
@@ -459,8 +497,8 @@ def test_simulate_backlog_to_weeks_omits_unidentifiable_percentiles_and_risk_sco
 def test_simulate_backlog_to_weeks_keeps_exact_finish_at_horizon_distinct_from_censure(monkeypatch):
     client = ApiTestClient(app)
 
-    def fake_compute(_command, _samples, _draw_port, *, batch_size):
-        assert batch_size == SIMULATION_BATCH_SIZE
+    def fake_compute(command, _samples, _draw_port, *, batch_size):
+        assert batch_size == engine_batch_size(command, batch_sizing)
         return (
             FinishWeeksSimulation(
                 completed_weeks=np.full(1000, 521, dtype=int),
@@ -950,3 +988,54 @@ def test_check_request_limit_reraises_rate_limit_exceeded(monkeypatch):
 
     with pytest.raises(RateLimitExceeded):
         limiter._check_request_limit(request, None, False)
+
+
+def test_shared_rate_limit_storage_is_attached_on_first_use(monkeypatch):
+    from limits.storage import MemoryStorage
+
+    from backend import api_routes_simulate
+
+    shared = MemoryStorage()
+    built: list[str] = []
+
+    def _storage_from_string(uri, **_options):
+        built.append(uri)
+        return shared
+
+    monkeypatch.setattr(api_routes_simulate, "storage_from_string", _storage_from_string)
+    deferred = api_routes_simulate.ObservableLimiter(
+        key_func=_client_key_from_request,
+        storage_uri="redis://redis:6379/0",
+    )
+    assert built == []
+    assert deferred._storage is not shared
+
+    assert deferred.check_storage() is True
+    deferred.check_storage()
+
+    assert built == ["redis://redis:6379/0"]
+    assert deferred._storage is shared
+    assert deferred._limiter.storage is shared
+
+
+def test_attached_rate_limit_storage_is_the_one_slowapi_enforces(monkeypatch):
+    # Guards the exact slowapi pin: _attach_storage rebinds slowapi's private
+    # _storage and _limiter, which slowapi itself must still read.
+    from limits import parse
+    from limits.storage import MemoryStorage
+
+    from backend import api_routes_simulate
+
+    shared = MemoryStorage()
+    monkeypatch.setattr(api_routes_simulate, "storage_from_string", lambda uri, **_: shared)
+    deferred = api_routes_simulate.ObservableLimiter(
+        key_func=_client_key_from_request,
+        storage_uri="redis://redis:6379/0",
+    )
+    deferred.check_storage()
+    item = parse("1/minute")
+
+    assert deferred.limiter.hit(item, "client") is True
+    assert shared.get(item.key_for("client")) == 1
+    deferred.reset()
+    assert shared.get(item.key_for("client")) == 0
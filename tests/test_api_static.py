@@ -1,3 +1,4 @@
+import gzip
 import shutil
 from pathlib import Path
 
@@ -7,6 +8,8 @@ from fastapi.routing import APIRoute
 from backend import api_static
 from tests.http_client import ApiTestClient
 
+ASSET_BODY = b"console.log('frontend asset');\n" * 64
+
 
 def _workspace_temp_front_dir() -> Path:
     base_dir = Path(__file__).resolve().parent.parent / ".tmp_api_static_tests"
@@ -15,6 +18,20 @@ def _workspace_temp_front_dir() -> Path:
     return base_dir / "frontend" / "dist"
 
 
+def _built_front_dir(monkeypatch) -> Path:
+    front_dir = _workspace_temp_front_dir()
+    (front_dir / "assets").mkdir(parents=True)
+    (front_dir / "index.html").write_text("<html><body>frontend ok</body></html>", encoding="utf-8")
+    (front_dir / "index.html.gz").write_bytes(gzip.compress(b"<html>gzip index</html>"))
+    (front_dir / "favicon.svg").write_text("<svg/>", encoding="utf-8")
+    asset = front_dir / "assets" / "index-3f2a1b.js"
+    asset.write_bytes(ASSET_BODY)
+    (front_dir / "assets" / "index-3f2a1b.js.gz").write_bytes(gzip.compress(ASSET_BODY))
+    (front_dir / "assets" / "index-3f2a1b.js.br").write_bytes(b"precompressed-brotli")
+    monkeypatch.setattr(api_static, "_front_dist_dir", lambda: front_dir)
+    return front_dir
+
+
 def test_mount_frontend_serves_index_when_dist_exists(monkeypatch):
     front_dir = _workspace_temp_front_dir()
     front_dir.mkdir(parents=True)
@@ -30,12 +47,12 @@ def test_mount_frontend_serves_index_when_dist_exists(monkeypatch):
     response = client.get("/")
     assert response.status_code == 200
     assert "frontend ok" in response.text
+    assert response.headers["cache-control"] == "no-cache"
 
     index_route = next(
         route for route in app.routes if isinstance(route, APIRoute) and route.path == "/"
     )
-    direct_response = index_route.endpoint()
-    assert Path(direct_response.path).name == "index.html"
+    assert index_route.methods == {"GET", "HEAD"}
 
 
 def test_mount_frontend_leaves_root_unmounted_when_dist_is_missing(monkeypatch):
@@ -48,3 +65,78 @@ def test_mount_frontend_leaves_root_unmounted_when_dist_is_missing(monkeypatch):
     client = ApiTestClient(app)
     response = client.get("/")
     assert response.status_code == 404
+
+
+def test_index_is_served_from_memory_with_encoding_and_etag(monkeypatch):
+    front_dir = _built_front_dir(monkeypatch)
+    app = FastAPI()
+    api_static.mount_frontend(app)
+    (front_dir / "index.html").write_text("<html>changed on disk</html>", encoding="utf-8")
+    client = ApiTestClient(app)
+
+    plain = client.get("/", headers={"accept-encoding": "identity"})
+    compressed = client.get("/", headers={"accept-encoding": "br;q=0, gzip"})
+    revalidated = client.get(
+        "/",
+        headers={"accept-encoding": "gzip", "if-none-match": f'W/{compressed.headers["etag"]}'},
+    )
+
+    assert plain.text == "<html><body>frontend ok</body></html>"
+    assert "content-encoding" not in plain.headers
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.text == "<html>gzip index</html>"
+    assert compressed.headers["etag"] != plain.headers["etag"]
+    assert compressed.headers["vary"] == "Accept-Encoding"
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == compressed.headers["etag"]
+
+
+def test_hashed_assets_use_precompressed_variants_and_immutable_cache(monkeypatch):
+    _built_front_dir(monkeypatch)
+    app = FastAPI()
+    api_static.mount_frontend(app)
+    client = ApiTestClient(app)
+
+    brotli = client.request("HEAD", "/assets/index-3f2a1b.js", headers={"accept-encoding": "br"})
+    gzipped = client.get("/assets/index-3f2a1b.js", headers={"accept-encoding": "gzip"})
+    plain = client.get("/assets/index-3f2a1b.js", headers={"accept-encoding": "identity"})
+    not_modified = client.get(
+        "/assets/index-3f2a1b.js",
+        headers={"accept-encoding": "gzip", "if-none-match": gzipped.headers["etag"]},
+    )
+
+    assert brotli.headers["content-encoding"] == "br"
+    assert brotli.headers["content-length"] == str(len(b"precompressed-brotli"))
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert gzipped.content == ASSET_BODY
+    assert "javascript" in gzipped.headers["content-type"]
+    assert plain.content == ASSET_BODY
+    assert "content-encoding" not in plain.headers
+    assert len({brotli.headers["etag"], gzipped.headers["etag"], plain.headers["etag"]}) == 3
+    for response in (brotli, gzipped, plain, not_modified):
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert response.headers["vary"] == "Accept-Encoding"
+    assert not_modified.status_code == 304
+
+
+def test_unhashed_files_are_revalidated_and_dist_without_index_mounts_assets_only(monkeypatch):
+    front_dir = _built_front_dir(monkeypatch)
+    app = FastAPI()
+    api_static.mount_frontend(app)
+
+    favicon = ApiTestClient(app).get("/favicon.svg")
+
+    assert favicon.headers["cache-control"] == "no-cache"
+    assert "vary" not in favicon.headers
+
+    (front_dir / "index.html").unlink()
+    bare_app = FastAPI()
+    api_static.mount_frontend(bare_app)
+    assert not any(isinstance(route, APIRoute) for route in bare_app.routes)
+    assert ApiTestClient(bare_app).get("/favicon.svg").status_code == 200
+
+
+def test_accepted_encodings_ignores_refused_codings():
+    assert api_static.accepted_encodings("gzip, br;q=0.5, deflate;q=0") == {"gzip", "br"}
+    assert api_static.accepted_encodings("br;q=0.0, gzip;q=abc") == {"gzip"}
+    assert api_static.accepted_encodings(None) == set()
@@ -0,0 +1,394 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from dataclasses import replace
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from pymongo.errors import AutoReconnect, OperationFailure
+
+from backend.async_simulation_store import AsyncSimulationStore
+from backend.simulation_store import SENSITIVE_HISTORY_FIELDS, SimulationStore
+from backend.simulation_store_factory import (
+    DisabledSimulationStore,
+    build_simulation_store,
+    call_store,
+)
+from backend.simulation_store_pool_metrics import MongoPoolMetrics
+from tests.test_simulation_store import _cfg, _req_resp
+
+
+class _FakeAdmin:
+    def __init__(self, fail: bool = False) -> None:
+        self.calls: list[str] = []
+        self.fail = fail
+
+    async def command(self, name: str):
+        self.calls.append(name)
+        if self.fail:
+            raise AutoReconnect("ping failed")
+        return {"ok": 1}
+
+
+class _FakeCursor:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def sort(self, *_args, **_kwargs):
+        return self
+
+    def limit(self, *_args, **_kwargs):
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._rows:
+            raise StopAsyncIteration
+        return self._rows.pop(0)
+
+
+class _FakeCollection:
+    def __init__(self, rows=None) -> None:
+        self.rows = rows or []
+        self.index_calls = []
+        self.inserted = []
+        self.updated = []
+        self.find_calls = []
+        self.dropped_indexes = []
+        self.index_error: Exception | None = None
+
+    async def create_index(self, spec, **kwargs):
+        self.index_calls.append((spec, kwargs))
+        if self.index_error is not None and "expireAfterSeconds" in kwargs:
+            error, self.index_error = self.index_error, None
+            raise error
+
+    async def drop_index(self, name):
+        self.dropped_indexes.append(name)
+
+    async def insert_one(self, doc):
+        self.inserted.append(doc)
+
+    async def update_many(self, query, update):
+        self.updated.append((query, update))
+
+    def find(self, query, projection):
+        self.find_calls.append((query, projection))
+        return _FakeCursor(self.rows)
+
+
+class _FakeAsyncMongoClient:
+    def __init__(self, coll: _FakeCollection, admin: _FakeAdmin | None = None) -> None:
+        self._coll = coll
+        self.admin = admin or _FakeAdmin()
+        self.closed = False
+
+    def __getitem__(self, _name):
+        return {"simulations": self._coll}
+
+    async def close(self):
+        self.closed = True
+
+
+def _install_clients(monkeypatch, *clients: _FakeAsyncMongoClient) -> list[dict]:
+    pending = list(clients)
+    options: list[dict] = []
+
+    def _factory(*_args, **kwargs):
+        options.append(kwargs)
+        return pending.pop(0)
+
+    monkeypatch.setattr("backend.async_simulation_store.AsyncMongoClient", _factory)
+    return options
+
+
+async def _drain_index_task(store: AsyncSimulationStore) -> None:
+    if store._index_task is not None:
+        await store._index_task
+
+
+def test_build_simulation_store_selects_driver_from_config():
+    url = "mongodb://localhost:27017"
+    assert type(build_simulation_store(_cfg(url))) is SimulationStore
+    async_store = build_simulation_store(replace(_cfg(url), mongo_driver="async"))
+    assert type(async_store) is AsyncSimulationStore
+
+
+def test_build_simulation_store_without_url_does_not_load_the_driver():
+    store = build_simulation_store(replace(_cfg(""), mongo_driver="async"))
+    req, resp = _req_resp()
+
+    async def _run():
+        await store.connect()
+        await store.save_simulation("c1", req, resp)
+        results = await store.ping(), await store.list_recent("c1")
+        await store.close()
+        return results
+
+    assert type(store) is DisabledSimulationStore
+    assert store.enabled is False
+    assert asyncio.run(_run()) == (False, [])
+    assert store.pool_status() == {"driver": "async", "indexes_ready": False, "pool": {}}
+
+
+def test_call_store_awaits_coroutines_and_offloads_blocking_operations():
+    loop_thread = threading.get_ident()
+    threads: list[int] = []
+
+    def _blocking(value):
+        threads.append(threading.get_ident())
+        return value + 1
+
+    async def _async(value):
+        threads.append(threading.get_ident())
+        return value * 2
+
+    async def _run():
+        return await call_store(_blocking, 1), await call_store(_async, 4)
+
+    assert asyncio.run(_run()) == (2, 8)
+    assert threads[0] != loop_thread
+    assert threads[1] == loop_thread
+
+
+def test_disabled_async_store_is_a_noop():
+    store = AsyncSimulationStore(_cfg(""))
+    req, resp = _req_resp()
+
+    async def _run():
+        await store.connect()
+        await store.save_simulation("c1", req, resp)
+        return await store.ping(), await store.list_recent("c1")
+
+    assert asyncio.run(_run()) == (False, [])
+    with pytest.raises(RuntimeError, match="disabled"):
+        asyncio.run(store._ensure_collection())
+
+
+def test_connect_pings_and_builds_indexes_in_background(monkeypatch):
+    coll = _FakeCollection()
+    client = _FakeAsyncMongoClient(coll)
+    options = _install_clients(monkeypatch, client)
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+
+    async def _run():
+        await store.connect()
+        ready_before = store.indexes_ready
+        await store.connect()
+        await _drain_index_task(store)
+        return ready_before
+
+    assert asyncio.run(_run()) is False
+    assert client.admin.calls == ["ping"]
+    assert store.indexes_ready is True
+    assert [call[0] for call in coll.index_calls] == [
+        [("mc_client_id", 1), ("created_at", -1)],
+        [("last_seen", 1)],
+    ]
+    assert options[0]["maxPoolSize"] == 20
+    assert options[0]["event_listeners"] == [store.pool_metrics]
+    assert store.pool_status()["driver"] == "async"
+
+
+def test_connect_closes_client_when_ping_fails(monkeypatch):
+    client = _FakeAsyncMongoClient(_FakeCollection(), _FakeAdmin(fail=True))
+    _install_clients(monkeypatch, client)
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+
+    with pytest.raises(AutoReconnect):
+        asyncio.run(store.connect())
+
+    assert client.closed is True
+    assert store._collection is None
+
+
+def test_index_conflict_is_repaired_and_other_failures_are_logged(monkeypatch, caplog):
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+    coll = _FakeCollection()
+    coll.index_error = OperationFailure("conflict", code=85)
+    asyncio.run(store._create_indexes_in_background(coll))
+    assert coll.dropped_indexes == ["last_seen_1"]
+    assert store.indexes_ready is True
+
+    failing = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+    coll = _FakeCollection()
+    coll.index_error = OperationFailure("other", code=123)
+    with caplog.at_level("WARNING"):
+        asyncio.run(failing._create_indexes_in_background(coll))
+    assert failing.indexes_ready is False
+    assert "Mongo index creation failed" in caplog.text
+
+
+def test_save_simulation_reconnects_once_after_pymongo_error(monkeypatch):
+    req, resp = _req_resp()
+    first = _FakeCollection()
+    second = _FakeCollection()
+
+    async def _broken_insert(_doc):
+        raise AutoReconnect("down")
+
+    first.insert_one = _broken_insert
+    first_client = _FakeAsyncMongoClient(first)
+    _install_clients(monkeypatch, first_client, _FakeAsyncMongoClient(second))
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+
+    async def _run():
+        await store.save_simulation("c1", req, resp)
+        await store.close()
+
+    asyncio.run(_run())
+
+    assert first_client.closed is True
+    assert second.inserted[0]["mc_client_id"] == "c1"
+    assert second.inserted[0]["seed"] == 98765
+    assert second.updated[0][0] == {"mc_client_id": "c1"}
+
+
+def test_run_with_reconnect_reraises_after_second_failure():
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+    calls: list[str] = []
+
+    async def _always_fail():
+        calls.append("attempt")
+        raise AutoReconnect("still down")
+
+    with pytest.raises(AutoReconnect, match="still down"):
+        asyncio.run(store._run_with_reconnect(_always_fail))
+    assert calls == ["attempt", "attempt"]
+
+
+def test_list_recent_projects_and_converts_datetimes(monkeypatch):
+    now = datetime(2026, 2, 26, 10, 0, tzinfo=timezone.utc)
+    coll = _FakeCollection(rows=[{"created_at": now, "last_seen": "kept", "mode": "x"}])
+    client = _FakeAsyncMongoClient(coll)
+    _install_clients(monkeypatch, client)
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+
+    async def _run():
+        rows = await store.list_recent("c1")
+        ping = await store.ping()
+        await store.close()
+        return rows, ping
+
+    rows, ping = asyncio.run(_run())
+
+    assert rows == [{"created_at": "2026-02-26T10:00:00Z", "last_seen": "kept", "mode": "x"}]
+    assert ping is True
+    assert coll.find_calls[0][0] == {"mc_client_id": "c1"}
+    for field in SENSITIVE_HISTORY_FIELDS:
+        assert coll.find_calls[0][1][field] == 0
+    assert client.closed is True
+
+
+def test_pool_metrics_track_connections_checkouts_and_waits():
+    metrics = MongoPoolMetrics()
+    event = SimpleNamespace(duration=0.004)
+    for _ in range(2):
+        metrics.connection_created(event)
+    metrics.connection_closed(event)
+    for _ in range(3):
+        metrics.connection_check_out_started(event)
+    metrics.connection_checked_out(event)
+    metrics.connection_checked_out(SimpleNamespace(duration=0.010))
+    metrics.connection_checked_in(event)
+    metrics.pool_cleared(event)
+    for hook in (metrics.pool_created, metrics.pool_ready, metrics.pool_closed):
+        hook(event)
+    metrics.connection_ready(event)
+
+    assert metrics.snapshot() == {
+        "open_connections": 1,
+        "in_use": 1,
+        "waiting": 1,
+        "checkouts": 2,
+        "checkout_failures": 0,
+        "pool_cleared": 1,
+        "checkout_wait_ms_avg": 7.0,
+        "checkout_wait_ms_max": 10.0,
+    }
+    metrics.connection_check_out_failed(SimpleNamespace(duration=0.001))
+    assert metrics.snapshot()["waiting"] == 0
+    assert metrics.snapshot()["checkout_failures"] == 1
+
+
+def test_connect_returns_early_when_collection_is_initialized_inside_lock(monkeypatch):
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+
+    class _LockThatInitializes:
+        async def __aenter__(self):
+            store._collection = _FakeCollection()
+            return self
+
+        async def __aexit__(self, exc_type, exc, tb):
+            return False
+
+    store._lock = _LockThatInitializes()
+    monkeypatch.setattr(store, "_build_client", lambda: pytest.fail("client must not be built"))
+
+    asyncio.run(store.connect())
+
+
+def test_close_cancels_pending_index_creation(monkeypatch):
+    coll = _FakeCollection()
+    client = _FakeAsyncMongoClient(coll)
+    _install_clients(monkeypatch, client)
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+
+    async def _never_finishes(_spec, **_kwargs):
+        await asyncio.Event().wait()
+
+    coll.create_index = _never_finishes
+
+    async def _run():
+        await store.connect()
+        await asyncio.sleep(0)
+        store._schedule_index_creation(coll)
+        task = store._index_task
+        await store.close()
+        return task
+
+    task = asyncio.run(_run())
+
+    assert task.cancelled()
+    assert client.closed is True
+    assert store.indexes_ready is False
+
+
+def test_run_with_reconnect_raises_runtime_error_on_unexpected_empty_retry_loop(monkeypatch):
+    import backend.async_simulation_store as module
+
+    store = AsyncSimulationStore(_cfg("mongodb://localhost:27017"))
+    monkeypatch.setattr(module, "range", lambda _count: [], raising=False)
+
+    async def _op():
+        return True
+
+    with pytest.raises(RuntimeError, match="unexpectedly"):
+        asyncio.run(store._run_with_reconnect(_op))
+
+
+def test_persist_simulation_async_skips_disabled_store_or_missing_client(monkeypatch):
+    from backend import api_routes_simulate
+
+    class _Store:
+        enabled = False
+
+        async def save_simulation(self, *_args):
+            pytest.fail("disabled store must not be called")
+
+    req, resp = _req_resp()
+    monkeypatch.setattr(api_routes_simulate, "simulation_store", _Store())
+    asyncio.run(api_routes_simulate._persist_simulation_async("c1", req, resp))
+    _Store.enabled = True
+    asyncio.run(api_routes_simulate._persist_simulation_async("", req, resp))
+
+
+def test_sync_store_reports_pool_status():
+    store = SimulationStore(_cfg("mongodb://localhost:27017"))
+    assert store.pool_status()["driver"] == "sync"
+    assert store.pool_status()["indexes_ready"] is False
+    assert store.pool_status()["pool"]["open_connections"] == 0
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import orjson
+import pytest
+
+from backend.api_models import SimulateCompactResponse, SimulateResponse
+from backend.engine_batch_size import batch_size_for_working_set, read_engine_batch_profile
+from Scripts import (
+    benchmark_common,
+    benchmark_engine,
+    benchmark_import_time,
+    benchmark_request_validation,
+    benchmark_simulate_response,
+    benchmark_source_analysis,
+    benchmark_static_assets,
+    benchmark_throughput_reliability,
+    tune_engine_batch_size,
+)
+
+
+def test_positive_int_rejects_zero_and_negative_values():
+    assert benchmark_common.positive_int("3") == 3
+    for value in ("0", "-2"):
+        with pytest.raises(argparse.ArgumentTypeError, match="positive integer"):
+            benchmark_common.positive_int(value)
+
+
+def test_measure_keeps_best_repeat_and_reports_throughput():
+    calls: list[int] = []
+
+    timing = benchmark_common.measure(lambda: calls.append(1), iterations=4, repeats=3)
+
+    assert len(calls) == 1 + 4 * 3
+    assert timing["ns_per_op"] > 0
+    assert timing["ops_per_second"] == pytest.approx(1e9 / timing["ns_per_op"], rel=1e-3)
+
+
+def test_emit_report_prints_and_optionally_writes(tmp_path, capsys):
+    output = tmp_path / "nested" / "report.json"
+
+    benchmark_common.emit_report({"b": 1}, output)
+    benchmark_common.emit_report({"a": 2}, None)
+
+    assert json.loads(output.read_text(encoding="utf-8")) == {"b": 1}
+    assert capsys.readouterr().out.count("{") == 2
+
+
+def test_simulate_response_fast_paths_match_validated_public_contract():
+    result = benchmark_simulate_response.build_benchmark_result(n_sims=2000)
+
+    legacy = benchmark_simulate_response.serialise_legacy(result)
+    fast = benchmark_simulate_response.serialise_fast(result)
+    compact = orjson.loads(benchmark_simulate_response.serialise_fast(result, "arrays"))
+
+    assert fast == legacy
+    SimulateResponse.model_validate(orjson.loads(fast))
+    SimulateCompactResponse.model_validate(compact)
+    assert len(compact["result_distribution"]["x"]) == len(result.result_distribution.buckets)
+
+
+def test_simulate_response_benchmark_main_writes_report(tmp_path, capsys):
+    output = tmp_path / "bench.json"
+
+    code = benchmark_simulate_response.main(
+        ["--iterations", "2", "--repeats", "1", "--n-sims", "1000", "--output", str(output)]
+    )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert code == 0
+    assert set(report["paths"]) == {
+        "legacy_pydantic_stdlib",
+        "fast_orjson_buckets",
+        "fast_orjson_arrays",
+    }
+    assert report["paths"]["legacy_pydantic_stdlib"]["speedup_vs_legacy"] == 1.0
+    paths = report["paths"]
+    assert paths["fast_orjson_arrays"]["bytes"] < paths["fast_orjson_buckets"]["bytes"]
+    assert "simulate_response_serialisation" in capsys.readouterr().out
+
+
+def test_request_validation_benchmark_paths_build_the_same_command(tmp_path):
+    for mode in ("backlog_to_weeks", "weeks_to_items"):
+        payload = benchmark_request_validation.max_payload(mode)
+        single = benchmark_request_validation.validate_single_pass(payload)
+        assert single == benchmark_request_validation.validate_twice(payload)
+        assert len(single.throughput_samples.raw_values) == 521
+
+    output = tmp_path / "validation.json"
+    code = benchmark_request_validation.main(
+        ["--iterations", "1", "--repeats", "1", "--output", str(output)]
+    )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert code == 0
+    assert set(report["modes"]) == {"backlog_to_weeks", "weeks_to_items"}
+    assert "speedup_vs_twice" in report["modes"]["weeks_to_items"]["single_pass"]
+
+
+def test_throughput_reliability_benchmark_paths_agree(tmp_path):
+    samples = benchmark_throughput_reliability.BENCHMARK_SAMPLES
+    assert benchmark_throughput_reliability.python_loops(samples) == (
+        benchmark_throughput_reliability.calculate_throughput_reliability(samples)
+    )
+    with pytest.raises(ValueError, match="invalid samples"):
+        benchmark_throughput_reliability.python_loops([1, -1])
+
+    output = tmp_path / "reliability.json"
+    code = benchmark_throughput_reliability.main(
+        ["--iterations", "1", "--repeats", "1", "--output", str(output)]
+    )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert code == 0
+    assert report["samples_count"] == 521
+    assert "speedup_vs_python_loops" in report["paths"]["cached_prepared_samples"]
+
+
+def test_static_assets_benchmark_compares_legacy_and_precompressed_serving(tmp_path):
+    output = tmp_path / "static.json"
+
+    code = benchmark_static_assets.main(
+        ["--requests", "2", "--asset-kib", "8", "--output", str(output)]
+    )
+
+    scenarios = json.loads(output.read_text(encoding="utf-8"))["scenarios"]
+    assert code == 0
+    assert scenarios["precompressed_asset"]["wire_bytes"] < scenarios["legacy_asset"]["wire_bytes"]
+    assert scenarios["revalidated_asset_304"]["status"] == 304
+    assert scenarios["cached_index"]["status"] == 200
+
+
+def test_import_time_parser_keeps_cumulative_microseconds_per_module():
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   numpy._core",
+            "import time:        80 |        200 | numpy",
+            "unrelated warning",
+        ]
+    )
+
+    assert benchmark_import_time.parse_importtime(stderr) == {"numpy._core": 120, "numpy": 200}
+
+
+def test_import_time_summary_flags_eager_deferred_modules_and_budget_overrun():
+    runs = [
+        {"backend.api": 900_000, "fastapi": 400_000, "numpy": 90_000, "numpy._core": 50_000},
+        {"backend.api": 800_000, "fastapi": 380_000, "pymongo": 60_000, "site": 20_000},
+    ]
+
+    report = benchmark_import_time.summarise(runs, "backend.api", budget_ms=500.0)
+
+    assert report["total_ms"] == 800.0
+    assert list(report["top_level_modules_ms"]) == ["fastapi", "pymongo"]
+    assert report["regressions"] == [
+        "pymongo is imported eagerly",
+        "import takes 800.0 ms > 500.0 ms",
+    ]
+
+
+def test_import_time_benchmark_keeps_engine_and_drivers_out_of_api_import(tmp_path, capsys):
+    output = tmp_path / "import.json"
+
+    code = benchmark_import_time.main(
+        ["--runs", "1", "--budget-ms", "100000", "--output", str(output)]
+    )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert code == 0
+    assert report["deferred_modules_loaded"] == []
+    assert report["total_ms"] > 0
+
+    assert benchmark_import_time.main(["--runs", "1", "--budget-ms", "0"]) == 1
+    assert "Regression: import takes" in capsys.readouterr().err
+
+
+def test_engine_cases_cover_modes_sizes_samples_batches_and_backlogs():
+    cases = benchmark_engine.build_cases()
+    ids = [case.case_id for case in cases]
+
+    assert len(ids) == len(set(ids)) == 24
+    assert {case.n_sims for case in cases} == {1_000, 20_000, 200_000}
+    assert {case.sample_count for case in cases} == {6, 52, 521}
+    assert {case.batch_size for case in cases} == {512, 2_048, 8_192}
+    assert {case.backlog_size for case in cases} == {None, 10, 200, 2_000}
+    assert max(case.n_sims for case in benchmark_engine.build_cases(20_000)) == 20_000
+    items = next(case for case in cases if case.mode == "weeks_to_items")
+    assert items.draws == items.n_sims * items.target_weeks
+
+
+def test_engine_benchmark_records_then_compares_against_the_baseline(tmp_path, capsys):
+    baseline = tmp_path / "engine.json"
+    common = ["--baseline", str(baseline), "--repeats", "1", "--max-n-sims", "1000"]
+
+    assert benchmark_engine.main(["record", *common, "--in-process"]) == 0
+    report = json.loads(baseline.read_text(encoding="utf-8"))
+    case = report["cases"]["weeks_to_items/n1000/s6/weeks26/b2048"]
+    assert report["schema_version"] == benchmark_engine.SCHEMA_VERSION
+    assert case["ns_per_draw"] > 0 and case["sims_per_second"] > 0
+    assert case["peak_traced_bytes"] > 0 and case["peak_rss_bytes"] > 0
+
+    lenient = ["--time-budget", "1000", "--memory-budget", "1000", "--in-process"]
+    assert benchmark_engine.main(["compare", *common, *lenient]) == 0
+    assert "compared 6 cases, 0 regression(s)" in capsys.readouterr().out
+
+    for entry in report["cases"].values():
+        entry["ns_per_draw"] = entry["ns_per_draw"] / 10_000
+    baseline.write_text(json.dumps(report), encoding="utf-8")
+    assert benchmark_engine.main(["compare", *common, "--in-process"]) == 1
+    assert "Regression: backlog_to_weeks/n1000" in capsys.readouterr().err
+
+
+def test_engine_comparison_ignores_unknown_cases_and_rejects_other_schemas(tmp_path, capsys):
+    current = {"cases": {"new": {"ns_per_draw": 9.0, "peak_traced_bytes": 9}}}
+    assert benchmark_engine.compare_reports(
+        {"cases": {}}, current, time_budget=0.1, memory_budget=0.1
+    ) == []
+
+    baseline = tmp_path / "engine.json"
+    baseline.write_text(json.dumps({"schema_version": 0, "cases": {}}), encoding="utf-8")
+    assert benchmark_engine.main(["compare", "--baseline", str(baseline)]) == 1
+    assert "unsupported engine baseline schema" in capsys.readouterr().err
+
+
+def test_engine_cases_run_in_one_spawned_worker_each(monkeypatch):
+    executors: list[dict] = []
+
+    class _InlineExecutor(ThreadPoolExecutor):
+        def __init__(self, *, max_workers, mp_context):
+            executors.append({"workers": max_workers, "start": mp_context.get_start_method()})
+            super().__init__(max_workers=max_workers)
+
+    monkeypatch.setattr(benchmark_engine, "ProcessPoolExecutor", _InlineExecutor)
+    cases = benchmark_engine.build_cases(1_000)[-2:]
+
+    results = benchmark_engine.measure_cases(cases, repeats=1, isolated=True)
+
+    assert list(results) == [case.case_id for case in cases]
+    assert executors == [{"workers": 1, "start": "spawn"}] * 2
+
+
+def test_source_analysis_benchmark_reuses_all_but_the_edited_files(tmp_path, capsys):
+    root = tmp_path / "repository"
+    (root / "config").mkdir(parents=True)
+    shutil.copy(
+        Path(benchmark_source_analysis.ROOT) / "config" / "maintainability.json",
+        root / "config" / "maintainability.json",
+    )
+    (root / "backend").mkdir()
+    for name in ("a", "b", "c"):
+        (root / "backend" / f"{name}.py").write_text(f"import os\n{name} = 1\n", encoding="utf-8")
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    output = tmp_path / "source-analysis.json"
+
+    assert benchmark_source_analysis.main(
+        ["--root", str(root), "--changed", "1", "--repeats", "1", "--output", str(output)]
+    ) == 0
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    scenarios = report["scenarios"]
+    assert report == json.loads(capsys.readouterr().out)
+    assert scenarios["full"]["extracted"] == scenarios["cold"]["extracted"] == 9
+    assert (scenarios["warm"]["extracted"], scenarios["warm"]["reused"]) == (0, 9)
+    assert (scenarios["incremental"]["extracted"], scenarios["incremental"]["reused"]) == (3, 6)
+
+
+def test_engine_batch_tuning_writes_a_profile_the_api_can_load(tmp_path, capsys):
+    output = tmp_path / "engine-batch-profile.json"
+
+    assert tune_engine_batch_size.main(
+        [
+            "--output", str(output), "--n-sims", "1000", "--repeats", "1",
+            "--working-set", "65536", "--working-set", "262144", "--working-set", "65536",
+        ]
+    ) == 0
+
+    profile = json.loads(output.read_text(encoding="utf-8"))
+    assert profile == json.loads(capsys.readouterr().out)
+    assert read_engine_batch_profile(output) == profile["working_set_bytes"] in {65536, 262144}
+    assert len(profile["measurements"]) == 2 * len(tune_engine_batch_size.HORIZONS)
+    for row in profile["measurements"]:
+        assert row["batch_size"] == batch_size_for_working_set(
+            row["horizon_weeks"], row["working_set_bytes"]
+        )
+
+
+def test_engine_batch_tuning_prefers_the_best_relative_budget_and_rejects_drift(monkeypatch):
+    rows = [
+        {"working_set_bytes": budget, "horizon_weeks": horizon, "ns_per_slot": cost}
+        for budget, horizon, cost in (
+            (1, 26, 10.0), (2, 26, 11.0), (1, 521, 30.0), (2, 521, 12.0)
+        )
+    ]
+    assert tune_engine_batch_size.best_working_set(rows) == 2
+
+    results = iter(range(100))
+    monkeypatch.setattr(tune_engine_batch_size, "run_case", lambda _case: [next(results)])
+    with pytest.raises(RuntimeError, match="batch size"):
+        tune_engine_batch_size.measure_working_sets((65536, 131072), n_sims=1000, repeats=1)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import subprocess
 import sys
 from pathlib import Path
 
@@ -9,6 +10,7 @@ ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT / "Scripts"))
 
 import check_no_secrets  # noqa: E402
+import check_no_secrets_lookup  # noqa: E402
 
 
 def test_allows_fake_ado_values_in_ci_workflow() -> None:
@@ -106,11 +108,6 @@ def test_skip_binary_staged_reads_and_rules(tmp_path: Path, monkeypatch) -> None
     assert check_no_secrets.is_probably_binary(b"a\0b")
     assert not check_no_secrets.is_probably_binary(b"text")
 
-    monkeypatch.setattr(check_no_secrets, "run_git", lambda _args: (1, "", "missing"))
-    assert check_no_secrets.read_staged_file_bytes("missing.txt") is None
-    monkeypatch.setattr(check_no_secrets, "run_git", lambda _args: (0, "hello", ""))
-    assert check_no_secrets.read_staged_file_bytes("file.txt") == b"hello"
-
     rules = check_no_secrets.compile_rules()
     findings = check_no_secrets.scan_text(
         "file.env",
@@ -155,9 +152,106 @@ def test_main_covers_repository_empty_and_finding_paths(monkeypatch, capsys) ->
         "safe.txt": b"ordinary text",
         "secret.txt": b"password='long-password'",
     }
-    monkeypatch.setattr(check_no_secrets, "read_staged_file_bytes", payloads.get)
+    monkeypatch.setattr(
+        check_no_secrets,
+        "read_staged_blobs",
+        lambda paths, _max_bytes: {path: payloads[path] for path in paths},
+    )
     assert check_no_secrets.main() == 1
     assert "Potential secrets" in capsys.readouterr().err
 
     monkeypatch.setattr(check_no_secrets, "get_staged_files", lambda: ["safe.txt"])
     assert check_no_secrets.main() == 0
+
+
+def test_staged_blobs_are_read_in_one_batch(tmp_path: Path, monkeypatch) -> None:
+    def git(*args: str) -> None:
+        subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+    git("init", "-q")
+    (tmp_path / "plain file.txt").write_bytes(b"first\nsecond\n")
+    (tmp_path / "binary.bin").write_bytes(b"bad\0data")
+    (tmp_path / "large.txt").write_bytes(b"x" * 64)
+    (tmp_path / "empty.txt").write_bytes(b"")
+    git("add", ".")
+    (tmp_path / "plain file.txt").write_bytes(b"unstaged edit\n")
+    monkeypatch.chdir(tmp_path)
+
+    blobs = check_no_secrets_lookup.read_staged_blobs(
+        ["plain file.txt", "missing.txt", "binary.bin", "large.txt", "new\nline", "empty.txt"],
+        32,
+    )
+
+    assert blobs == {
+        "plain file.txt": b"first\nsecond\n",
+        "missing.txt": None,
+        "binary.bin": b"bad\0data",
+        "large.txt": None,
+        "new\nline": None,
+        "empty.txt": b"",
+    }
+    assert check_no_secrets_lookup.read_staged_blobs(["new\nline"], 32) == {"new\nline": None}
+
+    class Failed:
+        returncode = 128
+        stdout = b""
+
+    monkeypatch.setattr(
+        check_no_secrets_lookup.subprocess, "run", lambda *_args, **_kwargs: Failed()
+    )
+    assert check_no_secrets_lookup.read_staged_blobs(["plain file.txt"], 32) == {
+        "plain file.txt": None
+    }
+
+
+def test_combined_rules_report_the_same_findings_as_each_rule_in_order() -> None:
+    rules = check_no_secrets.compile_rules()
+    github = "gh" "p_" + "A" * 24
+    aws = "AK" "IA" + "B" * 16
+    lines = [
+        "plain = 1",
+        f"url = '{github}'; password='long-password'",
+        f"KEY = {aws}",
+        "ado_pat = 'real-token-value'",
+        "ADO_PAT=<SET_ME>",
+        "-----BEGIN RSA PRIVATE" " KEY-----",
+        f"// {github}",
+        "token = decode()",
+        "r\u00e9sum\u00e9 = 1; \u017fecret = 'long-value'",
+        "\u00e9t\u00e9\u2028password='long-password'",
+    ]
+    text = "\n".join(lines)
+
+    findings = check_no_secrets.scan_text("file.py", text, rules)
+
+    expected = []
+    for number, line in enumerate(text.splitlines(), start=1):
+        if line.lstrip().startswith(("#", "//")):
+            continue
+        for name, pattern in rules.rules:
+            if pattern.search(line):
+                expected.append((number, name))
+                break
+    assert [(finding.line_no, finding.rule) for finding in findings] == expected
+    assert [name for _number, name in expected] == [
+        "Generic token assignment",
+        "AWS Access Key ID",
+        "ADO_PAT set",
+        "Private key block",
+        "Generic token assignment",
+        "Generic token assignment",
+    ]
+    assert check_no_secrets_lookup.fold_case("\u0130\u017f\u0131K") == "isik"
+    assert [name for name, _pattern in rules] == [name for name, _pattern in rules.rules]
+    assert check_no_secrets.scan_text("file.py", "plain = 1\n" * 100, rules) == []
+
+
+def test_large_commits_are_scanned_in_parallel_with_ordered_findings(monkeypatch) -> None:
+    texts = {f"tests/file{index}.env": f"password='long-password-{index}'\n" for index in range(6)}
+    texts["tests/fixture.env"] = "ADO_ORG=real-value\n"
+    serial = check_no_secrets.scan_files(texts, workers=1)
+
+    monkeypatch.setattr(check_no_secrets, "PARALLEL_MIN_BYTES", 0)
+
+    assert check_no_secrets.scan_files(texts, workers=2) == serial
+    assert [finding.path for finding in serial] == list(texts)
@@ -0,0 +1,82 @@
+import json
+import logging
+
+import pytest
+
+from backend.engine_batch_size import (
+    DEFAULT_ENGINE_WORKING_SET_BYTES,
+    DRAW_BYTES_PER_SLOT,
+    ENGINE_BATCH_PROFILE_FORMAT,
+    EngineBatchSizing,
+    batch_size_for_working_set,
+    read_engine_batch_profile,
+)
+
+
+def test_batch_size_shrinks_as_the_horizon_grows():
+    budget = 1024 * 1024
+
+    assert batch_size_for_working_set(521, budget) == budget // (521 * (DRAW_BYTES_PER_SLOT + 8))
+    assert batch_size_for_working_set(6, budget) > 80 * batch_size_for_working_set(521, budget)
+    assert batch_size_for_working_set(521, budget, sample_itemsize=1) > (
+        batch_size_for_working_set(521, budget)
+    )
+    assert batch_size_for_working_set(521, 1) == 1
+    for invalid in ((0, budget), (521, 0)):
+        with pytest.raises(ValueError, match="> 0"):
+            batch_size_for_working_set(*invalid)
+
+
+def _write_profile(path, **profile):
+    path.write_text(json.dumps(profile), encoding="utf-8")
+    return path
+
+
+def test_profile_provides_the_working_set_and_bad_profiles_are_ignored(tmp_path, caplog):
+    valid = _write_profile(
+        tmp_path / "valid.json", format=ENGINE_BATCH_PROFILE_FORMAT, working_set_bytes=524_288
+    )
+    assert read_engine_batch_profile(valid) == 524_288
+    assert read_engine_batch_profile(tmp_path / "missing.json") is None
+    assert caplog.records == []
+
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    invalid_profiles = [
+        tmp_path / "broken.json",
+        _write_profile(tmp_path / "format.json", format=99, working_set_bytes=524_288),
+        _write_profile(tmp_path / "size.json", format=1, working_set_bytes=-1),
+        _write_profile(tmp_path / "type.json", format=1, working_set_bytes="1MB"),
+    ]
+    (tmp_path / "list.json").write_text("[]", encoding="utf-8")
+    invalid_profiles.append(tmp_path / "list.json")
+    with caplog.at_level(logging.WARNING, logger="backend.engine_batch_size"):
+        assert [read_engine_batch_profile(path) for path in invalid_profiles] == [None] * 5
+    assert len(caplog.records) == 5
+
+
+def test_configured_sizing_applies_fixed_size_budget_profile_then_default(tmp_path):
+    profile = _write_profile(
+        tmp_path / "profile.json", format=ENGINE_BATCH_PROFILE_FORMAT, working_set_bytes=262_144
+    )
+
+    fixed = EngineBatchSizing.configured(
+        fixed_batch_size=300, working_set_bytes=1, profile_path=profile
+    )
+    budget = EngineBatchSizing.configured(
+        fixed_batch_size=None, working_set_bytes=2_000_000, profile_path=profile
+    )
+    tuned = EngineBatchSizing.configured(
+        fixed_batch_size=None, working_set_bytes=None, profile_path=profile
+    )
+    untuned = EngineBatchSizing.configured(
+        fixed_batch_size=None, working_set_bytes=None, profile_path=tmp_path / "none.json"
+    )
+
+    assert (fixed.batch_size(6), fixed.batch_size(521)) == (300, 300)
+    assert budget.working_set_bytes == 2_000_000
+    assert tuned.working_set_bytes == 262_144
+    assert untuned == EngineBatchSizing() == EngineBatchSizing.configured(
+        fixed_batch_size=None, working_set_bytes=None, profile_path=None
+    )
+    assert untuned.working_set_bytes == DEFAULT_ENGINE_WORKING_SET_BYTES
+    assert tuned.batch_size(521) == batch_size_for_working_set(521, 262_144)
@@ -248,6 +248,29 @@ def test_selected_org_persisted_in_store_triggers_identity_006(repo_root: Path)
     assert ("IDENTITY-006", "selected_org") in {(v.rule, v.token) for v in violations}
 
 
+def test_async_store_and_async_history_route_are_scanned(repo_root: Path) -> None:
+    repo = _build_repo(
+        repo_root,
+        {
+            "backend/async_simulation_store.py": """
+                class AsyncSimulationStore:
+                    async def save_simulation(self, mc_client_id, command, result) -> None:
+                        doc = {"mc_client_id": mc_client_id, "selected_team": command.team}
+                        _ = doc
+            """,
+            "backend/api_routes_simulate.py": """
+                async def simulation_history(request):
+                    return [{"organization_name": "leak"}]
+            """,
+        },
+    )
+
+    violations = {(v.rule, v.token) for v in collect_identity_boundary_violations(repo)}
+
+    assert ("IDENTITY-006", "selected_team") in violations
+    assert ("IDENTITY-007", "organization_name") in violations
+
+
 def test_pat_in_forecast_request_payload_triggers_identity_004(repo_root: Path) -> None:
     repo = _build_repo(
         repo_root,
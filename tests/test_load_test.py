@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+from contextlib import contextmanager
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from backend import simulation_store as simulation_store_module
+from backend.simulation_store import SENSITIVE_HISTORY_FIELDS, SimulationStore
+from Scripts import load_test, load_test_standins
+from tests.test_simulation_store import _cfg, _req_resp
+
+
+def test_in_memory_mongo_stand_in_serves_the_real_store_contract(monkeypatch):
+    monkeypatch.setattr(load_test_standins.InMemoryMongoClient, "collections", {})
+    monkeypatch.setattr(
+        simulation_store_module, "MongoClient", load_test_standins.InMemoryMongoClient
+    )
+    store = SimulationStore(_cfg(load_test_standins.STANDIN_MONGO_URL))
+    req, resp = _req_resp()
+
+    store.save_simulation("c1", req, resp)
+    store.save_simulation("c2", req, resp)
+    store.save_simulation("c1", req, resp)
+    rows = store.list_recent("c1")
+
+    assert store.ping() is True
+    assert len(rows) == 2
+    assert rows[0]["created_at"] >= rows[1]["created_at"]
+    assert not set(SENSITIVE_HISTORY_FIELDS) & set(rows[0])
+    assert "mc_client_id" not in rows[0]
+    store.close()
+
+
+def test_app_factory_installs_the_mongo_stand_in(monkeypatch):
+    from backend.api import app
+
+    monkeypatch.setattr(simulation_store_module, "MongoClient", simulation_store_module.MongoClient)
+    monkeypatch.setenv("APP_MONGO_URL", load_test_standins.STANDIN_MONGO_URL)
+    monkeypatch.setenv("APP_MONGO_DRIVER", "async")
+    monkeypatch.setenv("APP_RATE_LIMIT_SIMULATE", "5/minute")
+
+    assert load_test_standins.create_app() is app
+    assert simulation_store_module.MongoClient is load_test_standins.InMemoryMongoClient
+    assert os.environ["APP_MONGO_DRIVER"] == "sync"
+    assert os.environ["APP_RATE_LIMIT_SIMULATE"] == "5/minute"
+
+
+def test_plan_replays_a_deterministic_weighted_mix():
+    plan = load_test.build_plan(200, seed=7, max_n_sims=20_000)
+
+    assert plan == load_test.build_plan(200, seed=7, max_n_sims=20_000)
+    assert {request.kind for request in plan} == {kind for kind, _ in load_test.REQUEST_MIX}
+    simulations = [request.payload for request in plan if request.payload is not None]
+    assert max(payload["n_sims"] for payload in simulations) == 20_000
+    assert {payload["mode"] for payload in simulations} == {"backlog_to_weeks", "weeks_to_items"}
+    persisted = next(request for request in plan if request.kind == "simulate_persisted")
+    anonymous = next(request for request in plan if request.kind == "simulate_backlog")
+    assert "IDMontecarlo=load-test-client-" in load_test._headers(persisted)["cookie"]
+    assert "cookie" not in load_test._headers(anonymous)
+
+
+def test_mix_option_replaces_the_assumed_request_mix():
+    args = load_test._parser().parse_args(
+        ["--mix", "simulate_items=3, history=1,simulate_backlog=0"]
+    )
+    plan = load_test.build_plan(100, seed=7, max_n_sims=1_000, mix=args.mix)
+
+    assert load_test._parser().parse_args([]).mix == load_test.REQUEST_MIX
+    assert args.mix == (("simulate_items", 3), ("history", 1))
+    assert {request.kind for request in plan} == {"simulate_items", "history"}
+    for invalid in ("history", "unknown=1", "history=-1", "history=1,history=2", "history=0"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            load_test.request_mix(invalid)
+
+
+def test_outcomes_summary_reports_percentiles_timeouts_and_errors():
+    outcomes = [
+        load_test.Outcome("simulate_backlog", latency / 1000, 200) for latency in range(1, 98)
+    ]
+    outcomes += [
+        load_test.Outcome("simulate_backlog", 0.5, 503, forecast_timeout=True),
+        load_test.Outcome("simulate_backlog", 0.6, 503),
+        load_test.Outcome("simulate_backlog", 0.7, None),
+    ]
+
+    summary = load_test.summarise_outcomes(outcomes, elapsed_seconds=2.0)
+
+    assert summary["requests"] == 100
+    assert summary["throughput_rps"] == 50.0
+    assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (50.0, 95.0, 600.0)
+    assert summary["timeout_rate"] == 0.01
+    assert summary["error_rate"] == 0.03
+    assert summary["statuses"] == {"200": 97, "503": 2, "None": 1}
+    assert load_test.summarise_outcomes([], 0.0)["p99_ms"] is None
+
+
+def test_send_classifies_forecast_and_client_timeouts():
+    def _handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/slow":
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(503, json={"detail": "Simulation trop longue. Reessayez."})
+
+    async def _run():
+        transport = httpx.MockTransport(_handler)
+        async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+            forecast = load_test.PlannedRequest("simulate_backlog", "POST", "/simulate", 1, {})
+            slow = load_test.PlannedRequest("history", "GET", "/slow", 1)
+            return await load_test._send(client, forecast), await load_test._send(client, slow)
+
+    forecast, slow = asyncio.run(_run())
+
+    assert (forecast.status, forecast.forecast_timeout) == (503, True)
+    assert (slow.status, slow.forecast_timeout) == (None, False)
+
+
+def test_process_cpu_is_read_from_proc_when_available():
+    assert load_test.process_tree_cpu_seconds(os.getpid()) > 0
+    assert load_test.process_tree_cpu_seconds(2**22 + 1) is None
+
+
+def test_readiness_wait_fails_on_exit_or_deadline(monkeypatch):
+    base_url = f"http://127.0.0.1:{load_test._free_port()}"
+    with pytest.raises(RuntimeError, match="exited with code 3"):
+        load_test._wait_until_ready(base_url, SimpleNamespace(poll=lambda: 3, returncode=3))
+
+    monkeypatch.setattr(load_test, "READY_TIMEOUT_SECONDS", 0.2)
+    with pytest.raises(RuntimeError, match="did not become ready"):
+        load_test._wait_until_ready(base_url, SimpleNamespace(poll=lambda: None))
+
+
+def test_load_test_boots_the_app_and_reports_latency_and_cpu(tmp_path):
+    output = tmp_path / "load.json"
+
+    code = load_test.main(
+        ["--requests", "8", "--concurrency", "2", "--max-n-sims", "1000", "--output", str(output)]
+    )
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert code == 0
+    assert report["overall"]["requests"] == 8
+    assert report["overall"]["error_rate"] == 0.0
+    assert report["stand_ins"] == {"mongo": True, "redis": True}
+    assert report["cpu_ms_per_request"] > 0
+    assert set(report["by_kind"]) == {kind for kind, _ in load_test.REQUEST_MIX}
+
+
+def test_main_reports_unknown_cpu_when_proc_is_unavailable(monkeypatch, capsys):
+    @contextmanager
+    def _server(_args):
+        yield "http://load", SimpleNamespace(pid=0)
+
+    async def _run_load(_base_url, plan, *, concurrency, client_timeout):
+        outcomes = [load_test.Outcome(request.kind, 0.01, 200) for request in plan]
+        return load_test.LoadResult(outcomes, elapsed_seconds=0.5)
+
+    monkeypatch.setattr(load_test, "running_server", _server)
+    monkeypatch.setattr(load_test, "run_load", _run_load)
+    monkeypatch.setattr(load_test, "process_tree_cpu_seconds", lambda _pid: None)
+
+    assert load_test.main(["--requests", "5", "--mongo-url", "mongodb://db:27017"]) == 0
+
+    report = json.loads(capsys.readouterr().out)
+    assert report["overall"]["throughput_rps"] == 10.0
+    assert report["stand_ins"] == {"mongo": False, "redis": True}
+    assert report["cpu_ms_per_request"] is None
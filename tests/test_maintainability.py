@@ -4,6 +4,7 @@ import json
 import runpy
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -20,6 +21,7 @@ import maintainability_dependencies  # noqa: E402
 import maintainability_metrics  # noqa: E402
 import report_change_cost_baseline  # noqa: E402
 import report_dependency_graph  # noqa: E402
+import source_analysis_cache  # noqa: E402
 
 RATCHET_LIMITS = {
     "file.lines": 350,
@@ -365,6 +367,129 @@ def test_dependency_collection_resolves_relative_external_and_js_imports() -> No
     }
 
 
+def _analysis_texts() -> dict[str, str]:
+    return {
+        "pkg/__init__.py": "",
+        "pkg/a.py": "from . import b\n\ndef work(flag):\n    return 1 if flag else 0\n",
+        "pkg/b.py": "import external.lib\n",
+        "web/a.ts": "import { b } from './b';\nconst run = () => { return b ? 1 : 0; };\n",
+        "web/b.ts": "export const b = 1;\n",
+    }
+
+
+def _analyse(texts: dict[str, str], cache) -> tuple:
+    limits = {key: 0 for key in RATCHET_LIMITS}
+    return (
+        dependency_graph.collect_import_edges(texts, set(texts), cache),
+        maintainability_dependencies.collect_dependencies(texts, cache),
+        maintainability_metrics.collect_metric_debt(texts, limits, cache),
+    )
+
+
+def test_source_analysis_cache_reextracts_only_changed_files(tmp_path: Path) -> None:
+    texts = _analysis_texts()
+    uncached = _analyse(texts, None)
+    cold = source_analysis_cache.SourceAnalysisCache(tmp_path)
+    warm = source_analysis_cache.SourceAnalysisCache(tmp_path)
+
+    assert _analyse(texts, cold) == uncached
+    assert (cold.extracted, cold.reused) == (15, 0)
+    assert _analyse(texts, warm) == uncached
+    assert (warm.extracted, warm.reused) == (0, 15)
+    assert len(list(tmp_path.glob("*.json"))) == 3
+
+    texts["pkg/b.py"] = "import other.lib\n"
+    incremental = source_analysis_cache.SourceAnalysisCache(tmp_path)
+    assert _analyse(texts, incremental) == _analyse(texts, None)
+    assert (incremental.extracted, incremental.reused) == (3, 12)
+    assert ("pkg/b.py", "other/lib.py") in _analyse(texts, incremental)[1]
+
+    for path in tmp_path.glob("*.json"):
+        path.write_text("[]", encoding="utf-8")
+    (tmp_path / "dependency_graph.import_statements.json").write_text("{", encoding="utf-8")
+    corrupt = source_analysis_cache.SourceAnalysisCache(tmp_path)
+    assert _analyse(texts, corrupt) == _analyse(texts, None)
+    assert corrupt.reused == 0
+
+
+def test_source_analysis_cache_parses_in_processes_and_survives_unwritable_storage(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    texts = _analysis_texts()
+    monkeypatch.setattr(source_analysis_cache, "PARALLEL_THRESHOLD", 2)
+    parallel = source_analysis_cache.SourceAnalysisCache(tmp_path / "cache", workers=2)
+    assert _analyse(texts, parallel) == _analyse(texts, None)
+
+    blocked = tmp_path / "file"
+    blocked.write_text("", encoding="utf-8")
+    unwritable = source_analysis_cache.SourceAnalysisCache(blocked / "cache")
+    assert _analyse(texts, unwritable) == _analyse(texts, None)
+    assert "source analysis cache not written" in capsys.readouterr().err
+
+    with pytest.raises(SyntaxError):
+        source_analysis_cache.SourceAnalysisCache(tmp_path / "cache").facts(
+            maintainability_metrics.file_metrics, {"broken.py": "def (:\n"}
+        )
+
+
+def test_extractor_fingerprint_follows_the_first_party_helpers_it_imports(
+    tmp_path: Path, monkeypatch
+) -> None:
+    (tmp_path / "extract.py").write_text(
+        "import json\nimport helper\nfrom Scripts import shared\nfrom . import relative\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "helper.py").write_text("from Scripts.leaf import VALUE\n", encoding="utf-8")
+    (tmp_path / "shared.py").write_text("", encoding="utf-8")
+    (tmp_path / "leaf.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (tmp_path / "relative.py").write_text("", encoding="utf-8")
+    monkeypatch.setattr(source_analysis_cache, "SCRIPTS_DIRECTORY", tmp_path.resolve())
+
+    closure = source_analysis_cache.module_closure(tmp_path / "extract.py")
+    assert [path.name for path in closure] == ["extract.py", "helper.py", "leaf.py", "shared.py"]
+
+    module = type(sys)("extract")
+    module.__file__ = str(tmp_path / "extract.py")
+    exec("def extract(path, text):\n    return []\n", module.__dict__)
+    monkeypatch.setitem(sys.modules, "extract", module)
+    stored = source_analysis_cache.extractor_fingerprint(module.extract)
+    (tmp_path / "leaf.py").write_text("VALUE = 2\n", encoding="utf-8")
+    source_analysis_cache.file_digest.cache_clear()
+    assert source_analysis_cache.extractor_fingerprint(module.extract) != stored
+    (tmp_path / "relative.py").write_text("VALUE = 2\n", encoding="utf-8")
+    changed = source_analysis_cache.extractor_fingerprint(module.extract)
+    source_analysis_cache.file_digest.cache_clear()
+    assert source_analysis_cache.extractor_fingerprint(module.extract) == changed
+
+    current = sys.implementation.name, sys.version_info.major, sys.version_info.minor
+    assert f":{current[0]}-{current[1]}.{current[2]}:" in changed
+    for name, major, minor in (
+        (current[0], current[1], current[2] + 1),
+        (f"not-{current[0]}", *current[1:]),
+    ):
+        interpreter = SimpleNamespace(
+            modules=sys.modules,
+            version_info=SimpleNamespace(major=major, minor=minor),
+            implementation=SimpleNamespace(name=name),
+        )
+        monkeypatch.setattr(source_analysis_cache, "sys", interpreter)
+        assert source_analysis_cache.extractor_fingerprint(module.extract) != changed
+
+
+def test_source_analysis_cache_arguments_default_under_the_analysed_root(tmp_path: Path) -> None:
+    parser = check_maintainability.argparse.ArgumentParser()
+    parser.add_argument("--root", type=Path, default=tmp_path)
+    source_analysis_cache.add_cache_arguments(parser)
+
+    cache = source_analysis_cache.cache_from_arguments(parser.parse_args(["--workers", "3"]))
+    assert cache is not None
+    assert cache.directory == tmp_path.resolve() / ".cache" / "source-analysis"
+    assert cache.workers == 3
+    custom = parser.parse_args(["--cache-dir", str(tmp_path / "custom")])
+    assert source_analysis_cache.cache_from_arguments(custom).directory == tmp_path / "custom"
+    assert source_analysis_cache.cache_from_arguments(parser.parse_args(["--no-cache"])) is None
+
+
 def test_cycles_include_self_edges_and_ignore_edges_outside_graph() -> None:
     cycles = maintainability_dependencies.cyclic_components(
         {"a.py", "b.py"},
@@ -4,11 +4,13 @@ import pytest
 from backend.histogram import HISTOGRAM_MAX_BUCKETS, build_histogram
 from backend.mc_core import (
     FinishWeeksSimulation,
+    finish_weeks_draw_slots,
     mc_finish_weeks,
     mc_items_done_for_weeks,
     percentiles,
 )
 from backend.mca_prng_v1_sample_index_draw_port import McaPrngV1SampleIndexDrawPort
+from backend.prepared_samples import PreparedSamples
 from backend.simulation_limits import SIMULATION_HORIZON_WEEKS_MAX, SIMULATION_N_SIMS_MAX
 from backend.simulation_value_objects import SimulationSeed, ThroughputReliability
 from backend.throughput_reliability import calculate_throughput_reliability
@@ -128,6 +130,66 @@ def test_mc_finish_weeks_large_backlog_hits_cap():
     assert out.censored_rate == 1.0
 
 
+class _FullMatrixDrawPort:
+    """mca-prng-v1 sans la capacite de tirage des premiers slots."""
+
+    def __init__(self, seed: int) -> None:
+        self._draw_port = _prng_draw_port(seed)
+        self.requests: list[tuple[int, tuple[int, int]]] = []
+
+    def draw_sample_indices(self, sample_count, shape):
+        self.requests.append((sample_count, shape))
+        return self._draw_port.draw_sample_indices(sample_count, shape)
+
+
+@pytest.mark.parametrize(
+    ("samples", "include_zero_weeks", "backlog_size"),
+    [
+        ([2, 5, 3], False, 11),
+        ([0, 4, 9], True, 40),
+        ([1, 2, 3], False, 1_200),
+        ([7, 8], False, 6),
+    ],
+)
+def test_mc_finish_weeks_bounds_keep_the_full_matrix_results(
+    samples, include_zero_weeks, backlog_size
+):
+    full_matrix_port = _FullMatrixDrawPort(9)
+    arguments = (backlog_size, np.array(samples), 3_000, include_zero_weeks)
+
+    expected = mc_finish_weeks(*arguments, draw_port=full_matrix_port, batch_size=700)
+    actual = mc_finish_weeks(*arguments, draw_port=_prng_draw_port(9), batch_size=700)
+
+    assert np.array_equal(actual.completed_weeks, expected.completed_weeks)
+    assert actual.simulation_count == expected.simulation_count
+    assert full_matrix_port.requests[0] == (len(samples), (700, SIMULATION_HORIZON_WEEKS_MAX))
+
+
+def test_mc_finish_weeks_short_circuits_unreachable_backlogs_without_drawing():
+    for samples, backlog_size in (([0, 3], 3 * SIMULATION_HORIZON_WEEKS_MAX + 1), ([0, 0], 1)):
+        draw_port = RecordingSampleIndexDrawPort()
+        out = mc_finish_weeks(
+            backlog_size,
+            np.array(samples),
+            n_sims=1_000,
+            include_zero_weeks=True,
+            draw_port=draw_port,
+        )
+
+        assert draw_port.requests == []
+        assert out.completed_count == 0
+        assert out.censored_count == 1_000
+
+
+def test_finish_weeks_draw_slots_is_the_latest_possible_completion_week():
+    assert finish_weeks_draw_slots(20, PreparedSamples.create([2, 5, 7], True)) == 10
+    assert finish_weeks_draw_slots(21, PreparedSamples.create([2, 5, 7], True)) == 11
+    assert finish_weeks_draw_slots(20, PreparedSamples.create([0, 5], True)) == 521
+    assert finish_weeks_draw_slots(600, PreparedSamples.create([1, 5], True)) == 521
+    with pytest.raises(ValueError, match="backlog_size"):
+        finish_weeks_draw_slots(0, PreparedSamples.create([1, 5], True))
+
+
 def test_mc_finish_weeks_invalid_inputs():
     with pytest.raises(ValueError):
         mc_finish_weeks(
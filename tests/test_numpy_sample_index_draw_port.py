@@ -12,7 +12,10 @@ from backend.mca_prng_v1_sample_index_draw_port import (
     MCA_PRNG_V1_CONTRACT_ID,
     McaPrngV1SampleIndexDrawPort,
 )
-from backend.sample_index_draw_port import SampleIndexDrawPort
+from backend.sample_index_draw_port import (
+    LeadingSlotsSampleIndexDrawPort,
+    SampleIndexDrawPort,
+)
 from backend.simulation_value_objects import SimulationSeed
 
 _ROOT = Path(__file__).resolve().parents[1]
@@ -182,6 +185,24 @@ def test_numpy_draw_port_matches_default_rng_across_successive_vectorized_draws(
     assert McaPrngV1SampleIndexDrawPort.__slots__ == ("_state",)
 
 
+def test_leading_slots_match_the_full_matrix_and_consume_every_slot():
+    leading_port = McaPrngV1SampleIndexDrawPort(SimulationSeed(4_294_967_295))
+    full_port = McaPrngV1SampleIndexDrawPort(SimulationSeed(4_294_967_295))
+
+    assert isinstance(leading_port, LeadingSlotsSampleIndexDrawPort)
+    for leading_slots in (1, 4, 9):
+        leading = leading_port.draw_leading_sample_indices(17, (3, 9), leading_slots)
+        full = full_port.draw_sample_indices(17, (3, 9))
+        assert leading.shape == (3, leading_slots)
+        assert np.array_equal(leading, full[:, :leading_slots])
+        assert leading_port._state == full_port._state
+    for invalid in (0, 10, 2.0, True):
+        with pytest.raises(ValueError, match="leading_slots"):
+            leading_port.draw_leading_sample_indices(17, (3, 9), invalid)
+    with pytest.raises(ValueError, match="shape"):
+        leading_port.draw_leading_sample_indices(17, (3,), 1)
+
+
 @pytest.mark.parametrize("sample_count", [0, -1, 1.5, True])
 def test_numpy_draw_port_rejects_invalid_sample_count(sample_count):
     draw_port = McaPrngV1SampleIndexDrawPort(SimulationSeed(1))
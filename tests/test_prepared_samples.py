@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from backend.mc_core import mc_finish_weeks, mc_items_done_for_weeks
+from backend.mca_prng_v1_sample_index_draw_port import McaPrngV1SampleIndexDrawPort
+from backend.prepared_samples import PreparedSamples, prepare_samples
+from backend.simulation_value_objects import SimulationSeed, ThroughputSamples
+from backend.throughput_reliability import calculate_throughput_reliability
+
+HISTORY = (0, 3, 5, 0, 2, 8, 4, 6, 1)
+
+
+def _draw_port() -> McaPrngV1SampleIndexDrawPort:
+    return McaPrngV1SampleIndexDrawPort(SimulationSeed(42))
+
+
+def test_prepared_samples_hold_the_usable_history_and_its_reliability():
+    prepared = prepare_samples(ThroughputSamples.create(HISTORY, include_zero_weeks=False))
+
+    assert prepared.values.tolist() == [3, 5, 2, 8, 4, 6, 1]
+    assert prepared.values.dtype == np.int64
+    assert (prepared.minimum, prepared.maximum, prepared.samples_count) == (1, 8, 7)
+    assert prepared.include_zero_weeks is False
+    assert prepared.reliability == calculate_throughput_reliability([3, 5, 2, 8, 4, 6, 1])
+    with pytest.raises(ValueError, match="read-only"):
+        prepared.values[0] = 9
+
+
+def test_requests_on_the_same_history_share_one_prepared_instance():
+    first = prepare_samples(ThroughputSamples.create(HISTORY, include_zero_weeks=True))
+
+    assert prepare_samples(ThroughputSamples.create(list(HISTORY), True)) is first
+    assert prepare_samples(ThroughputSamples.create(HISTORY, False)) is not first
+    assert prepare_samples(ThroughputSamples.create(HISTORY[1:], True)) is not first
+
+
+@pytest.mark.parametrize("include_zero_weeks", [True, False])
+def test_engine_results_are_identical_from_an_array_or_prepared_samples(include_zero_weeks):
+    prepared = PreparedSamples.create(HISTORY, include_zero_weeks=True)
+    array = np.asarray(HISTORY)
+
+    for engine, target in ((mc_finish_weeks, 40), (mc_items_done_for_weeks, 6)):
+        expected = engine(target, array, 1000, include_zero_weeks, draw_port=_draw_port())
+        actual = engine(target, prepared, 1000, include_zero_weeks, draw_port=_draw_port())
+        if engine is mc_finish_weeks:
+            expected, actual = expected.completed_weeks, actual.completed_weeks
+        assert np.array_equal(actual, expected)
+
+
+def test_engine_rejects_prepared_samples_without_usable_value():
+    prepared = PreparedSamples.create((0, 0, 0), include_zero_weeks=True)
+
+    with pytest.raises(ValueError, match="aucune valeur > 0"):
+        mc_items_done_for_weeks(3, prepared, 1000, draw_port=_draw_port())
+    assert mc_items_done_for_weeks(3, prepared, 1000, True, draw_port=_draw_port()).sum() == 0
@@ -3212,7 +3212,7 @@ def test_execute_plan_dependency_error_pre_push_interrupt_and_main_dispatch(
     monkeypatch.setattr(quality_gate, "run_pre_push_gate", lambda *a, **k: 4)
     monkeypatch.setattr(quality_gate.sys, "stdin", io.StringIO("updates"))
     assert quality_gate.main(["push", "--remote-name", "origin"]) == 4
-    monkeypatch.setattr(quality_gate, "run_gate", lambda mode: 5)
+    monkeypatch.setattr(quality_gate, "run_gate", lambda mode, **_options: 5)
     assert quality_gate.main(["ci"]) == 5
 
 
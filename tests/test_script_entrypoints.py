@@ -15,6 +15,13 @@ ROOT = Path(__file__).resolve().parents[1]
 @pytest.mark.parametrize(
     "relative_path",
     [
+        "Scripts/benchmark_engine.py",
+        "Scripts/benchmark_import_time.py",
+        "Scripts/benchmark_request_validation.py",
+        "Scripts/benchmark_simulate_response.py",
+        "Scripts/benchmark_source_analysis.py",
+        "Scripts/benchmark_static_assets.py",
+        "Scripts/load_test.py",
         "Scripts/check_backlog_consistency.py",
         "Scripts/check_e2e_coverage.py",
         "Scripts/check_maintainability.py",
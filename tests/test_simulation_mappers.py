@@ -1,11 +1,12 @@
 import pytest
 from pydantic import ValidationError
 
-from backend.api_models import SimulateRequest, SimulateResponse
+from backend.api_models import SimulateCompactResponse, SimulateRequest, SimulateResponse
 from backend.simulation_mappers import (
     persistence_row_to_history_item,
     request_to_command,
     result_to_response,
+    result_to_response_payload,
 )
 from backend.simulation_models import (
     SimulationResult,
@@ -16,6 +17,7 @@ from backend.simulation_value_objects import (
     SimulationCount,
     SimulationPercentiles,
     SimulationSeed,
+    StatisticalValueError,
     ThroughputReliability,
 )
 
@@ -74,6 +76,33 @@ def test_request_to_command_resolves_transport_values_and_seed():
     assert command.seed.value == 98765
 
 
+def test_request_to_command_reuses_parameters_validated_by_the_request_contract():
+    request = SimulateRequest(
+        throughput_samples=[0, 1, 2, 3, 4, 5, 6],
+        mode="weeks_to_items",
+        target_weeks=12,
+    )
+
+    command = request_to_command(request, SimulationSeed(7))
+
+    assert request.command_parameters is not None
+    assert command.throughput_samples is request.command_parameters.throughput_samples
+    assert command.target_weeks is request.command_parameters.target_weeks
+    assert command.seed == SimulationSeed(7)
+
+
+def test_request_to_command_revalidates_when_history_is_insufficient():
+    request = SimulateRequest(
+        throughput_samples=[0, 0, 1, 2, 3, 4],
+        mode="backlog_to_weeks",
+        backlog_size=20,
+    )
+
+    assert request.command_parameters is None
+    with pytest.raises(StatisticalValueError, match="Historique insuffisant"):
+        request_to_command(request, SimulationSeed(7))
+
+
 def test_request_transport_defaults_are_explicitly_aligned_before_the_domain():
     request = SimulateRequest(
         throughput_samples=[0, 1, 2, 3, 4, 5, 6],
@@ -120,6 +149,18 @@ def test_result_to_response_preserves_public_json_and_omits_none_values():
     assert "completion_summary" not in serialized
 
 
+def test_result_to_response_payload_follows_response_field_order_and_compact_format():
+    result = _result(with_optional_values=True)
+
+    payload = result_to_response_payload(result)
+    compact = result_to_response_payload(result, histogram_format="arrays")
+
+    assert list(payload) == list(SimulateResponse.model_fields)
+    assert payload == result_to_response(result).model_dump(exclude_none=True)
+    assert compact["result_distribution"] == {"x": [8], "count": [800]}
+    SimulateCompactResponse.model_validate(compact)
+
+
 @pytest.mark.parametrize(
     "override",
     [
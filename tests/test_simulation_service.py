@@ -12,6 +12,8 @@ from backend.mc_core import (
 )
 from backend.simulation_models import SimulationCommand
 from backend.simulation_service import (
+    DEFAULT_BATCH_SIZING,
+    engine_batch_size,
     run_simulation,
     run_simulation_with_batch_size,
 )
@@ -169,7 +171,8 @@ def test_service_constructs_exactly_one_adapter_per_execution_and_passes_it_to_e
         create_port,
     )
 
-    run_simulation(_command(n_sims=1000))
+    # A 600-item backlog at one item per week may need the whole 521-week horizon.
+    run_simulation(_command(backlog_size=600, n_sims=1000))
     run_simulation(
         _command(
             mode="weeks_to_items",
@@ -181,10 +184,28 @@ def test_service_constructs_exactly_one_adapter_per_execution_and_passes_it_to_e
 
     assert created_seeds == [SimulationSeed(123), SimulationSeed(123)]
     assert len(created_ports) == 2
-    assert created_ports[0].requests == [(6, (1000, 521))]
+    backlog_batch = engine_batch_size(_command(backlog_size=600), DEFAULT_BATCH_SIZING)
+    assert backlog_batch < 1000
+    assert created_ports[0].requests == [
+        (6, (backlog_batch, 521)) for _ in range(1000 // backlog_batch)
+    ] + [(6, (1000 % backlog_batch, 521))]
     assert created_ports[1].requests == [(6, (1000, 3))]
 
 
+def test_backlog_batches_are_sized_from_the_drawn_completion_window():
+    narrow = engine_batch_size(_command(backlog_size=20), DEFAULT_BATCH_SIZING)
+    full_horizon = engine_batch_size(_command(backlog_size=600), DEFAULT_BATCH_SIZING)
+    with_zero_weeks = engine_batch_size(
+        _command(throughput_samples=(0, 1, 2, 3, 4, 5), include_zero_weeks=True, backlog_size=20),
+        DEFAULT_BATCH_SIZING,
+    )
+
+    # At least one item per week: 20 weeks are drawn instead of 521.
+    assert narrow == DEFAULT_BATCH_SIZING.batch_size(20)
+    assert full_horizon == with_zero_weeks == DEFAULT_BATCH_SIZING.batch_size(521)
+    assert narrow > full_horizon
+
+
 @pytest.mark.parametrize(
     ("completion_pattern", "expected_percentiles", "expected_risk"),
     [
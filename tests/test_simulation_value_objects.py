@@ -86,6 +86,16 @@ def test_throughput_rejects_invalid_values_before_zero_processing(invalid):
         ThroughputSamples.create(values, False)
 
 
+def test_throughput_validation_keeps_strict_types_for_int_subclasses_and_large_values():
+    class Weekly(int):
+        pass
+
+    with pytest.raises(StatisticalValueError, match="entier strict"):
+        ThroughputSamples.create([1, 2, 3, 4, 5, Weekly(6)], False)
+    large = ThroughputSamples.create([0, 1, 2, 3, 4, 5, 2**70], False)
+    assert large.usable_values == (1, 2, 3, 4, 5, 2**70)
+
+
 def test_throughput_enforces_raw_and_usable_sample_limits():
     assert len(ThroughputSamples.create([1] * 6, False).usable_values) == 6
     assert (
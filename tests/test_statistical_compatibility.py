@@ -145,7 +145,8 @@ def _response_field_type(root: Path) -> None:
 
 def _contract_version(root: Path) -> None:
     def change(value: dict[str, Any]) -> None:
-        value["components"][0]["current_version"] = "1.1"
+        component = value["components"][0]
+        component["current_version"] = f"{component['current_version']}.1"
 
     _mutate_json(root, AUTHORITY_PATH.as_posix(), change)
 
@@ -179,21 +180,23 @@ def _append_release(
 ) -> dict[str, Any]:
     component = next(item for item in authority["components"] if item["id"] == component_id)
     previous = component["releases"][-1]
+    major, minor = previous["version"].split(".")[:2]
+    version = f"{major}.{int(minor) + 1}"
     release = deepcopy(previous)
-    release["version"] = "1.1"
+    release["version"] = version
     release["semantic_fingerprint"] = "a" * 64
     release["decision"].update(
         {
-            "id": f"DEC-{component_id}-1.1",
+            "id": f"DEC-{component_id}-{version}",
             "classification": classification,
             "from_version": previous["version"],
-            "to_version": "1.1",
+            "to_version": version,
             "from_fingerprint": previous["semantic_fingerprint"],
             "to_fingerprint": "a" * 64,
             "changed_surfaces": [component["surfaces"][0]],
         }
     )
-    component["current_version"] = "1.1"
+    component["current_version"] = version
     component["releases"].append(release)
     return component
 
@@ -96,6 +96,29 @@ def test_evolution_rejects_removed_authorities_and_untraced_manifest_edits() ->
     )
 
 
+def test_dependents_may_follow_an_appended_release_without_their_own_release() -> None:
+    previous = _authority()
+    followed = deepcopy(previous)
+    response = _append_release(followed, "canonical-response", "compatible_contract_extension")
+    history = next(
+        item for item in followed["components"] if item["id"] == "serialization-and-history"
+    )
+    history["dependencies"][0]["version"] = response["current_version"]
+    codes = {(item.component, item.code) for item in evolution_diagnostics(followed, previous)}
+    assert ("serialization-and-history", "component_manifest_changed_without_release") not in codes
+
+    unreleased = deepcopy(previous)
+    history = next(
+        item for item in unreleased["components"] if item["id"] == "serialization-and-history"
+    )
+    history["dependencies"][0]["version"] = response["current_version"]
+    assert any(
+        item.component == "serialization-and-history"
+        and item.code == "component_manifest_changed_without_release"
+        for item in evolution_diagnostics(unreleased, previous)
+    )
+
+
 def test_proof_manifest_change_requires_version_and_component_release() -> None:
     previous = _authority()
     unversioned = deepcopy(previous)
@@ -442,6 +442,7 @@ def test_generator_validator_and_entrypoints_publish_both_views_from_one_model(
         == []
     )
     assert generator.main(["--root", str(root)]) == 0
+    assert "Schémas JSON : " in capsys.readouterr().err
     assert validator_cli.main(["--report", str(json_path), "--markdown", str(markdown_path)]) == 0
     assert "verdict=match" in capsys.readouterr().out
 
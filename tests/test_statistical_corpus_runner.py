@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import argparse
 import json
 import runpy
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
 from types import SimpleNamespace
@@ -11,6 +13,7 @@ from typing import Any
 import pytest
 
 from Scripts import run_statistical_reference_corpus as corpus_control
+from Scripts import statistical_case_cache as case_cache
 from Scripts import statistical_corpus_runner as corpus_runner
 from Scripts import statistical_parity_report as parity_report
 from Scripts import validate_statistical_reference_corpus as corpus_validation
@@ -131,6 +134,119 @@ def test_python_runner_reports_case_errors_without_stopping_following_cases() ->
     }
 
 
+def test_python_runner_fans_cases_out_over_worker_processes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    corpus = deepcopy(_corpus())
+    corpus["cases"] = corpus["cases"][:3]
+    pools: list[dict[str, Any]] = []
+
+    def thread_pool(*, max_workers: int, mp_context: Any) -> ThreadPoolExecutor:
+        # Same executor contract without spawning interpreters under coverage.
+        pools.append({"max_workers": max_workers, "start_method": mp_context.get_start_method()})
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    monkeypatch.setattr(corpus_runner, "ProcessPoolExecutor", thread_pool)
+    serial = corpus_runner.run_python_corpus(corpus, batch_size=128)
+    parallel = corpus_runner.run_python_corpus(corpus, batch_size=128, workers=8)
+
+    assert parallel == serial
+    assert pools == [{"max_workers": 3, "start_method": "spawn"}]
+    assert [case["status"] for case in parallel["cases"]] == ["ok", "ok", "ok"]
+
+
+def test_python_runner_reuses_cached_case_results_per_engine_and_batch_size(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    corpus = deepcopy(_corpus())
+    corpus["cases"] = corpus["cases"][:2]
+    cache = case_cache.CaseResultCache(tmp_path / "cache")
+    executed: list[tuple[str, int]] = []
+    run_cases = corpus_runner._run_python_cases
+
+    def counting_run(cases: list[dict[str, Any]], **options: Any) -> list[dict[str, Any]]:
+        executed.extend((case["id"], options["batch_size"]) for case in cases)
+        return run_cases(cases, **options)
+
+    monkeypatch.setattr(corpus_runner, "_run_python_cases", counting_run)
+    first = corpus_runner.run_python_corpus(corpus, batch_size=125, cache=cache)
+    second = corpus_runner.run_python_corpus(corpus, batch_size=125, cache=cache)
+    other_batch = corpus_runner.run_python_corpus(corpus, batch_size=128, cache=cache)
+
+    assert first == second
+    assert other_batch["cases"] == first["cases"]
+    ids = [case["id"] for case in corpus["cases"]]
+    assert executed == [(ids[0], 125), (ids[1], 125), (ids[0], 128), (ids[1], 128)]
+
+    key = case_cache.case_cache_key(
+        corpus["cases"][0],
+        batch_size=125,
+        fingerprint=case_cache.engine_source_fingerprint(),
+    )
+    next(tmp_path.glob(f"cache/*/{key}.json")).write_text("{truncated", encoding="utf-8")
+    assert corpus_runner.run_python_corpus(corpus, batch_size=125, cache=cache) == first
+    assert executed[-1] == (ids[0], 125)
+
+    error = {"type": "RuntimeError", "message": "engine failure"}
+    monkeypatch.setattr(
+        corpus_runner,
+        "_run_python_cases",
+        lambda cases, **_options: [
+            {"id": case["id"], "status": "engine_error", "error": error} for case in cases
+        ],
+    )
+    failed = corpus_runner.run_python_corpus(corpus, batch_size=1000, cache=cache)
+    assert failed["status"] == "engine_error"
+    assert len(list(tmp_path.glob("cache/*/*.json"))) == 4
+
+
+def test_case_cache_key_tracks_inputs_and_engine_sources_but_not_case_ids(
+    tmp_path: Path,
+) -> None:
+    reference_case = deepcopy(_corpus()["cases"][0])
+    renamed = {**reference_case, "id": "renamed", "expected_result": {}}
+    reseeded = {**reference_case, "seed": reference_case["seed"] + 1}
+    key = case_cache.case_cache_key(reference_case, batch_size=125, fingerprint="a")
+
+    assert case_cache.case_cache_key(renamed, batch_size=125, fingerprint="a") == key
+    assert case_cache.case_cache_key(reseeded, batch_size=125, fingerprint="a") != key
+    assert case_cache.case_cache_key(reference_case, batch_size=128, fingerprint="a") != key
+    assert case_cache.case_cache_key(reference_case, batch_size=125, fingerprint="b") != key
+
+    engine = tmp_path / "backend" / "mc_core.py"
+    engine.parent.mkdir()
+    engine.write_text("VERSION = 1\n", encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "notes.md").write_text("docs\n", encoding="utf-8")
+    before = case_cache.engine_source_fingerprint(tmp_path)
+    case_cache.engine_source_fingerprint.cache_clear()
+    (tmp_path / "docs" / "notes.md").write_text("edited docs\n", encoding="utf-8")
+    assert case_cache.engine_source_fingerprint(tmp_path) == before
+    case_cache.engine_source_fingerprint.cache_clear()
+    engine.write_text("VERSION = 2\n", encoding="utf-8")
+    assert case_cache.engine_source_fingerprint(tmp_path) != before
+    case_cache.engine_source_fingerprint.cache_clear()
+
+
+def test_runner_options_select_workers_and_cache_from_the_command_line(tmp_path: Path) -> None:
+    parser = argparse.ArgumentParser()
+    case_cache.add_runner_arguments(parser)
+
+    cached = case_cache.runner_options(
+        parser.parse_args(["--workers", "0", "--cache-dir", str(tmp_path)])
+    )
+    uncached = case_cache.runner_options(parser.parse_args(["--no-cache"]))
+
+    assert cached["workers"] == 1
+    assert cached["cache"].directory == tmp_path
+    assert uncached["cache"] is None
+    assert case_cache.CaseResultCache(tmp_path).load("0" * 64) is None
+    (tmp_path / "ab").mkdir()
+    (tmp_path / "ab" / f"ab{'0' * 62}.json").write_text("[]", encoding="utf-8")
+    assert case_cache.CaseResultCache(tmp_path).load(f"ab{'0' * 62}") is None
+
+
 def test_shared_validation_probes_match_in_python_and_typescript() -> None:
     probes = _validation_probes()
     expected = {probe["id"]: probe["accepted"] for probe in probes["cases"]}
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import json
+import math
+import random
 import runpy
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from pathlib import Path
+from statistics import NormalDist
 from typing import Any
 
 import numpy as np
@@ -12,6 +16,7 @@ import pytest
 
 from Scripts import calibrate_statistical_distribution as calibration_cli
 from Scripts import run_statistical_distribution as distribution_control
+from Scripts import schema_registry
 from Scripts import statistical_distribution_calibration as calibration
 from Scripts import statistical_distribution_evidence as evidence_validation
 from Scripts import statistical_distribution_metrics as metrics
@@ -111,6 +116,67 @@ def test_closed_protocol_seed_population_and_schema_are_independently_valid() ->
     )
 
 
+def test_schema_registry_checks_and_compiles_each_schema_content_once(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    registry = schema_registry.SchemaRegistry()
+    schema = {"type": "object", "required": ["a"]}
+    validator = registry.validator(schema)
+    schema["required"] = ["b"]
+    assert registry.validator({"type": "object", "required": ["a"]}) is validator
+    assert [error.message for error in registry.errors(schema, {"a": 1})] == [
+        "'b' is a required property"
+    ]
+    reordered = {"required": ["a"], "type": "object"}
+    assert [error.message for error in registry.errors(reordered, {})] == [
+        "'a' is a required property"
+    ]
+    for _attempt in range(2):
+        with pytest.raises(schema_registry.SchemaError):
+            registry.validator({"type": 7})
+    assert (registry.timings.checked, registry.timings.reused) == (3, 0)
+    assert registry.timings.validations == 2
+
+    persistent = schema_registry.SchemaRegistry(tmp_path / "schemas")
+    persistent.validator(schema)
+    with pytest.raises(schema_registry.SchemaError):
+        persistent.validator({"type": 7})
+    assert len(list((tmp_path / "schemas").iterdir())) == 1
+    restarted = schema_registry.SchemaRegistry(tmp_path / "schemas")
+    restarted.validator(deepcopy(schema))
+    assert (restarted.timings.checked, restarted.timings.reused) == (0, 1)
+    assert restarted.timings.check_seconds == 0.0
+
+    blocked = tmp_path / "file"
+    blocked.write_text("", encoding="utf-8")
+    unwritable = schema_registry.SchemaRegistry(blocked / "schemas")
+    assert [error.message for error in unwritable.errors(schema, {"b": 1})] == []
+    assert "WARNING: schema cache not written" in capsys.readouterr().err
+
+
+def test_schema_overhead_is_measured_per_block_and_rendered(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    outer = schema_registry.REGISTRY.timings
+    with schema_registry.schema_overhead() as timings:
+        schema_registry.check_schema({"type": "string"})
+        assert schema_registry.schema_errors({"type": "string"}, 1)[0].validator == "type"
+    assert schema_registry.REGISTRY.timings is outer
+    assert timings.validations == 1
+    timings.check_seconds, timings.validate_seconds = 0.030, 0.010
+    timings.checked, timings.reused = 2, 1
+    assert timings.render(0.080) == (
+        "Schémas JSON : 40 ms sur 80 ms (50%) ; vérification 30 ms "
+        "(2 schémas, 1 réutilisés), validation 10 ms (1 documents)."
+    )
+    assert "(0%)" in schema_registry.SchemaTimings().render(0.0)
+
+    monkeypatch.delenv(schema_registry.PERSISTENT_CACHE_ENV, raising=False)
+    assert schema_registry._default_registry().cache_dir is None
+    monkeypatch.setenv(schema_registry.PERSISTENT_CACHE_ENV, str(tmp_path))
+    assert schema_registry._default_registry().cache_dir == tmp_path
+
+
 def test_json_loading_and_protocol_bundle_fail_explicitly(tmp_path: Path) -> None:
     missing = tmp_path / "missing.json"
     with pytest.raises(protocol_validation.ProtocolBundleError) as unreadable:
@@ -201,6 +267,40 @@ def test_seed_collision_guard_and_population_fingerprint_diagnostics(
     assert any("cohort-b" in issue for issue in issues)
 
 
+@pytest.mark.parametrize("seed", [1, 218001])
+def test_vectorised_permutation_tests_return_the_reference_p_values(seed: int) -> None:
+    rng = random.Random(seed)
+    left = [
+        {float(rng.randint(0, 40)): rng.randint(1, 9) for _ in range(rng.randint(1, 12))}
+        for _ in range(9)
+    ]
+    right = [
+        {float(rng.randint(0, 40)): rng.randint(1, 9) for _ in range(rng.randint(1, 12))}
+        for _ in range(7)
+    ]
+    rates_left = [(rng.randint(0, 10), 10) for _ in range(9)]
+    rates_right = [(rng.randint(0, 10), 10) for _ in range(6)] + [(0, 0)]
+
+    for permutations in (0, 1, 300):
+        assert statistics.count_block_p_value(
+            left, right, permutations=permutations, seed=seed,
+        ) == statistics.permutation_p_value(
+            left, right, statistics.count_block_effect, permutations=permutations, seed=seed,
+        )
+        assert statistics.rate_block_p_value(
+            rates_left, rates_right, permutations=permutations, seed=seed,
+        ) == statistics.permutation_p_value(
+            rates_left, rates_right, statistics.rate_block_effect,
+            permutations=permutations, seed=seed,
+        )
+    empty = [{}, {}]
+    assert statistics.count_block_p_value(
+        empty, [{1.0: 1}], permutations=5, seed=seed,
+    ) == statistics.permutation_p_value(
+        empty, [{1.0: 1}], statistics.count_block_effect, permutations=5, seed=seed,
+    )
+
+
 def test_statistical_primitives_cover_discrete_rates_permutations_and_decisions() -> None:
     left = [{1.0: 2, 2.0: 1}, {2.0: 1}]
     right = [{1.0: 1, 2.0: 3}, {2.0: 1}]
@@ -283,10 +383,16 @@ def test_metric_extraction_covers_censoring_absence_and_all_metric_kinds() -> No
     assert metrics.presence_blocks([result], "risk_score") == [(1, 1)]
     assert metrics.value_blocks([result], "result_percentiles", "P50") == [{1.0: 1}]
     assert metrics.value_blocks([result], "result_percentiles", "P90") == []
-    assert metrics.scenario_results(
-        {"cases": [{"id": "a:0", "result": result}, {"id": "b:0", "result": {}}]},
-        "a",
-    ) == [result]
+    assert metrics.reduce_result(result) == {
+        "outcome": {1.0: 8, 522.0: 2},
+        "throughput_reliability": result["throughput_reliability"],
+        "completion_summary": result["completion_summary"],
+        "result_percentiles": result["result_percentiles"],
+        "risk_score": 0.1,
+    }
+    assert set(metrics.reduce_result(without_completion)) == {
+        "outcome", "throughput_reliability", "result_percentiles", "risk_score",
+    }
 
     inference = deepcopy(_fast_protocol()["inference"])
     assert metrics.compare_values(
@@ -297,7 +403,7 @@ def test_metric_extraction_covers_censoring_absence_and_all_metric_kinds() -> No
     )["diagnostic"].startswith("Observations")
     assert metrics.insufficient_metric("x", 1, 2, 0.5)["sample_sizes"]["typescript"] == 2
 
-    many = [deepcopy(result) for _ in range(8)]
+    many = [metrics.reduce_result(deepcopy(result)) for _ in range(8)]
     common = {"inference": inference, "alpha": 0.05, "seed": 3}
     for metric_id in (
         "outcome_cdf",
@@ -361,9 +467,13 @@ def test_python_plan_and_typescript_bridge_error_classification(
     protocol, seeds, corpus = _bundle()
     plan = runner.build_execution_plan(protocol, seeds, corpus, "python")
     plan["cases"] = plan["cases"][:1]
-    python_report = runner.run_python_plan(plan)
-    assert python_report["proof_kind"] == "distributional_parity"
-    assert python_report["cases"][0]["status"] == "ok"
+    observations = runner.observe_python_plan(plan)
+    assert list(observations) == [plan["cases"][0]["id"].rpartition(":")[0]]
+    assert "outcome" in observations[next(iter(observations))][0]
+    broken = deepcopy(plan)
+    broken["cases"][0]["input"]["n_sims"] = 0
+    with pytest.raises(runner.EngineExecutionError, match="moteur python a échoué"):
+        runner.observe_python_plan(broken)
 
     monkeypatch.setattr(runner.shutil, "which", lambda _name: None)
     with pytest.raises(runner.InfrastructureError, match="introuvable"):
@@ -407,9 +517,15 @@ def test_evidence_supports_match_divergence_inconclusive_and_invalid(tmp_path: P
     python_report = _engine_report(python_plan, "python")
     typescript_report = _engine_report(typescript_plan, "typescript")
 
-    matching = runner.build_distribution_evidence(
-        protocol, seeds, corpus, python_report, typescript_report,
-    )
+    python_observations = runner.reduce_engine_report(python_report, python_plan, "python")
+
+    def evidence(report: dict[str, Any]) -> dict[str, Any]:
+        typescript = runner.reduce_engine_report(report, typescript_plan, "typescript")
+        return runner.build_distribution_evidence(
+            protocol, seeds, corpus, python_observations, typescript,
+        )
+
+    matching = evidence(typescript_report)
     assert matching["status"] == "match"
     assert matching["summary"]["matches"] == 49
     assert matching["diagnostics"] == []
@@ -417,18 +533,14 @@ def test_evidence_supports_match_divergence_inconclusive_and_invalid(tmp_path: P
 
     divergent_report = deepcopy(typescript_report)
     divergent_report["cases"][0]["result"]["throughput_reliability"]["label"] = "fragile"
-    divergent = runner.build_distribution_evidence(
-        protocol, seeds, corpus, python_report, divergent_report,
-    )
+    divergent = evidence(divergent_report)
     assert divergent["status"] == "divergence"
     assert divergent["diagnostics"][0]["classification"] == "distributional_divergence"
 
     inconclusive_report = deepcopy(typescript_report)
     for case in inconclusive_report["cases"]:
         case["result"].pop("risk_score", None)
-    inconclusive = runner.build_distribution_evidence(
-        protocol, seeds, corpus, python_report, inconclusive_report,
-    )
+    inconclusive = evidence(inconclusive_report)
     assert inconclusive["status"] in {"divergence", "inconclusive"}
     assert any(
         diagnostic["classification"] in {
@@ -458,8 +570,10 @@ def test_evidence_validator_rejects_schema_summary_status_and_fingerprint(tmp_pa
         fast,
         seeds,
         corpus,
-        _engine_report(left_plan, "python"),
-        _engine_report(right_plan, "typescript"),
+        runner.reduce_engine_report(_engine_report(left_plan, "python"), left_plan, "python"),
+        runner.reduce_engine_report(
+            _engine_report(right_plan, "typescript"), right_plan, "typescript",
+        ),
     )
     path = tmp_path / "evidence.json"
     _write_json(path, report)
@@ -503,8 +617,8 @@ def test_control_classifies_protocol_engine_and_infrastructure_errors(
         lambda **_kwargs: (fast, seeds, corpus),
     )
 
-    def python_engine(plan: dict[str, Any]) -> dict[str, Any]:
-        return _engine_report(plan, "python")
+    def python_engine(plan: dict[str, Any]) -> runner.CohortObservations:
+        return runner.reduce_engine_report(_engine_report(plan, "python"), plan, "python")
 
     def typescript_engine(plan: dict[str, Any]) -> dict[str, Any]:
         return _engine_report(plan, "typescript")
@@ -564,7 +678,7 @@ def test_calibration_is_stable_calibrated_and_exposes_size_effects(
     grid = {(entry["cohort_size"], entry["n_sims"]): entry for entry in first["grid"]}
     assert grid[(16, 1000)]["same_law"]["pooled_cdf_match"] == 0
     assert grid[(64, 1000)]["same_law"]["pooled_cdf_match"] >= 0.99
-    assert calibration._score_p_value(0, 0, 10) == 1
+    assert calibration._score_p_values(np.array([0, 10]), np.array([0, 10]), 10).tolist() == [1, 1]
     assert calibration._binomial_envelope(0, 0.05, 0.99) == 0
     assert calibration._binomial_envelope(2, 0.05, 2.0) == 2
     assert calibration._count_pairwise(
@@ -586,6 +700,57 @@ def test_calibration_is_stable_calibrated_and_exposes_size_effects(
     assert len(invalid["diagnostics"]) == 2
 
 
+def test_vectorised_calibration_decisions_match_the_scalar_formulas() -> None:
+    rng = np.random.Generator(np.random.PCG64(5))
+    size = 64 * 1000
+    left = rng.binomial(size, 0.5, 400)
+    right = rng.binomial(size, 0.5, 400)
+    alpha = 0.05 / 49
+
+    def scalar_p_value(a: int, b: int) -> float:
+        pooled = (a + b) / (2 * size)
+        variance = pooled * (1 - pooled) * (2 / size)
+        z = abs(a / size - b / size) / math.sqrt(variance)
+        return 2 * (1 - NormalDist().cdf(z))
+
+    def scalar_rate_equivalent(a: int, b: int) -> bool:
+        low, high = statistics.rate_difference_interval((a, size), (b, size), alpha)
+        return max(abs(low), abs(high)) <= 0.002
+
+    pairs = [(int(a), int(b)) for a, b in zip(left, right)]
+    assert calibration._score_p_values(left, right, size).tolist() == [
+        scalar_p_value(a, b) for a, b in pairs
+    ]
+    assert calibration._rate_equivalent(left, right, size, alpha, 0.002).tolist() == [
+        scalar_rate_equivalent(a, b) for a, b in pairs
+    ]
+    rows = calibration._holm_rejects_any(
+        np.array([[0.06, 0.001], [0.02, 0.03], [0.001, 0.001]]),
+        np.array([[0.5, 0.0], [0.5, 0.5], [0.0, 0.5]]),
+        0.05,
+        0.1,
+    )
+    assert rows.tolist() == [False, True, True]
+
+
+def test_calibration_grid_cells_can_be_sharded_without_changing_the_artifact(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    protocol, _seeds, _corpus = _bundle()
+    pools: list[int] = []
+
+    def thread_pool(*, max_workers: int, mp_context: Any) -> ThreadPoolExecutor:
+        pools.append(max_workers)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    monkeypatch.setattr(calibration, "ProcessPoolExecutor", thread_pool)
+    sharded = calibration.build_calibration_report(protocol, workers=4)
+
+    assert pools == [4]
+    expected = Path(calibration_cli.DEFAULT_OUTPUT).read_text(encoding="utf-8")
+    assert json.dumps(sharded, ensure_ascii=False, indent=2) + "\n" == expected
+
+
 def test_cli_commands_and_entrypoints_report_success_and_failure(
     monkeypatch: pytest.MonkeyPatch,
     capsys: pytest.CaptureFixture[str],
@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import runpy
+import sys
+import threading
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from Scripts import run_statistical_evidence_chain as chain
+from Scripts import statistical_evidence_graph as graph
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _writer(path: Path, text: str, calls: list[str], *, passed: bool = True) -> Any:
+    def run() -> bool:
+        calls.append(path.name)
+        path.write_text(text, encoding="utf-8")
+        return passed
+
+    return run
+
+
+def _pipeline(tmp_path: Path, calls: list[str], **texts: str) -> tuple[graph.EvidenceStage, ...]:
+    source, middle, final = tmp_path / "source.json", tmp_path / "middle", tmp_path / "final"
+    return (
+        graph.EvidenceStage(
+            "middle", (source,), (middle,), _writer(middle, texts.get("middle", "m"), calls)
+        ),
+        graph.EvidenceStage("final", (middle,), (final,), _writer(final, "f", calls)),
+    )
+
+
+def _statuses(results: list[graph.StageResult]) -> dict[str, str]:
+    return {result.name: result.status for result in results}
+
+
+def test_dependencies_follow_artifacts_and_reject_invalid_graphs(tmp_path: Path) -> None:
+    calls: list[str] = []
+    stages = _pipeline(tmp_path, calls)
+    assert graph.stage_dependencies(reversed(stages)) == {"final": ("middle",), "middle": ()}
+
+    duplicate = graph.EvidenceStage("other", (), stages[0].outputs, lambda: True)
+    with pytest.raises(ValueError, match="is written by middle and other"):
+        graph.stage_dependencies((*stages, duplicate))
+    with pytest.raises(ValueError, match="names must be unique"):
+        graph.stage_dependencies((stages[0], graph.EvidenceStage("middle", (), (), bool)))
+    looped = graph.EvidenceStage("middle", stages[1].outputs, stages[0].outputs, lambda: True)
+    with pytest.raises(ValueError, match="cycle: final, middle"):
+        graph.stage_dependencies((looped, stages[1]))
+
+
+def test_only_stages_with_changed_inputs_or_outputs_are_regenerated(tmp_path: Path) -> None:
+    calls: list[str] = []
+    (tmp_path / "source.json").write_text("1", encoding="utf-8")
+    manifest_path = tmp_path / "cache" / "manifest.json"
+
+    def run(stages: tuple[graph.EvidenceStage, ...]) -> dict[str, str]:
+        return _statuses(graph.run_graph(stages, manifest=graph.EvidenceManifest(manifest_path)))
+
+    assert run(_pipeline(tmp_path, calls)) == {"middle": "regenerated", "final": "regenerated"}
+    assert run(_pipeline(tmp_path, calls)) == {"middle": "up_to_date", "final": "up_to_date"}
+    # Identical bytes from a regenerated dependency leave its dependent up to date.
+    (tmp_path / "source.json").write_text("2", encoding="utf-8")
+    assert run(_pipeline(tmp_path, calls)) == {"middle": "regenerated", "final": "up_to_date"}
+    (tmp_path / "source.json").write_text("3", encoding="utf-8")
+    changed = _pipeline(tmp_path, calls, middle="changed")
+    assert run(changed) == {"middle": "regenerated", "final": "regenerated"}
+    (tmp_path / "final").unlink()
+    assert run(changed) == {"middle": "up_to_date", "final": "regenerated"}
+    assert calls == ["middle", "final", "middle", "middle", "final", "final"]
+    assert set(graph.EvidenceManifest(manifest_path).entries) == {"middle", "final"}
+
+
+def test_failures_are_rerun_and_errors_block_their_dependents(tmp_path: Path) -> None:
+    calls: list[str] = []
+    source, middle, final = tmp_path / "source.json", tmp_path / "middle", tmp_path / "final"
+    manifest = graph.EvidenceManifest(tmp_path / "manifest.json")
+    manifest.entries["middle"] = {"fingerprint": "stale", "outputs": {}}
+    failing = (
+        graph.EvidenceStage(
+            "middle", (source,), (middle,), _writer(middle, "m", calls, passed=False)
+        ),
+        graph.EvidenceStage("final", (middle,), (final,), _writer(final, "f", calls)),
+    )
+    results = graph.run_graph(failing, manifest=manifest)
+    assert _statuses(results) == {"middle": "failed", "final": "regenerated"}
+    assert set(manifest.entries) == {"final"}
+
+    def broken() -> bool:
+        raise RuntimeError("moteur absent")
+
+    erroring = (graph.EvidenceStage("middle", (source,), (middle,), broken), failing[1])
+    final_after = graph.EvidenceStage("after", (final,), (), lambda: True)
+    results = graph.run_graph((*erroring, final_after), manifest=manifest)
+    assert _statuses(results) == {"middle": "error", "final": "blocked", "after": "blocked"}
+    assert results[0].detail == "RuntimeError: moteur absent"
+    assert set(manifest.entries) == {"final"}
+
+
+def test_independent_stages_run_concurrently(tmp_path: Path) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def meet() -> bool:
+        barrier.wait()
+        return True
+
+    stages = (
+        graph.EvidenceStage("left", (), (tmp_path / "left",), meet),
+        graph.EvidenceStage("right", (), (tmp_path / "right",), meet),
+    )
+    assert _statuses(graph.run_graph(stages, max_workers=2)) == {
+        "left": "regenerated",
+        "right": "regenerated",
+    }
+
+
+@pytest.mark.parametrize("content", ["{", "[]", '{"format": 0}', '{"format": 1, "stages": []}'])
+def test_unusable_manifests_start_empty(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "manifest.json"
+    path.write_text(content, encoding="utf-8")
+    assert graph.EvidenceManifest(path).entries == {}
+
+
+def test_artifact_labels_are_repository_relative(tmp_path: Path) -> None:
+    assert graph.artifact_label(ROOT / "reports" / "x.json") == "reports/x.json"
+    assert graph.artifact_label(tmp_path / "x.json") == str(tmp_path / "x.json")
+    assert graph.toolchain_fingerprint(ROOT) == graph.toolchain_fingerprint(ROOT)
+
+
+def test_shared_engine_runs_execute_each_report_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[tuple[str, int]] = []
+    release = threading.Event()
+
+    def python_corpus(corpus: dict[str, Any], *, batch_size: int, workers: int) -> dict[str, Any]:
+        release.wait(5)
+        calls.append((corpus["corpus_id"], batch_size))
+        return {"batch_size": batch_size, "cases": [workers]}
+
+    monkeypatch.setattr(chain, "run_python_corpus", python_corpus)
+    engines = chain.SharedEngineRuns(workers=3)
+    corpus = {"corpus_id": "c"}
+    reports: list[dict[str, Any]] = []
+    threads = [
+        threading.Thread(target=lambda: reports.append(engines.python_corpus(corpus, 2048)))
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert calls == [("c", 2048)]
+    assert reports == [{"batch_size": 2048, "cases": [3]}] * 2
+    assert reports[0] is not reports[1]
+    reports[0]["cases"].append(4)
+    assert engines.python_corpus({"corpus_id": "c"}, 2048)["cases"] == [3]
+    engines.python_corpus(corpus, 125)
+    assert calls == [("c", 2048), ("c", 125)]
+
+    failures: list[Path] = []
+
+    def typescript_corpus(path: Path) -> dict[str, Any]:
+        failures.append(path)
+        raise RuntimeError("Node.js est introuvable.")
+
+    monkeypatch.setattr(chain, "run_typescript_corpus", typescript_corpus)
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="introuvable"):
+            engines.typescript_corpus(Path("corpus.json"))
+    assert len(failures) == 1
+
+
+def test_chain_graph_matches_the_consolidated_evidence_flow() -> None:
+    stages = chain.build_stages(chain.SharedEngineRuns(), workers=1)
+    dependencies = graph.stage_dependencies(stages)
+    assert dependencies["compatibility_evidence"] == (
+        "deterministic_parity",
+        "exact_replay",
+        "distribution_calibration",
+        "distribution_evidence",
+    )
+    assert set(dependencies["consolidated_report"]) == {
+        "deterministic_parity",
+        "exact_replay",
+        "distribution_calibration",
+        "distribution_evidence",
+        "compatibility_evidence",
+    }
+    assert all(not dependencies[name] for name in list(dependencies)[:4])
+    assert stages[4].salt != "none"
+
+
+def test_chain_stages_share_engine_runs_between_controls(monkeypatch: pytest.MonkeyPatch) -> None:
+    engines = chain.SharedEngineRuns()
+    seen: dict[str, Any] = {}
+
+    def parity_control(**runners: Any) -> dict[str, Any]:
+        seen["parity"] = runners
+        return {"status": "engine_error"}
+
+    def replay_control(**runners: Any) -> dict[str, Any]:
+        seen["replay"] = runners
+        return {"status": "completed"}
+
+    monkeypatch.setattr(chain.parity, "run_control", parity_control)
+    monkeypatch.setattr(chain.exact_replay, "run_control", replay_control)
+    monkeypatch.setattr(chain.distribution, "run_control", lambda: {"status": "invalid"})
+    monkeypatch.setattr(
+        chain.calibration, "run_control", lambda workers: {"status": "calibrated"}
+    )
+    monkeypatch.setattr(
+        chain.compatibility, "run_control", lambda: type("Run", (), {"passed": True})()
+    )
+    monkeypatch.setattr(chain.consolidated, "run_control", lambda: (None, ["absent"]))
+    monkeypatch.setattr(
+        engines, "python_corpus", lambda corpus, size: {"corpus": corpus, "size": size}
+    )
+    stages = chain.build_stages(engines, workers=1)
+    assert [stage.run() for stage in stages] == [False, True, False, True, True, False]
+    assert seen["parity"]["python_runner"]({"id": 1}) == {"corpus": {"id": 1}, "size": 2048}
+    assert seen["parity"]["typescript_runner"] == engines.typescript_corpus
+    assert seen["replay"] == {
+        "python_runner": engines.python_corpus,
+        "typescript_runner": engines.typescript_corpus,
+    }
+
+
+def test_unreadable_authority_keeps_only_its_own_files(monkeypatch: pytest.MonkeyPatch) -> None:
+    def unreadable(path: Path) -> Any:
+        raise ValueError(path)
+
+    monkeypatch.setattr(chain, "load_json", unreadable)
+    monkeypatch.setattr(chain, "load_committed_authority", lambda root, path: None)
+    inputs, salt = chain._compatibility_inputs()
+    assert [path.name for path in inputs] == [
+        "statistical-compatibility-authority-v1.0.json",
+        "statistical-compatibility-authority-v1.0.schema.json",
+        "statistical-compatibility-evidence-v1.0.schema.json",
+    ]
+    assert salt == "none"
+
+
+def test_cli_reports_each_stage_and_records_successes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    calls: list[str] = []
+    source = tmp_path / "source.json"
+    source.write_text("1", encoding="utf-8")
+    options: list[dict[str, Any]] = []
+
+    def stages(engines: chain.SharedEngineRuns, *, workers: int) -> tuple[Any, ...]:
+        options.append({"workers": workers, **engines._python_options})
+        return _pipeline(tmp_path, calls)
+
+    monkeypatch.setattr(chain, "build_stages", stages)
+    manifest = tmp_path / "manifest.json"
+    arguments = ["--manifest", str(manifest), "--workers", "2", "--no-cache"]
+    assert chain.main(arguments) == 0
+    assert chain.main(arguments) == 0
+    assert chain.main([*arguments, "--force", "--jobs", "0"]) == 0
+    captured = capsys.readouterr()
+    assert "- middle : régénérée (" in captured.out
+    assert "- final : à jour\n" in captured.out
+    assert captured.err.count("Schémas JSON : ") == 3
+    assert calls == ["middle", "final", "middle", "final"]
+    assert options[0] == {"workers": 2, "cache": None}
+
+    monkeypatch.setattr(
+        chain,
+        "build_stages",
+        lambda engines, workers: (graph.EvidenceStage("broken", (), (), lambda: 1 / 0),),
+    )
+    assert chain.main(arguments) == 1
+    assert "- broken : erreur (0.0 s) — ZeroDivisionError: division by zero" in (
+        capsys.readouterr().out
+    )
+
+
+def test_cli_script_entrypoint(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(sys, "argv", ["run_statistical_evidence_chain.py", "--help"])
+    with pytest.raises(SystemExit) as exit_info:
+        runpy.run_path(str(ROOT / "Scripts/run_statistical_evidence_chain.py"), run_name="__main__")
+    assert exit_info.value.code == 0
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import subprocess
 from copy import deepcopy
 from pathlib import Path
@@ -7,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from Scripts import generate_statistical_consolidated_report as generator
+from Scripts import quality_gate_snapshot_sync as snapshot_sync
 from Scripts import quality_gate_workspace_snapshot as snapshot
 from Scripts import run_statistical_compatibility as compatibility
 from Scripts import validate_statistical_consolidated_report as validator
@@ -67,6 +69,156 @@ def test_workspace_snapshot_exposes_only_a_discoverable_git_pointer(tmp_path: Pa
         snapshot._write_git_pointer(tmp_path, tmp_path / "missing")
 
 
+def test_clone_file_falls_back_from_reflink_to_kernel_then_plain_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"cloned content\n" * 1000)
+    os.utime(source, ns=(1_000_000_000, 2_000_000_000))
+
+    def clone(destination: str) -> str:
+        method = snapshot_sync.clone_file(source, tmp_path / destination)
+        assert (tmp_path / destination).read_bytes() == source.read_bytes()
+        assert (tmp_path / destination).stat().st_mtime_ns == 2_000_000_000
+        return method
+
+    assert clone("native.txt") in {"reflink", "copy_file_range", "copy"}
+
+    class Reflink:
+        @staticmethod
+        def ioctl(destination_fd: int, request: int, source_fd: int) -> None:
+            assert request == snapshot_sync.FICLONE
+            os.write(destination_fd, os.pread(source_fd, 1 << 20, 0))
+
+    class NoReflink:
+        @staticmethod
+        def ioctl(*_args: object) -> None:
+            raise OSError("unsupported")
+
+    monkeypatch.setattr(snapshot_sync.sys, "platform", "linux")
+    monkeypatch.setattr(snapshot_sync, "fcntl", Reflink)
+    assert clone("reflinked.txt") == "reflink"
+    monkeypatch.setattr(snapshot_sync, "fcntl", NoReflink)
+    monkeypatch.setattr(snapshot_sync, "COPY_CHUNK_BYTES", 4096)
+    assert clone("ranged.txt") == "copy_file_range"
+
+    def failing_range(*_args: object) -> int:
+        raise OSError("cross-device")
+
+    monkeypatch.setattr(snapshot_sync.os, "copy_file_range", failing_range, raising=False)
+    assert clone("fallback.txt") == "copy"
+    monkeypatch.delattr(snapshot_sync.os, "copy_file_range")
+    assert clone("plain.txt") == "copy"
+
+
+@pytest.mark.skipif(snapshot_sync.fcntl is None, reason="persistent snapshots need flock")
+def test_persistent_workspace_snapshot_reclones_only_what_changed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    repository = tmp_path / "repository"
+    git_directory = repository / ".git"
+    persistent = tmp_path / "persistent"
+    git_directory.mkdir(parents=True)
+    for name in ("a.txt", "nested/b.txt", "nested/c.txt"):
+        (repository / name).parent.mkdir(parents=True, exist_ok=True)
+        (repository / name).write_text(name, encoding="utf-8")
+    paths = ("a.txt", "nested/b.txt", "nested/c.txt", "missing.txt")
+    monkeypatch.setenv(snapshot.PERSISTENT_SNAPSHOT_ENV, str(persistent))
+
+    def run() -> str:
+        with snapshot.workspace_snapshot(repository, paths, git_directory) as isolated:
+            assert isolated == persistent / "repository"
+            assert (isolated / ".git").is_file()
+            for name in filter(lambda item: (repository / item).exists(), paths):
+                assert (isolated / name).read_bytes() == (repository / name).read_bytes()
+        return capsys.readouterr().out
+
+    first = run()
+    assert "3 files" in first and "reused" not in first
+    assert "reused=3" in run()
+    (repository / "a.txt").write_text("edited source", encoding="utf-8")
+    isolated = persistent / "repository"
+    (isolated / "nested/b.txt").write_text("written by a gate command", encoding="utf-8")
+    (isolated / "reports/generated").mkdir(parents=True)
+    (isolated / "reports/generated/out.json").write_text("{}", encoding="utf-8")
+    (isolated / "linked").symlink_to(repository, target_is_directory=True)
+    assert "removed=2, reused=1" in run()
+    assert not (isolated / "reports").exists() and (repository / "a.txt").exists()
+    assert (repository / "nested/b.txt").read_text(encoding="utf-8") == "nested/b.txt"
+
+    (repository / "nested/c.txt").unlink()
+    (isolated / "a.txt").unlink()
+    (isolated / "a.txt").mkdir()
+    output = run()
+    assert "2 files" in output and "removed=1, reused=1" in output
+    assert not (isolated / "nested/c.txt").exists()
+
+    for inside in (repository, repository / "nested"):
+        monkeypatch.setenv(snapshot.PERSISTENT_SNAPSHOT_ENV, str(inside))
+        with pytest.raises(RuntimeError, match="part of the workspace"):
+            run()
+    monkeypatch.setenv(snapshot.PERSISTENT_SNAPSHOT_ENV, str(repository / "ignored"))
+    with snapshot.workspace_snapshot(repository, paths, git_directory) as isolated:
+        assert isolated == repository / "ignored" / "repository"
+
+
+@pytest.mark.skipif(snapshot_sync.fcntl is None, reason="persistent snapshots need flock")
+def test_persistent_snapshot_replaces_links_planted_at_kept_paths_without_following_them(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repository = tmp_path / "repository"
+    (repository / ".git").mkdir(parents=True)
+    (repository / "nested").mkdir()
+    for name in ("a.txt", "nested/b.txt"):
+        (repository / name).write_text(f"workspace {name}", encoding="utf-8")
+    outside = tmp_path / "outside.txt"
+    outside.write_text("outside the snapshot", encoding="utf-8")
+    monkeypatch.setenv(snapshot.PERSISTENT_SNAPSHOT_ENV, str(tmp_path / "persistent"))
+    paths = ("a.txt", "nested/b.txt")
+
+    with snapshot.workspace_snapshot(repository, paths, repository / ".git") as isolated:
+        (isolated / "a.txt").unlink()
+        (isolated / "a.txt").symlink_to(outside)
+        (isolated / "nested/b.txt").unlink()
+        (isolated / "nested/b.txt").mkdir()
+        (isolated / "nested/b.txt/kept.txt").write_text("written by a gate", encoding="utf-8")
+
+    with snapshot.workspace_snapshot(repository, paths, repository / ".git") as isolated:
+        for name in paths:
+            assert not (isolated / name).is_symlink() and (isolated / name).is_file()
+            assert (isolated / name).read_text(encoding="utf-8") == f"workspace {name}"
+    assert outside.read_text(encoding="utf-8") == "outside the snapshot"
+
+    (tmp_path / "link.txt").symlink_to(outside)
+    with pytest.raises(OSError):
+        snapshot_sync.clone_file(repository / "a.txt", tmp_path / "link.txt")
+    assert outside.read_text(encoding="utf-8") == "outside the snapshot"
+
+
+@pytest.mark.skipif(snapshot_sync.fcntl is None, reason="persistent snapshots need flock")
+def test_busy_persistent_snapshot_falls_back_to_a_temporary_copy(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    repository = tmp_path / "repository"
+    (repository / ".git").mkdir(parents=True)
+    (repository / "README.md").write_text("snapshot\n", encoding="utf-8")
+    persistent = tmp_path / "persistent"
+    persistent.mkdir()
+    monkeypatch.setenv(snapshot.PERSISTENT_SNAPSHOT_ENV, str(persistent))
+
+    with (persistent / ".lock").open("w") as holder:
+        snapshot_sync.fcntl.flock(holder, snapshot_sync.fcntl.LOCK_EX)
+        with snapshot.workspace_snapshot(
+            repository, ("README.md",), repository / ".git"
+        ) as isolated:
+            assert persistent not in isolated.parents
+            assert (isolated / "README.md").read_text(encoding="utf-8") == "snapshot\n"
+
+    output = capsys.readouterr().out
+    assert "snapshot busy" in output and "Workspace snapshot: 1 files" in output
+    assert not (persistent / "repository").exists()
+
+
 def test_snapshot_git_environment_requires_an_explicit_git_directory(
     tmp_path: Path,
 ) -> None:
@@ -1214,4 +1214,12 @@ def test_control_reports_invalid_schema_and_negative_probe_regressions(
     )
 
     with pytest.raises(SchemaError):
-        corpus_validation.Draft202012Validator.check_schema({"type": 7})
+        corpus_validation.check_schema({"type": 7})
+    assert corpus_validation.validate_instance({}, {"properties": {"a": {"type": 7}}}) == [
+        corpus_validation.ValidationIssue(
+            instance_path="/",
+            keyword="invalidSchema",
+            message="7 is not valid under any of the given schemas",
+            schema_path="/properties/a/type",
+        )
+    ]
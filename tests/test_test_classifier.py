@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import json
+import re
 import runpy
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
 from Scripts import classify_tests
+from Scripts.source_analysis_cache import SourceAnalysisCache
 from Scripts.test_classifier_discovery import (
     LogicalCase,
     discover_all,
@@ -19,6 +23,7 @@ from Scripts.test_classifier_engine import (
     rule_matches,
     validate_record,
 )
+from Scripts.test_classifier_index import RULE_FAMILIES, RuleIndex
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -222,6 +227,8 @@ def test_javascript_discovery_reports_process_and_payload_errors(
     monkeypatch.setattr(
         "Scripts.test_classifier_discovery.subprocess.run", lambda *_args, **_kwargs: Result()
     )
+    assert discover_javascript(tmp_path) == []
+    _write(tmp_path, "frontend/src/sample.test.ts", "")
     with pytest.raises(RuntimeError, match="compiler failed"):
         discover_javascript(tmp_path)
 
@@ -231,17 +238,68 @@ def test_javascript_discovery_reports_process_and_payload_errors(
     with pytest.raises(RuntimeError, match="non-array"):
         discover_javascript(tmp_path)
 
+    Result.stdout = '[{"sourcePath": "frontend/src/other.test.ts"}]'
+    with pytest.raises(RuntimeError, match="reported frontend/src/other.test.ts"):
+        discover_javascript(tmp_path)
+
+
+def test_discovery_cache_rediscovers_only_changed_test_files(monkeypatch, tmp_path: Path) -> None:
+    _write(tmp_path, "tests/test_a.py", "def test_a():\n    assert True\n")
+    _write(tmp_path, "tests/test_b.py", "def test_b(tmp_path):\n    assert tmp_path\n")
+    _write(tmp_path, "frontend/src/a.test.ts", "test('a')")
+    _write(tmp_path, "frontend/tests/e2e/b.spec.ts", "test('b')")
+    _write(tmp_path, "frontend/src/helper.ts", "export const helper = 1;")
+    collected: list[list[str]] = []
+
+    class Result:
+        returncode = 0
+        stderr = ""
+
+        def __init__(self, files: list[str]) -> None:
+            collected.append(files)
+            self.stdout = json.dumps(
+                [
+                    {"framework": "vitest", "sourcePath": file, "selector": "a", "evidence": {}}
+                    for file in files
+                ]
+            )
+
+    monkeypatch.setattr(
+        "Scripts.test_classifier_discovery.subprocess.run",
+        lambda *_args, **kwargs: Result(json.loads(kwargs["input"])),
+    )
+    uncached = discover_all(tmp_path)
+    cold = SourceAnalysisCache(tmp_path / "cache")
+    assert discover_all(tmp_path, cache=cold) == uncached
+    assert (cold.extracted, cold.reused) == (4, 0)
+    warm = SourceAnalysisCache(tmp_path / "cache")
+    assert discover_all(tmp_path, cache=warm) == uncached
+    assert (warm.extracted, warm.reused) == (0, 4)
+    assert collected == [["frontend/src/a.test.ts", "frontend/tests/e2e/b.spec.ts"]] * 2
+
+    _write(tmp_path, "tests/test_b.py", "def test_c():\n    assert True\n")
+    _write(tmp_path, "frontend/src/a.test.ts", "test('changed')")
+    incremental = SourceAnalysisCache(tmp_path / "cache", workers=2)
+    assert discover_all(tmp_path, cache=incremental) == discover_all(tmp_path)
+    assert (incremental.extracted, incremental.reused) == (2, 2)
+    assert collected[2] == ["frontend/src/a.test.ts"]
+    assert [case.selector for case in discover_pytest(tmp_path)] == ["test_a", "test_c"]
+
 
 def test_discover_all_is_sorted_and_rejects_duplicate_ids(monkeypatch) -> None:
     first = _case("pytest")
     second = LogicalCase("vitest", "z.test.ts", "test z", first.evidence)
-    monkeypatch.setattr("Scripts.test_classifier_discovery.discover_pytest", lambda _root: [first])
     monkeypatch.setattr(
-        "Scripts.test_classifier_discovery.discover_javascript", lambda _root, _node: [second]
+        "Scripts.test_classifier_discovery.discover_pytest", lambda _root, _cache: [first]
+    )
+    monkeypatch.setattr(
+        "Scripts.test_classifier_discovery.discover_javascript",
+        lambda _root, _node, _cache: [second],
     )
     assert discover_all(ROOT) == [first, second]
     monkeypatch.setattr(
-        "Scripts.test_classifier_discovery.discover_javascript", lambda _root, _node: [first]
+        "Scripts.test_classifier_discovery.discover_javascript",
+        lambda _root, _node, _cache: [first],
     )
     with pytest.raises(ValueError, match="Duplicate logical"):
         discover_all(ROOT)
@@ -380,6 +438,76 @@ def test_rule_matching_supports_all_any_none_and_behavior_requirement() -> None:
     )
 
 
+def _reference_values(case: LogicalCase, field: str) -> list[str]:
+    attributes = {"framework": case.framework, "sourcePath": case.source_path}
+    if field in attributes or field == "selector":
+        return [attributes.get(field, case.selector)]
+    value = case.evidence.get(field, [])
+    return [str(value).lower()] if isinstance(value, bool) else [str(item) for item in value]
+
+
+def _reference_group(case: LogicalCase, group: dict[str, list[str]], require_all: bool) -> bool:
+    outcomes = [
+        any(re.search(pattern, value, re.IGNORECASE) for value in _reference_values(case, field))
+        for field, patterns in group.items()
+        for pattern in patterns
+    ]
+    return not outcomes or (all(outcomes) if require_all else any(outcomes))
+
+
+def _reference_matches(case: LogicalCase, rule: dict) -> bool:
+    """Uncompiled matcher over raw ``re.search``, independent of the rule index."""
+    match = rule.get("match", {})
+    behaviour = {
+        field: match.get("any", {}).get(field, [])
+        for field in ("imports", "calls", "fixtures", "resources", "modifiers")
+    }
+    behaviour = {field: patterns for field, patterns in behaviour.items() if patterns}
+    return (
+        case.framework in match.get("frameworks", [case.framework])
+        and _reference_group(case, match.get("all", {}), True)
+        and (not match.get("any") or _reference_group(case, match["any"], False))
+        and not (match.get("none") and _reference_group(case, match["none"], False))
+        and (
+            not rule.get("requiresBehaviorEvidence")
+            or (bool(behaviour) and _reference_group(case, behaviour, False))
+        )
+    )
+
+
+def test_rule_index_matches_each_rule_in_priority_order() -> None:
+    rules, _overrides, _catalog, _schema = _configuration()
+    index = RuleIndex(rules)
+    cases = [
+        replace(case, framework=framework)
+        for case in discover_pytest(ROOT)[:120]
+        for framework in ("pytest", "vitest", "playwright")
+    ]
+    for case in cases:
+        for family in RULE_FAMILIES:
+            expected = sorted(
+                (rule for rule in rules[family] if _reference_matches(case, rule)),
+                key=lambda rule: (rule["priority"], rule["id"]),
+            )
+            assert index.matching(case, family) == expected
+
+
+def test_rule_index_keeps_uncombinable_patterns_and_empty_exclusions_exact() -> None:
+    case = _case("pytest", imports=["aa", "backend.mc_core"], calls=["simulate"])
+    rules = {
+        "natureRules": [
+            {"id": "repeat", "priority": 2, "match": {"all": {"imports": [r"(a)\1"]}}},
+            {"id": "flag", "priority": 1, "match": {"any": {"calls": ["(?x) sim ulate", "x"]}}},
+            {"id": "empty-none", "priority": 0, "match": {"none": {"calls": []}}},
+        ]
+    }
+    index = RuleIndex(rules)
+    assert [rule["id"] for rule in index.matching(case, "natureRules")] == ["flag", "repeat"]
+    assert [_reference_matches(case, rule) for rule in rules["natureRules"]] == [True, True, False]
+    assert [rule_matches(case, rule) for rule in rules["natureRules"]] == [True, True, False]
+    assert index.hits("imports", ("ab",)) == frozenset()
+
+
 def test_record_validation_rejects_contract_violations() -> None:
     _rules, _overrides, catalog, schema = _configuration()
     invalid = {
@@ -12,9 +12,11 @@ from typing import Any
 
 import pytest
 
+from Scripts import report_json_io
 from Scripts import report_test_execution_counts as counts
 
 ROOT = Path(__file__).resolve().parents[1]
+COUNTS_SCHEMA = ROOT / "config/test-execution-counts.schema.json"
 
 
 def _logical(
@@ -185,7 +187,7 @@ def test_two_consolidations_are_byte_identical_and_cli_writes_the_report(tmp_pat
     assert first == second
 
     assert counts.main(["--root", str(tmp_path), "--output", "cli.json"]) == 0
-    assert (tmp_path / "cli.json").read_bytes() == first
+    assert hashlib.sha256((tmp_path / "cli.json").read_bytes()).hexdigest() == first
 
 
 @pytest.mark.parametrize(
@@ -382,6 +384,69 @@ def test_report_shape_conforms_to_versioned_schema(tmp_path: Path) -> None:
         counts._validate_counts(aggregate, "schema test")
 
 
+def test_streamed_report_matches_the_canonical_serialisation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(report_json_io, "WRITE_BATCH_CHUNKS", 8)
+    value = {"name": "élan", "items": [{"n": index} for index in range(20)], "empty": {}}
+    expected = (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    assert len(list(report_json_io.report_blocks(value))) > 1
+
+    digest = report_json_io.write_json_report(value, tmp_path / "nested/report.json")
+
+    assert (tmp_path / "nested/report.json").read_bytes() == expected
+    assert digest == report_json_io.report_digest(value) == hashlib.sha256(expected).hexdigest()
+    assert [path.name for path in (tmp_path / "nested").iterdir()] == ["report.json"]
+    with pytest.raises(TypeError):
+        report_json_io.write_json_report({"value": object()}, tmp_path / "nested/report.json")
+    assert (tmp_path / "nested/report.json").read_bytes() == expected
+    assert [path.name for path in (tmp_path / "nested").iterdir()] == ["report.json"]
+
+
+def test_report_members_are_read_lazily_and_strictly(tmp_path: Path) -> None:
+    path = tmp_path / "report.json"
+    path.write_text('{"first": {"a": 1}, "totals": [1, 2], "last": ', encoding="utf-8")
+    assert report_json_io.json_member(path, "totals") == [1, 2]
+    with pytest.raises(json.JSONDecodeError):
+        report_json_io.json_member(path, "missing")
+
+    assert list(report_json_io.iter_json_members(" { } ")) == []
+    assert list(report_json_io.iter_json_members('{"a": 1, "b": {"c": []}}\n')) == [
+        ("a", 1),
+        ("b", {"c": []}),
+    ]
+    path.write_text('{"a": 1}', encoding="utf-8")
+    with pytest.raises(KeyError):
+        report_json_io.json_member(path, "b")
+    for text, error in [
+        ('{"a": 1, "a": 2}', "Duplicate JSON property: a"),
+        ('{"a": {"b": 1, "b": 2}}', "Duplicate JSON property: b"),
+        ("[]", "Expected one of '{'"),
+        ('{1: 2}', "Expected a property name"),
+        ('{"a" 1}', "Expected one of ':'"),
+        ('{"a": 1 "b": 2}', "Expected one of ',}'"),
+        ('{"a": 1} {}', "Extra data"),
+    ]:
+        with pytest.raises(ValueError, match=error):
+            list(report_json_io.iter_json_members(text))
+
+
+def test_logical_case_details_are_schema_checked_by_a_cached_validator(tmp_path: Path) -> None:
+    _repository(tmp_path)
+    report = counts.consolidate(tmp_path)
+    validator = report_json_io.record_validator(COUNTS_SCHEMA, "logicalCase")
+    assert report_json_io.record_validator(COUNTS_SCHEMA, "logicalCase") is validator
+    assert report_json_io.record_schema_errors(validator, report["logicalCases"], "case") == []
+
+    report["logicalCases"][1]["framework"] = "jest"
+    del report["logicalCases"][2]["results"]
+    with pytest.raises(ValueError) as error:
+        counts.write_report(report, tmp_path / counts.DEFAULT_OUTPUT)
+    assert "logical case 1: 'jest' is not one of" in str(error.value)
+    assert "logical case 2: 'results' is a required property" in str(error.value)
+    assert not (tmp_path / counts.DEFAULT_OUTPUT).exists()
+
+
 def test_pytest_native_hooks_count_parameters_classes_skip_xfail_and_setup_error(
     tmp_path: Path,
 ) -> None:
@@ -1,16 +1,27 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import re
 import runpy
+import shutil
 import sys
+import threading
+import time
 from copy import deepcopy
 from pathlib import Path
 from types import SimpleNamespace
 
 import pytest
 
-from Scripts import classify_tests, quality_gate, quality_gate_dag, quality_gate_plan
+from Scripts import (
+    classify_tests,
+    quality_gate,
+    quality_gate_cache,
+    quality_gate_dag,
+    quality_gate_plan,
+    quality_gate_scheduler,
+)
 from Scripts import test_execution_profiles as profiles
 from Scripts import test_execution_profiles_graph as profile_graph
 from Scripts import test_execution_profiles_validation as profile_validation
@@ -342,6 +353,16 @@ def test_contract_and_inventory_shape_failures_are_reported() -> None:
     assert any("profiles must not contain duplicates" in error for error in errors)
     assert any("aggregator must be boolean" in error for error in errors)
 
+    cached = _contract()
+    cached["nodes"][-1]["cacheInputs"] = ["tests/**"]
+    assert profiles.validate_contract(cached) == [
+        "aggregator aggregate must not declare cacheInputs"
+    ]
+    cached["nodes"][1]["cacheInputs"] = ["../outside/**"]
+    assert profiles.validate_contract(cached) == [
+        "nodes[1].cacheInputs must stay inside the repository"
+    ]
+
     bad_inventory: object = [
         None,
         {"logicalCaseId": "same", "framework": "unknown", "executionProfile": "unknown"},
@@ -412,7 +433,7 @@ def test_strict_json_report_and_cli_paths(tmp_path: Path, capsys, monkeypatch) -
     assert output.is_file()
     written = output.read_bytes()
     report = json.loads(written)
-    assert profiles.write_report(report, output) == written
+    assert profiles.write_report(report, output) == hashlib.sha256(written).hexdigest()
     assert profiles.main(["--root", str(root), "--check"]) == 0
     selection = root / "pytest-args.txt"
     assert profiles.main(
@@ -459,8 +480,12 @@ def _dag_root(tmp_path: Path) -> Path:
     return root
 
 
-def _dag_plan(*commands: quality_gate.GateCommand, docker: bool = False) -> SimpleNamespace:
-    return SimpleNamespace(commands=commands, execution_profile="main", docker_smoke=docker)
+def _dag_plan(
+    *commands: quality_gate.GateCommand, docker: bool = False, use_cache: bool = False
+) -> SimpleNamespace:
+    return SimpleNamespace(
+        commands=commands, execution_profile="main", docker_smoke=docker, use_cache=use_cache
+    )
 
 
 def test_dag_node_execution_aggregation_and_error_paths(tmp_path: Path, monkeypatch) -> None:
@@ -656,8 +681,13 @@ def test_dag_impossible_ready_set_and_quality_gate_cli_options(tmp_path: Path, m
     )
     assert code == 2
 
-    monkeypatch.setattr(quality_gate, "run_gate", lambda mode, **options: len(options) + 4)
-    assert quality_gate.main(["ci", "--profile", "main", "--node", "aggregate"]) == 6
+    monkeypatch.setattr(quality_gate, "run_gate", lambda mode, **options: options)
+    assert quality_gate.main(["ci", "--profile", "main", "--node", "aggregate"]) == {
+        "use_cache": True,
+        "execution_profile": "main",
+        "selected_node": "aggregate",
+    }
+    assert quality_gate.main(["fast", "--no-cache"]) == {"use_cache": False}
     assert quality_gate_plan.execution_plan("fast", False, quality_gate)
 
 
@@ -773,3 +803,250 @@ def test_github_workflow_has_parallel_jobs_and_publish_waits_for_aggregate() ->
     assert "needs: [aggregate]" in publish
     assert "Confirm published SHA" in publish
     assert '${{ steps.image.outputs.name }}:${{ github.sha }}' in publish
+
+
+def test_statistical_cache_inputs_cover_the_attested_snapshot() -> None:
+    from Scripts.statistical_main_enforcement_common import SNAPSHOT_FILES, SNAPSHOT_ROOTS
+
+    snapshot = {f"{root}/**" for root in SNAPSHOT_ROOTS} | set(SNAPSHOT_FILES)
+    nodes = profile_graph.node_map(_contract())
+    for identifier, node in nodes.items():
+        if identifier.startswith("statistical-") and "cacheInputs" in node:
+            assert snapshot <= set(node["cacheInputs"]), identifier
+    assert "cacheInputs" not in nodes["preflight"]
+    assert "cacheInputs" not in nodes["aggregate"]
+
+
+def test_dag_cache_restores_passing_nodes_until_an_input_changes(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    root = _dag_root(tmp_path)
+    (root / "backend").mkdir()
+    (root / "backend" / "engine.py").write_text("VALUE = 1\n", encoding="utf-8")
+    monkeypatch.setattr(quality_gate_dag, "DEFAULT_CACHE_DIR", tmp_path / "cache")
+    lint = quality_gate.GateCommand("Backend lint (Ruff)", ("python", "-V"), "fix")
+    executed: list[str] = []
+    exit_code = 0
+
+    def fake_run(command, *, extra_env, **_kwargs):
+        executed.append(command.step)
+        native = Path(extra_env["TEST_EXECUTION_NATIVE_DIR"])
+        native.mkdir(parents=True, exist_ok=True)
+        (native / "ruff.txt").write_text(f"run {len(executed)}", encoding="utf-8")
+        return exit_code
+
+    def run() -> int:
+        return quality_gate_dag.execute_gate_plan(
+            quality_gate,
+            _dag_plan(lint, use_cache=True),
+            validation_root=root,
+            runtime_temp_root=root / ".tmp",
+            isolated_validation=False,
+            selected_node="backend-static",
+        )
+
+    monkeypatch.setattr(quality_gate, "_run_command", fake_run)
+    native = root / "reports/test-execution-artifacts/main/backend-static"
+    assert run() == 0
+    shutil.rmtree(native)
+    assert run() == 0
+    assert executed == ["Backend lint (Ruff)"]
+    assert (native / "ruff.txt").read_text(encoding="utf-8") == "run 1"
+    assert json.loads((native / "result.json").read_text(encoding="utf-8"))["exitCode"] == 0
+    assert "DAG cache: hits=1/1 (100%) restored=backend-static" in capsys.readouterr().out
+
+    (root / "backend" / "engine.py").write_text("VALUE = 2\n", encoding="utf-8")
+    exit_code = 5
+    assert run() == 5
+    assert run() == 5
+    assert len(executed) == 3
+    assert "hits=0/1 (0%) restored=(none)" in capsys.readouterr().out
+
+    preflight = quality_gate.GateCommand(
+        "Repository hygiene (README, encoding, secrets and DoD)", ("python", "-V"), "fix"
+    )
+    exit_code = 0
+    assert quality_gate_dag.execute_gate_plan(
+        quality_gate,
+        _dag_plan(preflight, use_cache=True),
+        validation_root=root,
+        runtime_temp_root=root / ".tmp",
+        isolated_validation=False,
+        selected_node="preflight",
+    ) == 0
+    assert "hits=0/0" in capsys.readouterr().out
+
+
+def test_dag_cache_keys_tools_and_survives_unwritable_entries(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    contract = {"nodes": [{"id": "lint", "cacheInputs": ["src/*.py"]}]}
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "a.py").write_text("a", encoding="utf-8")
+    cache = quality_gate_cache.NodeResultCache(tmp_path / "cache", contract)
+    command = quality_gate.GateCommand("Lint", ("python", "-V"), "fix")
+
+    key = cache.key(tmp_path, "pr", "lint", (command,))
+    assert key == cache.key(tmp_path, "pr", "lint", (command,))
+    assert cache.key(tmp_path, "pr", "other", (command,)) is None
+    assert key is not None
+    cache.store(key, tmp_path / "src")
+    cache.store(key, tmp_path / "missing")
+    assert cache.restore(key, "lint", tmp_path / "restored")
+    assert (tmp_path / "restored" / "a.py").read_text(encoding="utf-8") == "a"
+
+    other = cache.key(tmp_path, "main", "lint", (command,))
+    assert other is not None
+    monkeypatch.setattr(quality_gate_cache.shutil, "copytree", _raise_os_error)
+    cache.store(other, tmp_path / "src")
+    assert "DAG cache entry not written" in capsys.readouterr().out
+    assert not cache.restore(other, "lint", tmp_path / "restored")
+
+    quality_gate_cache.tool_versions.cache_clear()
+    monkeypatch.setattr(quality_gate_cache.shutil, "which", lambda _name: None)
+    assert "node absent" in quality_gate_cache.tool_versions()
+    quality_gate_cache.tool_versions.cache_clear()
+    monkeypatch.setattr(quality_gate_cache.shutil, "which", lambda _name: "node")
+    monkeypatch.setattr(quality_gate_cache.subprocess, "run", _raise_os_error)
+    assert "node unavailable" in quality_gate_cache.tool_versions()
+    quality_gate_cache.tool_versions.cache_clear()
+
+
+def _scheduler_nodes(**needs: list[str]) -> dict[str, dict]:
+    return {identifier: {"id": identifier, "needs": items} for identifier, items in needs.items()}
+
+
+def test_scheduler_starts_unblocked_nodes_while_a_slow_sibling_runs() -> None:
+    nodes = _scheduler_nodes(first=[], second=["first"], slow=[])
+    second_started = threading.Event()
+
+    def start(node: str, _cancelled: threading.Event) -> tuple[int, float]:
+        if node == "second":
+            second_started.set()
+        if node == "slow":
+            return (0 if second_started.wait(timeout=5) else 1), 0.0
+        return 0, 0.0
+
+    scheduler = quality_gate_scheduler.NodeScheduler(nodes, set(nodes), {}, workers=3)
+
+    assert scheduler.run(start) == 0
+    assert set(scheduler.outcomes) == {"first", "second", "slow"}
+
+
+def test_scheduler_prefers_the_critical_path_and_serialises_resources() -> None:
+    nodes = _scheduler_nodes(head=[], tail=["head"], short=[])
+    priorities = quality_gate_scheduler.critical_path_seconds(nodes, {"tail": 10.0})
+    assert priorities == {"head": 11.0, "tail": 10.0, "short": 1.0}
+    started: list[str] = []
+
+    def record(node: str, _cancelled: threading.Event) -> tuple[int, float]:
+        started.append(node)
+        return 0, 0.0
+
+    scheduler = quality_gate_scheduler.NodeScheduler(nodes, set(nodes), priorities, workers=1)
+    assert scheduler.run(record) == 0
+    assert started == ["head", "tail", "short"]
+
+    shared = {
+        identifier: {"id": identifier, "needs": [], "resources": ["database"]}
+        for identifier in ("left", "right")
+    }
+    running: list[str] = []
+    overlaps: list[list[str]] = []
+
+    def exclusive(node: str, _cancelled: threading.Event) -> tuple[int, float]:
+        running.append(node)
+        overlaps.append(list(running))
+        time.sleep(0.01)
+        running.remove(node)
+        return 0, 0.0
+
+    scheduler = quality_gate_scheduler.NodeScheduler(shared, set(shared), {}, workers=2)
+    assert scheduler.run(exclusive) == 0
+    assert all(len(active) == 1 for active in overlaps)
+
+
+def test_scheduler_fails_fast_and_cancels_running_siblings() -> None:
+    nodes = _scheduler_nodes(broken=[], sibling=[], dependant=["sibling"])
+    sibling_started = threading.Event()
+    started: list[str] = []
+
+    def start(node: str, cancelled: threading.Event) -> tuple[int, float]:
+        started.append(node)
+        if node == "broken":
+            sibling_started.wait(timeout=5)
+            return 4, 0.0
+        sibling_started.set()
+        stopped = cancelled.wait(timeout=5)
+        return (quality_gate_scheduler.CANCELLED_EXIT_CODE if stopped else 0), 0.0
+
+    scheduler = quality_gate_scheduler.NodeScheduler(nodes, set(nodes), {}, workers=2)
+
+    assert scheduler.run(start) == 4
+    assert sorted(started) == ["broken", "sibling"]
+    assert scheduler.outcomes["sibling"][0] == quality_gate_scheduler.CANCELLED_EXIT_CODE
+    blocked = quality_gate_scheduler.NodeScheduler(
+        _scheduler_nodes(loop=["loop"]), {"loop"}, {}, workers=1
+    )
+    assert blocked.run(start) == 2
+
+
+def test_dag_duration_history_feeds_the_next_parallel_run(
+    tmp_path: Path, monkeypatch, capsys
+) -> None:
+    history = tmp_path / "cache"
+    assert quality_gate_scheduler.load_history(None, "pr") == {}
+    assert quality_gate_scheduler.load_history(history, "pr") == {}
+    quality_gate_scheduler.record_history(None, "pr", {"lint": 1.0})
+    quality_gate_scheduler.record_history(history, "pr", {})
+    assert not history.exists()
+
+    root = _dag_root(tmp_path)
+    monkeypatch.setattr(quality_gate_dag, "DEFAULT_CACHE_DIR", history)
+    monkeypatch.setattr(quality_gate, "_run_command", lambda *_args, **_kwargs: 0)
+    preflight = quality_gate.GateCommand(
+        "Repository hygiene (README, encoding, secrets and DoD)", ("python", "-V"), "fix"
+    )
+    assert quality_gate_dag.execute_gate_plan(
+        quality_gate,
+        _dag_plan(preflight, use_cache=True),
+        validation_root=root,
+        runtime_temp_root=root / ".tmp",
+        isolated_validation=False,
+        parallel=True,
+    ) == 0
+    assert set(quality_gate_scheduler.load_history(history, "main")) == {"preflight"}
+
+    quality_gate_scheduler.record_history(history, "pr", {"lint": 2.5})
+    assert quality_gate_scheduler.load_history(history, "pr") == {"lint": 2.5}
+    assert "preflight" in quality_gate_scheduler.load_history(history, "main")
+    (history / quality_gate_scheduler.HISTORY_FILE).write_text("[]", encoding="utf-8")
+    assert quality_gate_scheduler.load_history(history, "pr") == {}
+    quality_gate_scheduler.record_history(history, "pr", {"lint": 3.0})
+    assert quality_gate_scheduler.load_history(history, "pr") == {"lint": 3.0}
+    (history / quality_gate_scheduler.HISTORY_FILE).write_text("{", encoding="utf-8")
+    quality_gate_scheduler.record_history(history, "pr", {"lint": 4.0})
+    assert quality_gate_scheduler.load_history(history, "pr") == {"lint": 4.0}
+
+    monkeypatch.setattr(quality_gate_scheduler.os, "replace", _raise_os_error)
+    quality_gate_scheduler.record_history(history, "pr", {"lint": 5.0})
+    assert "DAG duration history not written" in capsys.readouterr().out
+
+    cancelled = threading.Event()
+    cancelled.set()
+    assert quality_gate_dag._execute_node(
+        quality_gate,
+        _dag_plan(preflight),
+        "preflight",
+        (preflight,),
+        validation_root=root,
+        runtime_temp_root=root / ".tmp",
+        isolated_validation=False,
+        command_env={},
+        cancelled=cancelled,
+    ) == quality_gate_scheduler.CANCELLED_EXIT_CODE
+    assert "preflight: cancelled after another node failed" in capsys.readouterr().out
+
+
+def _raise_os_error(*_args: object, **_kwargs: object) -> None:
+    raise OSError("unavailable")
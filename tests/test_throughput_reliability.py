@@ -1,7 +1,12 @@
+import numpy as np
 import pytest
 
 from backend.simulation_value_objects import StatisticalValueError
-from backend.throughput_reliability import calculate_throughput_reliability
+from backend.throughput_reliability import (
+    MAX_SAFE_SAMPLE,
+    calculate_throughput_reliability,
+    throughput_reliability_from_array,
+)
 
 
 @pytest.mark.parametrize(
@@ -123,3 +128,26 @@ def test_invalid_sample_histories_are_rejected(samples):
 def test_calculation_requires_a_collection():
     with pytest.raises(StatisticalValueError, match="collection"):
         calculate_throughput_reliability(None)
+
+
+@pytest.mark.parametrize(
+    ("samples", "slope_norm"),
+    [([0, 3, 2, 0, 0, 0, 3], 0.0313), ([2, 0, 0, 4, 4, 6, 0], 0.1562)],
+)
+def test_sums_run_left_to_right_like_the_typescript_engine(samples, slope_norm):
+    # Both slopes sit on a rounding boundary that a compensated sum crosses.
+    assert calculate_throughput_reliability(samples).slope_norm == slope_norm
+
+
+def test_values_beyond_the_exact_integer_range_are_rejected():
+    with pytest.raises(StatisticalValueError, match="entiers finis"):
+        calculate_throughput_reliability([1, 2, 3, 4, 5, MAX_SAFE_SAMPLE + 1])
+    assert calculate_throughput_reliability([MAX_SAFE_SAMPLE] * 6).cv == 0
+
+
+def test_integer_arrays_of_any_width_give_the_same_result():
+    samples = [(index * 7) % 13 for index in range(521)]
+    expected = calculate_throughput_reliability(samples)
+
+    for dtype in (np.int64, np.int32, np.uint8):
+        assert throughput_reliability_from_array(np.asarray(samples, dtype=dtype)) == expected